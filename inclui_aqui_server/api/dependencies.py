@@ -1,24 +1,141 @@
-from fastapi import Depends
+from typing import AsyncIterator, Optional
+
+from fastapi import Depends, Header, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-# Importa a dependência que nos dá a sessão do banco
-from inclui_aqui_server.db.database import get_db_session
-# Importa a classe do serviço que queremos instanciar
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.exception import PayloadTooLargeError
+# Importa as dependências que nos dão as sessões do banco
+from inclui_aqui_server.db.database import get_read_session, get_write_session
+# Importa as classes dos serviços que queremos instanciar
+from inclui_aqui_server.services.establishment import EstablishmentService
+from inclui_aqui_server.services.image import IMAGE_EXTENSIONS, ImageService
+from inclui_aqui_server.services.leaderboard import LeaderboardService
+from inclui_aqui_server.services.review import ReviewService
 from inclui_aqui_server.services.user import UserService
 
-def get_user_service(db: AsyncSession = Depends(get_db_session)) -> UserService:
+def get_user_service(
+    db: AsyncSession = Depends(get_write_session),
+    read_db: AsyncSession = Depends(get_read_session),
+) -> UserService:
     """
     Função de dependência que cria e retorna uma instância de UserService.
 
     Esta função atua como uma "fábrica" para a classe UserService. Para cada
     requisição, o FastAPI irá:
-    1. Resolver a dependência `get_db_session` para obter uma sessão de banco.
-    2. Passar essa sessão para o construtor do `UserService`.
+    1. Resolver `get_write_session` (primário) e `get_read_session` (réplica, quando houver).
+    2. Passar essas sessões para o construtor do `UserService`.
     3. Injetar a instância resultante do `UserService` no endpoint.
 
-    :param db: Sessão do banco de dados injetada pelo `get_db_session`.
+    :param db: Sessão de escrita injetada pelo `get_write_session`.
     :type db: AsyncSession
+    :param read_db: Sessão de leitura injetada pelo `get_read_session`.
+    :type read_db: AsyncSession
     :return: Uma instância do UserService pronta para uso.
     :rtype: UserService
     """
-    return UserService(db)
\ No newline at end of file
+    return UserService(db, read_db=read_db)
+
+
+def get_establishment_service(
+    db: AsyncSession = Depends(get_write_session),
+    read_db: AsyncSession = Depends(get_read_session),
+) -> EstablishmentService:
+    """
+    Função de dependência que cria e retorna uma instância de EstablishmentService.
+
+    :param db: Sessão de escrita injetada pelo `get_write_session`.
+    :type db: AsyncSession
+    :param read_db: Sessão de leitura injetada pelo `get_read_session`.
+    :type read_db: AsyncSession
+    :return: Uma instância do EstablishmentService pronta para uso.
+    :rtype: EstablishmentService
+    """
+    return EstablishmentService(db, read_db=read_db)
+
+
+def get_review_service(
+    db: AsyncSession = Depends(get_write_session),
+    read_db: AsyncSession = Depends(get_read_session),
+) -> ReviewService:
+    """
+    Função de dependência que cria e retorna uma instância de ReviewService.
+
+    :param db: Sessão de escrita injetada pelo `get_write_session`.
+    :type db: AsyncSession
+    :param read_db: Sessão de leitura injetada pelo `get_read_session`.
+    :type read_db: AsyncSession
+    :return: Uma instância do ReviewService pronta para uso.
+    :rtype: ReviewService
+    """
+    return ReviewService(db, read_db=read_db)
+
+
+def get_image_service(
+    db: AsyncSession = Depends(get_write_session),
+    read_db: AsyncSession = Depends(get_read_session),
+) -> ImageService:
+    """
+    Função de dependência que cria e retorna uma instância de ImageService.
+
+    :param db: Sessão de escrita injetada pelo `get_write_session`.
+    :type db: AsyncSession
+    :param read_db: Sessão de leitura injetada pelo `get_read_session`.
+    :type read_db: AsyncSession
+    :return: Uma instância do ImageService pronta para uso.
+    :rtype: ImageService
+    """
+    return ImageService(db, read_db=read_db)
+
+
+def get_leaderboard_service(
+    db: AsyncSession = Depends(get_write_session),
+    read_db: AsyncSession = Depends(get_read_session),
+) -> LeaderboardService:
+    """
+    Função de dependência que cria e retorna uma instância de LeaderboardService.
+
+    :param db: Sessão de escrita injetada pelo `get_write_session`.
+    :type db: AsyncSession
+    :param read_db: Sessão de leitura injetada pelo `get_read_session`.
+    :type read_db: AsyncSession
+    :return: Uma instância do LeaderboardService pronta para uso.
+    :rtype: LeaderboardService
+    """
+    return LeaderboardService(db, read_db=read_db)
+
+
+# Documenta o corpo binário dos uploads de imagem (o endpoint lê o corpo cru)
+IMAGE_UPLOAD_OPENAPI = {
+    'requestBody': {
+        'required': True,
+        'content': {
+            content_type: {'schema': {'type': 'string', 'format': 'binary'}}
+            for content_type in IMAGE_EXTENSIONS
+        },
+    }
+}
+
+
+def get_upload_stream(
+    request: Request,
+    content_length: Optional[int] = Header(None, include_in_schema=False),
+) -> AsyncIterator[bytes]:
+    """
+    Função de dependência que retorna o corpo da requisição como um fluxo de blocos.
+
+    O corpo nunca é carregado inteiro na memória. Quando o cliente informa
+    `Content-Length`, uploads grandes demais são recusados antes de ler o corpo;
+    sem ele, o limite é aplicado durante a leitura.
+
+    :param request: A requisição em andamento.
+    :type request: Request
+    :param content_length: O tamanho declarado do corpo, se enviado.
+    :type content_length: Optional[int]
+    :raises PayloadTooLargeError: Se o corpo declarado exceder `IMAGE_UPLOAD_MAX_BYTES`.
+    :return: Um iterador assíncrono dos blocos do corpo.
+    :rtype: AsyncIterator[bytes]
+    """
+    if content_length is not None and content_length > settings.IMAGE_UPLOAD_MAX_BYTES:
+        raise PayloadTooLargeError(max_bytes=settings.IMAGE_UPLOAD_MAX_BYTES)
+    return request.stream()
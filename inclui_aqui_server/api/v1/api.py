@@ -1,10 +1,27 @@
 from fastapi import APIRouter
 
-from inclui_aqui_server.api.v1.endpoints import auth_user
+from inclui_aqui_server.api.v1.endpoints import (
+    auth_user,
+    establishments,
+    leaderboard,
+    metrics,
+    reviews,
+    searches,
+    suggestions,
+)
 
 # cria roteador principal
 api_router_v1 = APIRouter()
 
+# Routers com prefixo fixo vêm antes de auth_user, cujas rotas na raiz
+# (ex.: GET /{user_id}) capturariam caminhos como /metrics.
+api_router_v1.include_router(metrics.router)
+api_router_v1.include_router(establishments.router)
+api_router_v1.include_router(reviews.router)
+api_router_v1.include_router(suggestions.router)
+api_router_v1.include_router(searches.router)
+api_router_v1.include_router(leaderboard.router)
+
 # Inclui o router do endpoint no roteador principal
 # Agora, todas as rotas de auth_user.router fazem parte de api_router_v1
 api_router_v1.include_router(auth_user.router)
@@ -1,10 +1,23 @@
 from http import HTTPStatus
-from fastapi import APIRouter, Depends, status
-from inclui_aqui_server.db.schemas import GenericResponseModel
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from inclui_aqui_server.db.schemas import GenericResponseModel, Status
 import uuid
 from inclui_aqui_server.api.dependencies import get_user_service
+from inclui_aqui_server.core.http_cache import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_validators,
+)
 from inclui_aqui_server.services.user import UserService
-from inclui_aqui_server.db.schemas.user_schema import UserRead, UserCreate
+from inclui_aqui_server.db.schemas.user_schema import (
+    UserBulkCreate,
+    UserBulkCreateResult,
+    UserCreate,
+    UserRead,
+    UserSearchRead,
+)
 
 
 router = APIRouter(
@@ -53,9 +66,97 @@ async def create_new_user(
     created_user = await user_service.create_user(user_in)
     return created_user
 
-@router.get("/{user_id}", response_model=UserRead, summary="Busca um usuário por ID")
+@router.post(
+    "/bulk",
+    response_model=UserBulkCreateResult,
+    summary="Cria usuários em lote"
+)
+async def create_users_in_bulk(
+    users_in: UserBulkCreate,
+    user_service: UserService = Depends(get_user_service)
+):
+    """
+    Cria vários usuários em uma única requisição.
+
+    Usuários cujo email ou nome de usuário já existam não interrompem o lote:
+    eles são retornados em `conflicts` com sua posição na lista enviada.
+
+    :param users_in: A lista de usuários a serem criados.
+    :type users_in: UserBulkCreate
+    :param user_service: Instância do serviço de usuário injetada.
+    :type user_service: UserService
+    :return: Os usuários criados e os conflitos encontrados.
+    :rtype: UserBulkCreateResult
+    """
+    return await user_service.create_users(users_in.users)
+
+@router.get(
+    "/",
+    response_model=GenericResponseModel[List[UserRead]],
+    summary="Lista usuários com paginação por cursor"
+)
+async def list_users(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
+    user_service: UserService = Depends(get_user_service)
+):
+    """
+    Lista usuários em ordem de criação.
+
+    Para obter a página seguinte, envie o `next_cursor` da resposta no parâmetro `cursor`.
+    A ausência de `next_cursor` indica a última página.
+
+    :param limit: O número máximo de usuários por página.
+    :type limit: int
+    :param cursor: O cursor da página anterior.
+    :type cursor: Optional[str]
+    :param user_service: Instância do serviço de usuário injetada.
+    :type user_service: UserService
+    :return: A página de usuários e o cursor da próxima página.
+    :rtype: GenericResponseModel[List[UserRead]]
+    """
+    users, next_cursor = await user_service.get_users(limit=limit, cursor=cursor)
+    return GenericResponseModel(
+        status=Status.SUCCESS,
+        data=[UserRead.model_validate(user) for user in users],
+        next_cursor=next_cursor,
+    )
+
+@router.get(
+    "/{user_id}/searches",
+    response_model=GenericResponseModel[List[UserSearchRead]],
+    summary="Lista as buscas recentes de um usuário"
+)
+async def list_recent_searches(
+    user_id: uuid.UUID,
+    limit: int = Query(20, ge=1, le=100),
+    user_service: UserService = Depends(get_user_service)
+):
+    """
+    Retorna as buscas mais recentes de um usuário, da mais nova à mais antiga.
+
+    :param user_id: O ID do usuário.
+    :type user_id: uuid.UUID
+    :param limit: O número máximo de buscas.
+    :type limit: int
+    :param user_service: Instância do serviço de usuário injetada.
+    :type user_service: UserService
+    :return: As buscas recentes.
+    :rtype: GenericResponseModel[List[UserSearchRead]]
+    """
+    searches = await user_service.get_recent_searches(user_id, limit=limit)
+    return GenericResponseModel(status=Status.SUCCESS, data=searches)
+
+@router.get(
+    "/{user_id}",
+    response_model=UserRead,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "A cópia do cliente ainda é atual"}},
+    summary="Busca um usuário por ID"
+)
 async def get_user_by_id(
     user_id: uuid.UUID,
+    request: Request,
+    response: Response,
     user_service: UserService = Depends(get_user_service)
 ):
     """
@@ -64,12 +165,27 @@ async def get_user_by_id(
     Se o usuário não for encontrado, o serviço levantará uma exceção `NotFoundError`,
     que será capturada pelo handler global e retornará um erro HTTP 404.
 
+    A resposta traz `ETag` e `Last-Modified`, derivados de `id` e `updated_at`.
+    Requisições com `If-None-Match` ou `If-Modified-Since` são validadas apenas
+    pela versão do usuário e recebem 304, sem corpo, se a cópia do cliente for atual.
+
     :param user_id: O ID do usuário a ser buscado.
     :type user_id: uuid.UUID
+    :param request: A requisição, de onde são lidos os cabeçalhos condicionais.
+    :type request: Request
+    :param response: A resposta, onde são gravados os validadores.
+    :type response: Response
     :param user_service: Instância do serviço de usuário injetada.
     :type user_service: UserService
     :return: Os dados do usuário encontrado.
     :rtype: UserReadSchema
     """
+    if "if-none-match" in request.headers or "if-modified-since" in request.headers:
+        updated_at = await user_service.get_user_version(user_id)
+        etag = make_etag(user_id, updated_at)
+        if is_not_modified(request.headers, etag, updated_at):
+            return not_modified_response(etag, updated_at)
+
     user = await user_service.get_user(user_id)
-    return user
\ No newline at end of file
+    set_validators(response, make_etag(user.id, user.updated_at), user.updated_at)
+    return user
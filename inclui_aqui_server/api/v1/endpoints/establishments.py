@@ -0,0 +1,510 @@
+import io
+import os
+import uuid
+from typing import AsyncIterator, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, UploadFile, status
+
+from inclui_aqui_server.api.dependencies import (
+    IMAGE_UPLOAD_OPENAPI,
+    get_establishment_service,
+    get_image_service,
+    get_review_service,
+    get_upload_stream,
+)
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.exception import BadRequestError
+from inclui_aqui_server.core.http_cache import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_validators,
+)
+from inclui_aqui_server.db.schemas import (
+    EstablishmentAccessibilityUpdate,
+    EstablishmentApprovalUpdate,
+    EstablishmentDetail,
+    EstablishmentImportReport,
+    EstablishmentLocationUpdate,
+    EstablishmentNearby,
+    EstablishmentRatingSummary,
+    EstablishmentRead,
+    EstablishmentSearchResult,
+    EstablishmentSuggestion,
+    GenericResponseModel,
+    ImageUploadResult,
+    MapClusters,
+    Status,
+)
+from inclui_aqui_server.services.establishment import EstablishmentService
+from inclui_aqui_server.services.establishment_import import IMPORT_FORMAT_SUFFIXES
+from inclui_aqui_server.services.image import ImageService
+from inclui_aqui_server.services.review import ReviewService
+
+router = APIRouter(
+    prefix='/establishments',
+    tags=['Establishments'],  # Agrupa na documentação /docs
+)
+
+
+@router.get(
+    '/nearby',
+    response_model=GenericResponseModel[List[EstablishmentNearby]],
+    summary='Busca estabelecimentos próximos a um ponto',
+)
+async def search_nearby_establishments(
+    latitude: float = Query(ge=-90, le=90),
+    longitude: float = Query(ge=-180, le=180),
+    radius_m: float = Query(1000, gt=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Lista os estabelecimentos aprovados dentro de um raio, do mais próximo ao mais distante.
+
+    Para obter a página seguinte, envie o `next_cursor` da resposta no parâmetro `cursor`.
+
+    :param latitude: Latitude do centro da busca.
+    :type latitude: float
+    :param longitude: Longitude do centro da busca.
+    :type longitude: float
+    :param radius_m: O raio da busca em metros.
+    :type radius_m: float
+    :param limit: O número máximo de estabelecimentos por página.
+    :type limit: int
+    :param cursor: O cursor da página anterior.
+    :type cursor: Optional[str]
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: A página de estabelecimentos com a distância de cada um.
+    :rtype: GenericResponseModel[List[EstablishmentNearby]]
+    """
+    establishments, next_cursor = await establishment_service.search_nearby(
+        latitude=latitude, longitude=longitude, radius_m=radius_m, limit=limit, cursor=cursor
+    )
+    return GenericResponseModel(
+        status=Status.SUCCESS, data=establishments, next_cursor=next_cursor
+    )
+
+
+@router.get(
+    '/nearest',
+    response_model=GenericResponseModel[List[EstablishmentNearby]],
+    summary='Busca os k estabelecimentos mais próximos de um ponto',
+)
+async def find_nearest_establishments(
+    latitude: float = Query(ge=-90, le=90),
+    longitude: float = Query(ge=-180, le=180),
+    k: int = Query(10, ge=1, le=100),
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Retorna os k estabelecimentos aprovados mais próximos, do mais próximo ao mais distante.
+
+    :param latitude: Latitude do ponto de referência.
+    :type latitude: float
+    :param longitude: Longitude do ponto de referência.
+    :type longitude: float
+    :param k: Quantidade de estabelecimentos desejada.
+    :type k: int
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: Os estabelecimentos encontrados com a distância de cada um.
+    :rtype: GenericResponseModel[List[EstablishmentNearby]]
+    """
+    establishments = await establishment_service.find_nearest(
+        latitude=latitude, longitude=longitude, k=k
+    )
+    return GenericResponseModel(status=Status.SUCCESS, data=establishments)
+
+
+@router.get(
+    '/search',
+    response_model=GenericResponseModel[List[EstablishmentSearchResult]],
+    summary='Busca estabelecimentos por nome, endereço ou tipo',
+)
+async def search_establishments(
+    q: str = Query(min_length=1, max_length=100),
+    type: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    user_id: Optional[uuid.UUID] = None,
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Busca textual tolerante a erros de digitação sobre os estabelecimentos aprovados.
+
+    :param q: O texto buscado.
+    :type q: str
+    :param type: Filtra pelo tipo do estabelecimento.
+    :type type: Optional[str]
+    :param limit: O número máximo de resultados.
+    :type limit: int
+    :param user_id: O usuário que fez a busca; se informado, a busca entra no seu histórico.
+    :type user_id: Optional[uuid.UUID]
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: Os estabelecimentos encontrados, do mais relevante ao menos relevante.
+    :rtype: GenericResponseModel[List[EstablishmentSearchResult]]
+    """
+    establishments = await establishment_service.search(
+        query=q, type=type, limit=limit, user_id=user_id
+    )
+    return GenericResponseModel(status=Status.SUCCESS, data=establishments)
+
+
+@router.get(
+    '/autocomplete',
+    response_model=GenericResponseModel[List[EstablishmentSuggestion]],
+    summary='Sugestões de estabelecimentos enquanto o usuário digita',
+)
+async def autocomplete_establishments(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Retorna sugestões leves (id, nome, endereço e tipo) para o texto digitado.
+
+    :param q: O texto digitado até o momento.
+    :type q: str
+    :param limit: O número máximo de sugestões.
+    :type limit: int
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: As sugestões, da mais relevante à menos relevante.
+    :rtype: GenericResponseModel[List[EstablishmentSuggestion]]
+    """
+    suggestions = await establishment_service.autocomplete(query=q, limit=limit)
+    return GenericResponseModel(status=Status.SUCCESS, data=suggestions)
+
+
+@router.get(
+    '/accessible',
+    response_model=GenericResponseModel[List[EstablishmentRead]],
+    summary='Filtra estabelecimentos por critérios de acessibilidade',
+)
+async def filter_accessible_establishments(
+    criteria: List[str] = Query(min_length=1, max_length=63),
+    match: Literal['all', 'any'] = 'all',
+    region: Optional[str] = Query(None, pattern='^[0-9b-hjkmnp-z]{1,12}$'),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Lista os estabelecimentos aprovados que atendem a todos (`match=all`) ou a
+    algum (`match=any`) dos critérios informados.
+
+    :param criteria: Os nomes dos critérios de acessibilidade (repita o parâmetro para vários).
+    :type criteria: List[str]
+    :param match: `all` para exigir todos os critérios, `any` para ao menos um.
+    :type match: str
+    :param region: Prefixo de geohash que restringe a busca a uma região.
+    :type region: Optional[str]
+    :param limit: O número máximo de estabelecimentos por página.
+    :type limit: int
+    :param cursor: O cursor da página anterior.
+    :type cursor: Optional[str]
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: A página de estabelecimentos encontrados.
+    :rtype: GenericResponseModel[List[EstablishmentRead]]
+    """
+    establishments, next_cursor = await establishment_service.filter_by_accessibility(
+        criteria=criteria,
+        match_all=match == 'all',
+        region=region,
+        limit=limit,
+        cursor=cursor,
+    )
+    return GenericResponseModel(
+        status=Status.SUCCESS, data=establishments, next_cursor=next_cursor
+    )
+
+
+@router.get(
+    '/clusters',
+    response_model=GenericResponseModel[MapClusters],
+    summary='Agrupa os estabelecimentos visíveis em uma área do mapa',
+)
+async def get_map_clusters(
+    min_latitude: float = Query(ge=-90, le=90),
+    min_longitude: float = Query(ge=-180, le=180),
+    max_latitude: float = Query(ge=-90, le=90),
+    max_longitude: float = Query(ge=-180, le=180),
+    zoom: int = Query(ge=0, le=22),
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Retorna os grupos de estabelecimentos aprovados (centroide e quantidade) visíveis
+    no retângulo, ou os estabelecimentos individuais nos zooms mais próximos.
+
+    Se `min_longitude` for maior que `max_longitude`, o retângulo cruza o antimeridiano.
+
+    :param min_latitude: Latitude da borda sul.
+    :type min_latitude: float
+    :param min_longitude: Longitude da borda oeste.
+    :type min_longitude: float
+    :param max_latitude: Latitude da borda norte.
+    :type max_latitude: float
+    :param max_longitude: Longitude da borda leste.
+    :type max_longitude: float
+    :param zoom: O zoom do mapa.
+    :type zoom: int
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: Os grupos ou os estabelecimentos da área.
+    :rtype: GenericResponseModel[MapClusters]
+    """
+    clusters = await establishment_service.get_map_clusters(
+        min_latitude=min_latitude,
+        min_longitude=min_longitude,
+        max_latitude=max_latitude,
+        max_longitude=max_longitude,
+        zoom=zoom,
+    )
+    return GenericResponseModel(status=Status.SUCCESS, data=clusters)
+
+
+@router.put(
+    '/{establishment_id}/approval',
+    response_model=GenericResponseModel[EstablishmentRead],
+    summary='Aprova ou reprova um estabelecimento (admin)',
+)
+async def update_establishment_approval(
+    establishment_id: uuid.UUID,
+    approval_in: EstablishmentApprovalUpdate,
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Altera o estado de aprovação de um estabelecimento.
+
+    :param establishment_id: O ID do estabelecimento.
+    :type establishment_id: uuid.UUID
+    :param approval_in: O novo estado de aprovação.
+    :type approval_in: EstablishmentApprovalUpdate
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: O estabelecimento atualizado.
+    :rtype: GenericResponseModel[EstablishmentRead]
+    """
+    establishment = await establishment_service.set_approval(establishment_id, approval_in)
+    return GenericResponseModel(status=Status.SUCCESS, data=establishment)
+
+
+@router.put(
+    '/{establishment_id}/location',
+    response_model=GenericResponseModel[EstablishmentRead],
+    summary='Altera a localização de um estabelecimento',
+)
+async def update_establishment_location(
+    establishment_id: uuid.UUID,
+    location_in: EstablishmentLocationUpdate,
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Move um estabelecimento para novas coordenadas.
+
+    :param establishment_id: O ID do estabelecimento.
+    :type establishment_id: uuid.UUID
+    :param location_in: As novas coordenadas.
+    :type location_in: EstablishmentLocationUpdate
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: O estabelecimento atualizado.
+    :rtype: GenericResponseModel[EstablishmentRead]
+    """
+    establishment = await establishment_service.move_establishment(establishment_id, location_in)
+    return GenericResponseModel(status=Status.SUCCESS, data=establishment)
+
+
+@router.put(
+    '/{establishment_id}/accessibility',
+    response_model=GenericResponseModel[EstablishmentRead],
+    summary='Atualiza os critérios de acessibilidade de um estabelecimento',
+)
+async def update_establishment_accessibility(
+    establishment_id: uuid.UUID,
+    features_in: EstablishmentAccessibilityUpdate,
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Substitui os critérios de acessibilidade de um estabelecimento.
+
+    :param establishment_id: O ID do estabelecimento.
+    :type establishment_id: uuid.UUID
+    :param features_in: Os critérios atendidos (ou não) pelo estabelecimento.
+    :type features_in: EstablishmentAccessibilityUpdate
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: O estabelecimento atualizado.
+    :rtype: GenericResponseModel[EstablishmentRead]
+    """
+    establishment = await establishment_service.set_accessibility_features(
+        establishment_id, features_in
+    )
+    return GenericResponseModel(status=Status.SUCCESS, data=establishment)
+
+
+@router.get(
+    '/{establishment_id}',
+    response_model=GenericResponseModel[EstablishmentDetail],
+    responses={304: {'description': 'A cópia do cliente ainda é atual'}},
+    summary='Detalhe de um estabelecimento com imagens e avaliações',
+)
+async def get_establishment_detail(
+    establishment_id: uuid.UUID,
+    request: Request,
+    images_limit: int = Query(settings.ESTABLISHMENT_DETAIL_MAX_IMAGES, ge=0),
+    reviews_limit: int = Query(settings.ESTABLISHMENT_DETAIL_MAX_REVIEWS, ge=0),
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Retorna o estabelecimento com seu dono, as imagens aprovadas e as avaliações
+    mais recentes (com autor e quantidade de comentários).
+
+    O `ETag` é derivado da versão do detalhe (datas de alteração e contagens de
+    todas as tabelas envolvidas), lida em uma única consulta antes do detalhe:
+    com `If-None-Match` atual, a resposta é 304 sem que o detalhe seja montado.
+
+    :param establishment_id: O ID do estabelecimento.
+    :type establishment_id: uuid.UUID
+    :param request: A requisição, de onde são lidos os cabeçalhos condicionais.
+    :type request: Request
+    :param images_limit: Quantidade máxima de imagens (limitada pela configuração do servidor).
+    :type images_limit: int
+    :param reviews_limit: Quantidade máxima de avaliações (limitada pela configuração do servidor).
+    :type reviews_limit: int
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: O detalhe do estabelecimento.
+    :rtype: GenericResponseModel[EstablishmentDetail]
+    """
+    version = await establishment_service.get_detail_version(establishment_id)
+    etag = make_etag(establishment_id, images_limit, reviews_limit, *version)
+    if is_not_modified(request.headers, etag):
+        return not_modified_response(etag)
+
+    establishment = await establishment_service.get_detail(
+        establishment_id, images_limit=images_limit, reviews_limit=reviews_limit
+    )
+    body = GenericResponseModel[EstablishmentDetail](
+        status=Status.SUCCESS, data=establishment
+    ).model_dump_json().encode()
+    response = Response(content=body, media_type='application/json')
+    set_validators(response, etag)
+    return response
+
+
+@router.get(
+    '/{establishment_id}/ratings',
+    response_model=GenericResponseModel[EstablishmentRatingSummary],
+    summary='Resumo das avaliações de um estabelecimento',
+)
+async def get_establishment_ratings(
+    establishment_id: uuid.UUID,
+    review_service: ReviewService = Depends(get_review_service),
+):
+    """
+    Retorna a quantidade de avaliações, a média, o histograma das notas e a média
+    de cada critério, lidos dos agregados mantidos a cada avaliação.
+
+    :param establishment_id: O ID do estabelecimento.
+    :type establishment_id: uuid.UUID
+    :param review_service: Instância do serviço de avaliações injetada.
+    :type review_service: ReviewService
+    :return: O resumo das avaliações.
+    :rtype: GenericResponseModel[EstablishmentRatingSummary]
+    """
+    summary = await review_service.get_rating_summary(establishment_id)
+    return GenericResponseModel(status=Status.SUCCESS, data=summary)
+
+
+@router.post(
+    '/{establishment_id}/images',
+    response_model=GenericResponseModel[ImageUploadResult],
+    status_code=status.HTTP_201_CREATED,
+    summary='Envia uma imagem de um estabelecimento',
+    openapi_extra=IMAGE_UPLOAD_OPENAPI,
+)
+async def upload_establishment_image(
+    establishment_id: uuid.UUID,
+    user_id: Optional[uuid.UUID] = None,
+    description: Optional[str] = Query(None, max_length=500),
+    content_type: Optional[str] = Header(None),
+    chunks: AsyncIterator[bytes] = Depends(get_upload_stream),
+    image_service: ImageService = Depends(get_image_service),
+):
+    """
+    Recebe uma imagem JPEG, PNG ou WebP no corpo da requisição (sem multipart).
+
+    O arquivo é gravado no armazenamento à medida que chega, então a memória
+    usada não depende do seu tamanho. Arquivos idênticos são armazenados uma
+    única vez; os thumbnails são gerados em segundo plano.
+
+    :param establishment_id: O ID do estabelecimento.
+    :type establishment_id: uuid.UUID
+    :param user_id: O usuário que enviou a imagem.
+    :type user_id: Optional[uuid.UUID]
+    :param description: A descrição da imagem.
+    :type description: Optional[str]
+    :param content_type: O tipo da imagem (`image/jpeg`, `image/png` ou `image/webp`).
+    :type content_type: Optional[str]
+    :param chunks: O corpo da requisição, bloco a bloco.
+    :type chunks: AsyncIterator[bytes]
+    :param image_service: Instância do serviço de imagens injetada.
+    :type image_service: ImageService
+    :return: A imagem registrada e as URLs dos thumbnails.
+    :rtype: GenericResponseModel[ImageUploadResult]
+    """
+    image = await image_service.upload_establishment_image(
+        establishment_id, chunks, content_type, user_id=user_id, description=description
+    )
+    return GenericResponseModel(status=Status.SUCCESS, data=image)
+
+
+@router.post(
+    '/import',
+    response_model=GenericResponseModel[EstablishmentImportReport],
+    summary='Importa estabelecimentos de um arquivo CSV ou NDJSON (admin)',
+)
+async def import_establishments(
+    file: UploadFile,
+    owner_id: uuid.UUID,
+    format: Optional[Literal['csv', 'ndjson']] = None,
+    approve: bool = False,
+    establishment_service: EstablishmentService = Depends(get_establishment_service),
+):
+    """
+    Insere ou atualiza estabelecimentos em lote, deduplicando pelo `google_place_id`.
+
+    O arquivo é processado em lotes, sem ser carregado inteiro na memória.
+    Linhas inválidas são rejeitadas individualmente e listadas no relatório.
+
+    :param file: O arquivo CSV (com cabeçalho) ou NDJSON.
+    :type file: UploadFile
+    :param owner_id: O usuário que será dono dos estabelecimentos inseridos.
+    :type owner_id: uuid.UUID
+    :param format: O formato do arquivo; por padrão, deduzido da extensão.
+    :type format: Optional[str]
+    :param approve: Se True, os estabelecimentos inseridos já entram aprovados.
+    :type approve: bool
+    :param establishment_service: Instância do serviço de estabelecimentos injetada.
+    :type establishment_service: EstablishmentService
+    :return: O relatório com inseridos, atualizados, inalterados, rejeitados e vazão.
+    :rtype: GenericResponseModel[EstablishmentImportReport]
+    """
+    fmt = format or IMPORT_FORMAT_SUFFIXES.get(os.path.splitext(file.filename or '')[1].lower())
+    if fmt is None:
+        raise BadRequestError(detail='Could not infer the file format; use format=csv or format=ndjson.')
+
+    stream = io.TextIOWrapper(file.file, encoding='utf-8-sig', newline='')
+    try:
+        report = await establishment_service.import_establishments(
+            stream, fmt, owner_id=owner_id, approve=approve
+        )
+    finally:
+        # Devolve o arquivo ao UploadFile, que é responsável por fechá-lo
+        stream.detach()
+    return GenericResponseModel(status=Status.SUCCESS, data=report)
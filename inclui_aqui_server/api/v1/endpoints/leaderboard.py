@@ -0,0 +1,86 @@
+import uuid
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+
+from inclui_aqui_server.api.dependencies import get_leaderboard_service
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.db.schemas import GenericResponseModel, LeaderboardEntry, Status
+from inclui_aqui_server.services.leaderboard import LeaderboardService
+
+router = APIRouter(
+    prefix='/leaderboard',
+    tags=['Leaderboard'],  # Agrupa na documentação /docs
+)
+
+
+@router.get(
+    '',
+    response_model=GenericResponseModel[List[LeaderboardEntry]],
+    summary='Usuários com mais pontos',
+)
+async def get_leaderboard(
+    limit: int = Query(settings.LEADERBOARD_MAX_TOP, ge=1, le=settings.LEADERBOARD_MAX_TOP),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+):
+    """
+    Retorna os primeiros colocados do ranking de pontos.
+
+    :param limit: O número máximo de usuários.
+    :type limit: int
+    :param leaderboard_service: Instância do serviço de ranking injetada.
+    :type leaderboard_service: LeaderboardService
+    :return: Os usuários, do primeiro colocado em diante.
+    :rtype: GenericResponseModel[List[LeaderboardEntry]]
+    """
+    entries = await leaderboard_service.get_top(limit=limit)
+    return GenericResponseModel(status=Status.SUCCESS, data=entries)
+
+
+@router.get(
+    '/users/{user_id}',
+    response_model=GenericResponseModel[LeaderboardEntry],
+    summary='Posição de um usuário no ranking',
+)
+async def get_user_rank(
+    user_id: uuid.UUID,
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+):
+    """
+    Retorna a posição e os pontos de um usuário.
+
+    :param user_id: O ID do usuário.
+    :type user_id: uuid.UUID
+    :param leaderboard_service: Instância do serviço de ranking injetada.
+    :type leaderboard_service: LeaderboardService
+    :return: A posição do usuário (empatados têm a mesma posição).
+    :rtype: GenericResponseModel[LeaderboardEntry]
+    """
+    entry = await leaderboard_service.get_user_rank(user_id)
+    return GenericResponseModel(status=Status.SUCCESS, data=entry)
+
+
+@router.get(
+    '/users/{user_id}/around',
+    response_model=GenericResponseModel[List[LeaderboardEntry]],
+    summary='Usuários próximos a um usuário no ranking',
+)
+async def get_users_around(
+    user_id: uuid.UUID,
+    radius: int = Query(5, ge=1, le=settings.LEADERBOARD_MAX_RADIUS),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service),
+):
+    """
+    Retorna o usuário e até `radius` usuários imediatamente acima e abaixo dele.
+
+    :param user_id: O ID do usuário.
+    :type user_id: uuid.UUID
+    :param radius: Quantidade de vizinhos de cada lado.
+    :type radius: int
+    :param leaderboard_service: Instância do serviço de ranking injetada.
+    :type leaderboard_service: LeaderboardService
+    :return: Os usuários, em ordem de ranking.
+    :rtype: GenericResponseModel[List[LeaderboardEntry]]
+    """
+    entries = await leaderboard_service.get_around(user_id, radius=radius)
+    return GenericResponseModel(status=Status.SUCCESS, data=entries)
@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+
+from inclui_aqui_server.core.security import password_handler
+from inclui_aqui_server.db.database import get_database_stats
+from inclui_aqui_server.db.schemas import GenericResponseModel, Status
+from inclui_aqui_server.services.accessibility import accessibility_region_index
+from inclui_aqui_server.services.image import thumbnail_pipeline
+from inclui_aqui_server.services.leaderboard import points_leaderboard
+from inclui_aqui_server.services.search_cache import search_result_cache
+from inclui_aqui_server.services.sentiment import sentiment_worker
+from inclui_aqui_server.services.telemetry import TELEMETRY_BUFFERS
+from inclui_aqui_server.services.trending import trending_searches
+from inclui_aqui_server.services.user import user_cache
+
+router = APIRouter(
+    prefix='/metrics',
+    tags=['Metrics'],  # Agrupa na documentação /docs
+)
+
+
+@router.get('', response_model=GenericResponseModel)
+def get_metrics():
+    """
+    Retorna métricas operacionais dos componentes internos do servidor.
+    """
+    return GenericResponseModel(
+        status=Status.SUCCESS,
+        data={
+            'password_hashing': password_handler.get_stats(),
+            'user_cache': user_cache.get_stats(),
+            'database': get_database_stats(),
+            'accessibility_regions': accessibility_region_index.get_stats(),
+            'search_cache': search_result_cache.get_stats(),
+            'sentiment': sentiment_worker.get_stats(),
+            'thumbnails': thumbnail_pipeline.get_stats(),
+            'telemetry': {buffer.name: buffer.get_stats() for buffer in TELEMETRY_BUFFERS},
+            'trending_searches': trending_searches.get_stats(),
+            'leaderboard': points_leaderboard.get_stats(),
+        },
+    )
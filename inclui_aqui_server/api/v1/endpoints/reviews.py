@@ -0,0 +1,138 @@
+import uuid
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, status
+
+from inclui_aqui_server.api.dependencies import (
+    IMAGE_UPLOAD_OPENAPI,
+    get_image_service,
+    get_review_service,
+    get_upload_stream,
+)
+from inclui_aqui_server.db.schemas import (
+    GenericResponseModel,
+    ImageUploadResult,
+    ReviewCreate,
+    ReviewRead,
+    ReviewUpdate,
+    Status,
+)
+from inclui_aqui_server.services.image import ImageService
+from inclui_aqui_server.services.review import ReviewService
+
+router = APIRouter(
+    prefix='/reviews',
+    tags=['Reviews'],  # Agrupa na documentação /docs
+)
+
+
+@router.post(
+    '',
+    response_model=GenericResponseModel[ReviewRead],
+    status_code=status.HTTP_201_CREATED,
+    summary='Cria uma avaliação de estabelecimento',
+)
+async def create_review(
+    review_in: ReviewCreate,
+    review_service: ReviewService = Depends(get_review_service),
+):
+    """
+    Cria uma avaliação; a média e a contagem do estabelecimento são atualizadas junto.
+
+    :param review_in: Os dados da nova avaliação.
+    :type review_in: ReviewCreate
+    :param review_service: Instância do serviço de avaliações injetada.
+    :type review_service: ReviewService
+    :return: A avaliação criada.
+    :rtype: GenericResponseModel[ReviewRead]
+    """
+    review = await review_service.create_review(review_in)
+    return GenericResponseModel(status=Status.SUCCESS, data=review)
+
+
+@router.patch(
+    '/{review_id}',
+    response_model=GenericResponseModel[ReviewRead],
+    summary='Atualiza uma avaliação',
+)
+async def update_review(
+    review_id: uuid.UUID,
+    review_in: ReviewUpdate,
+    review_service: ReviewService = Depends(get_review_service),
+):
+    """
+    Atualiza os campos enviados de uma avaliação.
+
+    :param review_id: O ID da avaliação.
+    :type review_id: uuid.UUID
+    :param review_in: Os campos a serem atualizados.
+    :type review_in: ReviewUpdate
+    :param review_service: Instância do serviço de avaliações injetada.
+    :type review_service: ReviewService
+    :return: A avaliação atualizada.
+    :rtype: GenericResponseModel[ReviewRead]
+    """
+    review = await review_service.update_review(review_id, review_in)
+    return GenericResponseModel(status=Status.SUCCESS, data=review)
+
+
+@router.delete(
+    '/{review_id}',
+    response_model=GenericResponseModel[ReviewRead],
+    summary='Remove uma avaliação',
+)
+async def delete_review(
+    review_id: uuid.UUID,
+    review_service: ReviewService = Depends(get_review_service),
+):
+    """
+    Remove uma avaliação.
+
+    :param review_id: O ID da avaliação.
+    :type review_id: uuid.UUID
+    :param review_service: Instância do serviço de avaliações injetada.
+    :type review_service: ReviewService
+    :return: A avaliação removida.
+    :rtype: GenericResponseModel[ReviewRead]
+    """
+    review = await review_service.delete_review(review_id)
+    return GenericResponseModel(status=Status.SUCCESS, data=review)
+
+
+@router.post(
+    '/{review_id}/images',
+    response_model=GenericResponseModel[ImageUploadResult],
+    status_code=status.HTTP_201_CREATED,
+    summary='Envia uma imagem de uma avaliação',
+    openapi_extra=IMAGE_UPLOAD_OPENAPI,
+)
+async def upload_review_image(
+    review_id: uuid.UUID,
+    user_id: Optional[uuid.UUID] = None,
+    description: Optional[str] = Query(None, max_length=500),
+    content_type: Optional[str] = Header(None),
+    chunks: AsyncIterator[bytes] = Depends(get_upload_stream),
+    image_service: ImageService = Depends(get_image_service),
+):
+    """
+    Recebe uma imagem JPEG, PNG ou WebP no corpo da requisição (sem multipart).
+
+    :param review_id: O ID da avaliação.
+    :type review_id: uuid.UUID
+    :param user_id: O usuário que enviou a imagem.
+    :type user_id: Optional[uuid.UUID]
+    :param description: A descrição da imagem.
+    :type description: Optional[str]
+    :param content_type: O tipo da imagem (`image/jpeg`, `image/png` ou `image/webp`).
+    :type content_type: Optional[str]
+    :param chunks: O corpo da requisição, bloco a bloco.
+    :type chunks: AsyncIterator[bytes]
+    :param image_service: Instância do serviço de imagens injetada.
+    :type image_service: ImageService
+    :return: A imagem registrada e as URLs dos thumbnails.
+    :rtype: GenericResponseModel[ImageUploadResult]
+    """
+    image = await image_service.upload_review_image(
+        review_id, chunks, content_type, user_id=user_id, description=description
+    )
+    return GenericResponseModel(status=Status.SUCCESS, data=image)
@@ -0,0 +1,53 @@
+from typing import List
+
+from fastapi import APIRouter, Query
+
+from inclui_aqui_server.db.schemas import GenericResponseModel, Status, TrendingSearch
+from inclui_aqui_server.services.trending import trending_searches
+
+router = APIRouter(
+    prefix='/searches',
+    tags=['Searches'],  # Agrupa na documentação /docs
+)
+
+
+@router.get(
+    '/trending',
+    response_model=GenericResponseModel[List[TrendingSearch]],
+    summary='Buscas em alta',
+)
+async def get_trending_searches(limit: int = Query(10, ge=1, le=50)):
+    """
+    Retorna as buscas mais frequentes nas últimas horas (buscas recentes pesam mais).
+
+    Servido da memória, sem acessar o banco; as contagens são aproximadas e
+    acompanham o histórico de buscas com alguns segundos de atraso.
+
+    :param limit: O número máximo de buscas.
+    :type limit: int
+    :return: As buscas, da maior à menor pontuação.
+    :rtype: GenericResponseModel[List[TrendingSearch]]
+    """
+    return GenericResponseModel(status=Status.SUCCESS, data=trending_searches.top(limit))
+
+
+@router.get(
+    '/autocomplete',
+    response_model=GenericResponseModel[List[TrendingSearch]],
+    summary='Completa o texto digitado com buscas em alta',
+)
+async def autocomplete_searches(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+):
+    """
+    Retorna as buscas em alta que começam com o texto digitado.
+
+    :param q: O texto digitado até o momento.
+    :type q: str
+    :param limit: O número máximo de buscas.
+    :type limit: int
+    :return: As buscas, da maior à menor pontuação.
+    :rtype: GenericResponseModel[List[TrendingSearch]]
+    """
+    return GenericResponseModel(status=Status.SUCCESS, data=trending_searches.complete(q, limit))
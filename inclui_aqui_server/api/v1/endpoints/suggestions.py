@@ -0,0 +1,36 @@
+import uuid
+
+from fastapi import APIRouter, status
+
+from inclui_aqui_server.db.schemas import GenericResponseModel, Status, SuggestionFeedbackCreate
+from inclui_aqui_server.services.telemetry import record_feedback
+
+router = APIRouter(
+    prefix='/suggestions',
+    tags=['Suggestions'],  # Agrupa na documentação /docs
+)
+
+
+@router.post(
+    '/{suggestion_id}/feedback',
+    response_model=GenericResponseModel,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary='Registra o feedback sobre uma sugestão',
+)
+async def create_suggestion_feedback(
+    suggestion_id: uuid.UUID,
+    feedback_in: SuggestionFeedbackCreate,
+):
+    """
+    Registra se uma sugestão foi útil. A gravação é feita em lote, em segundo
+    plano: a resposta não espera o banco de dados.
+
+    :param suggestion_id: O ID da sugestão.
+    :type suggestion_id: uuid.UUID
+    :param feedback_in: O tipo do feedback e o comentário opcional.
+    :type feedback_in: SuggestionFeedbackCreate
+    :return: Confirmação do recebimento.
+    :rtype: GenericResponseModel
+    """
+    record_feedback(suggestion_id, feedback_in.feedback_type, feedback_in.feedback_comment)
+    return GenericResponseModel(status=Status.SUCCESS, message='Feedback received')
@@ -1,16 +1,23 @@
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
 
 from inclui_aqui_server.api.v1.api import api_router_v1
 from inclui_aqui_server.core.config import settings
 from inclui_aqui_server.db.schemas import GenericResponseModel, Status
 from inclui_aqui_server.core.exception import AppException
+from inclui_aqui_server.core.security import password_handler
+from inclui_aqui_server.db.database import dispose_engines, primary_pin_middleware
+from inclui_aqui_server.services.image import thumbnail_pipeline
+from inclui_aqui_server.services.leaderboard import points_leaderboard
+from inclui_aqui_server.services.search_history import ensure_search_history_partitions
+from inclui_aqui_server.services.sentiment import sentiment_worker
+from inclui_aqui_server.services.telemetry import TELEMETRY_BUFFERS
+from inclui_aqui_server.services.trending import trending_searches
 
-app = FastAPI(title=settings.PROJECT_NAME)
-
-@app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
     """
     Captura todas as exceções que herdam de AppException e retorna
@@ -45,17 +52,67 @@ servers = [
     },
 ]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida da aplicação: inicia os workers em segundo plano e libera os
+    recursos compartilhados no desligamento.
+    """
+    if settings.SEARCH_HISTORY_ENSURE_PARTITIONS_ON_STARTUP:
+        await ensure_search_history_partitions()
+    if settings.SENTIMENT_WORKER_ENABLED:
+        sentiment_worker.start()
+    for buffer in TELEMETRY_BUFFERS:
+        buffer.start()
+    if settings.TRENDING_ENABLED:
+        # Restaura o snapshot e acompanha o histórico de buscas em segundo plano
+        trending_searches.start()
+    if settings.LEADERBOARD_ENABLED:
+        # Carrega o ranking de pontos em segundo plano; até lá, as rotas respondem 503
+        points_leaderboard.start()
+    yield
+    await sentiment_worker.stop()
+    await points_leaderboard.stop()
+    # Grava o snapshot das buscas em alta
+    await trending_searches.stop()
+    # Cancela os thumbnails pendentes e encerra o pool de processos
+    await thumbnail_pipeline.shutdown()
+    # Grava a telemetria ainda em memória antes de fechar os pools do banco
+    for buffer in TELEMETRY_BUFFERS:
+        await buffer.stop()
+    # Encerra os workers do pool de hashing de senhas
+    password_handler.shutdown()
+    # Fecha as conexões dos pools do banco
+    await dispose_engines()
+
+
 # 2. Crie a instância do FastAPI com os novos parâmetros
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f'{settings.API_V1_STR}/openapi.json',
     servers=servers,
     root_path=settings.API_V1_STR,
+    lifespan=lifespan,
 )
 
+# Registra o handler global na instância efetivamente servida
+app.add_exception_handler(AppException, app_exception_handler)
+
+# Fixa no primário, por alguns segundos, os clientes que acabaram de escrever
+app.middleware('http')(primary_pin_middleware)
+
 # Inclui todas as rotas da V1 na aplicação
 app.include_router(api_router_v1)
 
+# Em desenvolvimento, as imagens do armazenamento local são servidas pela própria aplicação
+if settings.OBJECT_STORE_BACKEND == 'local' and settings.OBJECT_STORE_BASE_URL.startswith('/'):
+    app.mount(
+        settings.OBJECT_STORE_BASE_URL,
+        StaticFiles(directory=settings.OBJECT_STORE_LOCAL_ROOT, check_dir=False),
+        name='media',
+    )
+
 
 @app.get('/', response_model=GenericResponseModel)
 def health_check():
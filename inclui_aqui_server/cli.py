@@ -0,0 +1,259 @@
+"""
+Comandos de manutenção executados fora do servidor.
+
+Uso: python -m inclui_aqui_server.cli <comando> [opções]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from typing import List, Optional
+
+from inclui_aqui_server.core.accessibility import AccessibilityEncoder
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.crud import (
+    accessibility_criteria_crud,
+    establishment_crud,
+    map_cell_crud,
+    review_crud,
+)
+from inclui_aqui_server.db.database import AsyncSessionLocal, dispose_engines
+from inclui_aqui_server.services.establishment import EstablishmentService
+from inclui_aqui_server.services.establishment_import import IMPORT_FORMAT_SUFFIXES
+from inclui_aqui_server.services.search_history import maintain_search_history_partitions
+from inclui_aqui_server.services.suggestion import SuggestionEngine
+from inclui_aqui_server.services.telemetry import benchmark_search_history
+
+
+async def backfill_accessibility(args: argparse.Namespace) -> None:
+    """
+    Atribui ordinais aos critérios novos e recalcula `accessibility_mask` a partir do JSON.
+
+    Pode ser executado novamente a qualquer momento: o resultado só depende do
+    JSON gravado e do catálogo.
+    """
+    started_at = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        assigned = await accessibility_criteria_crud.assign_missing_ordinals(db)
+        await db.commit()
+        encoder = AccessibilityEncoder(await accessibility_criteria_crud.get_ordinals(db))
+
+        total = 0
+        last_id = None
+        while True:
+            rows = await establishment_crud.get_features_batch(
+                db, after_id=last_id, limit=args.batch_size
+            )
+            if not rows:
+                break
+            await establishment_crud.update_masks(db, [
+                {'establishment_id': row.id, 'mask': encoder.encode(row.accessibility_features_json)}
+                for row in rows
+            ])
+            await db.commit()
+            total += len(rows)
+            last_id = rows[-1].id
+
+    elapsed = time.perf_counter() - started_at
+    print(
+        f'{assigned} criteria received an ordinal; '
+        f'{total} establishments updated in {elapsed:.1f}s.'
+    )
+
+
+async def recompute_ratings(args: argparse.Namespace) -> None:
+    """
+    Reconstrói os agregados de avaliações a partir da tabela `reviews`.
+
+    Corrige desvios dos contadores incrementais (ex.: avaliações alteradas
+    diretamente no banco). As escritas em `reviews` aguardam o término.
+    """
+    started_at = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        establishments, criteria = await review_crud.recompute_aggregates(db)
+        await db.commit()
+
+    elapsed = time.perf_counter() - started_at
+    print(
+        f'Rating aggregates rebuilt for {establishments} establishments '
+        f'({criteria} criteria rows) in {elapsed:.1f}s.'
+    )
+
+
+async def rebuild_map_cells(args: argparse.Namespace) -> None:
+    """
+    Reconstrói as células de clusters do mapa a partir dos estabelecimentos aprovados.
+    """
+    started_at = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        cells = await map_cell_crud.rebuild(db, batch_size=args.batch_size)
+        await db.commit()
+
+    elapsed = time.perf_counter() - started_at
+    print(f'{cells} map cells rebuilt in {elapsed:.1f}s.')
+
+
+async def import_establishments(args: argparse.Namespace) -> None:
+    """
+    Importa estabelecimentos de um arquivo CSV ou NDJSON, deduplicando pelo `google_place_id`.
+    """
+    fmt = args.format or IMPORT_FORMAT_SUFFIXES.get(os.path.splitext(args.path)[1].lower())
+    if fmt is None:
+        raise SystemExit('Could not infer the file format; use --format csv|ndjson.')
+
+    async with AsyncSessionLocal() as db:
+        with open(args.path, encoding='utf-8-sig', newline='') as stream:
+            report = await EstablishmentService(db).import_establishments(
+                stream,
+                fmt,
+                owner_id=args.owner_id,
+                approve=args.approve,
+                chunk_size=args.chunk_size,
+            )
+
+    print(
+        f'{report.total_rows} rows: {report.inserted} inserted, {report.updated} updated, '
+        f'{report.unchanged} unchanged, {report.rejected} rejected '
+        f'in {report.elapsed_seconds:.1f}s ({report.rows_per_second:.0f} rows/s).'
+    )
+    for error in report.errors:
+        print(f'  line {error.line}: {error.error}')
+    if report.stopped_at_line is not None:
+        print(f'Import stopped at line {report.stopped_at_line}: the rest of the file was not read.')
+
+
+async def generate_suggestions(args: argparse.Namespace) -> None:
+    """
+    Gera sugestões para os estabelecimentos com avaliações novas desde a última sugestão.
+    """
+    engine = SuggestionEngine(
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        min_new_reviews=args.min_new_reviews,
+    )
+    report = await engine.run()
+    print(
+        f'{report.suggestions} suggestions ({report.ai_model_version}) from {report.reviews} reviews '
+        f'across {report.establishments} establishments; {report.skipped} skipped, '
+        f'{report.failed} failed in {report.elapsed_seconds:.1f}s '
+        f'({report.reviews_per_second:.0f} reviews/s).'
+    )
+
+
+async def benchmark_telemetry(args: argparse.Namespace) -> None:
+    """
+    Compara INSERT + COMMIT por requisição com o buffer write-behind no histórico de buscas.
+    """
+    results = await benchmark_search_history(args.user_id, args.events, args.concurrency)
+    for mode, result in results.items():
+        print(
+            f'{mode:>12}: {result["events"]} events in {result["seconds"]:.2f}s '
+            f'({result["events_per_second"]:.0f} events/s), '
+            f'request latency p50 {result["p50_ms"]:.3f} ms, p99 {result["p99_ms"]:.3f} ms'
+        )
+
+
+async def maintain_search_history(args: argparse.Namespace) -> None:
+    """
+    Cria as partições mensais do histórico de buscas e remove as que passaram da retenção.
+    """
+    report = await maintain_search_history_partitions(
+        premake_months=args.premake_months,
+        retention_months=args.retention_months,
+        dry_run=args.dry_run,
+    )
+    prefix = '[dry run] ' if args.dry_run else ''
+    print(f'{prefix}Created partitions: {", ".join(report.created) or "none"}.')
+    print(
+        f'{prefix}Dropped partitions older than {report.retained_since}: '
+        f'{", ".join(report.dropped) or "none"}.'
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m inclui_aqui_server.cli')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    backfill = commands.add_parser(
+        'backfill-accessibility',
+        help='Converte o accessibility_features_json existente em máscaras de bits.',
+    )
+    backfill.add_argument('--batch-size', type=int, default=1000)
+    backfill.set_defaults(handler=backfill_accessibility)
+
+    recompute = commands.add_parser(
+        'recompute-ratings',
+        help='Reconstrói os agregados de avaliações a partir das avaliações.',
+    )
+    recompute.set_defaults(handler=recompute_ratings)
+
+    rebuild_cells = commands.add_parser(
+        'rebuild-map-cells',
+        help='Reconstrói as células de clusters do mapa.',
+    )
+    rebuild_cells.add_argument('--batch-size', type=int, default=5000)
+    rebuild_cells.set_defaults(handler=rebuild_map_cells)
+
+    import_parser = commands.add_parser(
+        'import-establishments',
+        help='Importa estabelecimentos de um arquivo CSV ou NDJSON.',
+    )
+    import_parser.add_argument('path')
+    import_parser.add_argument('--owner-id', type=uuid.UUID, required=True)
+    import_parser.add_argument('--format', choices=['csv', 'ndjson'])
+    import_parser.add_argument('--approve', action='store_true')
+    import_parser.add_argument('--chunk-size', type=int, default=settings.IMPORT_CHUNK_SIZE)
+    import_parser.set_defaults(handler=import_establishments)
+
+    suggestions = commands.add_parser(
+        'generate-suggestions',
+        help='Gera sugestões a partir das avaliações novas de cada estabelecimento.',
+    )
+    suggestions.add_argument('--concurrency', type=int, default=settings.SUGGESTION_CONCURRENCY)
+    suggestions.add_argument('--batch-size', type=int, default=settings.SUGGESTION_BATCH_SIZE)
+    suggestions.add_argument(
+        '--min-new-reviews', type=int, default=settings.SUGGESTION_MIN_NEW_REVIEWS
+    )
+    suggestions.set_defaults(handler=generate_suggestions)
+
+    benchmark = commands.add_parser(
+        'benchmark-telemetry',
+        help='Mede a gravação do histórico de buscas por requisição e em lote (write-behind).',
+    )
+    benchmark.add_argument('--user-id', type=uuid.UUID, required=True)
+    benchmark.add_argument('--events', type=int, default=10000)
+    benchmark.add_argument('--concurrency', type=int, default=50)
+    benchmark.set_defaults(handler=benchmark_telemetry)
+
+    search_history = commands.add_parser(
+        'maintain-search-history',
+        help='Cria as partições mensais do histórico de buscas e aplica a retenção.',
+    )
+    search_history.add_argument(
+        '--premake-months', type=int, default=settings.SEARCH_HISTORY_PREMAKE_MONTHS
+    )
+    search_history.add_argument(
+        '--retention-months', type=int, default=settings.SEARCH_HISTORY_RETENTION_MONTHS
+    )
+    search_history.add_argument('--dry-run', action='store_true')
+    search_history.set_defaults(handler=maintain_search_history)
+
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> None:
+    try:
+        await args.handler(args)
+    finally:
+        await dispose_engines()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    asyncio.run(_run(args))
+
+
+if __name__ == '__main__':
+    main()
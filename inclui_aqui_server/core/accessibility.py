@@ -0,0 +1,99 @@
+from typing import Any, Dict, Iterable, List
+
+from inclui_aqui_server.core.exception import BadRequestError
+
+# A máscara é gravada em um BIGINT (com sinal): os bits 0 a 62 estão disponíveis
+MAX_CRITERIA = 63
+
+
+class AccessibilityEncoder:
+    """
+    Converte critérios de acessibilidade em máscaras de bits e vice-versa.
+
+    Cada critério ativo do catálogo (`AccessibilityCriteria`) ocupa o bit
+    indicado pelo seu `ordinal`. Os nomes são comparados sem diferenciar
+    maiúsculas de minúsculas.
+    """
+
+    def __init__(self, ordinals: Dict[str, int]):
+        """
+        :param ordinals: Mapa nome do critério -> ordinal (0 a 62).
+        :raises ValueError: Se algum ordinal estiver fora do intervalo suportado.
+        """
+        for name, ordinal in ordinals.items():
+            if not 0 <= ordinal < MAX_CRITERIA:
+                raise ValueError(f'Ordinal {ordinal} of criterion {name!r} is out of range.')
+        self._ordinals = {name.strip().lower(): ordinal for name, ordinal in ordinals.items()}
+        self._names = {ordinal: name for name, ordinal in ordinals.items()}
+
+    @property
+    def names(self) -> List[str]:
+        """Os nomes dos critérios do catálogo, na ordem dos ordinais."""
+        return [self._names[ordinal] for ordinal in sorted(self._names)]
+
+    def mask_for(self, names: Iterable[str]) -> int:
+        """
+        Monta a máscara de um conjunto de critérios informado pelo cliente.
+
+        :param names: Os nomes dos critérios.
+        :raises BadRequestError: Se algum critério não existir no catálogo.
+        :return: A máscara com um bit por critério.
+        """
+        mask = 0
+        unknown = []
+        for name in names:
+            ordinal = self._ordinals.get(name.strip().lower())
+            if ordinal is None:
+                unknown.append(name)
+            else:
+                mask |= 1 << ordinal
+        if unknown:
+            raise BadRequestError(
+                detail='Unknown accessibility criteria.', data={'criteria': unknown}
+            )
+        return mask
+
+    def encode(self, features: Any) -> int:
+        """
+        Calcula a máscara de um `accessibility_features_json`.
+
+        Aceita um objeto {critério: valor} (entram os valores verdadeiros) ou uma
+        lista de nomes. Chaves que não estão no catálogo são ignoradas.
+
+        :param features: O conteúdo do JSON de acessibilidade.
+        :return: A máscara correspondente (0 para JSON vazio ou ausente).
+        """
+        if isinstance(features, dict):
+            names = [name for name, value in features.items() if value]
+        elif isinstance(features, (list, tuple, set)):
+            names = [name for name in features if isinstance(name, str)]
+        else:
+            return 0
+
+        mask = 0
+        for name in names:
+            ordinal = self._ordinals.get(str(name).strip().lower())
+            if ordinal is not None:
+                mask |= 1 << ordinal
+        return mask
+
+    def decode(self, mask: int) -> List[str]:
+        """
+        Lista os nomes dos critérios presentes em uma máscara.
+
+        :param mask: A máscara de bits.
+        :return: Os nomes, na ordem dos ordinais.
+        """
+        return [name for ordinal, name in sorted(self._names.items()) if mask >> ordinal & 1]
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """
+    Percorre as posições dos bits ligados de um inteiro, da menor para a maior.
+
+    :param mask: Um inteiro não negativo de qualquer tamanho.
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
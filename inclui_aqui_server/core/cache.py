@@ -0,0 +1,190 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """
+    Interface de um backend de cache assíncrono.
+
+    Implementações compartilhadas entre processos (ex.: Redis) devem aceitar
+    apenas valores serializáveis em JSON; o `LRUCache` em memória segue o mesmo
+    contrato e serve como substituto local em desenvolvimento e testes.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Retorna o valor armazenado em `key` ou None se ausente/expirado."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Armazena `value` em `key`, opcionalmente com um TTL próprio."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove `key` do cache, se existir."""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna os contadores do backend."""
+
+
+class LRUCache(CacheBackend):
+    """
+    Cache em memória do processo, limitado por tamanho (LRU) e por tempo (TTL).
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0):
+        """
+        :param max_size: Número máximo de entradas; a menos usada recentemente é descartada.
+        :param ttl_seconds: Tempo de vida padrão de cada entrada, em segundos.
+        """
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.get_nowait(key)
+
+    def get_nowait(self, key: str) -> Optional[Any]:
+        """
+        Variante síncrona de `get`, útil em caminhos que não podem ceder o event loop.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class ReadThroughCache:
+    """
+    Cache de leitura (read-through) sobre um `CacheBackend`.
+
+    Em caso de miss, o valor é carregado pela função `loader` e armazenado.
+    Requisições simultâneas pela mesma chave aguardam uma única carga, evitando
+    o "efeito manada" (cache stampede) sobre o banco de dados.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        """
+        :param backend: O backend onde os valores são armazenados.
+        """
+        self.backend = backend
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        """
+        Retorna o valor em cache ou o carrega com `loader`, populando o cache.
+
+        Valores None (ex.: registro inexistente) não são armazenados.
+
+        :param key: A chave do cache.
+        :param loader: Função assíncrona que busca o valor na fonte de dados.
+        :return: O valor em cache ou carregado.
+        """
+        value = await self.backend.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Marca a exceção como consumida caso não haja outras requisições aguardando
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+                stale = False
+            else:
+                # A chave foi invalidada durante a carga: o valor pode estar desatualizado
+                stale = True
+
+        if value is not None and not stale:
+            await self.backend.set(key, value)
+        future.set_result(value)
+        return value
+
+    async def peek(self, key: str) -> Optional[Any]:
+        """
+        Retorna o valor em cache, sem carregá-lo em caso de miss.
+
+        :param key: A chave do cache.
+        :return: O valor em cache ou None.
+        """
+        return await self.backend.get(key)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Remove a chave do cache e descarta o resultado de cargas em andamento.
+
+        :param key: A chave a ser invalidada.
+        """
+        self._inflight.pop(key, None)
+        await self.backend.delete(key)
+
+    async def refresh(self, key: str, value: Any) -> None:
+        """
+        Substitui o valor em cache por um valor recém-escrito (write-through).
+
+        Evita que uma leitura posterior em uma réplica atrasada repovoe o cache
+        com a versão antiga do registro.
+
+        :param key: A chave a ser atualizada.
+        :param value: O novo valor.
+        """
+        self._inflight.pop(key, None)
+        await self.backend.set(key, value)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores do backend acrescidos das cargas coalescidas.
+        """
+        return {**self.backend.get_stats(), "coalesced": self.coalesced}
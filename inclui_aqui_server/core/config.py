@@ -1,3 +1,5 @@
+from typing import List, Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +13,135 @@ class Settings(BaseSettings):
     PROJECT_NAME: str
     API_V1_STR: str
 
+    # Motor e pool de conexões do banco de dados
+    SQL_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
+    # Réplicas de leitura (lista JSON de URLs) e roteamento de sessões
+    READ_REPLICA_URLS: List[str] = []
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    REPLICA_RETRY_SECONDS: float = 30.0
+
+    # Pool de workers usado pelo hashing de senhas (bcrypt)
+    PASSWORD_HASH_EXECUTOR: Literal['process', 'thread'] = 'process'
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    PASSWORD_HASH_MAX_CONCURRENCY: Optional[int] = None
+
+    # Cache em memória dos perfis de usuário
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # Busca de estabelecimentos por proximidade (em metros)
+    NEARBY_MAX_RADIUS_M: float = 50_000.0
+    NEAREST_INITIAL_RADIUS_M: float = 1_000.0
+
+    # Busca textual de estabelecimentos (trigramas abaixo de 3 caracteres não usam o índice)
+    SEARCH_MIN_QUERY_LENGTH: int = 3
+    # Cache dos resultados da busca (texto normalizado + filtros -> IDs), relidos em uma consulta IN
+    SEARCH_CACHE_MAX_ENTRIES: int = 10_000
+    # O cache é por processo: alterações feitas em outro worker só aparecem após o TTL
+    SEARCH_CACHE_TTL_SECONDS: float = 30.0
+
+    # Filtro por critérios de acessibilidade (máscara de bits)
+    ACCESSIBILITY_CATALOGUE_TTL_SECONDS: float = 300.0
+    # Regiões (prefixos de geohash) mais consultadas são filtradas em memória, em cada processo;
+    # o TTL limita por quanto tempo os outros processos servem uma região alterada
+    ACCESSIBILITY_REGION_CACHE_SIZE: int = 64
+    ACCESSIBILITY_REGION_TTL_SECONDS: float = 60.0
+    ACCESSIBILITY_REGION_HOT_THRESHOLD: int = 5
+    ACCESSIBILITY_REGION_MAX_ROWS: int = 20_000
+
+    # Importação em lote de estabelecimentos (linhas por INSERT, no máximo 2500)
+    IMPORT_CHUNK_SIZE: int = 1000
+    IMPORT_MAX_REPORTED_ERRORS: int = 100
+
+    # Agrupamento (clusters) do mapa: grades pré-calculadas para os zooms 0..MAP_MAX_CLUSTER_ZOOM,
+    # com 2^MAP_CELL_BITS células por eixo em cada bloco (tile) do mapa
+    MAP_MAX_CLUSTER_ZOOM: int = 16
+    MAP_CELL_BITS: int = 3
+    # Limites da resposta, para que o tamanho não dependa do total de estabelecimentos
+    MAP_MAX_CELLS: int = 4096
+    MAP_MAX_POINTS: int = 500
+
+    # Detalhe do estabelecimento: máximo de itens de cada coleção incluída na resposta
+    ESTABLISHMENT_DETAIL_MAX_IMAGES: int = 20
+    ESTABLISHMENT_DETAIL_MAX_REVIEWS: int = 20
+
+    # Worker de análise de sentimento das avaliações (em segundo plano, no próprio processo)
+    SENTIMENT_WORKER_ENABLED: bool = True
+    SENTIMENT_BATCH_SIZE: int = 200
+    SENTIMENT_CONCURRENCY: int = 1
+    SENTIMENT_IDLE_SECONDS: float = 5.0
+    SENTIMENT_BACKLOG_REFRESH_SECONDS: float = 30.0
+
+    # Armazenamento das imagens enviadas (o backend 'local' grava em um diretório)
+    OBJECT_STORE_BACKEND: Literal['local'] = 'local'
+    OBJECT_STORE_LOCAL_ROOT: str = 'media'
+    OBJECT_STORE_BASE_URL: str = '/media'
+    # Upload de imagens: tamanho máximo do arquivo e thumbnails gerados (lado maior, em pixels)
+    IMAGE_UPLOAD_MAX_BYTES: int = 15 * 1024 * 1024
+    THUMBNAIL_SIZES: List[int] = [256, 1024]
+    THUMBNAIL_WORKERS: Optional[int] = None
+    THUMBNAIL_MAX_CONCURRENCY: int = 2
+
+    # Geração de sugestões a partir das avaliações (comando generate-suggestions)
+    SUGGESTION_CONCURRENCY: int = 8
+    # Máximo de avaliações consideradas em cada sugestão
+    SUGGESTION_BATCH_SIZE: int = 200
+    # Avaliações novas necessárias para gerar uma nova sugestão
+    SUGGESTION_MIN_NEW_REVIEWS: int = 3
+    # Avaliações mais novas que isso ficam para a próxima execução: transações ainda
+    # abertas podem gravar avaliações com created_at anterior ao da marca d'água
+    SUGGESTION_SETTLE_SECONDS: float = 60.0
+
+    # Telemetria (histórico de buscas e feedback das sugestões) gravada em lote, fora da requisição
+    TELEMETRY_FLUSH_ROWS: int = 500
+    TELEMETRY_FLUSH_SECONDS: float = 1.0
+    # Linhas em memória por tabela; acima disso, novos eventos são descartados (e contados)
+    TELEMETRY_MAX_PENDING: int = 20000
+
+    # Histórico de buscas particionado por mês: partições criadas com antecedência
+    # (também na inicialização) e meses completos mantidos pela retenção
+    SEARCH_HISTORY_PREMAKE_MONTHS: int = 3
+    SEARCH_HISTORY_RETENTION_MONTHS: int = 12
+    SEARCH_HISTORY_ENSURE_PARTITIONS_ON_STARTUP: bool = True
+
+    # Buscas em alta e autocompletar de buscas: contagens aproximadas em memória
+    # (count-min sketch + top-k com decaimento), alimentadas pelo histórico de buscas
+    TRENDING_ENABLED: bool = True
+    # Buscas distintas mantidas por nome (candidatas às buscas em alta e ao autocompletar)
+    TRENDING_CAPACITY: int = 5000
+    TRENDING_SKETCH_WIDTH: int = 16384
+    TRENDING_SKETCH_DEPTH: int = 4
+    # Tempo para o peso de uma busca cair à metade
+    TRENDING_HALF_LIFE_SECONDS: float = 6 * 3600
+    TRENDING_POLL_SECONDS: float = 5.0
+    TRENDING_POLL_BATCH_SIZE: int = 5000
+    # Janela de buscas lidas do histórico (na primeira leitura, sem snapshot, e após longas paradas)
+    TRENDING_WINDOW_SECONDS: float = 24 * 3600
+    # Buscas mais novas que isso ficam para a próxima leitura: um lote do write-behind
+    # ainda não confirmado pode ter timestamp anterior ao da marca d'água
+    TRENDING_SETTLE_SECONDS: float = 5.0
+    # Snapshot periódico em disco, restaurado na inicialização
+    TRENDING_SNAPSHOT_PATH: str = 'data/trending_searches.json.gz'
+    TRENDING_SNAPSHOT_SECONDS: float = 300.0
+
+    # Ranking de pontos em memória: carregado do banco na inicialização, atualizado pelas
+    # escritas deste processo e pelas alterações de outros processos lidas periodicamente
+    LEADERBOARD_ENABLED: bool = True
+    LEADERBOARD_POLL_SECONDS: float = 5.0
+    LEADERBOARD_SETTLE_SECONDS: float = 5.0
+    # Recarga completa periódica (remove usuários excluídos por outros processos)
+    LEADERBOARD_RESYNC_SECONDS: float = 3600.0
+    LEADERBOARD_LOAD_BATCH_SIZE: int = 10_000
+    LEADERBOARD_MAX_TOP: int = 100
+    LEADERBOARD_MAX_RADIUS: int = 25
+
 
 # Cria uma instância única que será importada em todo o projeto
 settings = Settings()
@@ -40,4 +40,40 @@ class UnauthorizedError(AppException):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=detail,
             data=data
-        )
\ No newline at end of file
+        )
+
+class BadRequestError(AppException):
+    """Levantada quando a requisição contém parâmetros inválidos. (HTTP 400)"""
+    def __init__(self, detail: str = "Invalid request", data: Any = None):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+            data=data
+        )
+
+class PayloadTooLargeError(AppException):
+    """Levantada quando o corpo da requisição excede o tamanho permitido. (HTTP 413)"""
+    def __init__(self, max_bytes: int, data: Any = None):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Payload exceeds the maximum size of {max_bytes} bytes.",
+            data=data
+        )
+
+class UnsupportedMediaTypeError(AppException):
+    """Levantada quando o tipo do conteúdo enviado não é aceito. (HTTP 415)"""
+    def __init__(self, detail: str = "Unsupported media type", data: Any = None):
+        super().__init__(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=detail,
+            data=data
+        )
+
+class ServiceUnavailableError(AppException):
+    """Levantada quando um recurso ainda não está pronto para atender. (HTTP 503)"""
+    def __init__(self, detail: str = "Service temporarily unavailable", data: Any = None):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            data=data
+        )
@@ -0,0 +1,177 @@
+import math
+from typing import List, Tuple
+
+EARTH_RADIUS_M = 6_371_008.8
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_BASE32_INDEX = {char: index for index, char in enumerate(_BASE32)}
+
+# Altura aproximada (em metros) de uma célula de geohash por precisão.
+# A largura é a mesma no equador e diminui com o cosseno da latitude.
+_CELL_SIZE_M = {
+    1: (5_009_400.0, 4_992_600.0),
+    2: (1_252_300.0, 624_100.0),
+    3: (156_500.0, 156_000.0),
+    4: (39_100.0, 19_500.0),
+    5: (4_890.0, 4_890.0),
+    6: (1_220.0, 610.0),
+    7: (153.0, 153.0),
+    8: (38.2, 19.1),
+    9: (4.77, 4.77),
+}
+
+GEOHASH_PRECISION = 9
+
+# Latitude máxima da projeção Web Mercator (usada pelos mapas em blocos)
+MERCATOR_MAX_LATITUDE = 85.05112878
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    Codifica uma coordenada em geohash.
+
+    :param latitude: Latitude em graus.
+    :param longitude: Longitude em graus.
+    :param precision: Número de caracteres do geohash.
+    :return: O geohash da célula que contém a coordenada.
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit, char_index, even = 0, 0, True
+    while len(chars) < precision:
+        interval, value = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (interval[0] + interval[1]) / 2
+        if value >= middle:
+            char_index = (char_index << 1) | 1
+            interval[0] = middle
+        else:
+            char_index <<= 1
+            interval[1] = middle
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[char_index])
+            bit, char_index = 0, 0
+    return ''.join(chars)
+
+
+def decode_geohash(geohash: str) -> Tuple[float, float, float, float]:
+    """
+    Decodifica um geohash no centro da célula e em suas meias-dimensões.
+
+    :param geohash: O geohash.
+    :return: Uma tupla (latitude, longitude, erro de latitude, erro de longitude).
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        char_index = _BASE32_INDEX[char]
+        for shift in range(4, -1, -1):
+            interval = lon_range if even else lat_range
+            middle = (interval[0] + interval[1]) / 2
+            if (char_index >> shift) & 1:
+                interval[0] = middle
+            else:
+                interval[1] = middle
+            even = not even
+    return (
+        (lat_range[0] + lat_range[1]) / 2,
+        (lon_range[0] + lon_range[1]) / 2,
+        (lat_range[1] - lat_range[0]) / 2,
+        (lon_range[1] - lon_range[0]) / 2,
+    )
+
+
+def geohash_with_neighbors(geohash: str) -> List[str]:
+    """
+    Retorna a célula e suas (até) 8 vizinhas, sem repetições.
+
+    :param geohash: O geohash central.
+    :return: Lista de geohashes com a mesma precisão.
+    """
+    latitude, longitude, lat_err, lon_err = decode_geohash(geohash)
+    cells = []
+    for d_lat in (-1, 0, 1):
+        for d_lon in (-1, 0, 1):
+            neighbor_lat = latitude + d_lat * 2 * lat_err
+            if not -90.0 <= neighbor_lat <= 90.0:
+                continue
+            neighbor_lon = (longitude + d_lon * 2 * lon_err + 180.0) % 360.0 - 180.0
+            cell = encode_geohash(neighbor_lat, neighbor_lon, len(geohash))
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def precision_for_radius(radius_m: float, latitude: float) -> int:
+    """
+    Escolhe a maior precisão cujas células cobrem o raio com o bloco 3x3 de vizinhas.
+
+    :param radius_m: O raio da busca em metros.
+    :param latitude: A latitude do centro da busca (as células estreitam em direção aos polos).
+    :return: A precisão do geohash.
+    """
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        width, height = _CELL_SIZE_M[precision]
+        if min(width * cos_lat, height) >= radius_m:
+            return precision
+    return 1
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius_m: float
+) -> Tuple[float, float, List[Tuple[float, float]]]:
+    """
+    Calcula o retângulo (lat/lon) que contém o círculo de raio `radius_m`.
+
+    Ao cruzar o antimeridiano, o intervalo de longitudes é dividido em dois;
+    se o círculo contém um polo, todas as longitudes são cobertas.
+
+    :return: Uma tupla (lat_min, lat_max, intervalos (lon_min, lon_max)).
+    """
+    d_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+    lat_min, lat_max = max(latitude - d_lat, -90.0), min(latitude + d_lat, 90.0)
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    d_lon = math.degrees(radius_m / (EARTH_RADIUS_M * cos_lat))
+    lon_min, lon_max = longitude - d_lon, longitude + d_lon
+    if d_lon >= 180.0 or lat_min <= -90.0 or lat_max >= 90.0:
+        return lat_min, lat_max, [(-180.0, 180.0)]
+    if lon_min < -180.0:
+        return lat_min, lat_max, [(lon_min + 360.0, 180.0), (-180.0, lon_max)]
+    if lon_max > 180.0:
+        return lat_min, lat_max, [(lon_min, 180.0), (-180.0, lon_max - 360.0)]
+    return lat_min, lat_max, [(lon_min, lon_max)]
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Distância em metros entre duas coordenadas pela fórmula de haversine.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def mercator_cell(latitude: float, longitude: float, level: int) -> Tuple[int, int]:
+    """
+    Localiza a célula de uma grade Web Mercator com 2^level células por eixo.
+
+    Com level = zoom, as células são os blocos (tiles) do mapa; níveis maiores
+    subdividem cada bloco. O eixo y cresce para o sul, como nos blocos.
+
+    :param latitude: Latitude em graus (limitada a ±MERCATOR_MAX_LATITUDE).
+    :param longitude: Longitude em graus.
+    :param level: Número de bits por eixo da grade.
+    :return: Uma tupla (x, y) com os índices da célula.
+    """
+    cells = 1 << level
+    latitude = max(min(latitude, MERCATOR_MAX_LATITUDE), -MERCATOR_MAX_LATITUDE)
+    sin_lat = math.sin(math.radians(latitude))
+    x = int((longitude + 180.0) / 360.0 * cells)
+    y = int((0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * cells)
+    return min(max(x, 0), cells - 1), min(max(y, 0), cells - 1)
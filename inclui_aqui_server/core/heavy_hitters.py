@@ -0,0 +1,228 @@
+import base64
+import bisect
+import hashlib
+import heapq
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+# Acima deste expoente, os pesos são reescalonados para não estourar o float
+_MAX_DECAY_EXPONENT = 64.0
+
+
+class CountMinSketch:
+    """
+    Contagem aproximada de frequências em memória fixa (`width * depth` contadores).
+
+    A estimativa nunca é menor que a contagem real; o excesso é limitado por
+    colisões (erro ~ total / width, com probabilidade ~ 1 - 2^-depth). Usa
+    atualização conservadora: só os contadores iguais ao mínimo são incrementados,
+    o que reduz o excesso sem perder a garantia.
+    """
+
+    def __init__(self, width: int = 16384, depth: int = 4):
+        """
+        :param width: Contadores por linha.
+        :param depth: Quantidade de linhas (funções de hash independentes).
+        """
+        self.width = width
+        self.depth = depth
+        self.rows = [array('d', bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        # Hash duplo: depth posições a partir de dois hashes de 64 bits
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, key: str, amount: float = 1.0) -> float:
+        """
+        Soma `amount` à contagem de `key`.
+
+        :return: A nova estimativa da contagem.
+        """
+        indexes = self._indexes(key)
+        rows = self.rows
+        estimate = min(rows[row][index] for row, index in enumerate(indexes)) + amount
+        for row, index in enumerate(indexes):
+            if rows[row][index] < estimate:
+                rows[row][index] = estimate
+        return estimate
+
+    def estimate(self, key: str) -> float:
+        """Retorna a estimativa da contagem de `key`."""
+        return min(self.rows[row][index] for row, index in enumerate(self._indexes(key)))
+
+    def scale(self, factor: float) -> None:
+        """Multiplica todos os contadores por `factor` (usado no decaimento)."""
+        for row in self.rows:
+            for index, value in enumerate(row):
+                if value:
+                    row[index] = value * factor
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'width': self.width,
+            'depth': self.depth,
+            'rows': [base64.b64encode(row.tobytes()).decode() for row in self.rows],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CountMinSketch':
+        sketch = cls(width=data['width'], depth=data['depth'])
+        for row, encoded in zip(sketch.rows, data['rows']):
+            raw = base64.b64decode(encoded)
+            if len(raw) != 8 * sketch.width:
+                raise ValueError('Sketch row size does not match its width.')
+            row[:] = array('d', raw)
+        return sketch
+
+
+class HeavyHitters:
+    """
+    Termos mais frequentes de um fluxo, com decaimento exponencial no tempo.
+
+    Um `CountMinSketch` estima a frequência de qualquer termo; só os `capacity`
+    termos com maior estimativa são mantidos por nome (heap de mínimo para a
+    troca, com uma entrada por termo, e lista ordenada para buscas por prefixo).
+
+    O decaimento usa "forward decay": um evento no instante t pesa
+    2^((t - t0) / half_life), em vez de reduzir todos os contadores a cada
+    instante. A pontuação atual é o peso acumulado dividido pelo peso de agora,
+    então eventos de `half_life` segundos atrás valem metade. Quando os pesos
+    crescem demais, tudo é reescalonado e `t0` avança.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 5000,
+        half_life_seconds: float = 6 * 3600,
+        sketch: Optional[CountMinSketch] = None,
+    ):
+        """
+        :param capacity: Quantidade de termos mantidos por nome.
+        :param half_life_seconds: Tempo para o peso de um evento cair à metade.
+        :param sketch: O sketch de contagem; por padrão, um `CountMinSketch()`.
+        """
+        self.capacity = capacity
+        self.half_life_seconds = half_life_seconds
+        self.sketch = sketch if sketch is not None else CountMinSketch()
+        self.t0: Optional[float] = None
+        # Instante do evento mais recente: referência para o decaimento das pontuações
+        self.now: Optional[float] = None
+        self.events = 0
+        self._scores: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._sorted_keys: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def add(self, key: str, timestamp: float, count: float = 1.0) -> None:
+        """
+        Registra `count` ocorrências de `key` no instante `timestamp` (em segundos).
+        """
+        if self.t0 is None:
+            self.t0 = timestamp
+        if self.now is None or timestamp > self.now:
+            self.now = timestamp
+        exponent = (timestamp - self.t0) / self.half_life_seconds
+        if exponent > _MAX_DECAY_EXPONENT:
+            self._rebase(timestamp)
+            exponent = 0.0
+        self.events += 1
+
+        score = self.sketch.add(key, count * 2.0 ** exponent)
+        scores = self._scores
+        if key in scores:
+            # A entrada do heap fica com a pontuação antiga; `_minimum` a atualiza se preciso
+            scores[key] = score
+        elif len(scores) < self.capacity:
+            self._insert(key, score)
+        else:
+            minimum = self._minimum()
+            if minimum is not None and score > minimum[0]:
+                minimum_key = minimum[1]
+                del scores[minimum_key]
+                self._sorted_keys.pop(bisect.bisect_left(self._sorted_keys, minimum_key))
+                heapq.heappop(self._heap)
+                self._insert(key, score)
+
+    def top(self, limit: int) -> List[Tuple[str, float]]:
+        """
+        Retorna os `limit` termos com maior pontuação atual.
+        """
+        factor = self._decay_factor()
+        best = heapq.nlargest(limit, self._scores.items(), key=lambda item: item[1])
+        return [(key, score * factor) for key, score in best]
+
+    def complete(self, prefix: str, limit: int) -> List[Tuple[str, float]]:
+        """
+        Retorna os `limit` termos com maior pontuação que começam com `prefix`.
+        """
+        keys = self._sorted_keys
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + '\U0010ffff', lo=start)
+        scores = self._scores
+        factor = self._decay_factor()
+        best = heapq.nlargest(limit, keys[start:end], key=scores.__getitem__)
+        return [(key, scores[key] * factor) for key in best]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa o estado (para snapshots)."""
+        return {
+            'capacity': self.capacity,
+            'half_life_seconds': self.half_life_seconds,
+            't0': self.t0,
+            'now': self.now,
+            'events': self.events,
+            'scores': self._scores,
+            'sketch': self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HeavyHitters':
+        """Restaura o estado serializado por `to_dict`."""
+        hitters = cls(
+            capacity=data['capacity'],
+            half_life_seconds=data['half_life_seconds'],
+            sketch=CountMinSketch.from_dict(data['sketch']),
+        )
+        hitters.t0 = data['t0']
+        hitters.now = data['now']
+        hitters.events = data['events']
+        hitters._scores = {key: float(score) for key, score in data['scores'].items()}
+        hitters._sorted_keys = sorted(hitters._scores)
+        hitters._rebuild_heap()
+        return hitters
+
+    def _insert(self, key: str, score: float) -> None:
+        self._scores[key] = score
+        heapq.heappush(self._heap, (score, key))
+        bisect.insort(self._sorted_keys, key)
+
+    def _minimum(self) -> Optional[Tuple[float, str]]:
+        # O heap tem uma entrada por termo, com a pontuação da época em que entrou: um
+        # limite inferior, pois as pontuações só crescem. Atualiza o topo até ele estar
+        # em dia; aí nenhum outro termo tem pontuação menor.
+        heap, scores = self._heap, self._scores
+        while heap and heap[0][0] != scores[heap[0][1]]:
+            key = heap[0][1]
+            heapq.heapreplace(heap, (scores[key], key))
+        return heap[0] if heap else None
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(score, key) for key, score in self._scores.items()]
+        heapq.heapify(self._heap)
+
+    def _rebase(self, timestamp: float) -> None:
+        factor = 2.0 ** (-(timestamp - self.t0) / self.half_life_seconds)
+        self.sketch.scale(factor)
+        self._scores = {key: score * factor for key, score in self._scores.items()}
+        self._rebuild_heap()
+        self.t0 = timestamp
+
+    def _decay_factor(self) -> float:
+        if self.t0 is None:
+            return 1.0
+        return 2.0 ** (-(self.now - self.t0) / self.half_life_seconds)
@@ -0,0 +1,102 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Mapping, Optional
+
+from fastapi import Response, status
+
+# Os clientes podem guardar a resposta, mas devem revalidá-la (GET condicional) antes de usá-la
+CACHE_CONTROL = 'private, no-cache'
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Gera um ETag fraco a partir da identidade e da versão de um recurso (ex.: id e updated_at).
+
+    :param parts: Os valores que identificam a versão do recurso.
+    :return: O ETag, já entre aspas (ex.: W/"3f2a...").
+    """
+    digest = hashlib.blake2b(
+        '|'.join(_etag_part(part) for part in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def http_date(moment: datetime) -> str:
+    """
+    Formata um instante como data HTTP (IMF-fixdate). Datas sem fuso são tratadas como UTC.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return format_datetime(moment.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def is_not_modified(
+    headers: Mapping[str, str], etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Verifica se a cópia do cliente ainda é atual (RFC 9110, seção 13.1).
+
+    `If-None-Match` tem precedência: quando presente, `If-Modified-Since` é ignorado.
+
+    :param headers: Os cabeçalhos da requisição.
+    :param etag: O ETag da versão atual.
+    :param last_modified: A data da última alteração da versão atual, se conhecida.
+    :return: True se a resposta pode ser 304 Not Modified.
+    """
+    if_none_match = headers.get('if-none-match')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*':
+            return True
+        # Comparação fraca: W/"x" e "x" representam a mesma versão
+        current = _opaque_tag(etag)
+        return any(_opaque_tag(tag) == current for tag in if_none_match.split(','))
+
+    if_modified_since = headers.get('if-modified-since')
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # Datas HTTP têm resolução de segundos
+    return last_modified.replace(microsecond=0) <= since
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime] = None
+) -> None:
+    """
+    Adiciona ETag, Last-Modified e Cache-Control à resposta.
+    """
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified)
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """
+    Cria a resposta 304 Not Modified, sem corpo, repetindo os validadores.
+    """
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def _etag_part(part: Any) -> str:
+    if isinstance(part, datetime):
+        # Mesma representação para datas vindas do banco ou do cache (JSON)
+        if part.tzinfo is not None:
+            part = part.astimezone(timezone.utc).replace(tzinfo=None)
+        return part.isoformat()
+    return str(part)
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith('W/') else tag
@@ -0,0 +1,225 @@
+import bisect
+import uuid
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Entrada do ranking: (posição no ranking, id do usuário, pontos)
+RankedUser = Tuple[int, uuid.UUID, int]
+
+# Chave de ordenação dentro de um balde: mais pontos primeiro, empates por id
+_Entry = Tuple[int, uuid.UUID]
+
+
+class FenwickTree:
+    """
+    Árvore de Fenwick (binary indexed tree) de contagens inteiras.
+
+    Soma de prefixo, atualização de um índice e busca do k-ésimo elemento em
+    O(log n).
+    """
+
+    def __init__(self, counts: Iterable[int]):
+        """
+        Constrói a árvore em O(n) a partir das contagens iniciais.
+
+        :param counts: A contagem de cada índice, a partir de 0.
+        """
+        tree = [0, *counts]
+        for index in range(1, len(tree)):
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def add(self, index: int, delta: int) -> None:
+        """Soma `delta` à contagem de `index`."""
+        index += 1
+        tree = self._tree
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        """Retorna a soma das contagens de 0 até `index` (inclusive)."""
+        index = min(index + 1, len(self._tree) - 1)
+        total = 0
+        tree = self._tree
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, k: int) -> int:
+        """
+        Retorna o menor índice cuja soma de prefixo é pelo menos `k` (k >= 1).
+        """
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            following = position + step
+            if following < len(tree) and tree[following] < k:
+                position = following
+                k -= tree[following]
+            step >>= 1
+        return position
+
+
+class Leaderboard:
+    """
+    Ranking de usuários por pontos, em memória.
+
+    Os pontos são agrupados em baldes de largura 2^shift (o balde 0 também
+    recebe pontuações negativas); uma `FenwickTree` conta os usuários de cada
+    balde, e cada balde guarda os seus usuários ordenados por (-pontos, id).
+    A posição de um usuário e o usuário em uma dada posição saem em
+    O(log B + log n), com B baldes.
+
+    Enquanto a maior pontuação couber em `max_buckets` baldes de largura 1,
+    cada balde tem uma única pontuação. Pontuações maiores dobram a largura
+    (juntando baldes vizinhos), para que a memória não dependa do maior valor.
+
+    A posição no ranking é a mesma para usuários empatados (1 + quantos têm
+    mais pontos); a ordem de exibição entre eles é a do id.
+    """
+
+    def __init__(
+        self,
+        points_by_user: Optional[Dict[uuid.UUID, int]] = None,
+        max_buckets: int = 1 << 16,
+    ):
+        """
+        :param points_by_user: Os pontos iniciais de cada usuário.
+        :param max_buckets: Quantidade máxima de baldes da árvore.
+        """
+        self.max_buckets = max_buckets
+        self._points: Dict[uuid.UUID, int] = dict(points_by_user or {})
+        self._shift = 0
+        highest = max(self._points.values(), default=0)
+        while highest >> self._shift >= max_buckets:
+            self._shift += 1
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, user_id: uuid.UUID) -> bool:
+        return user_id in self._points
+
+    def set(self, user_id: uuid.UUID, points: int) -> None:
+        """
+        Define os pontos de um usuário (inserindo-o, se necessário).
+        """
+        current = self._points.get(user_id)
+        if current == points:
+            return
+        if current is not None:
+            self._detach(user_id, current)
+        self._points[user_id] = points
+        if points >> self._shift >= self.max_buckets:
+            while points >> self._shift >= self.max_buckets:
+                self._shift += 1
+            # Reconstrói com o usuário já incluído
+            self._rebuild()
+            return
+        index = self._bucket_index(points)
+        bucket = self._buckets.get(index)
+        if bucket is None:
+            self._buckets[index] = [(-points, user_id)]
+            bisect.insort(self._nonempty, index)
+        else:
+            bisect.insort(bucket, (-points, user_id))
+        self._tree.add(index, 1)
+
+    def remove(self, user_id: uuid.UUID) -> None:
+        """
+        Remove um usuário do ranking, se presente.
+        """
+        points = self._points.pop(user_id, None)
+        if points is not None:
+            self._detach(user_id, points)
+
+    def get(self, user_id: uuid.UUID) -> Optional[RankedUser]:
+        """
+        Retorna a posição no ranking (1 = mais pontos) e os pontos de um usuário.
+        """
+        points = self._points.get(user_id)
+        if points is None:
+            return None
+        return self._greater_than(points) + 1, user_id, points
+
+    def top(self, limit: int) -> List[RankedUser]:
+        """
+        Retorna os `limit` primeiros usuários do ranking.
+        """
+        return list(self._walk(0, limit))
+
+    def around(self, user_id: uuid.UUID, radius: int) -> List[RankedUser]:
+        """
+        Retorna o usuário e até `radius` usuários antes e depois dele no ranking.
+        """
+        points = self._points.get(user_id)
+        if points is None:
+            return []
+        index = self._bucket_index(points)
+        position = self._after(index) + bisect.bisect_left(self._buckets[index], (-points, user_id))
+        start = max(position - radius, 0)
+        return list(self._walk(start, position + radius + 1 - start))
+
+    def _walk(self, start: int, limit: int) -> Iterator[RankedUser]:
+        total = len(self._points)
+        if start >= total or limit <= 0:
+            return
+        # Balde da posição `start` (posições em ordem decrescente de pontos)
+        index = self._tree.find(total - start)
+        position = self._after(index)
+        offset = start - position
+        position = start
+        rank, previous = 0, None
+        nonempty_index = bisect.bisect_left(self._nonempty, index)
+        while limit > 0 and nonempty_index >= 0:
+            bucket = self._buckets[self._nonempty[nonempty_index]]
+            for negative_points, user_id in bucket[offset:offset + limit]:
+                points = -negative_points
+                if points != previous:
+                    rank = self._greater_than(points) + 1 if previous is None else position + 1
+                    previous = points
+                yield rank, user_id, points
+                position += 1
+            limit -= len(bucket) - offset
+            offset = 0
+            nonempty_index -= 1
+
+    def _greater_than(self, points: int) -> int:
+        index = self._bucket_index(points)
+        # Usuários em baldes acima + os do mesmo balde com mais pontos
+        return self._after(index) + bisect.bisect_left(self._buckets.get(index, ()), (-points,))
+
+    def _after(self, index: int) -> int:
+        return len(self._points) - self._tree.prefix_sum(index)
+
+    def _bucket_index(self, points: int) -> int:
+        return max(points, 0) >> self._shift
+
+    def _detach(self, user_id: uuid.UUID, points: int) -> None:
+        index = self._bucket_index(points)
+        bucket = self._buckets[index]
+        del bucket[bisect.bisect_left(bucket, (-points, user_id))]
+        if not bucket:
+            del self._buckets[index]
+            del self._nonempty[bisect.bisect_left(self._nonempty, index)]
+        self._tree.add(index, -1)
+
+    def _rebuild(self) -> None:
+        self._buckets: Dict[int, List[_Entry]] = {}
+        for user_id, points in self._points.items():
+            self._buckets.setdefault(self._bucket_index(points), []).append((-points, user_id))
+        for bucket in self._buckets.values():
+            bucket.sort()
+        # Baldes com ao menos um usuário, em ordem crescente
+        self._nonempty = sorted(self._buckets)
+        self._tree = FenwickTree(
+            len(self._buckets.get(index, ())) for index in range(self.max_buckets)
+        )
@@ -1,32 +1,197 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
 from passlib.context import CryptContext
 
+from inclui_aqui_server.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# O contexto fica em nível de módulo para que as funções abaixo possam ser
+# enviadas (via pickle) aos processos do pool de workers.
+_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_password(password: str) -> str:
+    return _pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _pwd_context.verify(plain_password, hashed_password)
+
+
 class PasswordHandler:
     """
     Classe para manipulação de senhas, incluindo criptografia e verificação.
+
+    O bcrypt é propositalmente lento; por isso as variantes assíncronas
+    (`hash_async` e `verify_async`) executam o trabalho em um pool de workers
+    limitado, mantendo o event loop livre para as demais requisições.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        executor_kind: str = "process",
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
         """
         Inicializa o contexto de criptografia.
+
+        :param executor_kind: "process" para um ProcessPoolExecutor ou "thread" para um ThreadPoolExecutor.
+        :param max_workers: Número de workers do pool (padrão: número de CPUs).
+        :param max_concurrency: Máximo de operações simultâneas enviadas ao pool (padrão: `max_workers`).
         """
-        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        
+        self._pwd_context = _pwd_context
+        self._executor_kind = executor_kind
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_concurrency = max_concurrency or self._max_workers
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # Métricas expostas por `get_stats`
+        self._waiting = 0
+        self._max_waiting = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait_seconds = 0.0
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verifica se a senha em texto simples corresponde à senha criptografada.
-        
+
         :param plain_password: Senha em texto simples.
         :param hashed_password: Senha criptografada.
         :return: True se as senhas corresponderem, False caso contrário.
         """
         return self._pwd_context.verify(plain_password, hashed_password)
-    
+
     def get_password_hash(self, password: str) -> str:
         """
         Criptografa a senha em texto simples.
-        
+
         :param password: Senha em texto simples.
         :return: Senha criptografada.
         """
         return self._pwd_context.hash(password)
 
-password_handler = PasswordHandler()
\ No newline at end of file
+    async def hash_async(self, password: str) -> str:
+        """
+        Criptografa a senha em um worker do pool, sem bloquear o event loop.
+
+        :param password: Senha em texto simples.
+        :return: Senha criptografada.
+        """
+        return await self._run(_hash_password, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifica a senha em um worker do pool, sem bloquear o event loop.
+
+        :param plain_password: Senha em texto simples.
+        :param hashed_password: Senha criptografada.
+        :return: True se as senhas corresponderem, False caso contrário.
+        """
+        return await self._run(_verify_password, plain_password, hashed_password)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna as métricas do pool de hashing.
+
+        :return: Dicionário com o tipo de executor, limites, profundidade da fila e contadores.
+        """
+        started = self._completed + self._failed
+        return {
+            "executor": self._executor_kind,
+            "max_workers": self._max_workers,
+            "max_concurrency": self._max_concurrency,
+            "queue_depth": self._waiting,
+            "max_queue_depth": self._max_waiting,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "avg_wait_ms": (
+                self._total_wait_seconds / started * 1000 if started else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        """
+        Encerra o pool de workers, se ele tiver sido criado.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        self._waiting += 1
+        self._max_waiting = max(self._max_waiting, self._waiting)
+        started_at = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._total_wait_seconds += time.perf_counter() - started_at
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                result = await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                # Um worker morreu (ex.: OOM). Recorre ao pool de threads:
+                # o bcrypt libera a GIL, então o paralelismo é preservado.
+                self._use_thread_pool(broken=executor)
+                result = await loop.run_in_executor(self._get_executor(), func, *args)
+        except BaseException:
+            self._failed += 1
+            raise
+        else:
+            self._completed += 1
+            return result
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._executor_kind == "process":
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+                except (OSError, ImportError, NotImplementedError):
+                    # Ambientes sem suporte a multiprocessing (ex.: sem /dev/shm)
+                    logger.warning("Process pool unavailable; hashing passwords in threads.")
+                    self._use_thread_pool()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    def _use_thread_pool(self, broken: Optional[Executor] = None) -> None:
+        # Várias chamadas podem encontrar o mesmo pool quebrado ao mesmo tempo:
+        # só a primeira o substitui, sem derrubar o pool de threads já criado
+        if broken is not None and self._executor is not broken:
+            return
+        if self._executor is not None:
+            if broken is not None:
+                logger.warning("Password hashing process pool is broken; falling back to threads.")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._executor_kind = "thread"
+
+
+password_handler = PasswordHandler(
+    executor_kind=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+)
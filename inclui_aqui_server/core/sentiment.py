@@ -0,0 +1,139 @@
+import math
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+
+class SentimentModel(ABC):
+    """
+    Interface de um modelo local de análise de sentimento.
+
+    Implementações devem rodar sem serviços de rede e pontuar textos em lote;
+    o worker chama `score_batch` em uma thread, fora do event loop.
+    """
+
+    # Identifica o modelo e sua versão (ex.: para registrar a origem das notas)
+    version: str = 'unknown'
+
+    @abstractmethod
+    def score_batch(self, texts: Sequence[Optional[str]]) -> List[float]:
+        """
+        Pontua vários textos de uma vez.
+
+        :param texts: Os textos (None ou vazio vale como neutro).
+        :return: Uma nota em [-1, 1] por texto, na mesma ordem.
+        """
+
+
+# Polaridade das palavras (sem acentos, em minúsculas), de -3 a 3
+DEFAULT_LEXICON: Dict[str, float] = {
+    # Positivas
+    'acessivel': 2.0, 'adaptado': 1.5, 'adaptada': 1.5, 'adequado': 1.5, 'adequada': 1.5,
+    'agradavel': 2.0, 'amplo': 1.0, 'ampla': 1.0, 'atencioso': 2.0, 'atenciosa': 2.0,
+    'atencao': 1.0, 'bom': 1.5, 'boa': 1.5, 'bons': 1.5, 'boas': 1.5, 'confortavel': 2.0,
+    'educado': 1.5, 'educada': 1.5, 'eficiente': 1.5, 'excelente': 3.0, 'facil': 1.5,
+    'gentil': 2.0, 'gostei': 2.0, 'incrivel': 3.0, 'inclusivo': 2.0, 'inclusiva': 2.0,
+    'legal': 1.5, 'limpo': 1.5, 'limpa': 1.5, 'maravilhoso': 3.0, 'maravilhosa': 3.0,
+    'melhor': 2.0, 'otimo': 2.5, 'otima': 2.5, 'perfeito': 3.0, 'perfeita': 3.0,
+    'prestativo': 2.0, 'prestativa': 2.0, 'recomendo': 2.5, 'respeito': 1.5,
+    'seguro': 1.5, 'segura': 1.5, 'simpatico': 2.0, 'simpatica': 2.0, 'tranquilo': 1.0,
+    'tranquila': 1.0, 'amei': 3.0, 'adorei': 3.0, 'funciona': 1.0, 'sinalizado': 1.0,
+    'sinalizada': 1.0,
+    # Negativas
+    'apertado': -1.5, 'apertada': -1.5, 'barreira': -1.5, 'barreiras': -1.5,
+    'buraco': -1.5, 'buracos': -1.5, 'descaso': -2.5, 'desrespeito': -2.5,
+    'dificil': -1.5, 'dificuldade': -1.5, 'escada': -1.0, 'escadas': -1.0,
+    'estreito': -1.5, 'estreita': -1.5, 'falta': -1.5, 'horrivel': -3.0,
+    'impossivel': -2.5, 'inacessivel': -3.0, 'inadequado': -2.0, 'inadequada': -2.0,
+    'insuficiente': -1.5, 'lamentavel': -2.5, 'mal': -1.5, 'ma': -1.5, 'mau': -1.5,
+    'pessimo': -3.0, 'pessima': -3.0, 'perigoso': -2.0, 'perigosa': -2.0, 'pior': -2.0,
+    'problema': -1.5, 'problemas': -1.5, 'quebrado': -2.0, 'quebrada': -2.0,
+    'ruim': -2.0, 'sujo': -1.5, 'suja': -1.5, 'decepcionante': -2.5, 'grosso': -2.0,
+    'grossa': -2.0, 'odiei': -3.0, 'bloqueado': -2.0, 'bloqueada': -2.0,
+    'demorado': -1.0, 'demorada': -1.0,
+}
+
+# Palavras que invertem a polaridade das próximas `NEGATION_WINDOW` palavras
+DEFAULT_NEGATORS: FrozenSet[str] = frozenset(
+    {'nao', 'nem', 'nunca', 'jamais', 'sem', 'nenhum', 'nenhuma'}
+)
+
+# Modificadores de intensidade da palavra seguinte
+DEFAULT_BOOSTERS: Dict[str, float] = {
+    'muito': 1.5, 'muita': 1.5, 'super': 1.5, 'extremamente': 2.0, 'bastante': 1.3,
+    'totalmente': 1.5, 'bem': 1.2, 'mega': 1.5, 'pouco': 0.5, 'pouca': 0.5, 'meio': 0.6,
+}
+
+NEGATION_WINDOW = 3
+
+_TOKEN_RE = re.compile(r'[a-z]+')
+
+
+def _fold(text: str) -> str:
+    # Minúsculas e sem acentos, para que "péssimo" e "pessimo" casem com o léxico
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+class LexiconSentimentModel(SentimentModel):
+    """
+    Modelo de sentimento baseado em léxico, com negação e intensificadores.
+
+    A soma das polaridades é normalizada para [-1, 1] com `s / sqrt(s² + alpha)`,
+    de modo que textos longos não saturam a nota com poucas palavras.
+    """
+
+    version = 'lexicon-pt-1'
+
+    def __init__(
+        self,
+        lexicon: Optional[Dict[str, float]] = None,
+        negators: Optional[FrozenSet[str]] = None,
+        boosters: Optional[Dict[str, float]] = None,
+        alpha: float = 15.0,
+    ):
+        """
+        :param lexicon: Polaridade de cada palavra (sem acentos); por padrão, `DEFAULT_LEXICON`.
+        :param negators: Palavras de negação; por padrão, `DEFAULT_NEGATORS`.
+        :param boosters: Multiplicadores de intensidade; por padrão, `DEFAULT_BOOSTERS`.
+        :param alpha: Suavização da normalização (maior = notas menos extremas).
+        """
+        self.lexicon = {_fold(word): value for word, value in (lexicon or DEFAULT_LEXICON).items()}
+        self.negators = frozenset(_fold(word) for word in (negators or DEFAULT_NEGATORS))
+        self.boosters = {_fold(word): value for word, value in (boosters or DEFAULT_BOOSTERS).items()}
+        self.alpha = alpha
+
+    def score(self, text: Optional[str]) -> float:
+        """
+        Pontua um único texto.
+
+        :param text: O texto (None ou vazio vale como neutro).
+        :return: A nota em [-1, 1].
+        """
+        if not text:
+            return 0.0
+        lexicon, negators, boosters = self.lexicon, self.negators, self.boosters
+        total = 0.0
+        boost = 1.0
+        negated_for = 0
+        for token in _TOKEN_RE.findall(_fold(text)):
+            if token in negators:
+                negated_for = NEGATION_WINDOW
+                continue
+            multiplier = boosters.get(token)
+            if multiplier is not None:
+                boost *= multiplier
+                continue
+            polarity = lexicon.get(token)
+            if polarity is not None:
+                if negated_for:
+                    # Negação atenua e inverte ("não é ruim" não equivale a "ótimo")
+                    polarity *= -0.75
+                total += polarity * boost
+            boost = 1.0
+            negated_for = max(negated_for - 1, 0)
+        return total / math.sqrt(total * total + self.alpha)
+
+    def score_batch(self, texts: Sequence[Optional[str]]) -> List[float]:
+        return [self.score(text) for text in texts]
@@ -0,0 +1,134 @@
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from functools import cache
+from typing import AsyncIterable, AsyncIterator
+
+from inclui_aqui_server.core.config import settings
+
+
+class ObjectStore(ABC):
+    """
+    Interface de um armazenamento de objetos (ex.: S3) acessado em blocos.
+
+    Nenhum método recebe ou devolve o objeto inteiro: uploads e downloads são
+    transmitidos bloco a bloco, de modo que a memória usada não depende do
+    tamanho do arquivo.
+    """
+
+    @abstractmethod
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> int:
+        """
+        Grava um objeto a partir de um fluxo de blocos, substituindo o existente.
+
+        :param key: A chave do objeto.
+        :param chunks: Os blocos do conteúdo, em ordem.
+        :return: A quantidade de bytes gravados.
+        """
+
+    @abstractmethod
+    def read(self, key: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """
+        Lê um objeto em blocos.
+
+        :param key: A chave do objeto.
+        :param chunk_size: O tamanho máximo de cada bloco.
+        :return: Um iterador assíncrono dos blocos.
+        """
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Verifica se o objeto existe."""
+
+    @abstractmethod
+    async def move(self, source_key: str, target_key: str) -> None:
+        """Renomeia um objeto (em S3: cópia no servidor seguida de remoção)."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove o objeto, se existir."""
+
+    @abstractmethod
+    def url_for(self, key: str) -> str:
+        """Retorna a URL pública do objeto."""
+
+
+class LocalObjectStore(ObjectStore):
+    """
+    Armazenamento em um diretório local, para desenvolvimento e testes.
+
+    As operações de disco rodam em threads, fora do event loop.
+    """
+
+    def __init__(self, root: str, base_url: str):
+        """
+        :param root: O diretório onde os objetos são gravados.
+        :param base_url: O prefixo das URLs públicas (ex.: '/media' ou um CDN).
+        """
+        self.root = os.path.abspath(root)
+        self.base_url = base_url.rstrip('/')
+
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> int:
+        path = self._path(key)
+        await asyncio.to_thread(os.makedirs, os.path.dirname(path), exist_ok=True)
+        # Grava em um arquivo temporário: leitores nunca veem um objeto pela metade
+        partial_path = f'{path}.partial'
+        written = 0
+        handle = await asyncio.to_thread(open, partial_path, 'wb')
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(handle.write, chunk)
+                written += len(chunk)
+        except BaseException:
+            await asyncio.to_thread(handle.close)
+            await asyncio.to_thread(_remove_if_exists, partial_path)
+            raise
+        await asyncio.to_thread(handle.close)
+        await asyncio.to_thread(os.replace, partial_path, path)
+        return written
+
+    async def read(self, key: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        handle = await asyncio.to_thread(open, self._path(key), 'rb')
+        try:
+            while chunk := await asyncio.to_thread(handle.read, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(handle.close)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(os.path.isfile, self._path(key))
+
+    async def move(self, source_key: str, target_key: str) -> None:
+        target_path = self._path(target_key)
+        await asyncio.to_thread(os.makedirs, os.path.dirname(target_path), exist_ok=True)
+        await asyncio.to_thread(os.replace, self._path(source_key), target_path)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(_remove_if_exists, self._path(key))
+
+    def url_for(self, key: str) -> str:
+        return f'{self.base_url}/{key}'
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        # Impede chaves como '../..' de escapar do diretório raiz
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f'Invalid object key: {key!r}')
+        return path
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+@cache
+def get_object_store() -> ObjectStore:
+    """
+    Retorna o armazenamento de objetos configurado em `OBJECT_STORE_BACKEND` (criado uma única vez).
+    """
+    if settings.OBJECT_STORE_BACKEND == 'local':
+        return LocalObjectStore(settings.OBJECT_STORE_LOCAL_ROOT, settings.OBJECT_STORE_BASE_URL)
+    raise ValueError(f'Unknown object store backend: {settings.OBJECT_STORE_BACKEND}')
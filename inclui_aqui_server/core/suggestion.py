@@ -0,0 +1,109 @@
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class SuggestionInput:
+    """Dados de uma avaliação enviados ao modelo de sugestões."""
+
+    review_id: uuid.UUID
+    rating: int
+    comment: Optional[str] = None
+    # Notas numéricas de `criteria_json` (ver `criteria_scores`)
+    criteria: Dict[str, float] = field(default_factory=dict)
+    sentiment_score: Optional[float] = None
+
+
+class SuggestionModel(ABC):
+    """
+    Interface de um modelo que gera uma sugestão de melhoria a partir de avaliações.
+
+    `generate` é assíncrona para permitir modelos remotos (chamadas HTTP); o
+    gerador chama várias instâncias em paralelo, uma por estabelecimento.
+    """
+
+    # Gravado em `Suggestion.ai_model_version`
+    version: str = 'unknown'
+
+    @abstractmethod
+    async def generate(
+        self, establishment_id: uuid.UUID, reviews: Sequence[SuggestionInput]
+    ) -> str:
+        """
+        Gera o texto da sugestão.
+
+        :param establishment_id: O estabelecimento avaliado.
+        :param reviews: As avaliações novas, das mais antigas às mais recentes.
+        :return: O conteúdo da sugestão.
+        """
+
+
+class TemplateSuggestionModel(SuggestionModel):
+    """
+    Modelo local e determinístico: resume as avaliações em um texto fixo.
+
+    Aponta os critérios com as piores médias e a proporção de comentários
+    negativos. Serve para desenvolvimento, testes e medições de vazão sem
+    depender de um serviço externo; a mesma entrada sempre gera o mesmo texto.
+    """
+
+    version = 'template-pt-1'
+
+    def __init__(
+        self,
+        max_criteria: int = 3,
+        low_score: float = 3.0,
+        negative_sentiment: float = -0.3,
+    ):
+        """
+        :param max_criteria: Quantidade máxima de critérios citados.
+        :param low_score: Média abaixo da qual um critério é citado como problema.
+        :param negative_sentiment: Nota de sentimento abaixo da qual o comentário é negativo.
+        """
+        self.max_criteria = max_criteria
+        self.low_score = low_score
+        self.negative_sentiment = negative_sentiment
+
+    async def generate(
+        self, establishment_id: uuid.UUID, reviews: Sequence[SuggestionInput]
+    ) -> str:
+        return self.summarize(reviews)
+
+    def summarize(self, reviews: Sequence[SuggestionInput]) -> str:
+        """
+        Monta o texto da sugestão (síncrono, sem E/S).
+
+        :param reviews: As avaliações consideradas.
+        :return: O conteúdo da sugestão.
+        """
+        count = len(reviews)
+        average = sum(review.rating for review in reviews) / count if count else 0.0
+
+        totals: Dict[str, Tuple[float, int]] = {}
+        negative = 0
+        for review in reviews:
+            for criterion, score in review.criteria.items():
+                total, seen = totals.get(criterion, (0.0, 0))
+                totals[criterion] = (total + score, seen + 1)
+            if review.sentiment_score is not None and review.sentiment_score < self.negative_sentiment:
+                negative += 1
+
+        # Piores médias primeiro; empates pelo nome, para o texto ser determinístico
+        low: List[Tuple[float, str]] = sorted(
+            (total / seen, criterion)
+            for criterion, (total, seen) in totals.items()
+            if total / seen < self.low_score
+        )[:self.max_criteria]
+
+        parts = [f'Com base em {count} avaliações recentes (nota média {average:.1f})']
+        if low:
+            listed = ', '.join(f'{criterion} ({score:.1f})' for score, criterion in low)
+            parts.append(f'priorize melhorias em: {listed}')
+        else:
+            parts.append('nenhum critério de acessibilidade ficou abaixo do esperado')
+        text = '; '.join(parts) + '.'
+        if negative:
+            text += f' {negative} de {count} comentários relatam uma experiência negativa.'
+        return text
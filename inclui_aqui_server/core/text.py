@@ -0,0 +1,14 @@
+import re
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normaliza um texto de busca: minúsculas, sem espaços nas pontas e com
+    espaços internos colapsados.
+
+    :param query: O texto digitado pelo usuário.
+    :return: O texto normalizado.
+    """
+    return _WHITESPACE.sub(' ', query).strip().lower()
@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Limite de parâmetros de uma instrução no protocolo do PostgreSQL
+_MAX_BIND_PARAMS = 32767
+
+
+class WriteBehindBuffer:
+    """
+    Buffer de escrita adiada (write-behind) para tabelas de telemetria só de inserção.
+
+    `submit` apenas enfileira a linha em memória e retorna: a requisição não
+    espera o banco. Uma tarefa em segundo plano grava as linhas com um único
+    `INSERT ... VALUES (...), (...)` por lote, quando o lote atinge `max_batch`
+    linhas ou a cada `flush_interval` segundos, o que vier primeiro.
+
+    Com o buffer cheio (`max_pending`), `submit` descarta a linha e conta em
+    `dropped`; quem pode esperar usa `put`, que aguarda espaço (contrapressão)
+    ou, sem a tarefa de gravação rodando, grava ele mesmo as linhas pendentes.
+    Em `stop`, o lote em gravação é concluído e as linhas pendentes são gravadas
+    antes de retornar.
+
+    Como as linhas só chegam ao banco no flush, as colunas com `default=func.now()`
+    registram o instante da gravação (até `flush_interval` depois do evento).
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        session_factory: async_sessionmaker,
+        *,
+        max_batch: int = 500,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+        name: Optional[str] = None,
+    ):
+        """
+        :param model: O modelo ORM da tabela.
+        :param session_factory: Fábrica das sessões do banco primário.
+        :param max_batch: Linhas por INSERT (limitado pelo máximo de parâmetros do PostgreSQL).
+        :param flush_interval: Intervalo máximo, em segundos, entre a chegada de uma linha e a gravação.
+        :param max_pending: Linhas em memória a partir das quais novas linhas são descartadas.
+        :param name: Nome usado nos logs; por padrão, o nome da tabela.
+        """
+        self.model = model
+        self.session_factory = session_factory
+        columns = len(model.__table__.columns)
+        self.max_batch = max(1, min(max_batch, _MAX_BIND_PARAMS // columns))
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.name = name or model.__tablename__
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._batch_ready = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.accepted = 0
+        self.dropped = 0
+        self.written = 0
+        self.rejected = 0
+        self.failed = 0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """
+        Enfileira uma linha sem esperar o banco.
+
+        :param row: Os valores das colunas.
+        :return: False se o buffer estava cheio e a linha foi descartada.
+        """
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            self._has_space.clear()
+            return False
+        self._pending.append(row)
+        self.accepted += 1
+        if len(self._pending) >= self.max_batch:
+            self._batch_ready.set()
+        return True
+
+    async def put(self, row: Dict[str, Any]) -> None:
+        """
+        Enfileira uma linha, aguardando espaço se o buffer estiver cheio.
+
+        :param row: Os valores das colunas.
+        """
+        while len(self._pending) >= self.max_pending:
+            if not self.running:
+                # Ninguém esvaziaria o buffer: grava as linhas pendentes aqui mesmo
+                await self.flush()
+                continue
+            self._has_space.clear()
+            self._batch_ready.set()
+            await self._has_space.wait()
+        self.submit(row)
+
+    def start(self) -> None:
+        """
+        Inicia a tarefa de gravação no event loop atual (idempotente).
+        """
+        if not self.running:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name=f'write-behind-{self.name}')
+
+    async def stop(self) -> None:
+        """
+        Interrompe a tarefa de gravação e grava as linhas pendentes.
+
+        A tarefa não é cancelada: ela conclui o flush em andamento (um lote já
+        retirado do buffer se perderia) e termina antes do flush final.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._batch_ready.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Grava imediatamente todas as linhas pendentes, em lotes de `max_batch`.
+        """
+        while self._pending:
+            batch = [self._pending.popleft() for _ in range(min(self.max_batch, len(self._pending)))]
+            self._has_space.set()
+            await self._write(batch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o tamanho do buffer e os contadores de linhas.
+        """
+        return {
+            'running': self.running,
+            'pending': len(self._pending),
+            'accepted': self.accepted,
+            'dropped': self.dropped,
+            'written': self.written,
+            'rejected': self.rejected,
+            'failed': self.failed,
+            'flushes': self.flushes,
+            'avg_flush_ms': self.flush_seconds / self.flushes * 1000 if self.flushes else 0.0,
+        }
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        started_at = time.perf_counter()
+        try:
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(insert(self.model).values(rows))
+                    await db.commit()
+                self.written += len(rows)
+            except IntegrityError:
+                # Uma linha inválida (ex.: chave estrangeira inexistente) derrubaria o
+                # lote inteiro: regrava linha a linha, descartando só as inválidas
+                rows = await self._write_individually(rows)
+        except Exception:
+            self.failed += len(rows)
+            logger.exception('Write-behind flush of %d %s rows failed.', len(rows), self.name)
+        finally:
+            self.flushes += 1
+            self.flush_seconds += time.perf_counter() - started_at
+
+    async def _write_individually(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        valid = []
+        async with self.session_factory() as db:
+            for row in rows:
+                try:
+                    async with db.begin_nested():
+                        await db.execute(insert(self.model).values(row))
+                    valid.append(row)
+                except IntegrityError:
+                    self.rejected += 1
+            await db.commit()
+        self.written += len(valid)
+        return valid
@@ -1 +1,8 @@
-from .user import UserCRUD
\ No newline at end of file
+from .accessibility import AccessibilityCriteriaCRUD, accessibility_criteria_crud
+from .establishment import EstablishmentCRUD, establishment_crud
+from .image import ImageCRUD, image_crud
+from .map_cell import MapCellCRUD, MapCellDelta, map_cell_crud
+from .review import ReviewCRUD, review_crud
+from .search_history import SearchHistoryCRUD, search_history_crud
+from .suggestion import SuggestionCRUD, suggestion_crud
+from .user import UserCRUD, user_crud
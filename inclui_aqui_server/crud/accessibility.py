@@ -0,0 +1,71 @@
+from typing import Dict
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.core.accessibility import MAX_CRITERIA
+from inclui_aqui_server.db.models import AccessibilityCriteria
+
+
+class AccessibilityCriteriaCRUD:
+    """
+    Classe de Ações CRUD para o modelo AccessibilityCriteria.
+    """
+
+    async def get_ordinals(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        Busca o catálogo de critérios ativos que já possuem ordinal.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :return: Mapa nome do critério -> ordinal.
+        """
+        result = await db.execute(
+            select(AccessibilityCriteria.name, AccessibilityCriteria.ordinal).filter(
+                AccessibilityCriteria.is_active.is_(True),
+                AccessibilityCriteria.ordinal.is_not(None),
+            )
+        )
+        return {row.name: row.ordinal for row in result.all()}
+
+    async def assign_missing_ordinals(self, db: AsyncSession) -> int:
+        """
+        Atribui ordinais livres aos critérios que ainda não têm um, na ordem de criação.
+
+        Ordinais já atribuídos nunca mudam, pois as máscaras gravadas dependem deles.
+        Não faz commit.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :raises ValueError: Se não houver ordinais livres suficientes.
+        :return: A quantidade de critérios que receberam ordinal.
+        """
+        used = set(
+            (await db.scalars(
+                select(AccessibilityCriteria.ordinal).filter(
+                    AccessibilityCriteria.ordinal.is_not(None)
+                )
+            )).all()
+        )
+        pending = (await db.scalars(
+            select(AccessibilityCriteria.id)
+            .filter(AccessibilityCriteria.ordinal.is_(None))
+            .order_by(AccessibilityCriteria.created_at, AccessibilityCriteria.id)
+        )).all()
+
+        free = [ordinal for ordinal in range(MAX_CRITERIA) if ordinal not in used]
+        if len(pending) > len(free):
+            raise ValueError(
+                f'Only {MAX_CRITERIA} accessibility criteria fit in the bitmask '
+                f'({len(pending) - len(free)} left without ordinal).'
+            )
+
+        for criteria_id, ordinal in zip(pending, free):
+            await db.execute(
+                update(AccessibilityCriteria)
+                .where(AccessibilityCriteria.id == criteria_id)
+                .values(ordinal=ordinal)
+            )
+        return len(pending)
+
+
+# Cria uma instância única da classe AccessibilityCriteriaCRUD para ser importada em outros lugares.
+accessibility_criteria_crud = AccessibilityCriteriaCRUD()
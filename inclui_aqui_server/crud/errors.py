@@ -0,0 +1,59 @@
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+# SQLSTATE do PostgreSQL para violação de restrição UNIQUE
+UNIQUE_VIOLATION = '23505'
+# SQLSTATE do PostgreSQL para violação de chave estrangeira
+FOREIGN_KEY_VIOLATION = '23503'
+
+
+def is_unique_violation(exc: IntegrityError) -> bool:
+    """
+    Indica se o IntegrityError foi causado por uma restrição UNIQUE.
+
+    :param exc: A exceção levantada pelo SQLAlchemy.
+    :return: True se for uma violação de unicidade.
+    """
+    return _has_sqlstate(exc, UNIQUE_VIOLATION)
+
+
+def is_foreign_key_violation(exc: IntegrityError) -> bool:
+    """
+    Indica se o IntegrityError foi causado por uma chave estrangeira inexistente.
+
+    :param exc: A exceção levantada pelo SQLAlchemy.
+    :return: True se for uma violação de chave estrangeira.
+    """
+    return _has_sqlstate(exc, FOREIGN_KEY_VIOLATION)
+
+
+def get_violated_constraint(exc: IntegrityError) -> Optional[str]:
+    """
+    Extrai o nome da restrição violada do erro do driver (asyncpg ou psycopg2).
+
+    :param exc: A exceção levantada pelo SQLAlchemy.
+    :return: O nome da restrição ou None se o driver não o informar.
+    """
+    for error in _driver_errors(exc):
+        name = getattr(error, 'constraint_name', None) or getattr(
+            getattr(error, 'diag', None), 'constraint_name', None
+        )
+        if name:
+            return name
+    return None
+
+
+def _has_sqlstate(exc: IntegrityError, sqlstate: str) -> bool:
+    return any(
+        (getattr(error, 'sqlstate', None) or getattr(error, 'pgcode', None)) == sqlstate
+        for error in _driver_errors(exc)
+    )
+
+
+def _driver_errors(exc: IntegrityError):
+    # O adaptador do asyncpg embrulha a exceção original, que fica em __cause__
+    orig = exc.orig
+    yield orig
+    if orig is not None and orig.__cause__ is not None:
+        yield orig.__cause__
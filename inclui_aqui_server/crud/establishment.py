@@ -0,0 +1,690 @@
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    TEXT,
+    Float,
+    bindparam,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, selectinload
+
+from inclui_aqui_server.core.geo import (
+    EARTH_RADIUS_M,
+    bounding_box,
+    encode_geohash,
+    geohash_with_neighbors,
+    haversine_m,
+    precision_for_radius,
+)
+from inclui_aqui_server.crud.map_cell import MapCellDelta, map_cell_crud
+from inclui_aqui_server.crud.pagination import paginate_keyset
+from inclui_aqui_server.db.models import (
+    Comment,
+    Establishment,
+    EstablishmentImage,
+    EstablishmentRating,
+    Review,
+    User,
+)
+
+
+def distance_expression(latitude: float, longitude: float):
+    """
+    Expressão SQL (haversine) da distância em metros entre o estabelecimento e um ponto.
+
+    :param latitude: Latitude do ponto de referência.
+    :param longitude: Longitude do ponto de referência.
+    :return: Uma expressão SQLAlchemy do tipo Float.
+    """
+    lat1 = func.radians(latitude)
+    lat2 = func.radians(Establishment.latitude)
+    d_lat = func.radians(Establishment.latitude - latitude)
+    d_lon = func.radians(Establishment.longitude - longitude)
+    a = func.power(func.sin(d_lat / 2), 2) + func.cos(lat1) * func.cos(lat2) * func.power(
+        func.sin(d_lon / 2), 2
+    )
+    # LEAST protege o asin de erros de arredondamento (a ligeiramente > 1)
+    return (2 * EARTH_RADIUS_M * func.asin(func.sqrt(func.least(a, 1.0)))).cast(Float)
+
+
+def text_match(query: str):
+    """
+    Filtro e relevância da busca textual sobre `Establishment.search_text`.
+
+    Um estabelecimento casa se contém o texto (LIKE) ou se alguma de suas
+    palavras é parecida com ele (operador `<%` do pg_trgm, que tolera erros de
+    digitação). Ambas as condições usam o índice GIN de trigramas. A relevância é
+    a `word_similarity`, com um bônus quando o nome começa com o texto buscado.
+
+    :param query: O texto buscado, já normalizado (minúsculas).
+    :return: Uma tupla (condição do WHERE, expressão de relevância).
+    """
+    search_text = Establishment.search_text
+    condition = or_(
+        search_text.contains(query, autoescape=True),
+        literal(query).op('<%')(search_text),
+    )
+    prefix_bonus = case(
+        (func.lower(Establishment.name).startswith(query, autoescape=True), 1.0), else_=0.0
+    )
+    score = (func.word_similarity(query, search_text) + prefix_bonus).cast(Float)
+    return condition, score
+
+
+def accessibility_match(mask: int, match_all: bool):
+    """
+    Condição SQL que compara `Establishment.accessibility_mask` com uma máscara de critérios.
+
+    :param mask: A máscara com um bit por critério pedido.
+    :param match_all: Se True, exige todos os critérios (AND); senão, ao menos um (OR).
+    :return: Uma expressão booleana SQLAlchemy.
+    """
+    matched = Establishment.accessibility_mask.bitwise_and(mask)
+    return matched == mask if match_all else matched != 0
+
+
+# O JOIN de `rating_summary` não se aplica a UPDATE ... RETURNING; sem esta opção,
+# as respostas de escrita trariam review_count=0 e average_rating=None
+_RETURNING_RATING_SUMMARY = selectinload(Establishment.rating_summary)
+
+
+def _moved(old: Tuple[Any, Any], new: Tuple[Any, Any]) -> bool:
+    # As colunas guardam 8 casas decimais
+    return any(round(float(a), 8) != round(float(b), 8) for a, b in zip(old, new))
+
+
+class EstablishmentCRUD:
+    """
+    Classe de Ações CRUD para o modelo Establishment.
+    Encapsula toda a lógica de acesso ao banco de dados para os estabelecimentos.
+    """
+
+    # Colunas sobrescritas quando uma importação encontra o mesmo google_place_id.
+    # `owner_id` e `is_approved` são preservados.
+    IMPORT_UPDATE_COLUMNS = (
+        'name',
+        'address',
+        'latitude',
+        'longitude',
+        'type',
+        'main_image_url',
+        'description',
+        'accessibility_features_json',
+        'accessibility_mask',
+        'geohash',
+    )
+
+    async def get(self, db: AsyncSession, establishment_id: uuid.UUID) -> Optional[Establishment]:
+        """
+        Busca um único estabelecimento pelo seu ID.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :return: O objeto Establishment ou None se não for encontrado.
+        """
+        result = await db.execute(select(Establishment).filter(Establishment.id == establishment_id))
+        return result.scalar_one_or_none()
+
+    async def get_approved_by_ids(
+        self, db: AsyncSession, establishment_ids: Sequence[uuid.UUID]
+    ) -> List[Establishment]:
+        """
+        Busca estabelecimentos aprovados pelos IDs, em uma única consulta (IN).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_ids: Os UUIDs dos estabelecimentos.
+        :return: Os estabelecimentos encontrados, sem ordem definida.
+        """
+        if not establishment_ids:
+            return []
+        result = await db.scalars(
+            select(Establishment).filter(
+                Establishment.id.in_(establishment_ids), Establishment.is_approved.is_(True)
+            )
+        )
+        return list(result.all())
+
+    async def get_with_owner(
+        self, db: AsyncSession, establishment_id: uuid.UUID
+    ) -> Optional[Establishment]:
+        """
+        Busca um estabelecimento já com o dono carregado, na mesma consulta (JOIN).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :return: O objeto Establishment ou None se não for encontrado.
+        """
+        result = await db.execute(
+            select(Establishment)
+            .options(joinedload(Establishment.owner))
+            .filter(Establishment.id == establishment_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_detail_version(
+        self, db: AsyncSession, establishment_id: uuid.UUID
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Busca, em uma única consulta, os marcadores de versão de tudo o que compõe o detalhe.
+
+        São as datas de alteração do estabelecimento, do dono, dos agregados, das
+        avaliações e de seus autores, e a quantidade e a data mais recente das
+        imagens aprovadas e dos comentários. As escritas que preservam `updated_at`
+        (a máscara de acessibilidade e as notas de sentimento) entram pelos próprios
+        valores: a máscara e a quantidade de avaliações com nota. Qualquer escrita
+        que mude o detalhe muda ao menos um desses valores.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :return: A tupla de marcadores, ou None se o estabelecimento não for encontrado.
+        """
+        owner = aliased(User)
+        author = aliased(User)
+        of_establishment = Review.establishment_id == establishment_id
+        approved_images = select(EstablishmentImage).filter(
+            EstablishmentImage.establishment_id == establishment_id,
+            EstablishmentImage.is_approved.is_(True),
+        ).subquery()
+        comments = select(Comment).join(Review, Review.id == Comment.review_id).filter(
+            of_establishment
+        ).subquery()
+        stmt = (
+            select(
+                Establishment.updated_at,
+                Establishment.accessibility_mask,
+                owner.updated_at,
+                select(EstablishmentRating.updated_at)
+                .filter(EstablishmentRating.establishment_id == establishment_id)
+                .scalar_subquery(),
+                select(func.max(Review.updated_at)).filter(of_establishment).scalar_subquery(),
+                # As notas só passam de nulas a preenchidas (uma edição volta a anulá-las)
+                select(func.count(Review.sentiment_score)).filter(of_establishment).scalar_subquery(),
+                select(func.max(author.updated_at))
+                .join(Review, Review.user_id == author.id)
+                .filter(of_establishment)
+                .scalar_subquery(),
+                select(func.count()).select_from(approved_images).scalar_subquery(),
+                select(func.max(approved_images.c.uploaded_at)).scalar_subquery(),
+                select(func.count()).select_from(comments).scalar_subquery(),
+                select(func.max(comments.c.updated_at)).scalar_subquery(),
+            )
+            .join(owner, owner.id == Establishment.owner_id)
+            .filter(Establishment.id == establishment_id)
+        )
+        row = (await db.execute(stmt)).one_or_none()
+        return tuple(row) if row is not None else None
+
+    async def get_approved_images(
+        self, db: AsyncSession, establishment_id: uuid.UUID, *, limit: int
+    ) -> List[EstablishmentImage]:
+        """
+        Busca as imagens aprovadas de um estabelecimento, das mais recentes às mais antigas.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param limit: O número máximo de imagens.
+        :return: As imagens encontradas.
+        """
+        if limit <= 0:
+            return []
+        result = await db.scalars(
+            select(EstablishmentImage)
+            .filter(
+                EstablishmentImage.establishment_id == establishment_id,
+                EstablishmentImage.is_approved.is_(True),
+            )
+            .order_by(EstablishmentImage.uploaded_at.desc(), EstablishmentImage.id.desc())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def get_within_radius(
+        self,
+        db: AsyncSession,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Tuple[Establishment, float]], Optional[str]]:
+        """
+        Busca estabelecimentos aprovados dentro de um raio, ordenados pela distância.
+
+        A busca é feita em duas etapas: o índice de geohash seleciona apenas os
+        candidatos das 9 células que cobrem o círculo (mais um filtro por
+        retângulo), e a distância exata é calculada no banco sobre esse conjunto.
+        A paginação é por cursor sobre (distância, id).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param latitude: Latitude do centro da busca.
+        :param longitude: Longitude do centro da busca.
+        :param radius_m: O raio da busca em metros.
+        :param limit: O número máximo de registros a retornar.
+        :param cursor: O cursor retornado pela página anterior, ou None para a primeira página.
+        :return: Uma tupla com a lista de pares (Establishment, distância em metros) e o próximo cursor.
+        """
+        precision = precision_for_radius(radius_m, latitude)
+        cells = geohash_with_neighbors(encode_geohash(latitude, longitude, precision))
+        lat_min, lat_max, lon_ranges = bounding_box(latitude, longitude, radius_m)
+        distance = distance_expression(latitude, longitude)
+
+        stmt = select(Establishment, distance.label('distance_m')).filter(
+            Establishment.is_approved.is_(True),
+            or_(*(Establishment.geohash.startswith(cell, autoescape=True) for cell in cells)),
+            Establishment.latitude.between(lat_min, lat_max),
+            or_(*(Establishment.longitude.between(west, east) for west, east in lon_ranges)),
+            distance <= radius_m,
+        )
+        rows, next_cursor = await paginate_keyset(
+            db,
+            stmt,
+            keys=(distance, Establishment.id),
+            limit=limit,
+            cursor=cursor,
+            scalars=False,
+            cursor_values=lambda row: (row.distance_m, row.Establishment.id),
+        )
+        return [(row.Establishment, row.distance_m) for row in rows], next_cursor
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        type: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Tuple[Establishment, float]]:
+        """
+        Busca estabelecimentos aprovados por nome, endereço ou tipo, ordenados por relevância.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param query: O texto buscado, já normalizado.
+        :param type: Filtra pelo tipo exato do estabelecimento, se informado.
+        :param limit: O número máximo de registros a retornar.
+        :return: Lista de pares (Establishment, relevância).
+        """
+        condition, score = text_match(query)
+        stmt = select(Establishment, score.label('score')).filter(
+            Establishment.is_approved.is_(True), condition
+        )
+        if type is not None:
+            stmt = stmt.filter(Establishment.type == type)
+        stmt = stmt.order_by(score.desc(), Establishment.name, Establishment.id).limit(limit)
+        result = await db.execute(stmt)
+        return [(row.Establishment, row.score) for row in result.all()]
+
+    async def autocomplete(self, db: AsyncSession, *, query: str, limit: int = 10) -> List[Any]:
+        """
+        Sugestões de estabelecimentos aprovados para o texto digitado até o momento.
+
+        Seleciona apenas as colunas exibidas na sugestão, sem carregar o objeto ORM.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param query: O texto digitado, já normalizado.
+        :param limit: O número máximo de sugestões.
+        :return: Linhas com id, name, address, type e score.
+        """
+        condition, score = text_match(query)
+        stmt = (
+            select(
+                Establishment.id,
+                Establishment.name,
+                Establishment.address,
+                Establishment.type,
+                score.label('score'),
+            )
+            .filter(Establishment.is_approved.is_(True), condition)
+            .order_by(score.desc(), Establishment.name, Establishment.id)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return list(result.all())
+
+    async def get_by_accessibility(
+        self,
+        db: AsyncSession,
+        *,
+        mask: int,
+        match_all: bool = True,
+        region: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Establishment], Optional[str]]:
+        """
+        Busca estabelecimentos aprovados que atendem a um conjunto de critérios de acessibilidade.
+
+        A comparação é feita com operações de bits sobre `accessibility_mask`, sem
+        ler o JSON. A paginação é por cursor sobre (created_at, id).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param mask: A máscara dos critérios pedidos.
+        :param match_all: Se True, exige todos os critérios; senão, ao menos um.
+        :param region: Restringe a busca às células de geohash com este prefixo, se informado.
+        :param limit: O número máximo de registros a retornar.
+        :param cursor: O cursor retornado pela página anterior, ou None para a primeira página.
+        :return: Uma tupla com a lista de Establishment e o próximo cursor.
+        """
+        stmt = select(Establishment).filter(
+            Establishment.is_approved.is_(True), accessibility_match(mask, match_all)
+        )
+        if region:
+            stmt = stmt.filter(Establishment.geohash.startswith(region, autoescape=True))
+        return await paginate_keyset(
+            db,
+            stmt,
+            keys=(Establishment.created_at, Establishment.id),
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def get_region(self, db: AsyncSession, *, region: str, limit: int) -> List[Establishment]:
+        """
+        Busca os estabelecimentos aprovados de uma região (prefixo de geohash), na ordem (created_at, id).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param region: O prefixo de geohash da região.
+        :param limit: O número máximo de registros a retornar.
+        :return: A lista de Establishment.
+        """
+        result = await db.scalars(
+            select(Establishment)
+            .filter(
+                Establishment.is_approved.is_(True),
+                Establishment.geohash.startswith(region, autoescape=True),
+            )
+            .order_by(Establishment.created_at, Establishment.id)
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def update_accessibility(
+        self,
+        db: AsyncSession,
+        *,
+        establishment_id: uuid.UUID,
+        features: Any,
+        mask: int,
+    ) -> Optional[Establishment]:
+        """
+        Grava o JSON de acessibilidade e a máscara correspondente em um único UPDATE.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param features: O novo `accessibility_features_json`.
+        :param mask: A máscara calculada a partir de `features`.
+        :return: O objeto Establishment atualizado, ou None se não for encontrado.
+        """
+        stmt = (
+            update(Establishment)
+            .where(Establishment.id == establishment_id)
+            .values(accessibility_features_json=features, accessibility_mask=mask)
+            .returning(Establishment)
+            .options(_RETURNING_RATING_SUMMARY)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        establishment = (await db.scalars(stmt)).one_or_none()
+        await db.commit()
+        return establishment
+
+    async def set_approval(
+        self, db: AsyncSession, *, establishment_id: uuid.UUID, is_approved: bool
+    ) -> Optional[Establishment]:
+        """
+        Aprova ou reprova um estabelecimento, atualizando as células do mapa na mesma transação.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param is_approved: O novo estado de aprovação.
+        :return: O objeto Establishment, ou None se não for encontrado.
+        """
+        stmt = (
+            update(Establishment)
+            .where(
+                Establishment.id == establishment_id,
+                Establishment.is_approved.is_distinct_from(is_approved),
+            )
+            .values(is_approved=is_approved)
+            .returning(Establishment)
+            .options(_RETURNING_RATING_SUMMARY)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        establishment = (await db.scalars(stmt)).one_or_none()
+        if establishment is None:
+            # Já estava no estado pedido (ou não existe): nada a atualizar
+            await db.rollback()
+            return await self.get(db, establishment_id)
+
+        delta = MapCellDelta()
+        delta.add(establishment.latitude, establishment.longitude, sign=1 if is_approved else -1)
+        await map_cell_crud.apply(db, delta)
+        await db.commit()
+        return establishment
+
+    async def update_location(
+        self,
+        db: AsyncSession,
+        *,
+        establishment_id: uuid.UUID,
+        latitude: float,
+        longitude: float,
+    ) -> Tuple[Optional[Establishment], Optional[str]]:
+        """
+        Move um estabelecimento, atualizando geohash e células do mapa na mesma transação.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param latitude: A nova latitude.
+        :param longitude: A nova longitude.
+        :return: Uma tupla (Establishment atualizado ou None se não encontrado, geohash anterior).
+        """
+        old = (await db.execute(
+            select(
+                Establishment.latitude,
+                Establishment.longitude,
+                Establishment.is_approved,
+                Establishment.geohash,
+            )
+            .where(Establishment.id == establishment_id)
+            .with_for_update()
+        )).one_or_none()
+        if old is None:
+            await db.rollback()
+            return None, None
+
+        # Mesma precisão das colunas DECIMAL, para que o mapa use a coordenada gravada
+        latitude, longitude = round(latitude, 8), round(longitude, 8)
+        stmt = (
+            update(Establishment)
+            .where(Establishment.id == establishment_id)
+            .values(
+                latitude=latitude,
+                longitude=longitude,
+                geohash=encode_geohash(latitude, longitude),
+            )
+            .returning(Establishment)
+            .options(_RETURNING_RATING_SUMMARY)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        establishment = (await db.scalars(stmt)).one()
+
+        if old.is_approved and _moved((old.latitude, old.longitude), (latitude, longitude)):
+            delta = MapCellDelta()
+            delta.move((old.latitude, old.longitude), (latitude, longitude))
+            await map_cell_crud.apply(db, delta)
+        await db.commit()
+        return establishment, old.geohash
+
+    async def get_points_in_box(
+        self,
+        db: AsyncSession,
+        *,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Busca as coordenadas dos estabelecimentos aprovados dentro de um retângulo.
+
+        O retângulo é coberto pelas células de geohash em torno do seu centro (como
+        em `get_within_radius`), para que a consulta use o índice de geohash.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param limit: O número máximo de pontos.
+        :return: Linhas com id, name, type, latitude e longitude.
+        """
+        center_lat = (min_latitude + max_latitude) / 2
+        center_lon = (min_longitude + max_longitude) / 2
+        radius_m = haversine_m(center_lat, center_lon, max_latitude, max_longitude)
+        cells = geohash_with_neighbors(
+            encode_geohash(center_lat, center_lon, precision_for_radius(radius_m, center_lat))
+        )
+        result = await db.execute(
+            select(
+                Establishment.id,
+                Establishment.name,
+                Establishment.type,
+                Establishment.latitude,
+                Establishment.longitude,
+            )
+            .filter(
+                Establishment.is_approved.is_(True),
+                or_(*(Establishment.geohash.startswith(cell, autoescape=True) for cell in cells)),
+                Establishment.latitude.between(min_latitude, max_latitude),
+                Establishment.longitude.between(min_longitude, max_longitude),
+            )
+            .order_by(Establishment.id)
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def get_features_batch(
+        self, db: AsyncSession, *, after_id: Optional[uuid.UUID] = None, limit: int = 1000
+    ) -> List[Any]:
+        """
+        Lê (id, accessibility_features_json) de todos os estabelecimentos em lotes, por id.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param after_id: O último id do lote anterior, ou None para o primeiro lote.
+        :param limit: O tamanho do lote.
+        :return: As linhas do lote.
+        """
+        stmt = select(Establishment.id, Establishment.accessibility_features_json)
+        if after_id is not None:
+            stmt = stmt.filter(Establishment.id > after_id)
+        result = await db.execute(stmt.order_by(Establishment.id).limit(limit))
+        return list(result.all())
+
+    async def update_masks(self, db: AsyncSession, rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        Atualiza `accessibility_mask` de vários estabelecimentos em um único executemany.
+
+        `updated_at` é preservado: a máscara é derivada de um dado que não mudou.
+        `get_detail_version` lê a máscara diretamente. Não faz commit.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param rows: Dicionários com as chaves `establishment_id` e `mask`.
+        """
+        if not rows:
+            return
+        table = Establishment.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam('establishment_id'))
+            .values(accessibility_mask=bindparam('mask'), updated_at=table.c.updated_at)
+        )
+        await db.execute(stmt, list(rows))
+
+    async def upsert_by_place_id(
+        self, db: AsyncSession, *, rows: Sequence[Dict[str, Any]]
+    ) -> Tuple[int, int]:
+        """
+        Insere ou atualiza estabelecimentos pelo `google_place_id`. Não faz commit.
+
+        Usa `INSERT ... ON CONFLICT (google_place_id) DO UPDATE` em lotes
+        multi-linha. A atualização só acontece se algum campo mudou, então
+        reimportar o mesmo arquivo não altera `updated_at`. O `RETURNING xmax = 0`
+        distingue linhas inseridas (xmax zero) de atualizadas.
+
+        As linhas não podem repetir `google_place_id` e devem trazer `geohash` e
+        `accessibility_mask` já calculados (os listeners do ORM não rodam aqui).
+        Elas são gravadas na ordem do `google_place_id`, para que importações
+        concorrentes bloqueiem as mesmas linhas na mesma ordem, sem deadlock.
+        As células do mapa são atualizadas na mesma transação para os inseridos já
+        aprovados e para os aprovados cuja coordenada mudou.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param rows: Dicionários com as colunas de cada estabelecimento.
+        :return: Uma tupla (inseridos, atualizados); as demais linhas estavam iguais.
+        """
+        if not rows:
+            return 0, 0
+        rows = sorted(rows, key=lambda row: row['google_place_id'])
+
+        # Bloqueia os existentes até o commit, para calcular a mudança de posição no mapa
+        existing = {
+            row.google_place_id: row
+            for row in (await db.execute(
+                select(
+                    Establishment.google_place_id,
+                    Establishment.latitude,
+                    Establishment.longitude,
+                    Establishment.is_approved,
+                )
+                .filter(Establishment.google_place_id.in_([row['google_place_id'] for row in rows]))
+                .order_by(Establishment.google_place_id)
+                .with_for_update()
+            )).all()
+        }
+
+        table = Establishment.__table__
+        stmt = pg_insert(table)
+        excluded = stmt.excluded
+        changed = or_(*(
+            # json não tem operador de igualdade; compara a representação textual
+            cast(table.c[name], TEXT).is_distinct_from(cast(excluded[name], TEXT))
+            if name == 'accessibility_features_json'
+            else table.c[name].is_distinct_from(excluded[name])
+            for name in self.IMPORT_UPDATE_COLUMNS
+        ))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.google_place_id],
+            set_={
+                **{name: excluded[name] for name in self.IMPORT_UPDATE_COLUMNS},
+                'updated_at': func.now(),
+            },
+            where=changed,
+        ).returning(literal_column('xmax = 0').label('inserted'))
+
+        result = await db.execute(stmt, list(rows))
+        flags = result.scalars().all()
+        inserted = sum(1 for flag in flags if flag)
+
+        delta = MapCellDelta()
+        for row in rows:
+            old = existing.get(row['google_place_id'])
+            new_position = (row['latitude'], row['longitude'])
+            if old is None:
+                if row.get('is_approved'):
+                    delta.add(*new_position)
+            elif old.is_approved and _moved((old.latitude, old.longitude), new_position):
+                delta.move((old.latitude, old.longitude), new_position)
+        await map_cell_crud.apply(db, delta)
+
+        return inserted, len(flags) - inserted
+
+
+# Cria uma instância única da classe EstablishmentCRUD para ser importada em outros lugares.
+establishment_crud = EstablishmentCRUD()
@@ -0,0 +1,112 @@
+import uuid
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.db.models import EstablishmentImage, ReviewImage
+
+
+class ImageCRUD:
+    """
+    Classe de Ações CRUD para os modelos EstablishmentImage e ReviewImage.
+
+    O mesmo arquivo (mesma URL) pode ser associado a vários estabelecimentos ou
+    avaliações, mas no máximo uma vez a cada um: reenviar a mesma foto devolve
+    o registro existente.
+    """
+
+    async def add_establishment_image(
+        self,
+        db: AsyncSession,
+        *,
+        establishment_id: uuid.UUID,
+        url: str,
+        content_hash: str,
+        user_id: Optional[uuid.UUID] = None,
+        description: Optional[str] = None,
+    ) -> Tuple[EstablishmentImage, bool]:
+        """
+        Associa uma imagem a um estabelecimento, se ainda não estiver associada.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param url: A URL da imagem no armazenamento.
+        :param content_hash: O SHA-256 do arquivo.
+        :param user_id: O usuário que enviou a imagem.
+        :param description: A descrição da imagem.
+        :return: Uma tupla (imagem, True se foi criada agora).
+        """
+        stmt = (
+            pg_insert(EstablishmentImage)
+            .values(
+                establishment_id=establishment_id,
+                user_id=user_id,
+                s3_url=url,
+                content_hash=content_hash,
+                description=description,
+            )
+            .on_conflict_do_nothing(index_elements=['establishment_id', 's3_url'])
+            .returning(EstablishmentImage)
+        )
+        image = (await db.scalars(stmt)).one_or_none()
+        created = image is not None
+        if image is None:
+            image = (await db.scalars(
+                select(EstablishmentImage).filter(
+                    EstablishmentImage.establishment_id == establishment_id,
+                    EstablishmentImage.s3_url == url,
+                )
+            )).one()
+        await db.commit()
+        return image, created
+
+    async def add_review_image(
+        self,
+        db: AsyncSession,
+        *,
+        review_id: uuid.UUID,
+        url: str,
+        content_hash: str,
+        user_id: Optional[uuid.UUID] = None,
+        description: Optional[str] = None,
+    ) -> Tuple[ReviewImage, bool]:
+        """
+        Associa uma imagem a uma avaliação, se ainda não estiver associada.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param review_id: O UUID da avaliação.
+        :param url: A URL da imagem no armazenamento.
+        :param content_hash: O SHA-256 do arquivo.
+        :param user_id: O usuário que enviou a imagem.
+        :param description: A descrição da imagem.
+        :return: Uma tupla (imagem, True se foi criada agora).
+        """
+        stmt = (
+            pg_insert(ReviewImage)
+            .values(
+                review_id=review_id,
+                user_id=user_id,
+                s3_url=url,
+                content_hash=content_hash,
+                description=description,
+            )
+            .on_conflict_do_nothing(index_elements=['review_id', 's3_url'])
+            .returning(ReviewImage)
+        )
+        image = (await db.scalars(stmt)).one_or_none()
+        created = image is not None
+        if image is None:
+            image = (await db.scalars(
+                select(ReviewImage).filter(
+                    ReviewImage.review_id == review_id,
+                    ReviewImage.s3_url == url,
+                )
+            )).one()
+        await db.commit()
+        return image, created
+
+
+# Cria uma instância única da classe ImageCRUD para ser importada em outros lugares.
+image_crud = ImageCRUD()
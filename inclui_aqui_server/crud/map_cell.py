@@ -0,0 +1,176 @@
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import and_, delete, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.geo import mercator_cell
+from inclui_aqui_server.db.models import Establishment, EstablishmentMapCell
+
+# Chave de uma célula: (zoom, x, y)
+CellKey = Tuple[int, int, int]
+
+
+class MapCellDelta:
+    """
+    Acumula as alterações (contagem e somas de coordenadas) a aplicar nas células do mapa.
+
+    Cada estabelecimento aprovado conta uma vez em cada zoom de 0 a `MAP_MAX_CLUSTER_ZOOM`.
+    """
+
+    def __init__(self):
+        self._cells: Dict[CellKey, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+
+    def __bool__(self) -> bool:
+        return any(count for count, _, _ in self._cells.values())
+
+    def add(self, latitude: float, longitude: float, sign: int = 1) -> None:
+        """
+        Soma (sign=1) ou subtrai (sign=-1) um estabelecimento de todas as suas células.
+        """
+        latitude, longitude = float(latitude), float(longitude)
+        for zoom in range(settings.MAP_MAX_CLUSTER_ZOOM + 1):
+            x, y = mercator_cell(latitude, longitude, zoom + settings.MAP_CELL_BITS)
+            cell = self._cells[(zoom, x, y)]
+            cell[0] += sign
+            cell[1] += sign * latitude
+            cell[2] += sign * longitude
+
+    def move(self, old: Tuple[float, float], new: Tuple[float, float]) -> None:
+        """
+        Transfere um estabelecimento de uma coordenada para outra.
+        """
+        self.add(*old, sign=-1)
+        self.add(*new, sign=1)
+
+    def rows(self) -> List[dict]:
+        # Ordem fixa das chaves, para evitar deadlocks entre transações concorrentes
+        return [
+            {
+                'zoom': zoom,
+                'cell_x': x,
+                'cell_y': y,
+                'count': count,
+                'latitude_sum': latitude_sum,
+                'longitude_sum': longitude_sum,
+            }
+            for (zoom, x, y), (count, latitude_sum, longitude_sum) in sorted(self._cells.items())
+            if count
+        ]
+
+
+class MapCellCRUD:
+    """
+    Classe de Ações CRUD para o modelo EstablishmentMapCell.
+    """
+
+    async def apply(self, db: AsyncSession, delta: MapCellDelta) -> None:
+        """
+        Aplica um `MapCellDelta` com incrementos atômicos (ON CONFLICT DO UPDATE). Não faz commit.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param delta: As alterações acumuladas.
+        """
+        rows = delta.rows()
+        if not rows:
+            return
+        table = EstablishmentMapCell.__table__
+        stmt = pg_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.zoom, table.c.cell_x, table.c.cell_y],
+            set_={
+                name: table.c[name] + stmt.excluded[name]
+                for name in ('count', 'latitude_sum', 'longitude_sum')
+            },
+        )
+        await db.execute(stmt, rows)
+
+    async def get_cells(
+        self,
+        db: AsyncSession,
+        *,
+        zoom: int,
+        x_ranges: Sequence[Tuple[int, int]],
+        y_range: Tuple[int, int],
+    ) -> List[EstablishmentMapCell]:
+        """
+        Busca as células não vazias de um zoom dentro de intervalos de índices.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param zoom: O zoom do mapa.
+        :param x_ranges: Intervalos fechados de x (dois quando a área cruza o antimeridiano).
+        :param y_range: Intervalo fechado de y.
+        :return: As células encontradas.
+        """
+        result = await db.scalars(
+            select(EstablishmentMapCell).filter(
+                EstablishmentMapCell.zoom == zoom,
+                or_(*(
+                    and_(EstablishmentMapCell.cell_x >= low, EstablishmentMapCell.cell_x <= high)
+                    for low, high in x_ranges
+                )),
+                EstablishmentMapCell.cell_y.between(*y_range),
+                EstablishmentMapCell.count > 0,
+            )
+        )
+        return list(result.all())
+
+    async def rebuild(self, db: AsyncSession, *, batch_size: int = 5000) -> int:
+        """
+        Recalcula todas as células a partir dos estabelecimentos aprovados. Não faz commit.
+
+        As coordenadas são lidas uma única vez (em lotes) e agregadas zoom a zoom
+        com a mesma função usada nas atualizações incrementais, garantindo que
+        cada ponto caia exatamente na mesma célula. A tabela `establishments` fica
+        bloqueada para escrita (SHARE) até o commit, para que nenhum incremento
+        concorrente se perca entre a leitura e a reconstrução.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param batch_size: Quantidade de linhas lidas e gravadas por vez.
+        :return: A quantidade de células gravadas.
+        """
+        await db.execute(text('LOCK TABLE establishments IN SHARE MODE'))
+        latitudes, longitudes = array('d'), array('d')
+        result = await db.stream(
+            select(Establishment.latitude, Establishment.longitude)
+            .filter(Establishment.is_approved.is_(True))
+            .execution_options(yield_per=batch_size)
+        )
+        async for latitude, longitude in result:
+            latitudes.append(float(latitude))
+            longitudes.append(float(longitude))
+
+        await db.execute(delete(EstablishmentMapCell))
+        table = EstablishmentMapCell.__table__
+        written = 0
+        for zoom in range(settings.MAP_MAX_CLUSTER_ZOOM + 1):
+            level = zoom + settings.MAP_CELL_BITS
+            cells: Dict[Tuple[int, int], List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+            for latitude, longitude in zip(latitudes, longitudes):
+                cell = cells[mercator_cell(latitude, longitude, level)]
+                cell[0] += 1
+                cell[1] += latitude
+                cell[2] += longitude
+
+            rows = [
+                {
+                    'zoom': zoom,
+                    'cell_x': x,
+                    'cell_y': y,
+                    'count': count,
+                    'latitude_sum': latitude_sum,
+                    'longitude_sum': longitude_sum,
+                }
+                for (x, y), (count, latitude_sum, longitude_sum) in cells.items()
+            ]
+            for start in range(0, len(rows), batch_size):
+                await db.execute(table.insert(), rows[start:start + batch_size])
+            written += len(rows)
+        return written
+
+
+# Cria uma instância única da classe MapCellCRUD para ser importada em outros lugares.
+map_cell_crud = MapCellCRUD()
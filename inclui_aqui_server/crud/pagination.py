@@ -0,0 +1,140 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import ColumnElement, Select, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import TypeEngine
+
+from inclui_aqui_server.core.exception import BadRequestError
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Codifica os valores da chave de ordenação em um token opaco (base64 url-safe).
+
+    :param values: Os valores da chave do último item da página, na ordem da chave.
+    :return: O token do cursor.
+    """
+    payload = json.dumps([_encode_value(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str, keys: Optional[Sequence[ColumnElement]] = None) -> List[Any]:
+    """
+    Decodifica um token gerado por `encode_cursor`.
+
+    Com `keys`, a quantidade e o tipo de cada valor são conferidos com as colunas
+    da chave, para que um cursor adulterado não chegue ao banco.
+
+    :param token: O token do cursor.
+    :param keys: As colunas (ou expressões) da chave de ordenação, se conhecidas.
+    :raises BadRequestError: Se o token estiver malformado ou não corresponder às chaves.
+    :return: Os valores da chave de ordenação.
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_decode_value(item) for item in payload]
+        if keys is not None:
+            if len(values) != len(keys):
+                raise ValueError('Wrong number of cursor values')
+            values = [_coerce_value(value, key.type) for key, value in zip(keys, values)]
+        return values
+    except (binascii.Error, ValueError, TypeError, KeyError, ArithmeticError):
+        raise BadRequestError(detail='Invalid pagination cursor.')
+
+
+async def paginate_keyset(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    keys: Sequence[ColumnElement],
+    limit: int,
+    cursor: Optional[str] = None,
+    scalars: bool = True,
+    cursor_values: Optional[Callable[[Any], Sequence[Any]]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Executa uma consulta paginada por chave (keyset/cursor) em ordem crescente.
+
+    Em vez de OFFSET, a página seguinte é obtida com `WHERE (k1, k2) > (:v1, :v2)`,
+    que aproveita um índice composto sobre as chaves e custa o mesmo em qualquer
+    profundidade. A última chave deve ser única (ex.: `id`) para a ordem ser estável.
+
+    :param db: A sessão do banco de dados assíncrona.
+    :param stmt: A consulta base, sem ORDER BY nem LIMIT.
+    :param keys: As colunas (ou expressões) que formam a chave de ordenação.
+    :param limit: O número máximo de itens da página.
+    :param cursor: O token da página anterior, ou None para a primeira página.
+    :param scalars: Se True, retorna apenas a primeira coluna de cada linha (ex.: o objeto ORM).
+    :param cursor_values: Função que extrai os valores da chave de um item; por padrão usa
+        os atributos com o mesmo nome das colunas em `keys`.
+    :return: Uma tupla (itens, próximo cursor ou None se não houver mais páginas).
+    """
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        stmt = stmt.where(
+            tuple_(*keys) > tuple_(*(literal(value, key.type) for key, value in zip(keys, values)))
+        )
+
+    stmt = stmt.order_by(*keys).limit(limit + 1)
+    result = await (db.scalars(stmt) if scalars else db.execute(stmt))
+    items = list(result.all())
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        if cursor_values is not None:
+            next_cursor = encode_cursor(cursor_values(last))
+        else:
+            next_cursor = encode_cursor([getattr(last, key.key) for key in keys])
+    return items, next_cursor
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {'uuid': str(value)}
+    if isinstance(value, Decimal):
+        return {'dec': str(value)}
+    return value
+
+
+def _decode_value(item: Any) -> Any:
+    if isinstance(item, dict):
+        if 'dt' in item:
+            return datetime.fromisoformat(item['dt'])
+        if 'uuid' in item:
+            return uuid.UUID(item['uuid'])
+        if 'dec' in item:
+            return Decimal(item['dec'])
+        raise ValueError('Unknown cursor value type')
+    return item
+
+
+def _coerce_value(value: Any, type_: TypeEngine) -> Any:
+    try:
+        expected = type_.python_type
+    except NotImplementedError:
+        return value
+    # bool é subclasse de int, mas nunca é um valor válido de chave numérica
+    if isinstance(value, bool) and expected is not bool:
+        raise TypeError('Unexpected cursor value type')
+    if expected in (float, Decimal) and isinstance(value, int):
+        return expected(value)
+    if expected is float and isinstance(value, Decimal):
+        return float(value)
+    if not isinstance(value, expected):
+        raise TypeError('Unexpected cursor value type')
+    if isinstance(value, datetime) and (value.tzinfo is not None) != bool(
+        getattr(type_, 'timezone', False)
+    ):
+        raise ValueError('Unexpected cursor timezone')
+    return value
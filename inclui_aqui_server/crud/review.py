@@ -0,0 +1,490 @@
+import math
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    DECIMAL,
+    Float,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from inclui_aqui_server.db.models import (
+    Comment,
+    EstablishmentCriteriaRating,
+    EstablishmentRating,
+    Review,
+)
+from inclui_aqui_server.db.schemas import ReviewCreate, ReviewUpdate
+
+# Mesmo tamanho de `EstablishmentCriteriaRating.criterion`
+MAX_CRITERION_LENGTH = 100
+
+# Par (nota, criteria_json) de uma avaliação, usado no cálculo dos agregados
+RatingEntry = Tuple[int, Optional[Any]]
+
+
+def criteria_scores(criteria: Any) -> Dict[str, float]:
+    """
+    Extrai as notas numéricas de um `criteria_json`.
+
+    Números valem como estão e booleanos como 1/0; os demais valores são
+    ignorados. A recomputação em SQL (`recompute_aggregates`) segue a mesma regra.
+
+    :param criteria: O conteúdo de `Review.criteria_json`.
+    :return: Mapa critério -> nota.
+    """
+    if not isinstance(criteria, dict):
+        return {}
+    scores = {}
+    for key, value in criteria.items():
+        if len(key) > MAX_CRITERION_LENGTH:
+            continue
+        if isinstance(value, bool):
+            scores[key] = 1.0 if value else 0.0
+        elif isinstance(value, (int, float)) and math.isfinite(value):
+            scores[key] = float(value)
+    return scores
+
+
+# Recalcula os agregados por critério a partir de todas as avaliações.
+# Espelha `criteria_scores`: números valem como estão e booleanos como 1/0.
+_RECOMPUTE_CRITERIA_SQL = text("""
+    INSERT INTO establishment_criteria_ratings
+        (establishment_id, criterion, score_count, score_sum)
+    SELECT r.establishment_id, c.key, count(*), sum(c.score)
+    FROM reviews AS r
+    CROSS JOIN LATERAL (
+        SELECT item.key,
+               CASE json_typeof(item.value)
+                   WHEN 'number' THEN (item.value #>> '{}')::numeric
+                   WHEN 'boolean' THEN CASE WHEN (item.value #>> '{}')::boolean THEN 1 ELSE 0 END
+               END AS score
+        FROM json_each(
+            CASE WHEN json_typeof(r.criteria_json) = 'object' THEN r.criteria_json END
+        ) AS item
+    ) AS c
+    WHERE c.score IS NOT NULL AND length(c.key) <= :max_length
+    GROUP BY r.establishment_id, c.key
+""")
+
+
+class ReviewCRUD:
+    """
+    Classe de Ações CRUD para o modelo Review.
+
+    Toda escrita de avaliação atualiza, na mesma transação, os agregados do
+    estabelecimento (`EstablishmentRating` e `EstablishmentCriteriaRating`) com
+    incrementos atômicos (`INSERT ... ON CONFLICT DO UPDATE SET x = x + delta`).
+    """
+
+    async def get(self, db: AsyncSession, review_id: uuid.UUID) -> Optional[Review]:
+        """
+        Busca uma única avaliação pelo seu ID.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param review_id: O UUID da avaliação.
+        :return: O objeto Review ou None se não for encontrado.
+        """
+        result = await db.execute(select(Review).filter(Review.id == review_id))
+        return result.scalar_one_or_none()
+
+    async def create(self, db: AsyncSession, *, review_in: ReviewCreate) -> Review:
+        """
+        Cria uma avaliação e soma sua nota aos agregados do estabelecimento.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param review_in: O schema Pydantic com os dados de criação.
+        :return: O objeto Review recém-criado.
+        """
+        result = await db.scalars(insert(Review).values(**review_in.model_dump()).returning(Review))
+        review = result.one()
+        await self._apply_delta(
+            db, review.establishment_id, added=[(review.rating, review.criteria_json)]
+        )
+        await db.commit()
+        return review
+
+    async def update(
+        self, db: AsyncSession, *, review_id: uuid.UUID, review_in: ReviewUpdate
+    ) -> Optional[Review]:
+        """
+        Atualiza uma avaliação e corrige os agregados com a diferença entre as notas.
+
+        A linha antiga é lida com `FOR UPDATE`, para que duas edições simultâneas
+        da mesma avaliação não subtraiam a mesma nota duas vezes.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param review_id: O UUID da avaliação.
+        :param review_in: O schema Pydantic com os campos a serem atualizados.
+        :return: O objeto Review atualizado, ou None se não for encontrado.
+        """
+        old = (await db.execute(
+            select(Review.establishment_id, Review.rating, Review.criteria_json, Review.comment)
+            .where(Review.id == review_id)
+            .with_for_update()
+        )).one_or_none()
+        if old is None:
+            await db.rollback()
+            return None
+
+        update_data = review_in.model_dump(exclude_unset=True)
+        if update_data.get('rating') is None:
+            update_data.pop('rating', None)
+        if not update_data:
+            review = await self.get(db, review_id)
+            # Desanexada, a avaliação não é expirada pelo rollback que libera o FOR UPDATE
+            db.expunge(review)
+            await db.rollback()
+            return review
+
+        if 'comment' in update_data and update_data['comment'] != old.comment:
+            # A nota de sentimento é recalculada pelo worker a partir do novo comentário
+            update_data['sentiment_score'] = None
+        stmt = (
+            update(Review)
+            .where(Review.id == review_id)
+            .values(**update_data)
+            .returning(Review)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        review = (await db.scalars(stmt)).one()
+
+        if 'rating' in update_data or 'criteria_json' in update_data:
+            await self._apply_delta(
+                db,
+                review.establishment_id,
+                removed=[(old.rating, old.criteria_json)],
+                added=[(review.rating, review.criteria_json)],
+            )
+        await db.commit()
+        return review
+
+    async def remove(self, db: AsyncSession, *, review_id: uuid.UUID) -> Optional[Review]:
+        """
+        Remove uma avaliação e subtrai sua nota dos agregados do estabelecimento.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param review_id: O UUID da avaliação.
+        :return: O objeto Review removido, ou None se não for encontrado.
+        """
+        stmt = (
+            delete(Review)
+            .where(Review.id == review_id)
+            .returning(Review)
+            .execution_options(synchronize_session=False)
+        )
+        review = (await db.scalars(stmt)).one_or_none()
+        if review is not None:
+            await self._apply_delta(
+                db, review.establishment_id, removed=[(review.rating, review.criteria_json)]
+            )
+        await db.commit()
+        return review
+
+    async def remove_by_user(self, db: AsyncSession, *, user_id: uuid.UUID) -> int:
+        """
+        Remove todas as avaliações de um usuário, atualizando os agregados. Não faz commit.
+
+        Deve ser chamado antes de remover o usuário: o `ON DELETE CASCADE` do banco
+        apagaria as avaliações sem passar pelos agregados.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param user_id: O UUID do usuário.
+        :return: A quantidade de avaliações removidas.
+        """
+        result = await db.execute(
+            delete(Review)
+            .where(Review.user_id == user_id)
+            .returning(Review.establishment_id, Review.rating, Review.criteria_json)
+            .execution_options(synchronize_session=False)
+        )
+        removed: Dict[uuid.UUID, List[RatingEntry]] = defaultdict(list)
+        for row in result.all():
+            removed[row.establishment_id].append((row.rating, row.criteria_json))
+        # Ordem fixa de estabelecimentos, para evitar deadlocks entre transações
+        for establishment_id in sorted(removed):
+            await self._apply_delta(db, establishment_id, removed=removed[establishment_id])
+        return sum(len(entries) for entries in removed.values())
+
+    async def get_recent_by_establishment(
+        self, db: AsyncSession, establishment_id: uuid.UUID, *, limit: int
+    ) -> List[Review]:
+        """
+        Busca as avaliações mais recentes de um estabelecimento, com os autores carregados.
+
+        Os autores são carregados com `selectinload`: uma única consulta extra
+        (`WHERE users.id IN (...)`), independentemente da quantidade de avaliações.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param limit: O número máximo de avaliações.
+        :return: As avaliações encontradas.
+        """
+        if limit <= 0:
+            return []
+        result = await db.scalars(
+            select(Review)
+            .options(selectinload(Review.user))
+            .filter(Review.establishment_id == establishment_id)
+            .order_by(Review.created_at.desc(), Review.id.desc())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def count_comments(
+        self, db: AsyncSession, review_ids: Sequence[uuid.UUID]
+    ) -> Dict[uuid.UUID, int]:
+        """
+        Conta os comentários de várias avaliações em uma única consulta.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param review_ids: Os UUIDs das avaliações.
+        :return: Mapa avaliação -> quantidade de comentários (avaliações sem comentários ficam de fora).
+        """
+        if not review_ids:
+            return {}
+        result = await db.execute(
+            select(Comment.review_id, func.count())
+            .filter(Comment.review_id.in_(review_ids))
+            .group_by(Comment.review_id)
+        )
+        return {review_id: count for review_id, count in result.all()}
+
+    async def claim_unscored(self, db: AsyncSession, *, limit: int) -> List[Any]:
+        """
+        Reserva um lote de avaliações sem nota de sentimento. Não faz commit.
+
+        As linhas ficam bloqueadas (`FOR UPDATE SKIP LOCKED`) até o fim da
+        transação: workers concorrentes recebem lotes disjuntos, sem se esperar.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param limit: O tamanho máximo do lote.
+        :return: Linhas com id e comment, das mais antigas às mais recentes.
+        """
+        result = await db.execute(
+            select(Review.id, Review.comment)
+            .filter(Review.sentiment_score.is_(None))
+            .order_by(Review.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.all())
+
+    async def update_sentiment_scores(
+        self, db: AsyncSession, scores: Sequence[Tuple[uuid.UUID, float]]
+    ) -> None:
+        """
+        Grava as notas de sentimento de um lote com um único UPDATE ... FROM (VALUES ...). Não faz commit.
+
+        `updated_at` é preservado: a nota é derivada de um dado que não mudou.
+        A versão do detalhe do estabelecimento (`get_detail_version`) conta as
+        avaliações com nota, então o ETag muda mesmo assim.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param scores: Pares (id da avaliação, nota).
+        """
+        if not scores:
+            return
+        table = Review.__table__
+        batch = values(
+            column('id', UUID(as_uuid=True)),
+            column('score', DECIMAL(3, 2)),
+            name='scores',
+        ).data([(review_id, round(score, 2)) for review_id, score in scores])
+        await db.execute(
+            update(table)
+            .where(table.c.id == batch.c.id)
+            .values(sentiment_score=batch.c.score, updated_at=table.c.updated_at)
+        )
+
+    async def count_unscored(self, db: AsyncSession) -> int:
+        """
+        Conta as avaliações que aguardam a nota de sentimento.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :return: O tamanho da fila.
+        """
+        result = await db.execute(
+            select(func.count()).select_from(Review).filter(Review.sentiment_score.is_(None))
+        )
+        return result.scalar_one()
+
+    async def get_after(
+        self,
+        db: AsyncSession,
+        establishment_id: uuid.UUID,
+        *,
+        after: Optional[Tuple[datetime, uuid.UUID]],
+        settle_seconds: float,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Busca as avaliações de um estabelecimento posteriores a uma marca d'água.
+
+        Percorre o índice (establishment_id, created_at, id) a partir da marca,
+        sem ler as avaliações já processadas.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param after: (created_at, id) da última avaliação processada, ou None para começar do início.
+        :param settle_seconds: Avaliações mais recentes que isso são ignoradas.
+        :param limit: O número máximo de avaliações.
+        :return: Linhas com id, rating, comment, criteria_json, sentiment_score e created_at,
+            das mais antigas às mais recentes.
+        """
+        query = (
+            select(
+                Review.id,
+                Review.rating,
+                Review.comment,
+                Review.criteria_json,
+                Review.sentiment_score,
+                Review.created_at,
+            )
+            .filter(
+                Review.establishment_id == establishment_id,
+                Review.created_at
+                <= func.localtimestamp() - func.make_interval(0, 0, 0, 0, 0, 0, type_coerce(settle_seconds, Float)),
+            )
+            .order_by(Review.created_at, Review.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.filter(tuple_(Review.created_at, Review.id) > tuple_(*after))
+        result = await db.execute(query)
+        return list(result.all())
+
+    async def get_aggregates(
+        self, db: AsyncSession, establishment_id: uuid.UUID
+    ) -> Tuple[Optional[EstablishmentRating], List[EstablishmentCriteriaRating]]:
+        """
+        Busca os agregados de avaliações de um estabelecimento.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :return: Uma tupla (agregado geral ou None, agregados por critério).
+        """
+        rating = await db.get(EstablishmentRating, establishment_id)
+        criteria = await db.scalars(
+            select(EstablishmentCriteriaRating)
+            .filter(
+                EstablishmentCriteriaRating.establishment_id == establishment_id,
+                EstablishmentCriteriaRating.score_count > 0,
+            )
+            .order_by(EstablishmentCriteriaRating.criterion)
+        )
+        return rating, list(criteria.all())
+
+    async def recompute_aggregates(self, db: AsyncSession) -> Tuple[int, int]:
+        """
+        Reconstrói todos os agregados a partir da tabela `reviews`, em SQL. Não faz commit.
+
+        Corrige desvios causados por escritas fora deste CRUD. A tabela `reviews`
+        fica bloqueada para escrita (SHARE) até o commit, para que nenhum incremento
+        concorrente se perca entre a limpeza e a reconstrução.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :return: Uma tupla (estabelecimentos com avaliações, linhas de critérios).
+        """
+        await db.execute(text('LOCK TABLE reviews IN SHARE MODE'))
+        await db.execute(delete(EstablishmentRating))
+        await db.execute(delete(EstablishmentCriteriaRating))
+
+        histogram = [func.count().filter(Review.rating == score) for score in range(1, 6)]
+        ratings = await db.execute(
+            insert(EstablishmentRating).from_select(
+                [
+                    'establishment_id',
+                    'review_count',
+                    'rating_sum',
+                    *(f'rating_{score}' for score in range(1, 6)),
+                    'updated_at',
+                ],
+                select(
+                    Review.establishment_id,
+                    func.count(),
+                    func.sum(Review.rating),
+                    *histogram,
+                    func.now(),
+                ).group_by(Review.establishment_id),
+            )
+        )
+        criteria = await db.execute(_RECOMPUTE_CRITERIA_SQL, {'max_length': MAX_CRITERION_LENGTH})
+        return ratings.rowcount, criteria.rowcount
+
+    async def _apply_delta(
+        self,
+        db: AsyncSession,
+        establishment_id: uuid.UUID,
+        *,
+        removed: Sequence[RatingEntry] = (),
+        added: Sequence[RatingEntry] = (),
+    ) -> None:
+        histogram = Counter(rating for rating, _ in added)
+        histogram.subtract(rating for rating, _ in removed)
+        values = {
+            'review_count': len(added) - len(removed),
+            'rating_sum': (
+                sum(rating for rating, _ in added) - sum(rating for rating, _ in removed)
+            ),
+            **{f'rating_{score}': histogram[score] for score in range(1, 6)},
+        }
+        if any(values.values()):
+            stmt = pg_insert(EstablishmentRating).values(establishment_id=establishment_id, **values)
+            table = EstablishmentRating.__table__
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.establishment_id],
+                set_={
+                    **{name: table.c[name] + stmt.excluded[name] for name in values},
+                    'updated_at': func.now(),
+                },
+            )
+            await db.execute(stmt)
+
+        criteria: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        for sign, entries in ((1, added), (-1, removed)):
+            for _, criteria_json in entries:
+                for criterion, score in criteria_scores(criteria_json).items():
+                    criteria[criterion][0] += sign
+                    criteria[criterion][1] += sign * score
+        rows = [
+            {
+                'establishment_id': establishment_id,
+                'criterion': criterion,
+                'score_count': count,
+                'score_sum': score_sum,
+            }
+            # Ordem fixa de critérios, para evitar deadlocks entre transações
+            for criterion, (count, score_sum) in sorted(criteria.items())
+            if count or score_sum
+        ]
+        if rows:
+            stmt = pg_insert(EstablishmentCriteriaRating).values(rows)
+            table = EstablishmentCriteriaRating.__table__
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.establishment_id, table.c.criterion],
+                set_={
+                    'score_count': table.c.score_count + stmt.excluded.score_count,
+                    'score_sum': table.c.score_sum + stmt.excluded.score_sum,
+                },
+            )
+            await db.execute(stmt)
+
+
+# Cria uma instância única da classe ReviewCRUD para ser importada em outros lugares.
+review_crud = ReviewCRUD()
@@ -0,0 +1,196 @@
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Float, func, select, text, tuple_, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.db.models import UserSearchHistory
+
+_TABLE = UserSearchHistory.__tablename__
+
+# O DDL precisa de um lock exclusivo na tabela; sem limite, ele esperaria atrás de
+# consultas longas enquanto todas as buscas novas esperam atrás dele
+_LOCK_TIMEOUT_SQL = text("SET LOCAL lock_timeout = '5s'")
+
+_BOUND_RE = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+_LIST_PARTITIONS_SQL = text("""
+    SELECT child.relname AS name, pg_get_expr(child.relpartbound, child.oid) AS bound
+    FROM pg_inherits AS inheritance
+    JOIN pg_class AS child ON child.oid = inheritance.inhrelid
+    WHERE inheritance.inhparent = CAST(:table AS regclass)
+    ORDER BY child.relname
+""")
+
+
+@dataclass(frozen=True)
+class SearchHistoryPartition:
+    name: str
+    # Intervalo [start, end) de `timestamp` coberto pela partição
+    start: datetime
+    end: datetime
+
+
+def month_start(day: date) -> date:
+    """Retorna o primeiro dia do mês de `day`."""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Soma (ou subtrai) meses ao primeiro dia de um mês."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Nome da partição mensal (ex.: user_search_history_p202610)."""
+    return f'{_TABLE}_p{month:%Y%m}'
+
+
+class SearchHistoryCRUD:
+    """
+    Classe de Ações CRUD para o modelo UserSearchHistory.
+
+    A tabela é particionada por mês em `timestamp`. As partições são criadas
+    com antecedência (`ensure_partitions`) e a retenção remove partições
+    inteiras (`drop_partitions_before`): um DROP TABLE não gera linhas mortas
+    nem trabalho de VACUUM, ao contrário de um DELETE.
+    """
+
+    async def get_recent_by_user(
+        self, db: AsyncSession, user_id: uuid.UUID, *, limit: int
+    ) -> List[UserSearchHistory]:
+        """
+        Busca as buscas mais recentes de um usuário.
+
+        Usa o índice (user_id, timestamp DESC) de cada partição, da mais nova
+        para a mais antiga, parando ao atingir `limit`.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param user_id: O UUID do usuário.
+        :param limit: O número máximo de buscas.
+        :return: As buscas, da mais recente à mais antiga.
+        """
+        result = await db.scalars(
+            select(UserSearchHistory)
+            .filter(UserSearchHistory.user_id == user_id)
+            .order_by(UserSearchHistory.timestamp.desc())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def get_after(
+        self,
+        db: AsyncSession,
+        *,
+        after: Optional[Tuple[datetime, uuid.UUID]],
+        window_seconds: float,
+        settle_seconds: float,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Busca as buscas (de todos os usuários) posteriores a uma marca d'água.
+
+        O filtro simples em `timestamp` permite descartar as partições antigas
+        (a comparação de tuplas sozinha não permite) e usar o índice BRIN.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param after: (timestamp, id) da última busca lida, ou None para começar do início da janela.
+        :param window_seconds: Buscas mais antigas que isso são ignoradas (mesmo após a marca d'água).
+        :param settle_seconds: Buscas mais recentes que isso são ignoradas.
+        :param limit: O número máximo de buscas.
+        :return: Linhas com timestamp, id e query, das mais antigas às mais recentes.
+        """
+        query = (
+            select(UserSearchHistory.timestamp, UserSearchHistory.id, UserSearchHistory.query)
+            .filter(
+                UserSearchHistory.timestamp
+                > func.localtimestamp() - func.make_interval(0, 0, 0, 0, 0, 0, type_coerce(window_seconds, Float)),
+                UserSearchHistory.timestamp
+                <= func.localtimestamp() - func.make_interval(0, 0, 0, 0, 0, 0, type_coerce(settle_seconds, Float)),
+            )
+            .order_by(UserSearchHistory.timestamp, UserSearchHistory.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.filter(
+                UserSearchHistory.timestamp >= after[0],
+                tuple_(UserSearchHistory.timestamp, UserSearchHistory.id) > tuple_(*after),
+            )
+        result = await db.execute(query)
+        return list(result.all())
+
+    async def list_partitions(self, db: AsyncSession) -> List[SearchHistoryPartition]:
+        """
+        Lista as partições de intervalo da tabela.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :return: As partições, em ordem de nome (e, portanto, de mês).
+        """
+        result = await db.execute(_LIST_PARTITIONS_SQL, {'table': _TABLE})
+        partitions = []
+        for row in result:
+            match = _BOUND_RE.search(row.bound or '')
+            if match is None:
+                # Partição DEFAULT: não tem intervalo e nunca é removida pela retenção
+                continue
+            partitions.append(SearchHistoryPartition(
+                name=row.name,
+                start=datetime.fromisoformat(match.group(1)),
+                end=datetime.fromisoformat(match.group(2)),
+            ))
+        return partitions
+
+    async def ensure_partitions(
+        self, db: AsyncSession, *, first_month: date, months: int
+    ) -> List[str]:
+        """
+        Cria as partições mensais que ainda não existem. Não faz commit.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param first_month: Um dia do primeiro mês a garantir.
+        :param months: Quantidade de meses, a partir de `first_month`.
+        :return: Os nomes das partições criadas.
+        """
+        existing = {partition.name for partition in await self.list_partitions(db)}
+        await db.execute(_LOCK_TIMEOUT_SQL)
+        created = []
+        month = month_start(first_month)
+        for _ in range(months):
+            name = partition_name(month)
+            if name not in existing:
+                # Nomes e limites são gerados a partir de datas, não de entrada do usuário
+                await db.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {_TABLE} "
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                ))
+                created.append(name)
+            month = add_months(month, 1)
+        return created
+
+    async def drop_partitions_before(self, db: AsyncSession, cutoff: date) -> List[str]:
+        """
+        Remove as partições cujo intervalo termina até `cutoff`. Não faz commit.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param cutoff: As partições com todas as buscas anteriores a esta data são removidas.
+        :return: Os nomes das partições removidas.
+        """
+        cutoff_at = datetime.combine(cutoff, datetime.min.time())
+        expired = [
+            partition.name
+            for partition in await self.list_partitions(db)
+            if partition.end <= cutoff_at
+        ]
+        if expired:
+            await db.execute(_LOCK_TIMEOUT_SQL)
+        for name in expired:
+            await db.execute(text(f'DROP TABLE IF EXISTS {name}'))
+        return expired
+
+
+# Cria uma instância única da classe SearchHistoryCRUD para ser importada em outros lugares.
+search_history_crud = SearchHistoryCRUD()
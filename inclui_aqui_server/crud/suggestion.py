@@ -0,0 +1,172 @@
+import uuid
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, bindparam, func, insert, select, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.db.models import Suggestion
+
+# Marca d'água: (created_at, id) da avaliação mais recente já usada em uma sugestão
+Watermark = Tuple[datetime, uuid.UUID]
+
+# Maior UUID possível: com ele, a marca d'água cobre todo o instante `created_at`
+_MAX_UUID = uuid.UUID(int=(1 << 128) - 1)
+
+# Marca d'água de um estabelecimento: a avaliação mais recente entre as fontes da
+# última sugestão. Se todas as fontes foram removidas, vale o instante da sugestão.
+_WATERMARK_SQL = """
+    SELECT COALESCE(newest.created_at, last_suggestion.generated_at) AS created_at,
+           COALESCE(newest.id, :max_uuid) AS id
+    FROM (
+        SELECT s.source_review_ids, s.generated_at
+        FROM suggestions AS s
+        WHERE s.establishment_id = {establishment_id} AND s.source_review_ids IS NOT NULL
+        ORDER BY s.generated_at DESC
+        LIMIT 1
+    ) AS last_suggestion
+    LEFT JOIN LATERAL (
+        SELECT r.created_at, r.id
+        FROM reviews AS r
+        WHERE r.id = ANY(last_suggestion.source_review_ids)
+        ORDER BY r.created_at DESC, r.id DESC
+        LIMIT 1
+    ) AS newest ON true
+"""
+
+# Estabelecimentos com ao menos `min_new_reviews` avaliações depois da marca d'água.
+# A contagem para em `min_new_reviews` e percorre só o trecho novo do índice
+# (establishment_id, created_at, id): o custo não depende das avaliações antigas.
+_PENDING_SQL = text(f"""
+    SELECT e.id AS establishment_id
+    FROM establishments AS e
+    LEFT JOIN LATERAL ({_WATERMARK_SQL.format(establishment_id='e.id')}) AS watermark ON true
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS new_reviews
+        FROM (
+            SELECT 1
+            FROM reviews AS r
+            WHERE r.establishment_id = e.id
+              AND r.created_at <= LOCALTIMESTAMP - make_interval(secs => :settle_seconds)
+              AND (watermark.created_at IS NULL
+                   OR (r.created_at, r.id) > (watermark.created_at, watermark.id))
+            LIMIT :min_new_reviews
+        ) AS capped
+    ) AS pending
+    WHERE e.id > :after_id AND pending.new_reviews >= :min_new_reviews
+    ORDER BY e.id
+    LIMIT :limit
+""").bindparams(
+    bindparam('max_uuid', type_=UUID(as_uuid=True)),
+    bindparam('after_id', type_=UUID(as_uuid=True)),
+    bindparam('settle_seconds', type_=Float),
+)
+
+_ESTABLISHMENT_WATERMARK_SQL = text(
+    _WATERMARK_SQL.format(establishment_id=':establishment_id')
+).bindparams(
+    bindparam('max_uuid', type_=UUID(as_uuid=True)),
+    bindparam('establishment_id', type_=UUID(as_uuid=True)),
+)
+
+
+class SuggestionCRUD:
+    """
+    Classe de Ações CRUD para o modelo Suggestion.
+
+    O gerador de sugestões não guarda estado próprio: o ponto de onde cada
+    estabelecimento continua é derivado de `Suggestion.source_review_ids`.
+    """
+
+    async def get_pending_establishments(
+        self,
+        db: AsyncSession,
+        *,
+        min_new_reviews: int,
+        settle_seconds: float,
+        after_id: Optional[uuid.UUID] = None,
+        limit: int = 1000,
+    ) -> List[uuid.UUID]:
+        """
+        Lista, em páginas ordenadas por id, os estabelecimentos com avaliações novas.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param min_new_reviews: Avaliações novas necessárias para o estabelecimento entrar na lista.
+        :param settle_seconds: Avaliações mais recentes que isso são ignoradas.
+        :param after_id: O último id da página anterior (keyset).
+        :param limit: O tamanho máximo da página.
+        :return: Os ids dos estabelecimentos.
+        """
+        result = await db.scalars(_PENDING_SQL, {
+            'max_uuid': _MAX_UUID,
+            'after_id': after_id or uuid.UUID(int=0),
+            'settle_seconds': settle_seconds,
+            'min_new_reviews': max(min_new_reviews, 1),
+            'limit': limit,
+        })
+        return list(result.all())
+
+    async def try_lock_establishment(self, db: AsyncSession, establishment_id: uuid.UUID) -> bool:
+        """
+        Tenta obter o lock consultivo do estabelecimento até o fim da transação.
+
+        Impede que duas execuções simultâneas do gerador criem sugestões com as
+        mesmas avaliações; quem não obtém o lock simplesmente pula o estabelecimento.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :return: True se o lock foi obtido.
+        """
+        key = int.from_bytes(establishment_id.bytes[:8], 'big', signed=True)
+        return bool(await db.scalar(select(func.pg_try_advisory_xact_lock(key))))
+
+    async def get_watermark(
+        self, db: AsyncSession, establishment_id: uuid.UUID
+    ) -> Optional[Watermark]:
+        """
+        Busca a marca d'água do estabelecimento.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :return: (created_at, id) da avaliação mais recente já usada, ou None se não há sugestões.
+        """
+        row = (await db.execute(_ESTABLISHMENT_WATERMARK_SQL, {
+            'max_uuid': _MAX_UUID,
+            'establishment_id': establishment_id,
+        })).first()
+        return (row.created_at, row.id) if row is not None else None
+
+    async def create(
+        self,
+        db: AsyncSession,
+        *,
+        establishment_id: uuid.UUID,
+        content: str,
+        ai_model_version: str,
+        source_review_ids: Sequence[uuid.UUID],
+    ) -> uuid.UUID:
+        """
+        Grava uma sugestão. Não faz commit.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param establishment_id: O UUID do estabelecimento.
+        :param content: O texto da sugestão.
+        :param ai_model_version: A versão do modelo que gerou o texto.
+        :param source_review_ids: As avaliações usadas.
+        :return: O id da sugestão criada.
+        """
+        return await db.scalar(
+            insert(Suggestion)
+            .values(
+                establishment_id=establishment_id,
+                content=content,
+                ai_model_version=ai_model_version,
+                source_review_ids=list(source_review_ids),
+            )
+            .returning(Suggestion.id)
+        )
+
+
+# Cria uma instância única da classe SuggestionCRUD para ser importada em outros lugares.
+suggestion_crud = SuggestionCRUD()
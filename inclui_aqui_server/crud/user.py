@@ -1,9 +1,15 @@
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from inclui_aqui_server.crud.errors import get_violated_constraint, is_unique_violation
+from inclui_aqui_server.crud.pagination import paginate_keyset
+from inclui_aqui_server.crud.review import review_crud
 from inclui_aqui_server.db.models import User
 from inclui_aqui_server.db.schemas.user_schema import UserCreate, UserUpdate
-from sqlalchemy import select
+from sqlalchemy import Float, delete, func, insert, or_, select, tuple_, type_coerce, update
+from sqlalchemy.exc import IntegrityError
 
 class UserCRUD:
     """
@@ -11,6 +17,31 @@ class UserCRUD:
     Encapsula toda a lógica de acesso ao banco de dados para os usuários.
     """
 
+    # Nomes gerados pelo PostgreSQL para as colunas declaradas com unique=True
+    UNIQUE_CONSTRAINT_FIELDS = {
+        'users_email_key': 'email',
+        'users_username_key': 'username',
+    }
+
+    def get_conflicting_field(self, exc: IntegrityError) -> Optional[str]:
+        """
+        Identifica qual campo único foi violado em um IntegrityError.
+
+        :param exc: A exceção levantada ao escrever na tabela de usuários.
+        :return: O nome do campo ("email" ou "username") ou None se não for uma violação de unicidade.
+        """
+        if not is_unique_violation(exc):
+            return None
+        constraint = get_violated_constraint(exc)
+        if constraint in self.UNIQUE_CONSTRAINT_FIELDS:
+            return self.UNIQUE_CONSTRAINT_FIELDS[constraint]
+        # Alguns drivers não expõem o nome da restrição; recorre à mensagem do erro
+        message = str(exc.orig)
+        for field in self.UNIQUE_CONSTRAINT_FIELDS.values():
+            if f'({field})' in message:
+                return field
+        return 'identifier'
+
     async def get(self, db: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
         """
         Busca um único usuário pelo seu ID.
@@ -22,6 +53,90 @@ class UserCRUD:
         result = await db.execute(select(User).filter(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_updated_at(self, db: AsyncSession, user_id: uuid.UUID) -> Optional[datetime]:
+        """
+        Busca apenas a versão (`updated_at`) de um usuário, sem carregar a linha inteira.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param user_id: O UUID do usuário.
+        :return: A data da última alteração, ou None se o usuário não for encontrado.
+        """
+        result = await db.execute(select(User.updated_at).filter(User.id == user_id))
+        return result.scalar_one_or_none()
+
+    async def get_usernames(
+        self, db: AsyncSession, user_ids: Sequence[uuid.UUID]
+    ) -> Dict[uuid.UUID, str]:
+        """
+        Busca os nomes de usuário de vários usuários em uma única consulta (IN).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param user_ids: Os UUIDs dos usuários.
+        :return: Um dicionário id -> username (usuários inexistentes ficam de fora).
+        """
+        if not user_ids:
+            return {}
+        result = await db.execute(select(User.id, User.username).filter(User.id.in_(user_ids)))
+        return {row.id: row.username for row in result.all()}
+
+    async def get_points_page(
+        self, db: AsyncSession, *, after_id: Optional[uuid.UUID] = None, limit: int = 10_000
+    ) -> List[Any]:
+        """
+        Busca (id, points) dos usuários em páginas ordenadas por id (keyset pela chave primária).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param after_id: O último id da página anterior, ou None para a primeira página.
+        :param limit: O tamanho máximo da página.
+        :return: Linhas com id e points.
+        """
+        stmt = select(User.id, User.points).order_by(User.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.filter(User.id > after_id)
+        result = await db.execute(stmt)
+        return list(result.all())
+
+    async def get_points_changed_after(
+        self,
+        db: AsyncSession,
+        *,
+        after: Tuple[datetime, uuid.UUID],
+        settle_seconds: float,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Busca os usuários alterados depois de uma marca d'água (timestamp, id).
+
+        Percorre o índice (updated_at, id) a partir da marca.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param after: (updated_at, id) da última alteração lida.
+        :param settle_seconds: Alterações mais recentes que isso são ignoradas.
+        :param limit: O número máximo de usuários.
+        :return: Linhas com updated_at, id e points, das alterações mais antigas às mais recentes.
+        """
+        result = await db.execute(
+            select(User.updated_at, User.id, User.points)
+            .filter(
+                tuple_(User.updated_at, User.id) > tuple_(*after),
+                User.updated_at
+                <= func.localtimestamp()
+                - func.make_interval(0, 0, 0, 0, 0, 0, type_coerce(settle_seconds, Float)),
+            )
+            .order_by(User.updated_at, User.id)
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def get_database_time(self, db: AsyncSession) -> datetime:
+        """
+        Retorna o horário atual do banco, no mesmo formato de `User.updated_at`.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :return: O valor de LOCALTIMESTAMP.
+        """
+        return await db.scalar(select(func.localtimestamp()))
+
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """
         Busca um usuário pelo seu email.
@@ -44,18 +159,55 @@ class UserCRUD:
         result = await db.execute(select(User).filter(User.username == username))
         return result.scalar_one_or_none()
 
+    async def get_existing_identifiers(
+        self, db: AsyncSession, *, emails: Sequence[str], usernames: Sequence[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Busca, em uma única consulta, os emails e nomes de usuário já cadastrados.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param emails: Os emails a serem verificados.
+        :param usernames: Os nomes de usuário a serem verificados.
+        :return: Uma lista de tuplas (email, username) dos usuários que colidem com algum valor.
+        """
+        result = await db.execute(
+            select(User.email, User.username).filter(
+                or_(User.email.in_(emails), User.username.in_(usernames))
+            )
+        )
+        return [tuple(row) for row in result.all()]
+
     async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[User]:
         """
-        Busca múltiplos usuários com paginação.
+        Busca múltiplos usuários com paginação por OFFSET.
+
+        Prefira `get_page` para listagens: o custo do OFFSET cresce com a profundidade da página.
 
         :param db: A sessão do banco de dados assíncrona.
         :param skip: O número de registros a pular.
         :param limit: O número máximo de registros a retornar.
         :return: Uma lista de objetos User.
         """
-        result = await db.execute(select(User).offset(skip).limit(limit))
+        result = await db.execute(
+            select(User).order_by(User.created_at, User.id).offset(skip).limit(limit)
+        )
         return result.scalars().all()
 
+    async def get_page(
+        self, db: AsyncSession, *, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[User], Optional[str]]:
+        """
+        Busca uma página de usuários usando paginação por cursor sobre (created_at, id).
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param limit: O número máximo de registros a retornar.
+        :param cursor: O cursor retornado pela página anterior, ou None para a primeira página.
+        :return: Uma tupla com a lista de objetos User e o cursor da próxima página (ou None).
+        """
+        return await paginate_keyset(
+            db, select(User), keys=(User.created_at, User.id), limit=limit, cursor=cursor
+        )
+
     async def create(self, db: AsyncSession, *, user_in: UserCreate, hashed_password: str) -> User:
         """
         Cria um novo usuário no banco de dados.
@@ -63,6 +215,9 @@ class UserCRUD:
         Nota: A responsabilidade de hashear a senha é da camada de serviço.
         Esta função recebe a senha já hasheada.
 
+        O INSERT usa RETURNING para obter a linha criada (id, created_at, ...)
+        na mesma ida ao banco, dispensando o `refresh` após o commit.
+
         :param db: A sessão do banco de dados assíncrona.
         :param user_in: O schema Pydantic com os dados de criação.
         :param hashed_password: A senha já processada (hash).
@@ -74,31 +229,54 @@ class UserCRUD:
         # pop() é mais seguro pois não gera KeyError se a chave não existir.
         user_data.pop('password', None)
 
-        # Cria a instância do modelo SQLAlchemy com a senha hasheada
-        db_obj = User(**user_data, hashed_password=hashed_password)
-
-        db.add(db_obj)
+        result = await db.scalars(
+            insert(User).values(**user_data, hashed_password=hashed_password).returning(User)
+        )
+        db_obj = result.one()
         await db.commit()
-        await db.refresh(db_obj)  # Atualiza o objeto com os dados do banco (ex: id, created_at)
         return db_obj
 
+    async def create_many(self, db: AsyncSession, *, rows: List[Dict[str, Any]]) -> List[User]:
+        """
+        Cria vários usuários com um único INSERT multi-linha ... RETURNING.
+
+        Linhas que violem uma restrição de unicidade (ex.: inseridas por outra
+        transação concorrente) são ignoradas via ON CONFLICT DO NOTHING e,
+        portanto, não aparecem no retorno.
+
+        :param db: A sessão do banco de dados assíncrona.
+        :param rows: Dicionários com as colunas de cada usuário, já com `hashed_password`.
+        :return: Os objetos User efetivamente criados.
+        """
+        if not rows:
+            return []
+
+        stmt = pg_insert(User).on_conflict_do_nothing().returning(User)
+        result = await db.scalars(stmt, rows)
+        created = list(result.all())
+        await db.commit()
+        return created
+
     async def update(
         self,
         db: AsyncSession,
         *,
-        db_obj: User,
+        user_id: uuid.UUID,
         obj_in: Union[UserUpdate, Dict[str, Any]]
-    ) -> User:
+    ) -> Optional[User]:
         """
-        Atualiza um usuário existente no banco de dados.
+        Atualiza um usuário existente no banco de dados com um único UPDATE ... RETURNING.
+
+        Apenas os campos presentes em `obj_in` entram no SET; não é necessário
+        carregar o usuário antes nem recarregá-lo depois.
 
         Nota: A camada de serviço é responsável por preparar o dicionário `obj_in`,
         incluindo o hashing de uma nova senha, se aplicável.
 
         :param db: A sessão do banco de dados assíncrona.
-        :param db_obj: O objeto User atual a ser modificado.
+        :param user_id: O UUID do usuário a ser atualizado.
         :param obj_in: Um schema Pydantic ou um dicionário com os campos a serem atualizados.
-        :return: O objeto User atualizado.
+        :return: O objeto User atualizado ou None se não encontrado.
         """
         if isinstance(obj_in, dict):
             update_data = obj_in
@@ -106,28 +284,42 @@ class UserCRUD:
             # exclude_unset=True garante que apenas os campos enviados sejam atualizados
             update_data = obj_in.model_dump(exclude_unset=True)
 
-        # Atualiza os campos do objeto do banco de dados
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
+        if not update_data:
+            return await self.get(db, user_id=user_id)
 
-        db.add(db_obj)
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.scalars(stmt)
+        db_obj = result.one_or_none()
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
     async def remove(self, db: AsyncSession, *, user_id: uuid.UUID) -> Optional[User]:
         """
-        Remove um usuário do banco de dados pelo seu ID.
+        Remove um usuário do banco de dados pelo seu ID com um único DELETE ... RETURNING.
+
+        As avaliações do usuário são removidas antes, na mesma transação, para que
+        os agregados dos estabelecimentos sejam atualizados.
 
         :param db: A sessão do banco de dados assíncrona.
         :param user_id: O UUID do usuário a ser removido.
         :return: O objeto User que foi removido ou None se não encontrado.
         """
-        # Reutiliza o método get assíncrono para encontrar o objeto
-        obj = await self.get(db, user_id=user_id)
-        if obj:
-            await db.delete(obj)
-            await db.commit()
+        await review_crud.remove_by_user(db, user_id=user_id)
+        stmt = (
+            delete(User)
+            .where(User.id == user_id)
+            .returning(User)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.scalars(stmt)
+        obj = result.one_or_none()
+        await db.commit()
         return obj
 
 # Cria uma instância única da classe CRUDUser para ser importada em outros lugares.
@@ -1,24 +1,367 @@
-from core.config import settings
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event, exc, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import registry
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from inclui_aqui_server.core.config import settings
 
 DATABASE_URL = settings.DATABASE_URL
 
-async_engine = create_async_engine(DATABASE_URL, echo=True)
+
+class PoolMetrics:
+    """
+    Contadores de aquisição de conexões de um pool.
+    """
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.acquisitions += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'acquisitions': self.acquisitions,
+            'timeouts': self.timeouts,
+            'avg_wait_ms': (
+                self.total_wait_seconds / self.acquisitions * 1000 if self.acquisitions else 0.0
+            ),
+            'max_wait_ms': self.max_wait_seconds * 1000,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool de conexões que mede o tempo de espera por uma conexão e os timeouts.
+
+    Os contadores ficam em `metrics` e passam para o pool novo quando o
+    SQLAlchemy o recria (ex.: em `dispose()`).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> 'InstrumentedQueuePool':
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started_at)
+
+
+def create_engine_from_settings(url: str, name: str) -> AsyncEngine:
+    """
+    Cria um motor assíncrono com as configurações de pool definidas em `Settings`.
+
+    :param url: A URL de conexão do banco.
+    :param name: Nome do pool, usado nos logs e nas métricas.
+    :return: O motor criado.
+    """
+    db_url = make_url(url)
+    if db_url.drivername == 'postgresql+asyncpg':
+        db_url = db_url.update_query_dict({
+            'prepared_statement_cache_size': str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)
+        })
+    return create_async_engine(
+        db_url,
+        echo=settings.SQL_ECHO,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_logging_name=name,
+    )
+
+
+def get_pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    Retorna o estado atual do pool de um motor e seus contadores acumulados.
+
+    :param engine: O motor cujo pool será inspecionado.
+    :return: Dicionário com conexões em uso, ociosas, overflow, espera e timeouts.
+    """
+    pool = engine.pool
+    metrics = getattr(pool, 'metrics', None) or PoolMetrics()
+    return {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': max(pool.overflow(), 0),
+        **metrics.as_dict(),
+    }
+
+
+class ReplicaRouter:
+    """
+    Distribui as sessões de leitura entre as réplicas em round-robin.
+
+    Uma réplica que apresente erro de conexão é marcada como indisponível por
+    `retry_seconds`; sem réplicas saudáveis, as leituras vão para o primário.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica_engines: List[AsyncEngine],
+        retry_seconds: float = 30.0,
+    ):
+        """
+        :param primary: O sessionmaker do banco primário, usado como fallback.
+        :param replica_engines: Os motores das réplicas de leitura.
+        :param retry_seconds: Por quanto tempo uma réplica com falha fica fora do rodízio.
+        """
+        self._primary = primary
+        self.engines = replica_engines
+        self._sessionmakers = [
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            for engine in replica_engines
+        ]
+        self._retry_seconds = retry_seconds
+        self._unhealthy_until: Dict[int, float] = {}
+        self._next = 0
+        self.fallbacks = 0
+
+        for index, engine in enumerate(replica_engines):
+            event.listen(engine.sync_engine, 'handle_error', self._error_listener(index))
+
+    def pick(self) -> async_sessionmaker:
+        """
+        Escolhe o sessionmaker da próxima réplica saudável, ou o do primário.
+
+        :return: O sessionmaker a ser usado na leitura.
+        """
+        now = time.monotonic()
+        for _ in range(len(self._sessionmakers)):
+            index = self._next % len(self._sessionmakers)
+            self._next += 1
+            if self._unhealthy_until.get(index, 0.0) <= now:
+                return self._sessionmakers[index]
+        if self._sessionmakers:
+            self.fallbacks += 1
+        return self._primary
+
+    def mark_unhealthy(self, index: int) -> None:
+        """
+        Retira a réplica do rodízio por `retry_seconds`.
+
+        :param index: A posição da réplica em `READ_REPLICA_URLS`.
+        """
+        self._unhealthy_until[index] = time.monotonic() + self._retry_seconds
+
+    def is_healthy(self, index: int) -> bool:
+        return self._unhealthy_until.get(index, 0.0) <= time.monotonic()
+
+    def _error_listener(self, index: int):
+        def on_error(context):
+            # Falha ao abrir a conexão (connection is None) ou conexão perdida
+            if (
+                context.connection is None
+                or context.is_disconnect
+                or isinstance(context.original_exception, OSError)
+            ):
+                self.mark_unhealthy(index)
+        return on_error
+
 
 # Cria o registry para mapear as classes para tabelas
 table_registry = registry()
 
-# Cria o motor de banco de dados assíncrono
-async_engine = create_async_engine(DATABASE_URL, echo=True)
+# Cria o motor de banco de dados assíncrono (uma única vez por processo)
+async_engine = create_engine_from_settings(DATABASE_URL, name='primary')
 
 # Cria um sessionmaker para sessões assíncronas
 AsyncSessionLocal = async_sessionmaker(
     async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Réplicas de leitura (opcionais)
+replica_router = ReplicaRouter(
+    AsyncSessionLocal,
+    [
+        create_engine_from_settings(url, name=f'replica-{index}')
+        for index, url in enumerate(settings.READ_REPLICA_URLS)
+    ],
+    retry_seconds=settings.REPLICA_RETRY_SECONDS,
+)
+
+# Cookie que fixa o cliente no primário logo após uma escrita (read-your-writes)
+PRIMARY_PIN_COOKIE = 'db_primary_until'
+
+
+def get_database_stats() -> Dict[str, Any]:
+    """
+    Retorna as métricas dos pools do primário e de cada réplica.
+    """
+    stats = {'primary': get_pool_stats(async_engine)}
+    for index, engine in enumerate(replica_router.engines):
+        stats[f'replica-{index}'] = {
+            **get_pool_stats(engine),
+            'healthy': replica_router.is_healthy(index),
+        }
+    stats['replica_fallbacks'] = replica_router.fallbacks
+    return stats
+
+
+async def dispose_engines() -> None:
+    """
+    Fecha todas as conexões dos pools. Chamado no desligamento da aplicação.
+    """
+    await async_engine.dispose()
+    for engine in replica_router.engines:
+        await engine.dispose()
+
+
+class LazySession:
+    """
+    Proxy de `AsyncSession` que só cria a sessão no primeiro uso.
+
+    Requisições respondidas pelo cache ou rejeitadas antes de qualquer consulta
+    não instanciam sessão nem tocam o pool. Os atributos e métodos são
+    repassados à `AsyncSession` subjacente, então o proxy pode ser usado onde
+    uma sessão é esperada.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncSession]):
+        """
+        :param factory: Função que cria a sessão real quando ela for necessária.
+        """
+        self._factory = factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def is_started(self) -> bool:
+        """Indica se a sessão real já foi criada."""
+        return self._session is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    async def close(self) -> None:
+        """
+        Encerra a transação corrente e devolve a conexão ao pool.
+
+        A sessão pode continuar sendo usada depois; uma nova conexão só será
+        obtida se outra consulta for executada.
+        """
+        if self._session is not None:
+            await self._session.close()
+
 
 # Função para obter uma sessão de banco de dados por requisição (dependência do FastAPI)
 async def get_db_session():
-    async with AsyncSessionLocal() as session:
+    session = LazySession(AsyncSessionLocal)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_write_session(request: Request):
+    """
+    Dependência que fornece uma sessão (preguiçosa) no banco primário.
+
+    Após cada commit, a requisição é marcada para que `primary_pin_middleware`
+    envie ao cliente um cookie que o mantém no primário por
+    `READ_YOUR_WRITES_SECONDS`, para que suas leituras seguintes vejam a própria escrita
+    mesmo que as réplicas estejam atrasadas.
+    """
+    def create_session() -> AsyncSession:
+        session = AsyncSessionLocal()
+        event.listen(session.sync_session, 'after_commit', _pin_to_primary(request))
+        return session
+
+    session = LazySession(create_session)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_read_session(request: Request):
+    """
+    Dependência que fornece uma sessão (preguiçosa) de leitura, em uma réplica quando possível.
+
+    A réplica só é escolhida quando a sessão é efetivamente usada.
+    """
+    def create_session() -> AsyncSession:
+        return _read_sessionmaker(request)()
+
+    session = LazySession(create_session)
+    try:
         yield session
+    finally:
+        await session.close()
+
+
+def _read_sessionmaker(request: Request) -> async_sessionmaker:
+    pinned_until = _parse_float(request.cookies.get(PRIMARY_PIN_COOKIE))
+    now = time.time()
+    # O cookie vem do cliente: um prazo além da janela não foi emitido por nós e é ignorado
+    if pinned_until is not None and now < pinned_until <= now + settings.READ_YOUR_WRITES_SECONDS:
+        return AsyncSessionLocal
+    return replica_router.pick()
+
+
+async def primary_pin_middleware(request: Request, call_next) -> Response:
+    """
+    Middleware HTTP que envia o cookie de read-your-writes às requisições que fizeram commit.
+
+    O cookie é aplicado à resposta final, inclusive quando o endpoint devolve
+    a sua própria `Response` em vez da injetada pelo FastAPI.
+    """
+    response = await call_next(request)
+    pinned_until = getattr(request.state, 'primary_pinned_until', None)
+    if pinned_until is not None:
+        response.set_cookie(
+            PRIMARY_PIN_COOKIE,
+            str(pinned_until),
+            max_age=math.ceil(settings.READ_YOUR_WRITES_SECONDS),
+            httponly=True,
+            samesite='lax',
+        )
+    return response
+
+
+def _pin_to_primary(request: Request):
+    def on_commit(session):
+        window = settings.READ_YOUR_WRITES_SECONDS
+        if window > 0:
+            request.state.primary_pinned_until = time.time() + window
+    return on_commit
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    try:
+        number = float(value) if value is not None else None
+    except ValueError:
+        return None
+    # float() aceita 'nan' e 'inf'
+    return number if number is not None and math.isfinite(number) else None
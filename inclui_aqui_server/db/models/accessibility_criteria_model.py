@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import TEXT, Boolean, String, func
+from sqlalchemy import TEXT, Boolean, SmallInteger, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,7 +11,7 @@ from inclui_aqui_server.db.database import table_registry  # Importa o table_reg
 
 
 # Modelo ORM para a tabela 'accessibility_criteria'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class AccessibilityCriteria:
     __tablename__ = 'accessibility_criteria'
 
@@ -22,6 +22,8 @@ class AccessibilityCriteria:
     description: Mapped[str | None] = mapped_column(TEXT, default=None)
     category: Mapped[str | None] = mapped_column(String(50), default=None)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Posição do critério na máscara de bits `Establishment.accessibility_mask` (0 a 62)
+    ordinal: Mapped[int | None] = mapped_column(SmallInteger, unique=True, default=None)
     created_at: Mapped[datetime] = mapped_column(default=func.now(), init=False)
     updated_at: Mapped[datetime] = mapped_column(
         default=func.now(), onupdate=func.now(), init=False
@@ -19,7 +19,7 @@ class FeedbackType(enum.Enum):
 
 
 # Modelo ORM para a tabela 'ai_feedback_logs'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class AIFeedbackLog:
     __tablename__ = 'ai_feedback_logs'
 
@@ -38,7 +38,7 @@ class AIFeedbackLog:
     created_at: Mapped[datetime] = mapped_column(default=func.now(), init=False)
 
     # Relação com o modelo Suggestion (importação diferida)
-    suggestion: Mapped['Suggestion'] = relationship(backref='feedback_logs')
+    suggestion: Mapped['Suggestion'] = relationship(backref='feedback_logs', init=False)
 
     def __repr__(self):
         return f"<AIFeedbackLog(id={self.id}, suggestion_id='{self.suggestion_id}', type='{self.feedback_type.value}')>"
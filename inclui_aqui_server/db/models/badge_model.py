@@ -11,7 +11,7 @@ from inclui_aqui_server.db.database import table_registry  # Importa o table_reg
 
 
 # Modelo ORM para a tabela 'badges'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class Badge:
     __tablename__ = 'badges'
 
@@ -27,7 +27,7 @@ class Badge:
 
 
 # Modelo ORM para a tabela 'user_badges' (tabela de junção)
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class UserBadge:
     __tablename__ = 'user_badges'
 
@@ -46,8 +46,8 @@ class UserBadge:
     __table_args__ = (UniqueConstraint('user_id', 'badge_id', name='_user_badge_uc'),)
 
     # Relações com outros modelos (importação diferida)
-    user: Mapped['User'] = relationship(backref='user_badges')
-    badge: Mapped['Badge'] = relationship(backref='user_badges')
+    user: Mapped['User'] = relationship(backref='user_badges', init=False)
+    badge: Mapped['Badge'] = relationship(backref='user_badges', init=False)
 
     def __repr__(self):
         return f"<UserBadge(id={self.id}, user_id='{self.user_id}', badge_id='{self.badge_id}')>"
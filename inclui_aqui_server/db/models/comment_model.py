@@ -11,7 +11,7 @@ from inclui_aqui_server.db.database import table_registry  # Importa o table_reg
 
 
 # Modelo ORM para a tabela 'comments'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class Comment:
     __tablename__ = 'comments'
 
@@ -31,8 +31,8 @@ class Comment:
     )
 
     # Relações com outros modelos (importação diferida)
-    review: Mapped['Review'] = relationship(backref='comments')
-    user: Mapped['User'] = relationship(backref='comments')
+    review: Mapped['Review'] = relationship(backref='comments', init=False)
+    user: Mapped['User'] = relationship(backref='comments', init=False)
 
     def __repr__(self):
         return f"<Comment(id={self.id}, review_id='{self.review_id}', user_id='{self.user_id}')>"
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import TEXT, Boolean, ForeignKey, String, func
+from sqlalchemy import TEXT, Boolean, ForeignKey, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,9 +11,11 @@ from inclui_aqui_server.db.database import table_registry  # Importa o table_reg
 
 
 # Modelo ORM para a tabela 'establishment_images'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class EstablishmentImage:
     __tablename__ = 'establishment_images'
+    # O arquivo é deduplicado pelo conteúdo: a mesma imagem pode aparecer em vários estabelecimentos
+    __table_args__ = (UniqueConstraint('establishment_id', 's3_url'),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
@@ -26,14 +28,16 @@ class EstablishmentImage:
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey('users.id', ondelete='SET NULL'), default=None
     )
-    s3_url: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    s3_url: Mapped[str] = mapped_column(String(255), nullable=False)
+    # SHA-256 do arquivo original, também usado na chave dos thumbnails
+    content_hash: Mapped[str | None] = mapped_column(String(64), index=True, default=None)
     description: Mapped[str | None] = mapped_column(TEXT, default=None)
     is_approved: Mapped[bool] = mapped_column(Boolean, default=False)
     uploaded_at: Mapped[datetime] = mapped_column(default=func.now(), init=False)
 
     # Relações com outros modelos (importação diferida)
-    establishment: Mapped['Establishment'] = relationship(backref='images')
-    user: Mapped['User'] = relationship(backref='uploaded_establishment_images')
+    establishment: Mapped['Establishment'] = relationship(backref='images', init=False)
+    user: Mapped['User'] = relationship(backref='uploaded_establishment_images', init=False)
 
     def __repr__(self):
         return f"<EstablishmentImage(id={self.id}, establishment_id='{self.establishment_id}', s3_url='{self.s3_url}')>"
@@ -0,0 +1,29 @@
+# inclui_aqui_server/db/models/establishment_map_cell_model.py
+
+from sqlalchemy import Double, Integer, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from inclui_aqui_server.db.database import table_registry  # Importa o table_registry
+
+
+# Modelo ORM para a tabela 'establishment_map_cells'
+# Grade pré-agregada dos estabelecimentos aprovados, por zoom do mapa. Mantida
+# incrementalmente quando um estabelecimento é aprovado, reprovado ou movido
+# (ver `crud/map_cell.py`).
+@table_registry.mapped_as_dataclass(kw_only=True)
+class EstablishmentMapCell:
+    __tablename__ = 'establishment_map_cells'
+
+    zoom: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    cell_x: Mapped[int] = mapped_column(Integer, primary_key=True)
+    cell_y: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    # Somas das coordenadas, para calcular o centroide sem reler os estabelecimentos
+    latitude_sum: Mapped[float] = mapped_column(Double, default=0.0, server_default='0')
+    longitude_sum: Mapped[float] = mapped_column(Double, default=0.0, server_default='0')
+
+    def __repr__(self):
+        return (
+            f"<EstablishmentMapCell(zoom={self.zoom}, cell_x={self.cell_x}, "
+            f"cell_y={self.cell_y}, count={self.count})>"
+        )
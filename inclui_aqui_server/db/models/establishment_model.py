@@ -3,17 +3,46 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DECIMAL, JSON, TEXT, Boolean, ForeignKey, String, func
+from sqlalchemy import (
+    DECIMAL,
+    JSON,
+    TEXT,
+    BigInteger,
+    Boolean,
+    Computed,
+    ForeignKey,
+    Index,
+    String,
+    event,
+    func,
+    inspect,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from inclui_aqui_server.core.geo import encode_geohash
 from inclui_aqui_server.db.database import table_registry  # Importa o table_registry
 
 
 # Modelo ORM para a tabela 'establishments'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class Establishment:
     __tablename__ = 'establishments'
+    __table_args__ = (
+        # varchar_pattern_ops permite que `geohash LIKE 'prefixo%'` use o índice
+        Index(
+            'ix_establishments_geohash',
+            'geohash',
+            postgresql_ops={'geohash': 'varchar_pattern_ops'},
+        ),
+        # Índice de trigramas (extensão pg_trgm) para busca textual tolerante a erros
+        Index(
+            'ix_establishments_search_text_trgm',
+            'search_text',
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
@@ -23,7 +52,8 @@ class Establishment:
     latitude: Mapped[float] = mapped_column(DECIMAL(10, 8), nullable=False)
     longitude: Mapped[float] = mapped_column(DECIMAL(11, 8), nullable=False)
     type: Mapped[str | None] = mapped_column(String(100), default=None)
-    google_place_id: Mapped[str | None] = mapped_column(String(255), default=None)
+    # Único: reimportações atualizam o estabelecimento em vez de duplicá-lo
+    google_place_id: Mapped[str | None] = mapped_column(String(255), unique=True, default=None)
     is_approved: Mapped[bool] = mapped_column(Boolean, default=False)
     owner_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey('users.id', ondelete='RESTRICT'), nullable=False
@@ -35,10 +65,51 @@ class Establishment:
     main_image_url: Mapped[str | None] = mapped_column(String(255), default=None)
     description: Mapped[str | None] = mapped_column(TEXT, default=None)
     accessibility_features_json: Mapped[dict | None] = mapped_column(JSON, default=None)
+    # Critérios atendidos, um bit por `AccessibilityCriteria.ordinal`; mantido pelo serviço
+    accessibility_mask: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default='0', nullable=False, init=False
+    )
+    # Derivado de latitude/longitude; mantido pelos listeners abaixo
+    geohash: Mapped[str | None] = mapped_column(String(12), default=None, init=False)
+    # Nome, endereço e tipo concatenados em minúsculas, gerado pelo próprio banco
+    search_text: Mapped[str | None] = mapped_column(
+        TEXT,
+        Computed("lower(name || ' ' || address || ' ' || coalesce(type, ''))", persisted=True),
+        init=False,
+    )
 
     # Relação com o modelo User (um estabelecimento pertence a um usuário)
     # Importação diferida para evitar dependência circular imediata
-    owner: Mapped['User'] = relationship(backref='establishments')
+    owner: Mapped['User'] = relationship(backref='establishments', init=False)
+    # Agregados das avaliações, lidos com LEFT OUTER JOIN em vez de varrer `reviews`
+    rating_summary: Mapped['EstablishmentRating'] = relationship(
+        lazy='joined', uselist=False, viewonly=True, init=False
+    )
+
+    @property
+    def review_count(self) -> int:
+        summary = self._loaded_rating_summary()
+        return summary.review_count if summary is not None else 0
+
+    @property
+    def average_rating(self) -> float | None:
+        summary = self._loaded_rating_summary()
+        return summary.average_rating if summary is not None else None
+
+    def _loaded_rating_summary(self):
+        # Não dispara lazy load (proibido em sessões assíncronas), ex.: objetos vindos de UPDATE ... RETURNING
+        if 'rating_summary' in inspect(self).unloaded:
+            return None
+        return self.rating_summary
 
     def __repr__(self):
         return f"<Establishment(id={self.id}, name='{self.name}', type='{self.type}')>"
+
+
+# Mantém o geohash sincronizado com as coordenadas em escritas via ORM.
+# Escritas em massa (Core) devem preencher a coluna explicitamente.
+@event.listens_for(Establishment, 'before_insert')
+@event.listens_for(Establishment, 'before_update')
+def _sync_geohash(mapper, connection, target):
+    if target.latitude is not None and target.longitude is not None:
+        target.geohash = encode_geohash(float(target.latitude), float(target.longitude))
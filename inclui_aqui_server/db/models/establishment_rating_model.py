@@ -0,0 +1,81 @@
+# inclui_aqui_server/db/models/establishment_rating_model.py
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DECIMAL, ForeignKey, Integer, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from inclui_aqui_server.db.database import table_registry  # Importa o table_registry
+
+
+# Modelo ORM para a tabela 'establishment_ratings'
+# Agregados das avaliações de cada estabelecimento, mantidos na mesma transação
+# que grava a avaliação (ver `crud/review.py`).
+@table_registry.mapped_as_dataclass(kw_only=True)
+class EstablishmentRating:
+    __tablename__ = 'establishment_ratings'
+
+    establishment_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('establishments.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    review_count: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    # Histograma das notas (1 a 5)
+    rating_1: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    rating_2: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    rating_3: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    rating_4: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    rating_5: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.now(), onupdate=func.now(), init=False
+    )
+
+    @property
+    def average_rating(self) -> float | None:
+        return self.rating_sum / self.review_count if self.review_count > 0 else None
+
+    @property
+    def histogram(self) -> dict[int, int]:
+        return {
+            1: self.rating_1,
+            2: self.rating_2,
+            3: self.rating_3,
+            4: self.rating_4,
+            5: self.rating_5,
+        }
+
+    def __repr__(self):
+        return (
+            f"<EstablishmentRating(establishment_id={self.establishment_id}, "
+            f"review_count={self.review_count}, rating_sum={self.rating_sum})>"
+        )
+
+
+# Modelo ORM para a tabela 'establishment_criteria_ratings'
+# Soma e quantidade das notas de cada critério de `Review.criteria_json`.
+@table_registry.mapped_as_dataclass(kw_only=True)
+class EstablishmentCriteriaRating:
+    __tablename__ = 'establishment_criteria_ratings'
+
+    establishment_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('establishments.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    criterion: Mapped[str] = mapped_column(String(100), primary_key=True)
+    score_count: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
+    score_sum: Mapped[float] = mapped_column(DECIMAL(12, 2), default=0, server_default='0')
+
+    @property
+    def average_score(self) -> float | None:
+        return float(self.score_sum) / self.score_count if self.score_count > 0 else None
+
+    def __repr__(self):
+        return (
+            f"<EstablishmentCriteriaRating(establishment_id={self.establishment_id}, "
+            f"criterion='{self.criterion}', score_count={self.score_count})>"
+        )
@@ -30,7 +30,7 @@ class ModerationAction(enum.Enum):
 
 
 # Modelo ORM para a tabela 'moderation_logs'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class ModerationLog:
     __tablename__ = 'moderation_logs'
 
@@ -52,7 +52,7 @@ class ModerationLog:
     action_at: Mapped[datetime] = mapped_column(default=func.now(), init=False)
 
     # Relação com o modelo User (moderador) (importação diferida)
-    moderator: Mapped['User'] = relationship(backref='moderation_actions')
+    moderator: Mapped['User'] = relationship(backref='moderation_actions', init=False)
 
     def __repr__(self):
         return f"<ModerationLog(id={self.id}, moderator_id='{self.moderator_id}', action='{self.action.value}', content_type='{self.content_type.value}', content_id='{self.content_id}')>"
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DECIMAL, JSON, TEXT, ForeignKey, Integer, String, func
+from sqlalchemy import DECIMAL, JSON, TEXT, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,9 +11,19 @@ from inclui_aqui_server.db.database import table_registry  # Importa o table_reg
 
 
 # Modelo ORM para a tabela 'reviews'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class Review:
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # Avaliações de um estabelecimento em ordem cronológica (detalhe e gerador de sugestões)
+        Index('ix_reviews_establishment_created', 'establishment_id', 'created_at', 'id'),
+        # Fila do worker de sentimento: só as avaliações ainda sem nota
+        Index(
+            'ix_reviews_unscored',
+            'created_at',
+            postgresql_where=text('sentiment_score IS NULL'),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
@@ -34,11 +44,12 @@ class Review:
         default=func.now(), onupdate=func.now(), init=False
     )
     image_urls: Mapped[list[str] | None] = mapped_column(ARRAY(String), default=None)
+    # Preenchido em segundo plano pelo `SentimentWorker`; volta a NULL quando o comentário muda
     sentiment_score: Mapped[float | None] = mapped_column(DECIMAL(3, 2), default=None)
 
     # Relações com outros modelos (importação diferida)
-    establishment: Mapped['Establishment'] = relationship(backref='reviews')
-    user: Mapped['User'] = relationship(backref='reviews')
+    establishment: Mapped['Establishment'] = relationship(backref='reviews', init=False)
+    user: Mapped['User'] = relationship(backref='reviews', init=False)
 
     def __repr__(self):
         return f"<Review(id={self.id}, establishment_id='{self.establishment_id}', rating={self.rating})>"
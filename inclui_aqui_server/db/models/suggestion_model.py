@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import TEXT, Boolean, ForeignKey, String, func
+from sqlalchemy import TEXT, Boolean, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,9 +11,13 @@ from inclui_aqui_server.db.database import table_registry  # Importa o table_reg
 
 
 # Modelo ORM para a tabela 'suggestions'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class Suggestion:
     __tablename__ = 'suggestions'
+    __table_args__ = (
+        # Última sugestão de cada estabelecimento (marca d'água do gerador)
+        Index('ix_suggestions_establishment_generated', 'establishment_id', 'generated_at'),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
@@ -27,12 +31,14 @@ class Suggestion:
     generated_at: Mapped[datetime] = mapped_column(default=func.now(), init=False)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
     ai_model_version: Mapped[str | None] = mapped_column(String(50), default=None)
+    # Avaliações que originaram a sugestão; a mais recente delas é a marca d'água
+    # a partir da qual a próxima execução do gerador continua
     source_review_ids: Mapped[list[uuid.UUID] | None] = mapped_column(
         ARRAY(UUID(as_uuid=True)), default=None
     )
 
     # Relação com o modelo Establishment (importação diferida)
-    establishment: Mapped['Establishment'] = relationship(backref='suggestions')
+    establishment: Mapped['Establishment'] = relationship(backref='suggestions', init=False)
 
     def __repr__(self):
         return f"<Suggestion(id={self.id}, establishment_id='{self.establishment_id}', is_read={self.is_read})>"
@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, Enum, Integer, String, func
+from sqlalchemy import JSON, Enum, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,9 +17,15 @@ class UserRole(enum.Enum):
     moderator = 'moderator'
 
 
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class User:
     __tablename__ = 'users'
+    __table_args__ = (
+        # Índice usado pela paginação por cursor (created_at, id)
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+        # Leitura das alterações recentes (ranking de pontos de cada processo)
+        Index('ix_users_updated_at_id', 'updated_at', 'id'),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
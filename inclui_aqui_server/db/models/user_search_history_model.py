@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, ForeignKey, String, func
+from sqlalchemy import JSON, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,9 +11,18 @@ from inclui_aqui_server.db.database import table_registry  # Importa o table_reg
 
 
 # Modelo ORM para a tabela 'user_search_history'
-@table_registry.mapped_as_dataclass
+@table_registry.mapped_as_dataclass(kw_only=True)
 class UserSearchHistory:
     __tablename__ = 'user_search_history'
+    __table_args__ = (
+        # Buscas recentes de um usuário: percorre o índice já na ordem da resposta
+        Index('ix_user_search_history_user_timestamp', 'user_id', text('timestamp DESC')),
+        # Leitura das buscas novas de todos os usuários (buscas em alta): a tabela só
+        # recebe inserções em ordem de tempo, e um BRIN ocupa poucas páginas
+        Index('ix_user_search_history_timestamp_brin', 'timestamp', postgresql_using='brin'),
+        # Uma partição por mês (ver `SearchHistoryCRUD`); a retenção remove partições inteiras
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
@@ -26,10 +35,13 @@ class UserSearchHistory:
     search_results_ids: Mapped[list[uuid.UUID] | None] = mapped_column(
         ARRAY(UUID(as_uuid=True)), default=None
     )
-    timestamp: Mapped[datetime] = mapped_column(default=func.now(), init=False)
+    # Em tabelas particionadas, a chave primária precisa incluir a coluna de partição
+    timestamp: Mapped[datetime] = mapped_column(
+        primary_key=True, default=func.now(), init=False
+    )
 
     # Relação com o modelo User (importação diferida)
-    user: Mapped['User'] = relationship(backref='search_history')
+    user: Mapped['User'] = relationship(backref='search_history', init=False)
 
     def __repr__(self):
         return f"<UserSearchHistory(id={self.id}, user_id='{self.user_id}', query='{self.query}')>"
@@ -1,2 +1,42 @@
+from .establishment_schema import (
+    EstablishmentAccessibilityUpdate,
+    EstablishmentApprovalUpdate,
+    EstablishmentDetail,
+    EstablishmentImageRead,
+    EstablishmentImportError,
+    EstablishmentImportReport,
+    EstablishmentImportRow,
+    EstablishmentLocationUpdate,
+    EstablishmentNearby,
+    EstablishmentRead,
+    EstablishmentSearchResult,
+    EstablishmentSuggestion,
+    MapCluster,
+    MapClusters,
+    MapPoint,
+)
+from .image_schema import ImageUploadResult
 from .response_schema import GenericResponseModel, Status
-from .user_schema import UserCreate, UserBase, UserUpdate, UserRole, UserInDB, UserRead
+from .review_schema import (
+    EstablishmentRatingSummary,
+    ReviewCreate,
+    ReviewDetail,
+    ReviewRead,
+    ReviewUpdate,
+)
+from .search_schema import TrendingSearch
+from .suggestion_schema import FeedbackType, SuggestionFeedbackCreate, SuggestionRunReport
+from .user_schema import (
+    UserCreate,
+    UserBase,
+    UserUpdate,
+    UserRole,
+    UserInDB,
+    UserRead,
+    UserBulkCreate,
+    UserBulkConflict,
+    UserBulkCreateResult,
+    UserSummary,
+    UserSearchRead,
+    LeaderboardEntry,
+)
@@ -0,0 +1,157 @@
+import uuid
+from datetime import datetime
+import json
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .review_schema import ReviewDetail
+from .user_schema import UserSummary
+
+
+# --- Schema para Leitura/Retorno ---
+class EstablishmentRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    address: str
+    latitude: float
+    longitude: float
+    type: Optional[str] = None
+    main_image_url: Optional[str] = None
+    description: Optional[str] = None
+    accessibility_features_json: Optional[dict] = None
+    created_at: datetime
+    updated_at: datetime
+    # Lidos dos agregados de avaliações (ver `EstablishmentRating`)
+    average_rating: Optional[float] = None
+    review_count: int = 0
+
+
+# --- Schemas do detalhe do estabelecimento ---
+class EstablishmentImageRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    s3_url: str
+    description: Optional[str] = None
+    uploaded_at: datetime
+
+
+class EstablishmentDetail(EstablishmentRead):
+    owner: UserSummary
+    # Imagens aprovadas, das mais recentes às mais antigas
+    images: List[EstablishmentImageRead] = []
+    # Avaliações mais recentes, com autor e quantidade de comentários
+    reviews: List[ReviewDetail] = []
+
+
+# --- Schema de resultado de busca por proximidade ---
+class EstablishmentNearby(EstablishmentRead):
+    # Distância em metros até o ponto da busca
+    distance_m: float
+
+
+# --- Schemas de busca textual ---
+class EstablishmentSearchResult(EstablishmentRead):
+    # Relevância do resultado para o texto buscado (maior é melhor)
+    score: float
+
+
+class EstablishmentSuggestion(BaseModel):
+    id: uuid.UUID
+    name: str
+    address: str
+    type: Optional[str] = None
+    score: float
+
+
+# --- Schema para atualização dos critérios de acessibilidade ---
+class EstablishmentAccessibilityUpdate(BaseModel):
+    # Critério do catálogo -> se o estabelecimento o atende
+    features: Dict[str, bool]
+
+
+# --- Schemas de aprovação e localização ---
+class EstablishmentApprovalUpdate(BaseModel):
+    is_approved: bool
+
+
+class EstablishmentLocationUpdate(BaseModel):
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+
+
+# --- Schemas do mapa ---
+class MapCluster(BaseModel):
+    # Centroide dos estabelecimentos agrupados na célula
+    latitude: float
+    longitude: float
+    count: int
+
+
+class MapPoint(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    latitude: float
+    longitude: float
+    type: Optional[str] = None
+
+
+class MapClusters(BaseModel):
+    zoom: int
+    # Preenchido até `MAP_MAX_CLUSTER_ZOOM`; acima dele, os pontos vêm em `points`
+    clusters: List[MapCluster] = []
+    points: List[MapPoint] = []
+
+
+# --- Schemas da importação em lote ---
+class EstablishmentImportRow(BaseModel):
+    """Uma linha do arquivo de importação (CSV ou NDJSON)."""
+
+    google_place_id: str = Field(min_length=1, max_length=255)
+    name: str = Field(min_length=1, max_length=255)
+    address: str = Field(min_length=1, max_length=255)
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    type: Optional[str] = Field(None, max_length=100)
+    main_image_url: Optional[str] = Field(None, max_length=255)
+    description: Optional[str] = None
+    accessibility_features_json: Optional[Dict[str, Any]] = None
+
+    @field_validator('*', mode='before')
+    @classmethod
+    def empty_string_as_none(cls, value: Any) -> Any:
+        # Células vazias do CSV equivalem a campos ausentes
+        return None if value == '' else value
+
+    @field_validator('accessibility_features_json', mode='before')
+    @classmethod
+    def parse_json_cell(cls, value: Any) -> Any:
+        # No CSV, o JSON de acessibilidade chega como texto (vazio = ausente)
+        if isinstance(value, str):
+            return json.loads(value) if value.strip() else None
+        return value
+
+
+class EstablishmentImportError(BaseModel):
+    line: int
+    error: str
+
+
+class EstablishmentImportReport(BaseModel):
+    total_rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    # Linhas idênticas ao que já estava gravado
+    unchanged: int = 0
+    rejected: int = 0
+    # As primeiras `IMPORT_MAX_REPORTED_ERRORS` linhas rejeitadas
+    errors: List[EstablishmentImportError] = []
+    # Linha com texto ilegível em que a leitura foi interrompida, se houver
+    stopped_at_line: Optional[int] = None
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
@@ -0,0 +1,19 @@
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+# --- Schema de retorno do upload de imagens ---
+class ImageUploadResult(BaseModel):
+    id: uuid.UUID
+    url: str
+    content_hash: str
+    description: Optional[str] = None
+    is_approved: bool = False
+    uploaded_at: datetime
+    # True se o arquivo já existia no armazenamento (conteúdo idêntico)
+    deduplicated: bool = False
+    # Lado maior (em pixels) -> URL; gerados em segundo plano, logo após o upload
+    thumbnails: Dict[int, str] = {}
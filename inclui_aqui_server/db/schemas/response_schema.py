@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Generic, TypeVar, Optional, List
+from typing import Generic, TypeVar, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -26,4 +26,6 @@ class GenericResponseModel(BaseModel, Generic[DataType]):
 
     status: Status
     message: Optional[str] = None
-    data: Optional[DataType] = None
\ No newline at end of file
+    data: Optional[DataType] = None
+    # Token opaco para buscar a próxima página em listagens paginadas por cursor
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .user_schema import UserSummary
+
+
+# --- Schema para Criação ---
+class ReviewCreate(BaseModel):
+    establishment_id: uuid.UUID
+    user_id: uuid.UUID
+    rating: int = Field(ge=1, le=5)
+    comment: Optional[str] = None
+    # Nota de cada critério de acessibilidade (ex.: {"rampa": 5, "banheiro": 3})
+    criteria_json: Optional[Dict[str, float]] = None
+    image_urls: Optional[List[str]] = None
+
+
+# --- Schema para Atualização ---
+class ReviewUpdate(BaseModel):
+    rating: Optional[int] = Field(None, ge=1, le=5)
+    comment: Optional[str] = None
+    criteria_json: Optional[Dict[str, float]] = None
+    image_urls: Optional[List[str]] = None
+
+
+# --- Schema para Leitura/Retorno ---
+class ReviewRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    establishment_id: uuid.UUID
+    user_id: uuid.UUID
+    rating: int
+    comment: Optional[str] = None
+    criteria_json: Optional[dict] = None
+    image_urls: Optional[List[str]] = None
+    sentiment_score: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+# --- Schema de avaliação com autor, usado no detalhe do estabelecimento ---
+class ReviewDetail(ReviewRead):
+    user: UserSummary
+    comment_count: int = 0
+
+
+# --- Schema do resumo de avaliações de um estabelecimento ---
+class EstablishmentRatingSummary(BaseModel):
+    establishment_id: uuid.UUID
+    review_count: int = 0
+    average_rating: Optional[float] = None
+    # Quantidade de avaliações por nota (1 a 5)
+    histogram: Dict[int, int]
+    # Média de cada critério de `criteria_json`
+    criteria: Dict[str, float]
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+# --- Schema de uma busca em alta (ou sugestão de busca) ---
+class TrendingSearch(BaseModel):
+    # Texto normalizado da busca
+    query: str
+    # Contagem aproximada com decaimento: buscas recentes valem mais
+    score: float
@@ -0,0 +1,32 @@
+import enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+# --- Enum dos tipos de feedback sobre uma sugestão ---
+class FeedbackType(str, enum.Enum):
+    useful = 'useful'
+    not_useful = 'not_useful'
+    irrelevant = 'irrelevant'
+
+
+# --- Schema para registro de feedback ---
+class SuggestionFeedbackCreate(BaseModel):
+    feedback_type: FeedbackType
+    feedback_comment: Optional[str] = Field(None, max_length=1000)
+
+
+# --- Schema de retorno de uma execução do gerador de sugestões ---
+class SuggestionRunReport(BaseModel):
+    ai_model_version: str
+    # Estabelecimentos com avaliações novas encontrados na execução
+    establishments: int = 0
+    suggestions: int = 0
+    # Avaliações novas consumidas (fontes das sugestões criadas)
+    reviews: int = 0
+    # Estabelecimentos em processamento por outra execução (lock ocupado)
+    skipped: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    reviews_per_second: float = 0.0
@@ -1,9 +1,9 @@
 import enum
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 # --- Enum para Papéis de Usuário ---
 # Define os papéis possíveis para um usuário.
@@ -52,6 +52,52 @@ class UserRead(UserBase):
     updated_at: datetime
 
 
+# --- Schema público resumido (autor de avaliação, dono de estabelecimento) ---
+class UserSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    username: str
+    profile_image_url: Optional[str] = None
+
+
+# --- Schema de uma busca do histórico do usuário ---
+class UserSearchRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    query: str
+    search_filters: Optional[Dict] = None
+    search_results_ids: Optional[List[uuid.UUID]] = None
+    timestamp: datetime
+
+
+# --- Schema de uma posição no ranking de pontos ---
+class LeaderboardEntry(BaseModel):
+    # 1 + quantidade de usuários com mais pontos (empatados têm a mesma posição)
+    rank: int
+    user_id: uuid.UUID
+    username: str
+    points: int
+
+
 # --- Schema Interno ---
 class UserInDB(UserRead):
-    hashed_password: str
\ No newline at end of file
+    hashed_password: str
+
+
+# --- Schemas para Criação em Lote ---
+class UserBulkCreate(BaseModel):
+    users: List[UserCreate] = Field(min_length=1, max_length=1000)
+
+
+class UserBulkConflict(BaseModel):
+    # Posição do usuário na lista enviada
+    index: int
+    field: str
+    value: str
+
+
+class UserBulkCreateResult(BaseModel):
+    created: List[UserRead]
+    conflicts: List[UserBulkConflict]
@@ -0,0 +1,222 @@
+import bisect
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.core.accessibility import AccessibilityEncoder, MAX_CRITERIA, iter_bits
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.crud import accessibility_criteria_crud
+from inclui_aqui_server.crud.pagination import decode_cursor, encode_cursor
+from inclui_aqui_server.db.models import Establishment
+from inclui_aqui_server.db.schemas import EstablishmentRead
+
+
+class AccessibilityCatalogue:
+    """
+    Mantém em memória o codificador do catálogo de critérios, recarregado após um TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        """
+        :param ttl_seconds: Por quanto tempo o catálogo carregado é considerado atual.
+        """
+        self._ttl_seconds = ttl_seconds
+        self._encoder: Optional[AccessibilityEncoder] = None
+        self._loaded_at = 0.0
+
+    async def get_encoder(self, db: AsyncSession) -> AccessibilityEncoder:
+        """
+        Retorna o codificador do catálogo, carregando-o do banco se estiver ausente ou vencido.
+
+        :param db: A sessão usada caso o catálogo precise ser carregado.
+        :return: O codificador atual.
+        """
+        if self._encoder is None or time.monotonic() - self._loaded_at > self._ttl_seconds:
+            self._encoder = AccessibilityEncoder(await accessibility_criteria_crud.get_ordinals(db))
+            self._loaded_at = time.monotonic()
+        return self._encoder
+
+    def invalidate(self) -> None:
+        """Força a recarga do catálogo na próxima consulta."""
+        self._encoder = None
+
+
+class RegionBitmap:
+    """
+    Índice em memória dos estabelecimentos de uma região, um bitmap por critério.
+
+    O estabelecimento na posição `i` (ordem created_at, id) corresponde ao bit
+    `i` de cada bitmap. Como os bitmaps são inteiros Python de tamanho
+    arbitrário, um filtro AND/OR sobre milhares de estabelecimentos se resume a
+    algumas operações `&`/`|`, executadas palavra a palavra em C.
+    """
+
+    def __init__(self, establishments: Sequence[Tuple[EstablishmentRead, int]]):
+        """
+        :param establishments: Pares (estabelecimento, máscara), já na ordem (created_at, id).
+        """
+        self.items = [establishment for establishment, _ in establishments]
+        self._keys = [(item.created_at, item.id) for item in self.items]
+        self._bitmaps = [0] * MAX_CRITERIA
+        for position, (_, mask) in enumerate(establishments):
+            for ordinal in iter_bits(mask):
+                self._bitmaps[ordinal] |= 1 << position
+        self._all = (1 << len(self.items)) - 1
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def select(
+        self, mask: int, match_all: bool, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[EstablishmentRead], Optional[str]]:
+        """
+        Filtra a região pelos critérios, com a mesma paginação da consulta SQL.
+
+        :param mask: A máscara dos critérios pedidos.
+        :param match_all: Se True, exige todos os critérios; senão, ao menos um.
+        :param limit: O número máximo de itens da página.
+        :param cursor: O cursor da página anterior (compatível com o da consulta SQL).
+        :return: Uma tupla (itens, próximo cursor ou None).
+        """
+        if match_all:
+            matched = self._all
+            for ordinal in iter_bits(mask):
+                matched &= self._bitmaps[ordinal]
+        else:
+            matched = 0
+            for ordinal in iter_bits(mask):
+                matched |= self._bitmaps[ordinal]
+
+        if cursor:
+            values = decode_cursor(cursor, (Establishment.created_at, Establishment.id))
+            start = bisect.bisect_right(self._keys, tuple(values))
+            matched &= ~((1 << start) - 1)
+
+        page = []
+        for position in iter_bits(matched):
+            page.append(self.items[position])
+            if len(page) > limit:
+                break
+
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_cursor([page[-1].created_at, page[-1].id])
+        return page, next_cursor
+
+
+class AccessibilityRegionIndex:
+    """
+    Cache LRU de `RegionBitmap` para as regiões (prefixos de geohash) mais consultadas.
+
+    Uma região só é carregada depois de `hot_threshold` consultas, para que
+    buscas esporádicas continuem indo ao banco.
+
+    O índice é local ao processo: `invalidate` só descarta as regiões deste
+    processo. Nos demais workers, uma região alterada continua sendo servida
+    com os dados antigos até expirar, então `ttl_seconds` é o atraso máximo.
+    """
+
+    def __init__(
+        self,
+        max_regions: int = 64,
+        ttl_seconds: float = 60.0,
+        hot_threshold: int = 5,
+        max_rows: int = 20_000,
+    ):
+        """
+        :param max_regions: Número máximo de regiões mantidas em memória.
+        :param ttl_seconds: Tempo de vida de uma região carregada.
+        :param hot_threshold: Consultas necessárias para que uma região seja carregada.
+        :param max_rows: Regiões com mais estabelecimentos que isso não são carregadas.
+        """
+        self.max_regions = max_regions
+        self.ttl_seconds = ttl_seconds
+        self.hot_threshold = hot_threshold
+        self.max_rows = max_rows
+        self._regions: OrderedDict[str, Tuple[float, RegionBitmap]] = OrderedDict()
+        self._counts: Dict[str, int] = {}
+        self._oversized: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def get(self, region: str) -> Optional[RegionBitmap]:
+        """
+        Retorna a região carregada, se existir e não tiver expirado.
+        """
+        entry = self._regions.get(region)
+        if entry is None or entry[0] <= time.monotonic():
+            self._regions.pop(region, None)
+            self.misses += 1
+            return None
+        self._regions.move_to_end(region)
+        self.hits += 1
+        return entry[1]
+
+    def record_query(self, region: str) -> bool:
+        """
+        Contabiliza uma consulta à região.
+
+        :return: True se a região ficou "quente" e deve ser carregada.
+        """
+        oversized_until = self._oversized.get(region)
+        if oversized_until is not None:
+            if oversized_until > time.monotonic():
+                return False
+            del self._oversized[region]
+        if len(self._counts) > self.max_regions * 16:
+            self._counts.clear()
+        count = self._counts.get(region, 0) + 1
+        self._counts[region] = count
+        return count >= self.hot_threshold
+
+    def mark_oversized(self, region: str) -> None:
+        """
+        Impede que uma região grande demais seja carregada novamente antes do TTL.
+        """
+        self._counts.pop(region, None)
+        if len(self._oversized) > self.max_regions * 16:
+            self._oversized.clear()
+        self._oversized[region] = time.monotonic() + self.ttl_seconds
+
+    def put(self, region: str, bitmap: RegionBitmap) -> None:
+        self._counts.pop(region, None)
+        self._regions[region] = (time.monotonic() + self.ttl_seconds, bitmap)
+        self._regions.move_to_end(region)
+        self.loads += 1
+        while len(self._regions) > self.max_regions:
+            self._regions.popitem(last=False)
+
+    def invalidate(self, geohash: Optional[str]) -> None:
+        """
+        Descarta as regiões que contêm o geohash informado (ou todas, se None).
+        """
+        if geohash is None:
+            self._regions.clear()
+            return
+        for region in [region for region in self._regions if geohash.startswith(region)]:
+            del self._regions[region]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'regions': len(self._regions),
+            'max_regions': self.max_regions,
+            'hits': self.hits,
+            'misses': self.misses,
+            'loads': self.loads,
+        }
+
+
+# Instâncias compartilhadas por todas as requisições deste processo (não entre processos)
+accessibility_catalogue = AccessibilityCatalogue(
+    ttl_seconds=settings.ACCESSIBILITY_CATALOGUE_TTL_SECONDS
+)
+accessibility_region_index = AccessibilityRegionIndex(
+    max_regions=settings.ACCESSIBILITY_REGION_CACHE_SIZE,
+    ttl_seconds=settings.ACCESSIBILITY_REGION_TTL_SECONDS,
+    hot_threshold=settings.ACCESSIBILITY_REGION_HOT_THRESHOLD,
+    max_rows=settings.ACCESSIBILITY_REGION_MAX_ROWS,
+)
@@ -0,0 +1,607 @@
+import time
+import uuid
+from typing import Any, List, Optional, TextIO, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Importa as camadas que o serviço irá orquestrar
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.exception import BadRequestError, NotFoundError
+from inclui_aqui_server.core.geo import haversine_m, mercator_cell
+from inclui_aqui_server.core.text import normalize_query
+from inclui_aqui_server.crud import establishment_crud, map_cell_crud, review_crud, user_crud
+from inclui_aqui_server.db.models import Establishment
+from inclui_aqui_server.services.accessibility import (
+    AccessibilityRegionIndex,
+    RegionBitmap,
+    accessibility_catalogue,
+    accessibility_region_index,
+)
+from inclui_aqui_server.services.establishment_import import EstablishmentImporter, ImportFormat
+from inclui_aqui_server.services.search_cache import (
+    SearchResultCache,
+    search_cache_key,
+    search_result_cache,
+)
+from inclui_aqui_server.services.telemetry import record_search
+from inclui_aqui_server.db.schemas import (
+    EstablishmentAccessibilityUpdate,
+    EstablishmentApprovalUpdate,
+    EstablishmentDetail,
+    EstablishmentImageRead,
+    EstablishmentImportReport,
+    EstablishmentLocationUpdate,
+    EstablishmentNearby,
+    EstablishmentRead,
+    EstablishmentSearchResult,
+    EstablishmentSuggestion,
+    MapCluster,
+    MapClusters,
+    MapPoint,
+    ReviewDetail,
+    ReviewRead,
+    UserSummary,
+)
+
+
+class EstablishmentService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        read_db: Optional[AsyncSession] = None,
+        region_index: AccessibilityRegionIndex = accessibility_region_index,
+        search_cache: SearchResultCache = search_result_cache,
+    ):
+        """
+        O serviço é inicializado com uma sessão de banco de dados assíncrona.
+
+        :param db: A sessão do banco de dados (primário) usada nas escritas.
+        :type db: AsyncSession
+        :param read_db: A sessão usada nas leituras (ex.: réplica); por padrão, a mesma de `db`.
+        :type read_db: Optional[AsyncSession]
+        :param region_index: O índice em memória das regiões mais consultadas.
+        :type region_index: AccessibilityRegionIndex
+        :param search_cache: O cache dos resultados da busca textual.
+        :type search_cache: SearchResultCache
+        """
+        self.db = db
+        self.read_db = read_db if read_db is not None else db
+        self.region_index = region_index
+        self.search_cache = search_cache
+
+    async def get_detail_version(self, establishment_id: uuid.UUID) -> Tuple[Any, ...]:
+        """
+        Retorna a versão do detalhe de um estabelecimento, para validar GETs condicionais.
+
+        Uma única consulta, sem carregar as coleções: deve ser feita antes de
+        `get_detail`, para que o corpo nunca seja mais antigo que a versão.
+
+        :param establishment_id: O ID do estabelecimento.
+        :type establishment_id: uuid.UUID
+        :raises NotFoundError: Se o estabelecimento não for encontrado.
+        :return: Os marcadores de versão do estabelecimento e de suas coleções.
+        :rtype: Tuple[Any, ...]
+        """
+        version = await establishment_crud.get_detail_version(self.read_db, establishment_id)
+        await self.read_db.close()
+        if version is None:
+            raise NotFoundError(resource="Establishment")
+        return version
+
+    async def get_detail(
+        self,
+        establishment_id: uuid.UUID,
+        images_limit: int = settings.ESTABLISHMENT_DETAIL_MAX_IMAGES,
+        reviews_limit: int = settings.ESTABLISHMENT_DETAIL_MAX_REVIEWS,
+    ) -> EstablishmentDetail:
+        """
+        Retorna um estabelecimento com dono, imagens aprovadas e avaliações recentes.
+
+        Nenhuma relação é carregada sob demanda: são sempre cinco consultas
+        (estabelecimento e dono, imagens, avaliações, autores em lote e
+        contagem de comentários em lote), qualquer que seja o número de avaliações.
+
+        :param establishment_id: O ID do estabelecimento.
+        :type establishment_id: uuid.UUID
+        :param images_limit: Quantidade máxima de imagens (limitada por `ESTABLISHMENT_DETAIL_MAX_IMAGES`).
+        :type images_limit: int
+        :param reviews_limit: Quantidade máxima de avaliações (limitada por `ESTABLISHMENT_DETAIL_MAX_REVIEWS`).
+        :type reviews_limit: int
+        :raises NotFoundError: Se o estabelecimento não for encontrado.
+        :return: O estabelecimento com suas coleções.
+        :rtype: EstablishmentDetail
+        """
+        establishment = await establishment_crud.get_with_owner(self.read_db, establishment_id)
+        if establishment is None:
+            await self.read_db.close()
+            raise NotFoundError(resource="Establishment")
+
+        images = await establishment_crud.get_approved_images(
+            self.read_db,
+            establishment_id,
+            limit=min(images_limit, settings.ESTABLISHMENT_DETAIL_MAX_IMAGES),
+        )
+        reviews = await review_crud.get_recent_by_establishment(
+            self.read_db,
+            establishment_id,
+            limit=min(reviews_limit, settings.ESTABLISHMENT_DETAIL_MAX_REVIEWS),
+        )
+        comment_counts = await review_crud.count_comments(
+            self.read_db, [review.id for review in reviews]
+        )
+        await self.read_db.close()
+
+        return EstablishmentDetail(
+            **EstablishmentRead.model_validate(establishment).model_dump(),
+            owner=UserSummary.model_validate(establishment.owner),
+            images=[EstablishmentImageRead.model_validate(image) for image in images],
+            reviews=[
+                ReviewDetail(
+                    **ReviewRead.model_validate(review).model_dump(),
+                    user=UserSummary.model_validate(review.user),
+                    comment_count=comment_counts.get(review.id, 0),
+                )
+                for review in reviews
+            ],
+        )
+
+    async def search_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[EstablishmentNearby], Optional[str]]:
+        """
+        Busca estabelecimentos aprovados dentro de um raio, do mais próximo ao mais distante.
+
+        :param latitude: Latitude do centro da busca.
+        :type latitude: float
+        :param longitude: Longitude do centro da busca.
+        :type longitude: float
+        :param radius_m: O raio da busca em metros.
+        :type radius_m: float
+        :param limit: O número máximo de registros a retornar.
+        :type limit: int
+        :param cursor: O cursor retornado pela página anterior, ou None para a primeira página.
+        :type cursor: Optional[str]
+        :raises BadRequestError: Se o raio exceder o máximo permitido ou o cursor for inválido.
+        :return: Uma tupla com os estabelecimentos e suas distâncias e o cursor da próxima página.
+        :rtype: Tuple[List[EstablishmentNearby], Optional[str]]
+        """
+        if radius_m > settings.NEARBY_MAX_RADIUS_M:
+            raise BadRequestError(
+                detail=f"radius_m must be at most {settings.NEARBY_MAX_RADIUS_M:g}."
+            )
+
+        rows, next_cursor = await establishment_crud.get_within_radius(
+            self.read_db,
+            latitude=latitude,
+            longitude=longitude,
+            radius_m=radius_m,
+            limit=limit,
+            cursor=cursor,
+        )
+        await self.read_db.close()
+        return [self._to_nearby(establishment, distance) for establishment, distance in rows], next_cursor
+
+    async def find_nearest(self, latitude: float, longitude: float, k: int) -> List[EstablishmentNearby]:
+        """
+        Busca os k estabelecimentos aprovados mais próximos de um ponto.
+
+        O raio começa em `NEAREST_INITIAL_RADIUS_M` e dobra até encontrar k resultados
+        ou atingir `NEARBY_MAX_RADIUS_M`. Como a busca por raio devolve todos os
+        pontos do círculo ordenados, os k primeiros são de fato os mais próximos.
+
+        :param latitude: Latitude do ponto de referência.
+        :type latitude: float
+        :param longitude: Longitude do ponto de referência.
+        :type longitude: float
+        :param k: Quantidade de estabelecimentos desejada.
+        :type k: int
+        :return: Até k estabelecimentos, do mais próximo ao mais distante.
+        :rtype: List[EstablishmentNearby]
+        """
+        radius_m = min(settings.NEAREST_INITIAL_RADIUS_M, settings.NEARBY_MAX_RADIUS_M)
+        while True:
+            rows, _ = await establishment_crud.get_within_radius(
+                self.read_db, latitude=latitude, longitude=longitude, radius_m=radius_m, limit=k
+            )
+            if len(rows) >= k or radius_m >= settings.NEARBY_MAX_RADIUS_M:
+                break
+            radius_m = min(radius_m * 2, settings.NEARBY_MAX_RADIUS_M)
+        await self.read_db.close()
+        return [self._to_nearby(establishment, distance) for establishment, distance in rows]
+
+    async def search(
+        self,
+        query: str,
+        type: Optional[str] = None,
+        limit: int = 20,
+        user_id: Optional[uuid.UUID] = None,
+    ) -> List[EstablishmentSearchResult]:
+        """
+        Busca estabelecimentos aprovados por nome, endereço ou tipo.
+
+        Buscas repetidas (mesmo texto normalizado e filtros) são servidas pelo
+        cache de resultados: só os IDs ficam em cache, e os estabelecimentos são
+        relidos em uma única consulta por chave primária. Logo após uma
+        invalidação, as buscas que vão ao banco usam o primário.
+
+        :param query: O texto buscado.
+        :type query: str
+        :param type: Filtra pelo tipo do estabelecimento, se informado.
+        :type type: Optional[str]
+        :param limit: O número máximo de registros a retornar.
+        :type limit: int
+        :param user_id: O usuário que fez a busca; se informado, a busca entra no seu histórico.
+        :type user_id: Optional[uuid.UUID]
+        :raises BadRequestError: Se o texto for curto demais após a normalização.
+        :return: Os estabelecimentos encontrados, do mais relevante ao menos relevante.
+        :rtype: List[EstablishmentSearchResult]
+        """
+        normalized = self._normalize(query)
+        search_filters = {'type': type} if type else None
+        key = search_cache_key(normalized, {**(search_filters or {}), 'limit': limit})
+
+        started_at = time.perf_counter()
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            establishments = await establishment_crud.get_approved_by_ids(
+                self.read_db, [establishment_id for establishment_id, _ in cached]
+            )
+            by_id = {establishment.id: establishment for establishment in establishments}
+            rows = [
+                (by_id[establishment_id], score)
+                for establishment_id, score in cached
+                if establishment_id in by_id
+            ]
+        else:
+            generation = self.search_cache.begin()
+            # Logo após uma escrita, a réplica pode não tê-la: o resultado ficaria em cache
+            search_db = self.db if self.search_cache.reads_from_primary() else self.read_db
+            rows = await establishment_crud.search(
+                search_db, query=normalized, type=type, limit=limit
+            )
+            self.search_cache.put(
+                key, [(establishment.id, score) for establishment, score in rows], generation
+            )
+            await search_db.close()
+        self.search_cache.record(cached is not None, time.perf_counter() - started_at)
+        await self.read_db.close()
+
+        if user_id is not None:
+            # Gravado em lote, em segundo plano: não acrescenta latência à busca
+            record_search(
+                user_id,
+                query,
+                search_filters=search_filters,
+                result_ids=[establishment.id for establishment, _ in rows],
+            )
+        return [
+            EstablishmentSearchResult(
+                **EstablishmentRead.model_validate(establishment).model_dump(), score=score
+            )
+            for establishment, score in rows
+        ]
+
+    async def autocomplete(self, query: str, limit: int = 10) -> List[EstablishmentSuggestion]:
+        """
+        Sugere estabelecimentos aprovados para o texto digitado até o momento.
+
+        :param query: O texto digitado.
+        :type query: str
+        :param limit: O número máximo de sugestões.
+        :type limit: int
+        :raises BadRequestError: Se o texto for curto demais após a normalização.
+        :return: As sugestões, da mais relevante à menos relevante.
+        :rtype: List[EstablishmentSuggestion]
+        """
+        normalized = self._normalize(query)
+        rows = await establishment_crud.autocomplete(self.read_db, query=normalized, limit=limit)
+        await self.read_db.close()
+        return [EstablishmentSuggestion.model_validate(row, from_attributes=True) for row in rows]
+
+    async def filter_by_accessibility(
+        self,
+        criteria: List[str],
+        match_all: bool = True,
+        region: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[EstablishmentRead], Optional[str]]:
+        """
+        Busca estabelecimentos aprovados que atendem aos critérios de acessibilidade pedidos.
+
+        Em regiões muito consultadas, o filtro é avaliado sobre bitmaps em memória;
+        nas demais, com operações de bits no banco. Os dois caminhos produzem a
+        mesma ordem e cursores intercambiáveis.
+
+        :param criteria: Os nomes dos critérios do catálogo.
+        :type criteria: List[str]
+        :param match_all: Se True, exige todos os critérios; senão, ao menos um.
+        :type match_all: bool
+        :param region: Prefixo de geohash que restringe a busca, se informado.
+        :type region: Optional[str]
+        :param limit: O número máximo de registros a retornar.
+        :type limit: int
+        :param cursor: O cursor retornado pela página anterior, ou None para a primeira página.
+        :type cursor: Optional[str]
+        :raises BadRequestError: Se algum critério não existir ou o cursor for inválido.
+        :return: Uma tupla com os estabelecimentos e o cursor da próxima página.
+        :rtype: Tuple[List[EstablishmentRead], Optional[str]]
+        """
+        encoder = await accessibility_catalogue.get_encoder(self.read_db)
+        mask = encoder.mask_for(criteria)
+
+        if region:
+            bitmap = await self._get_region_bitmap(region)
+            if bitmap is not None:
+                await self.read_db.close()
+                return bitmap.select(mask, match_all, limit, cursor)
+
+        establishments, next_cursor = await establishment_crud.get_by_accessibility(
+            self.read_db,
+            mask=mask,
+            match_all=match_all,
+            region=region,
+            limit=limit,
+            cursor=cursor,
+        )
+        await self.read_db.close()
+        return [EstablishmentRead.model_validate(item) for item in establishments], next_cursor
+
+    async def set_accessibility_features(
+        self, establishment_id: uuid.UUID, features_in: EstablishmentAccessibilityUpdate
+    ) -> EstablishmentRead:
+        """
+        Atualiza os critérios de acessibilidade de um estabelecimento.
+
+        O JSON e a máscara de bits são gravados juntos, então nunca divergem.
+
+        :param establishment_id: O ID do estabelecimento.
+        :type establishment_id: uuid.UUID
+        :param features_in: Os critérios atendidos (ou não) pelo estabelecimento.
+        :type features_in: EstablishmentAccessibilityUpdate
+        :raises BadRequestError: Se algum critério não existir no catálogo.
+        :raises NotFoundError: Se o estabelecimento não for encontrado.
+        :return: O estabelecimento atualizado.
+        :rtype: EstablishmentRead
+        """
+        encoder = await accessibility_catalogue.get_encoder(self.db)
+        # Valida os nomes; critérios com valor False não entram na máscara
+        encoder.mask_for(features_in.features)
+        mask = encoder.encode(features_in.features)
+
+        establishment = await establishment_crud.update_accessibility(
+            self.db, establishment_id=establishment_id, features=features_in.features, mask=mask
+        )
+        if establishment is None:
+            raise NotFoundError(resource="Establishment")
+
+        self.region_index.invalidate(establishment.geohash)
+        self.search_cache.invalidate([establishment.id])
+        return EstablishmentRead.model_validate(establishment)
+
+    async def set_approval(
+        self, establishment_id: uuid.UUID, approval_in: EstablishmentApprovalUpdate
+    ) -> EstablishmentRead:
+        """
+        Aprova ou reprova um estabelecimento, atualizando os clusters do mapa.
+
+        :param establishment_id: O ID do estabelecimento.
+        :type establishment_id: uuid.UUID
+        :param approval_in: O novo estado de aprovação.
+        :type approval_in: EstablishmentApprovalUpdate
+        :raises NotFoundError: Se o estabelecimento não for encontrado.
+        :return: O estabelecimento atualizado.
+        :rtype: EstablishmentRead
+        """
+        establishment = await establishment_crud.set_approval(
+            self.db, establishment_id=establishment_id, is_approved=approval_in.is_approved
+        )
+        if establishment is None:
+            raise NotFoundError(resource="Establishment")
+
+        self.region_index.invalidate(establishment.geohash)
+        # Um estabelecimento aprovado pode passar a aparecer em qualquer busca
+        self.search_cache.invalidate(None if establishment.is_approved else [establishment.id])
+        return EstablishmentRead.model_validate(establishment)
+
+    async def move_establishment(
+        self, establishment_id: uuid.UUID, location_in: EstablishmentLocationUpdate
+    ) -> EstablishmentRead:
+        """
+        Altera a localização de um estabelecimento, atualizando geohash e clusters do mapa.
+
+        :param establishment_id: O ID do estabelecimento.
+        :type establishment_id: uuid.UUID
+        :param location_in: As novas coordenadas.
+        :type location_in: EstablishmentLocationUpdate
+        :raises NotFoundError: Se o estabelecimento não for encontrado.
+        :return: O estabelecimento atualizado.
+        :rtype: EstablishmentRead
+        """
+        establishment, old_geohash = await establishment_crud.update_location(
+            self.db,
+            establishment_id=establishment_id,
+            latitude=location_in.latitude,
+            longitude=location_in.longitude,
+        )
+        if establishment is None:
+            raise NotFoundError(resource="Establishment")
+
+        self.region_index.invalidate(old_geohash)
+        self.region_index.invalidate(establishment.geohash)
+        self.search_cache.invalidate([establishment.id])
+        return EstablishmentRead.model_validate(establishment)
+
+    async def get_map_clusters(
+        self,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        zoom: int,
+    ) -> MapClusters:
+        """
+        Agrupa os estabelecimentos aprovados visíveis em um retângulo do mapa.
+
+        Até `MAP_MAX_CLUSTER_ZOOM`, os grupos são lidos das células pré-calculadas
+        (uma linha por célula, independentemente de quantos estabelecimentos ela
+        contém); acima dele, os estabelecimentos são retornados individualmente.
+
+        :param min_latitude: Latitude da borda sul.
+        :type min_latitude: float
+        :param min_longitude: Longitude da borda oeste (maior que a leste ao cruzar o antimeridiano).
+        :type min_longitude: float
+        :param max_latitude: Latitude da borda norte.
+        :type max_latitude: float
+        :param max_longitude: Longitude da borda leste.
+        :type max_longitude: float
+        :param zoom: O zoom do mapa.
+        :type zoom: int
+        :raises BadRequestError: Se o retângulo for inválido ou grande demais para o zoom.
+        :return: Os grupos (centroide e quantidade) ou os estabelecimentos individuais.
+        :rtype: MapClusters
+        """
+        if min_latitude > max_latitude:
+            raise BadRequestError(detail="min_latitude must not be greater than max_latitude.")
+        # Ao cruzar o antimeridiano, o retângulo é dividido em dois
+        longitude_ranges = (
+            [(min_longitude, max_longitude)]
+            if min_longitude <= max_longitude
+            else [(min_longitude, 180.0), (-180.0, max_longitude)]
+        )
+
+        if zoom > settings.MAP_MAX_CLUSTER_ZOOM:
+            return await self._get_map_points(min_latitude, max_latitude, longitude_ranges, zoom)
+
+        level = zoom + settings.MAP_CELL_BITS
+        x_ranges = []
+        for west, east in longitude_ranges:
+            (x_min, y_min), (x_max, y_max) = (
+                mercator_cell(max_latitude, west, level),
+                mercator_cell(min_latitude, east, level),
+            )
+            x_ranges.append((x_min, x_max))
+        cell_count = sum(high - low + 1 for low, high in x_ranges) * (y_max - y_min + 1)
+        if cell_count > settings.MAP_MAX_CELLS:
+            raise BadRequestError(
+                detail=f"The bounding box covers {cell_count} cells at zoom {zoom}; "
+                f"the maximum is {settings.MAP_MAX_CELLS}."
+            )
+
+        cells = await map_cell_crud.get_cells(
+            self.read_db, zoom=zoom, x_ranges=x_ranges, y_range=(y_min, y_max)
+        )
+        await self.read_db.close()
+        return MapClusters(
+            zoom=zoom,
+            clusters=[
+                MapCluster(
+                    latitude=cell.latitude_sum / cell.count,
+                    longitude=cell.longitude_sum / cell.count,
+                    count=cell.count,
+                )
+                for cell in cells
+            ],
+        )
+
+    async def import_establishments(
+        self,
+        stream: TextIO,
+        fmt: ImportFormat,
+        owner_id: uuid.UUID,
+        approve: bool = False,
+        chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+    ) -> EstablishmentImportReport:
+        """
+        Importa estabelecimentos de um arquivo CSV ou NDJSON, deduplicando pelo `google_place_id`.
+
+        :param stream: O arquivo aberto em modo texto.
+        :type stream: TextIO
+        :param fmt: O formato do arquivo (`csv` ou `ndjson`).
+        :type fmt: ImportFormat
+        :param owner_id: O usuário que será dono dos estabelecimentos inseridos.
+        :type owner_id: uuid.UUID
+        :param approve: Se True, os estabelecimentos inseridos já entram aprovados.
+        :type approve: bool
+        :param chunk_size: Quantidade de linhas por lote.
+        :type chunk_size: int
+        :raises NotFoundError: Se o usuário dono não existir.
+        :return: O relatório da importação.
+        :rtype: EstablishmentImportReport
+        """
+        if await user_crud.get(self.db, user_id=owner_id) is None:
+            raise NotFoundError(resource="User")
+        importer = EstablishmentImporter(
+            self.db, owner_id=owner_id, approve=approve, chunk_size=chunk_size
+        )
+        report = await importer.run(stream, fmt)
+        if report.inserted or report.updated:
+            # Nomes e endereços alterados (ou novos aprovados) mudam quais buscas casam
+            self.search_cache.invalidate()
+        return report
+
+    async def _get_region_bitmap(self, region: str) -> Optional[RegionBitmap]:
+        bitmap = self.region_index.get(region)
+        if bitmap is not None or not self.region_index.record_query(region):
+            return bitmap
+
+        max_rows = self.region_index.max_rows
+        establishments = await establishment_crud.get_region(
+            self.read_db, region=region, limit=max_rows + 1
+        )
+        if len(establishments) > max_rows:
+            self.region_index.mark_oversized(region)
+            return None
+        bitmap = RegionBitmap([
+            (EstablishmentRead.model_validate(item), item.accessibility_mask)
+            for item in establishments
+        ])
+        self.region_index.put(region, bitmap)
+        return bitmap
+
+    async def _get_map_points(
+        self,
+        min_latitude: float,
+        max_latitude: float,
+        longitude_ranges: List[Tuple[float, float]],
+        zoom: int,
+    ) -> MapClusters:
+        points = []
+        for west, east in longitude_ranges:
+            half_diagonal = haversine_m(min_latitude, west, max_latitude, east) / 2
+            if half_diagonal > settings.NEARBY_MAX_RADIUS_M:
+                raise BadRequestError(
+                    detail=f"The bounding box is too large for zoom {zoom}."
+                )
+            rows = await establishment_crud.get_points_in_box(
+                self.read_db,
+                min_latitude=min_latitude,
+                min_longitude=west,
+                max_latitude=max_latitude,
+                max_longitude=east,
+                limit=settings.MAP_MAX_POINTS - len(points),
+            )
+            points.extend(MapPoint.model_validate(row) for row in rows)
+            if len(points) >= settings.MAP_MAX_POINTS:
+                break
+        await self.read_db.close()
+        return MapClusters(zoom=zoom, points=points)
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        normalized = normalize_query(query)
+        if len(normalized) < settings.SEARCH_MIN_QUERY_LENGTH:
+            raise BadRequestError(
+                detail=f"q must have at least {settings.SEARCH_MIN_QUERY_LENGTH} characters."
+            )
+        return normalized
+
+    @staticmethod
+    def _to_nearby(establishment: Establishment, distance: float) -> EstablishmentNearby:
+        establishment_data = EstablishmentRead.model_validate(establishment).model_dump()
+        return EstablishmentNearby(**establishment_data, distance_m=distance)
@@ -0,0 +1,219 @@
+import asyncio
+import csv
+import itertools
+import json
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Literal, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.core.accessibility import AccessibilityEncoder
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.geo import encode_geohash
+from inclui_aqui_server.crud import establishment_crud
+from inclui_aqui_server.db.schemas import (
+    EstablishmentImportError,
+    EstablishmentImportReport,
+    EstablishmentImportRow,
+)
+from inclui_aqui_server.services.accessibility import (
+    accessibility_catalogue,
+    accessibility_region_index,
+)
+
+ImportFormat = Literal['csv', 'ndjson']
+
+# Extensões de arquivo reconhecidas por formato
+IMPORT_FORMAT_SUFFIXES = {'.csv': 'csv', '.ndjson': 'ndjson', '.jsonl': 'ndjson'}
+
+# Com ~12 parâmetros por linha, mantém cada INSERT abaixo do limite de 32767 do PostgreSQL
+MAX_CHUNK_SIZE = 2500
+
+# Linha numerada do arquivo: (número da linha, registro lido ou erro de leitura)
+NumberedRecord = Tuple[int, Any]
+
+
+def iter_records(stream: TextIO, fmt: ImportFormat) -> Iterator[NumberedRecord]:
+    """
+    Lê o arquivo de importação registro a registro, sem carregá-lo inteiro na memória.
+
+    Uma linha malformada vira um erro no lugar do registro e a leitura continua.
+    Texto que não pode ser decodificado encerra a leitura: a posição no arquivo
+    deixa de ser confiável.
+
+    :param stream: O arquivo aberto em modo texto.
+    :param fmt: O formato do arquivo.
+    :return: Um iterador de (número da linha, dicionário) ou (número da linha, exceção).
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        last_line = 0
+        while True:
+            try:
+                if last_line == 0:
+                    # Lê o cabeçalho, para que a primeira linha de dados seja numerada corretamente
+                    reader.fieldnames
+                    last_line = reader.line_num
+                record = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as exc:
+                # O leitor nem sempre conta a linha em que o erro aconteceu
+                last_line = max(reader.line_num, last_line + 1)
+                yield last_line, exc
+                continue
+            except UnicodeDecodeError as exc:
+                yield last_line + 1, UnreadableFileError(exc)
+                return
+            last_line = reader.line_num
+            yield last_line, record
+
+    lines = iter(stream)
+    line_number = 0
+    while True:
+        try:
+            line = next(lines)
+        except StopIteration:
+            return
+        except UnicodeDecodeError as exc:
+            yield line_number + 1, UnreadableFileError(exc)
+            return
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as exc:
+            yield line_number, exc
+
+
+class UnreadableFileError(ValueError):
+    """Texto que não pôde ser decodificado; o restante do arquivo não é importado."""
+
+    def __init__(self, exc: UnicodeDecodeError):
+        super().__init__(
+            f'Unreadable {exc.encoding} text ({exc.reason}) at or after this line; '
+            'the rest of the file was not imported.'
+        )
+
+
+class EstablishmentImporter:
+    """
+    Importa estabelecimentos de arquivos CSV ou NDJSON em lotes de tamanho fixo.
+
+    Cada lote é lido e validado em uma thread (sem bloquear o event loop),
+    gravado com um upsert multi-linha pelo `google_place_id` e confirmado com
+    commit, de modo que a memória usada não depende do tamanho do arquivo.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        owner_id: uuid.UUID,
+        approve: bool = False,
+        chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+    ):
+        """
+        :param db: A sessão do banco de dados (primário).
+        :param owner_id: O usuário que será dono dos estabelecimentos inseridos.
+        :param approve: Se True, os estabelecimentos inseridos já entram aprovados.
+        :param chunk_size: Quantidade de linhas por lote (1 a `MAX_CHUNK_SIZE`).
+        :raises ValueError: Se `chunk_size` estiver fora do intervalo permitido.
+        """
+        if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f'chunk_size must be between 1 and {MAX_CHUNK_SIZE}.')
+        self.db = db
+        self.owner_id = owner_id
+        self.approve = approve
+        self.chunk_size = chunk_size
+
+    async def run(self, stream: TextIO, fmt: ImportFormat) -> EstablishmentImportReport:
+        """
+        Importa todas as linhas do arquivo.
+
+        :param stream: O arquivo aberto em modo texto.
+        :param fmt: O formato do arquivo.
+        :return: O relatório com inseridos, atualizados, inalterados, rejeitados e vazão.
+        """
+        report = EstablishmentImportReport()
+        started_at = time.perf_counter()
+        encoder = await accessibility_catalogue.get_encoder(self.db)
+        records = iter_records(stream, fmt)
+
+        while True:
+            chunk = await asyncio.to_thread(self._read_chunk, records, encoder, report)
+            if chunk is None:
+                break
+            inserted, updated = await establishment_crud.upsert_by_place_id(self.db, rows=chunk)
+            await self.db.commit()
+            report.inserted += inserted
+            report.updated += updated
+            report.unchanged += len(chunk) - inserted - updated
+
+        if report.inserted or report.updated:
+            accessibility_region_index.invalidate(None)
+
+        report.elapsed_seconds = time.perf_counter() - started_at
+        if report.elapsed_seconds > 0:
+            report.rows_per_second = report.total_rows / report.elapsed_seconds
+        return report
+
+    def _read_chunk(
+        self,
+        records: Iterator[NumberedRecord],
+        encoder: AccessibilityEncoder,
+        report: EstablishmentImportReport,
+    ) -> Optional[List[Dict[str, Any]]]:
+        # Executado em uma thread: lê, valida e prepara as linhas de um lote
+        batch = list(itertools.islice(records, self.chunk_size))
+        if not batch:
+            return None
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        for line_number, record in batch:
+            report.total_rows += 1
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                row = EstablishmentImportRow.model_validate(record)
+            except (ValidationError, ValueError, csv.Error) as exc:
+                if isinstance(exc, UnreadableFileError):
+                    report.stopped_at_line = line_number
+                self._reject(report, line_number, exc)
+                continue
+
+            prepared = {
+                **row.model_dump(),
+                # Mesma precisão das colunas DECIMAL, para que o mapa use a coordenada gravada
+                'latitude': round(row.latitude, 8),
+                'longitude': round(row.longitude, 8),
+                'geohash': encode_geohash(row.latitude, row.longitude),
+                'accessibility_mask': encoder.encode(row.accessibility_features_json),
+                'owner_id': self.owner_id,
+                'is_approved': self.approve,
+            }
+            previous = rows.get(row.google_place_id)
+            if previous is not None:
+                # A última ocorrência prevalece, como aconteceria entre lotes
+                if previous == prepared:
+                    report.unchanged += 1
+                else:
+                    report.updated += 1
+            rows[row.google_place_id] = prepared
+        return list(rows.values())
+
+    @staticmethod
+    def _reject(report: EstablishmentImportReport, line_number: int, exc: Exception) -> None:
+        report.rejected += 1
+        if len(report.errors) < settings.IMPORT_MAX_REPORTED_ERRORS:
+            if isinstance(exc, ValidationError):
+                message = '; '.join(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                    for error in exc.errors()
+                )
+            else:
+                message = str(exc)
+            report.errors.append(EstablishmentImportError(line=line_number, error=message))
@@ -0,0 +1,434 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.exception import (
+    BadRequestError,
+    NotFoundError,
+    PayloadTooLargeError,
+    UnsupportedMediaTypeError,
+)
+from inclui_aqui_server.core.storage import ObjectStore, get_object_store
+from inclui_aqui_server.crud import establishment_crud, image_crud, review_crud
+from inclui_aqui_server.crud.errors import is_foreign_key_violation
+from inclui_aqui_server.db.schemas import ImageUploadResult
+
+logger = logging.getLogger(__name__)
+
+# Tipo de conteúdo aceito -> extensão do arquivo gravado
+IMAGE_EXTENSIONS = {'image/jpeg': 'jpg', 'image/png': 'png', 'image/webp': 'webp'}
+
+# Bytes lidos do início do arquivo para identificar o formato real
+_SNIFF_BYTES = 12
+
+# Pillow é opcional: sem ele, as imagens são aceitas, mas os thumbnails não são gerados
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = ImageOps = None
+PILLOW_AVAILABLE = Image is not None
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """
+    Identifica o formato da imagem pela assinatura dos primeiros bytes.
+
+    :param head: Os primeiros bytes do arquivo (ao menos 12).
+    :return: O tipo de conteúdo ou None se não for um formato aceito.
+    """
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def render_thumbnails(source_path: str, target_dir: str, sizes: Sequence[int]) -> List[Tuple[int, str]]:
+    """
+    Gera os thumbnails JPEG de uma imagem. Executada em um processo do pool.
+
+    :param source_path: O arquivo da imagem original.
+    :param target_dir: O diretório onde os thumbnails são gravados.
+    :param sizes: Os tamanhos (lado maior, em pixels).
+    :return: Pares (tamanho, caminho do arquivo gerado).
+    """
+    largest = max(sizes)
+    results = []
+    with Image.open(source_path) as source:
+        # Em JPEGs, decodifica já em escala reduzida: menos memória e CPU
+        source.draft('RGB', (largest, largest))
+        image = ImageOps.exif_transpose(source).convert('RGB')
+        # Do maior para o menor, reaproveitando a redução anterior
+        for size in sorted(sizes, reverse=True):
+            image.thumbnail((size, size))
+            path = os.path.join(target_dir, f'{size}.jpg')
+            image.save(path, 'JPEG', quality=85, optimize=True)
+            results.append((size, path))
+    return results
+
+
+@dataclass
+class StoredImage:
+    key: str
+    content_hash: str
+    size_bytes: int
+    deduplicated: bool
+
+
+class ThumbnailPipeline:
+    """
+    Gera os thumbnails das imagens enviadas em segundo plano, fora da requisição.
+
+    O redimensionamento roda em um pool de processos (não disputa a GIL com o
+    servidor) e no máximo `max_concurrency` imagens são processadas ao mesmo
+    tempo. Os thumbnails são gravados em chaves derivadas do hash do conteúdo,
+    então uma imagem repetida nunca é processada duas vezes.
+    """
+
+    def __init__(
+        self,
+        store_factory: Callable[[], ObjectStore] = get_object_store,
+        sizes: Sequence[int] = settings.THUMBNAIL_SIZES,
+        max_workers: Optional[int] = settings.THUMBNAIL_WORKERS,
+        max_concurrency: int = settings.THUMBNAIL_MAX_CONCURRENCY,
+    ):
+        """
+        :param store_factory: Função que retorna o armazenamento de objetos.
+        :param sizes: Os tamanhos dos thumbnails (lado maior, em pixels).
+        :param max_workers: Processos do pool; None usa a quantidade de CPUs.
+        :param max_concurrency: Imagens processadas ao mesmo tempo.
+        """
+        self._store_factory = store_factory
+        self.sizes = sorted(set(sizes))
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.completed = 0
+        self.skipped = 0
+        self.failed = 0
+
+    @staticmethod
+    def thumbnail_key(content_hash: str, size: int) -> str:
+        return f'thumbnails/{content_hash[:2]}/{content_hash}/{size}.jpg'
+
+    def thumbnail_urls(self, store: ObjectStore, content_hash: str) -> Dict[int, str]:
+        """
+        Retorna as URLs onde os thumbnails de uma imagem ficam disponíveis.
+        """
+        if not PILLOW_AVAILABLE:
+            return {}
+        return {size: store.url_for(self.thumbnail_key(content_hash, size)) for size in self.sizes}
+
+    def submit(self, key: str, content_hash: str) -> None:
+        """
+        Agenda a geração dos thumbnails de uma imagem já armazenada.
+
+        :param key: A chave da imagem original no armazenamento.
+        :param content_hash: O SHA-256 da imagem.
+        """
+        if not PILLOW_AVAILABLE or not self.sizes:
+            self.skipped += 1
+            return
+        task = asyncio.create_task(self._process(key, content_hash))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def shutdown(self) -> None:
+        """
+        Cancela os thumbnails pendentes e encerra o pool de processos.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna as métricas do pipeline de thumbnails.
+        """
+        return {
+            'available': PILLOW_AVAILABLE,
+            'pending': len(self._tasks),
+            'completed': self.completed,
+            'skipped': self.skipped,
+            'failed': self.failed,
+        }
+
+    async def _process(self, key: str, content_hash: str) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        store = self._store_factory()
+        async with self._semaphore:
+            try:
+                existing = await asyncio.gather(*(
+                    store.exists(self.thumbnail_key(content_hash, size)) for size in self.sizes
+                ))
+                if all(existing):
+                    self.skipped += 1
+                    return
+                with tempfile.TemporaryDirectory(prefix='thumbnails-') as workdir:
+                    source_path = os.path.join(workdir, 'source')
+                    await _download(store, key, source_path)
+                    loop = asyncio.get_running_loop()
+                    rendered = await loop.run_in_executor(
+                        self._get_executor(), render_thumbnails, source_path, workdir, self.sizes
+                    )
+                    for size, path in rendered:
+                        await store.write(self.thumbnail_key(content_hash, size), _read_file(path))
+                self.completed += 1
+            except Exception:
+                self.failed += 1
+                logger.exception('Thumbnail generation failed for %s.', key)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            try:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            except (OSError, ImportError, NotImplementedError):
+                # Ambientes sem suporte a multiprocessing (ex.: sem /dev/shm)
+                logger.warning('Process pool unavailable; rendering thumbnails in threads.')
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix='thumbnails'
+                )
+        return self._executor
+
+
+async def _download(store: ObjectStore, key: str, path: str) -> None:
+    handle = await asyncio.to_thread(open, path, 'wb')
+    try:
+        async for chunk in store.read(key):
+            await asyncio.to_thread(handle.write, chunk)
+    finally:
+        await asyncio.to_thread(handle.close)
+
+
+async def _read_file(path: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    handle = await asyncio.to_thread(open, path, 'rb')
+    try:
+        while chunk := await asyncio.to_thread(handle.read, chunk_size):
+            yield chunk
+    finally:
+        await asyncio.to_thread(handle.close)
+
+
+# Cria uma instância única do pipeline, encerrada no ciclo de vida da aplicação.
+thumbnail_pipeline = ThumbnailPipeline()
+
+
+class ImageService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        read_db: Optional[AsyncSession] = None,
+        store: Optional[ObjectStore] = None,
+        pipeline: ThumbnailPipeline = thumbnail_pipeline,
+    ):
+        """
+        O serviço é inicializado com uma sessão de banco de dados assíncrona.
+
+        :param db: A sessão do banco de dados (primário) usada nas escritas.
+        :type db: AsyncSession
+        :param read_db: A sessão usada nas leituras (ex.: réplica); por padrão, a mesma de `db`.
+        :type read_db: Optional[AsyncSession]
+        :param store: O armazenamento de objetos; por padrão, o configurado em `Settings`.
+        :type store: Optional[ObjectStore]
+        :param pipeline: O pipeline que gera os thumbnails em segundo plano.
+        :type pipeline: ThumbnailPipeline
+        """
+        self.db = db
+        self.read_db = read_db if read_db is not None else db
+        self.store = store if store is not None else get_object_store()
+        self.pipeline = pipeline
+
+    async def upload_establishment_image(
+        self,
+        establishment_id: uuid.UUID,
+        chunks: AsyncIterable[bytes],
+        content_type: Optional[str],
+        user_id: Optional[uuid.UUID] = None,
+        description: Optional[str] = None,
+    ) -> ImageUploadResult:
+        """
+        Armazena uma imagem enviada em blocos e a associa a um estabelecimento.
+
+        :param establishment_id: O ID do estabelecimento.
+        :type establishment_id: uuid.UUID
+        :param chunks: O corpo da requisição, bloco a bloco.
+        :type chunks: AsyncIterable[bytes]
+        :param content_type: O cabeçalho Content-Type enviado.
+        :type content_type: Optional[str]
+        :param user_id: O usuário que enviou a imagem.
+        :type user_id: Optional[uuid.UUID]
+        :param description: A descrição da imagem.
+        :type description: Optional[str]
+        :raises NotFoundError: Se o estabelecimento ou o usuário não existirem.
+        :raises UnsupportedMediaTypeError: Se o conteúdo não for JPEG, PNG ou WebP.
+        :raises PayloadTooLargeError: Se o arquivo exceder `IMAGE_UPLOAD_MAX_BYTES`.
+        :return: A imagem registrada e as URLs dos thumbnails.
+        :rtype: ImageUploadResult
+        """
+        if await establishment_crud.get(self.db, establishment_id) is None:
+            raise NotFoundError(resource="Establishment")
+        # Não mantém uma conexão do pool presa enquanto o arquivo é recebido
+        await self.db.close()
+
+        stored = await self._store(chunks, content_type)
+        try:
+            image, _ = await image_crud.add_establishment_image(
+                self.db,
+                establishment_id=establishment_id,
+                url=self.store.url_for(stored.key),
+                content_hash=stored.content_hash,
+                user_id=user_id,
+                description=description,
+            )
+        except IntegrityError as exc:
+            await self.db.rollback()
+            if is_foreign_key_violation(exc):
+                raise NotFoundError(resource="Establishment or user") from exc
+            raise
+        return self._to_result(image, stored)
+
+    async def upload_review_image(
+        self,
+        review_id: uuid.UUID,
+        chunks: AsyncIterable[bytes],
+        content_type: Optional[str],
+        user_id: Optional[uuid.UUID] = None,
+        description: Optional[str] = None,
+    ) -> ImageUploadResult:
+        """
+        Armazena uma imagem enviada em blocos e a associa a uma avaliação.
+
+        :param review_id: O ID da avaliação.
+        :type review_id: uuid.UUID
+        :param chunks: O corpo da requisição, bloco a bloco.
+        :type chunks: AsyncIterable[bytes]
+        :param content_type: O cabeçalho Content-Type enviado.
+        :type content_type: Optional[str]
+        :param user_id: O usuário que enviou a imagem.
+        :type user_id: Optional[uuid.UUID]
+        :param description: A descrição da imagem.
+        :type description: Optional[str]
+        :raises NotFoundError: Se a avaliação ou o usuário não existirem.
+        :raises UnsupportedMediaTypeError: Se o conteúdo não for JPEG, PNG ou WebP.
+        :raises PayloadTooLargeError: Se o arquivo exceder `IMAGE_UPLOAD_MAX_BYTES`.
+        :return: A imagem registrada e as URLs dos thumbnails.
+        :rtype: ImageUploadResult
+        """
+        if await review_crud.get(self.db, review_id) is None:
+            raise NotFoundError(resource="Review")
+        # Não mantém uma conexão do pool presa enquanto o arquivo é recebido
+        await self.db.close()
+
+        stored = await self._store(chunks, content_type)
+        try:
+            image, _ = await image_crud.add_review_image(
+                self.db,
+                review_id=review_id,
+                url=self.store.url_for(stored.key),
+                content_hash=stored.content_hash,
+                user_id=user_id,
+                description=description,
+            )
+        except IntegrityError as exc:
+            await self.db.rollback()
+            if is_foreign_key_violation(exc):
+                raise NotFoundError(resource="Review or user") from exc
+            raise
+        return self._to_result(image, stored)
+
+    async def _store(self, chunks: AsyncIterable[bytes], content_type: Optional[str]) -> StoredImage:
+        # Transmite o corpo para uma chave temporária calculando o SHA-256; depois
+        # move para a chave definitiva (derivada do hash) ou descarta a cópia repetida.
+        declared_type = (content_type or '').split(';')[0].strip().lower()
+        if declared_type not in IMAGE_EXTENSIONS:
+            raise UnsupportedMediaTypeError(
+                detail=f"Content-Type must be one of: {', '.join(IMAGE_EXTENSIONS)}."
+            )
+
+        digest = hashlib.sha256()
+        max_bytes = settings.IMAGE_UPLOAD_MAX_BYTES
+        received = 0
+        head = b''
+
+        async def checked_chunks() -> AsyncIterator[bytes]:
+            nonlocal received, head
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                received += len(chunk)
+                if received > max_bytes:
+                    raise PayloadTooLargeError(max_bytes=max_bytes)
+                if len(head) < _SNIFF_BYTES:
+                    head += chunk[:_SNIFF_BYTES - len(head)]
+                    if len(head) == _SNIFF_BYTES:
+                        self._check_signature(head, declared_type)
+                digest.update(chunk)
+                yield chunk
+            if len(head) < _SNIFF_BYTES:
+                if not head:
+                    raise BadRequestError(detail="The request body is empty.")
+                self._check_signature(head, declared_type)
+
+        staging_key = f'staging/{uuid.uuid4().hex}'
+        size_bytes = await self.store.write(staging_key, checked_chunks())
+
+        content_hash = digest.hexdigest()
+        key = f'images/{content_hash[:2]}/{content_hash}.{IMAGE_EXTENSIONS[declared_type]}'
+        deduplicated = await self.store.exists(key)
+        if deduplicated:
+            await self.store.delete(staging_key)
+        else:
+            await self.store.move(staging_key, key)
+
+        self.pipeline.submit(key, content_hash)
+        return StoredImage(
+            key=key, content_hash=content_hash, size_bytes=size_bytes, deduplicated=deduplicated
+        )
+
+    @staticmethod
+    def _check_signature(head: bytes, declared_type: str) -> None:
+        if sniff_image_type(head) != declared_type:
+            raise UnsupportedMediaTypeError(
+                detail=f"The file content does not match Content-Type {declared_type}."
+            )
+
+    def _to_result(self, image: Any, stored: StoredImage) -> ImageUploadResult:
+        return ImageUploadResult(
+            id=image.id,
+            url=image.s3_url,
+            content_hash=stored.content_hash,
+            description=image.description,
+            is_approved=image.is_approved,
+            uploaded_at=image.uploaded_at,
+            deduplicated=stored.deduplicated,
+            thumbnails=self.pipeline.thumbnail_urls(self.store, stored.content_hash),
+        )
@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.exception import NotFoundError, ServiceUnavailableError
+from inclui_aqui_server.core.leaderboard import Leaderboard, RankedUser
+from inclui_aqui_server.crud import user_crud
+from inclui_aqui_server.db.database import AsyncSessionLocal
+from inclui_aqui_server.db.schemas import LeaderboardEntry
+
+logger = logging.getLogger(__name__)
+
+
+class PointsLeaderboard:
+    """
+    Mantém o ranking de pontos (`Leaderboard`) do processo em dia com o banco.
+
+    Na inicialização, os pontos de todos os usuários são carregados em páginas e
+    o ranking só passa a responder depois da carga completa. As escritas deste
+    processo são aplicadas na hora (`record`/`forget`); as de outros processos
+    são lidas a cada `poll_seconds` pelo índice (updated_at, id). Uma recarga
+    completa a cada `resync_seconds` remove os usuários excluídos em outros
+    processos.
+
+    A marca d'água de uma carga é o horário do banco no seu início (menos
+    `settle_seconds`): alterações gravadas durante a carga são relidas depois,
+    e reaplicar os pontos de um usuário não tem efeito.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        poll_seconds: float = settings.LEADERBOARD_POLL_SECONDS,
+        settle_seconds: float = settings.LEADERBOARD_SETTLE_SECONDS,
+        resync_seconds: float = settings.LEADERBOARD_RESYNC_SECONDS,
+        batch_size: int = settings.LEADERBOARD_LOAD_BATCH_SIZE,
+    ):
+        """
+        :param session_factory: Fábrica das sessões do banco primário.
+        :param poll_seconds: Intervalo entre leituras das alterações.
+        :param settle_seconds: Alterações mais recentes que isso ficam para a próxima leitura.
+        :param resync_seconds: Intervalo entre recargas completas.
+        :param batch_size: Usuários lidos por consulta.
+        """
+        self.session_factory = session_factory
+        self.poll_seconds = poll_seconds
+        self.settle_seconds = settle_seconds
+        self.resync_seconds = resync_seconds
+        self.batch_size = batch_size
+        self.board: Optional[Leaderboard] = None
+        self.watermark: Optional[Tuple[datetime, uuid.UUID]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loaded_at = float('-inf')
+        self.loads = 0
+        self.last_load_seconds = 0.0
+        self.changes = 0
+        self.errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def ready(self) -> bool:
+        return self.board is not None
+
+    def start(self) -> None:
+        """
+        Inicia a carga e a leitura das alterações no event loop atual (idempotente).
+        """
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name='points-leaderboard')
+
+    async def stop(self) -> None:
+        """
+        Interrompe a tarefa em segundo plano.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def record(self, user_id: uuid.UUID, points: int) -> None:
+        """
+        Aplica os pontos gravados por este processo (sem esperar a próxima leitura).
+        """
+        if self.board is not None:
+            self.board.set(user_id, points)
+
+    def forget(self, user_id: uuid.UUID) -> None:
+        """
+        Remove do ranking um usuário excluído por este processo.
+        """
+        if self.board is not None:
+            self.board.remove(user_id)
+
+    async def load(self) -> int:
+        """
+        Recarrega o ranking inteiro do banco e o substitui de uma vez.
+
+        :return: A quantidade de usuários carregados.
+        """
+        started_at = time.perf_counter()
+        points_by_user: Dict[uuid.UUID, int] = {}
+        async with self.session_factory() as db:
+            now = await user_crud.get_database_time(db)
+        after_id = None
+        while True:
+            async with self.session_factory() as db:
+                rows = await user_crud.get_points_page(db, after_id=after_id, limit=self.batch_size)
+            points_by_user.update((row.id, row.points) for row in rows)
+            if len(rows) < self.batch_size:
+                break
+            after_id = rows[-1].id
+            # Cede o loop entre as páginas
+            await asyncio.sleep(0)
+
+        # Construído em uma thread: com muitos usuários, a ordenação levaria segundos
+        self.board = await asyncio.to_thread(Leaderboard, points_by_user)
+        self.watermark = (now - timedelta(seconds=self.settle_seconds), uuid.UUID(int=0))
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+        self.last_load_seconds = time.perf_counter() - started_at
+        return len(points_by_user)
+
+    async def poll_once(self) -> int:
+        """
+        Aplica as alterações de pontos gravadas desde a última leitura.
+
+        :return: A quantidade de usuários alterados lidos.
+        """
+        if self.board is None or self.watermark is None:
+            return 0
+        total = 0
+        while True:
+            async with self.session_factory() as db:
+                rows = await user_crud.get_points_changed_after(
+                    db,
+                    after=self.watermark,
+                    settle_seconds=self.settle_seconds,
+                    limit=self.batch_size,
+                )
+            for row in rows:
+                self.board.set(row.id, row.points)
+            if rows:
+                self.watermark = (rows[-1].updated_at, rows[-1].id)
+            total += len(rows)
+            self.changes += len(rows)
+            if len(rows) < self.batch_size:
+                return total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o tamanho do ranking e os contadores de sincronização.
+        """
+        return {
+            'running': self.running,
+            'ready': self.ready,
+            'users': len(self.board) if self.board is not None else 0,
+            'loads': self.loads,
+            'last_load_ms': self.last_load_seconds * 1000,
+            'changes': self.changes,
+            'errors': self.errors,
+            'watermark': self.watermark[0].isoformat() if self.watermark is not None else None,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() - self._loaded_at >= self.resync_seconds:
+                    await self.load()
+                else:
+                    await self.poll_once()
+            except Exception:
+                self.errors += 1
+                logger.exception('Leaderboard synchronization failed; retrying later.')
+            await asyncio.sleep(self.poll_seconds)
+
+
+# Cria uma instância única do ranking, carregada no ciclo de vida da aplicação.
+points_leaderboard = PointsLeaderboard()
+
+
+class LeaderboardService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        read_db: Optional[AsyncSession] = None,
+        leaderboard: PointsLeaderboard = points_leaderboard,
+    ):
+        """
+        O serviço é inicializado com uma sessão de banco de dados assíncrona.
+
+        :param db: A sessão do banco de dados (primário).
+        :type db: AsyncSession
+        :param read_db: A sessão usada nas leituras (ex.: réplica); por padrão, a mesma de `db`.
+        :type read_db: Optional[AsyncSession]
+        :param leaderboard: O ranking de pontos em memória.
+        :type leaderboard: PointsLeaderboard
+        """
+        self.db = db
+        self.read_db = read_db if read_db is not None else db
+        self.leaderboard = leaderboard
+
+    async def get_top(self, limit: int = 100) -> List[LeaderboardEntry]:
+        """
+        Retorna os usuários com mais pontos.
+
+        :param limit: O número máximo de usuários.
+        :type limit: int
+        :raises ServiceUnavailableError: Se o ranking ainda está sendo carregado.
+        :return: Os usuários, do primeiro colocado em diante.
+        :rtype: List[LeaderboardEntry]
+        """
+        board = self._board()
+        return await self._hydrate(lambda: board.top(limit))
+
+    async def get_user_rank(self, user_id: uuid.UUID) -> LeaderboardEntry:
+        """
+        Retorna a posição de um usuário no ranking.
+
+        :param user_id: O ID do usuário.
+        :type user_id: uuid.UUID
+        :raises ServiceUnavailableError: Se o ranking ainda está sendo carregado.
+        :raises NotFoundError: Se o usuário não estiver no ranking.
+        :return: A posição e os pontos do usuário.
+        :rtype: LeaderboardEntry
+        """
+        board = self._board()
+        entries = await self._hydrate(
+            lambda: [ranked] if (ranked := board.get(user_id)) is not None else []
+        )
+        if not entries:
+            raise NotFoundError(resource="User")
+        return entries[0]
+
+    async def get_around(self, user_id: uuid.UUID, radius: int = 5) -> List[LeaderboardEntry]:
+        """
+        Retorna o usuário e os vizinhos imediatamente acima e abaixo dele no ranking.
+
+        :param user_id: O ID do usuário.
+        :type user_id: uuid.UUID
+        :param radius: Quantidade de vizinhos de cada lado.
+        :type radius: int
+        :raises ServiceUnavailableError: Se o ranking ainda está sendo carregado.
+        :raises NotFoundError: Se o usuário não estiver no ranking.
+        :return: Os usuários, em ordem de ranking.
+        :rtype: List[LeaderboardEntry]
+        """
+        board = self._board()
+        entries = await self._hydrate(lambda: board.around(user_id, radius))
+        if not any(entry.user_id == user_id for entry in entries):
+            raise NotFoundError(resource="User")
+        return entries
+
+    def _board(self) -> Leaderboard:
+        board = self.leaderboard.board
+        if board is None:
+            raise ServiceUnavailableError(detail="The leaderboard is still loading.")
+        return board
+
+    async def _hydrate(self, ranking: Callable[[], List[RankedUser]]) -> List[LeaderboardEntry]:
+        # Usuários excluídos por outro processo (desde a última recarga) saem do
+        # ranking e as posições são recalculadas sem eles
+        while True:
+            ranked = ranking()
+            usernames = await user_crud.get_usernames(
+                self.read_db, [user_id for _, user_id, _ in ranked]
+            )
+            missing = [user_id for _, user_id, _ in ranked if user_id not in usernames]
+            if not missing:
+                break
+            for user_id in missing:
+                self.leaderboard.forget(user_id)
+        # Devolve a conexão ao pool assim que a leitura termina
+        await self.read_db.close()
+        return [
+            LeaderboardEntry(
+                rank=rank, user_id=user_id, username=usernames[user_id], points=points
+            )
+            for rank, user_id, points in ranked
+        ]
@@ -0,0 +1,100 @@
+import uuid
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Importa as camadas que o serviço irá orquestrar
+from inclui_aqui_server.core.exception import NotFoundError
+from inclui_aqui_server.crud import review_crud
+from inclui_aqui_server.crud.errors import is_foreign_key_violation
+from inclui_aqui_server.db.schemas import (
+    EstablishmentRatingSummary,
+    ReviewCreate,
+    ReviewRead,
+    ReviewUpdate,
+)
+
+
+class ReviewService:
+    def __init__(self, db: AsyncSession, read_db: Optional[AsyncSession] = None):
+        """
+        O serviço é inicializado com uma sessão de banco de dados assíncrona.
+
+        :param db: A sessão do banco de dados (primário) usada nas escritas.
+        :type db: AsyncSession
+        :param read_db: A sessão usada nas leituras (ex.: réplica); por padrão, a mesma de `db`.
+        :type read_db: Optional[AsyncSession]
+        """
+        self.db = db
+        self.read_db = read_db if read_db is not None else db
+
+    async def create_review(self, review_in: ReviewCreate) -> ReviewRead:
+        """
+        Cria uma avaliação, atualizando os agregados do estabelecimento na mesma transação.
+
+        :param review_in: Os dados da nova avaliação.
+        :type review_in: ReviewCreate
+        :raises NotFoundError: Se o estabelecimento ou o usuário não existirem.
+        :return: A avaliação criada.
+        :rtype: ReviewRead
+        """
+        try:
+            review = await review_crud.create(self.db, review_in=review_in)
+        except IntegrityError as exc:
+            await self.db.rollback()
+            if is_foreign_key_violation(exc):
+                raise NotFoundError(resource="Establishment or user") from exc
+            raise
+        return ReviewRead.model_validate(review)
+
+    async def update_review(self, review_id: uuid.UUID, review_in: ReviewUpdate) -> ReviewRead:
+        """
+        Atualiza uma avaliação, corrigindo os agregados do estabelecimento.
+
+        :param review_id: O ID da avaliação.
+        :type review_id: uuid.UUID
+        :param review_in: Os campos a serem atualizados.
+        :type review_in: ReviewUpdate
+        :raises NotFoundError: Se a avaliação não for encontrada.
+        :return: A avaliação atualizada.
+        :rtype: ReviewRead
+        """
+        review = await review_crud.update(self.db, review_id=review_id, review_in=review_in)
+        if review is None:
+            raise NotFoundError(resource="Review")
+        return ReviewRead.model_validate(review)
+
+    async def delete_review(self, review_id: uuid.UUID) -> ReviewRead:
+        """
+        Remove uma avaliação, subtraindo-a dos agregados do estabelecimento.
+
+        :param review_id: O ID da avaliação.
+        :type review_id: uuid.UUID
+        :raises NotFoundError: Se a avaliação não for encontrada.
+        :return: A avaliação removida.
+        :rtype: ReviewRead
+        """
+        review = await review_crud.remove(self.db, review_id=review_id)
+        if review is None:
+            raise NotFoundError(resource="Review")
+        return ReviewRead.model_validate(review)
+
+    async def get_rating_summary(self, establishment_id: uuid.UUID) -> EstablishmentRatingSummary:
+        """
+        Retorna o resumo das avaliações de um estabelecimento, lido dos agregados.
+
+        :param establishment_id: O ID do estabelecimento.
+        :type establishment_id: uuid.UUID
+        :return: Quantidade, média, histograma e média por critério.
+        :rtype: EstablishmentRatingSummary
+        """
+        rating, criteria = await review_crud.get_aggregates(self.read_db, establishment_id)
+        await self.read_db.close()
+        return EstablishmentRatingSummary(
+            establishment_id=establishment_id,
+            review_count=rating.review_count if rating is not None else 0,
+            average_rating=rating.average_rating if rating is not None else None,
+            histogram=rating.histogram if rating is not None else dict.fromkeys(range(1, 6), 0),
+            criteria={item.criterion: item.average_score for item in criteria},
+        )
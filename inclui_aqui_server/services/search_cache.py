@@ -0,0 +1,191 @@
+import json
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from inclui_aqui_server.core.config import settings
+
+# Resultado em cache: (id do estabelecimento, relevância), na ordem da busca
+CachedResults = List[Tuple[uuid.UUID, float]]
+
+
+def search_cache_key(query: str, filters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Chave canônica de uma busca: o texto normalizado e os filtros com valor,
+    em ordem de nome (a mesma busca gera a mesma chave, qualquer que seja a
+    ordem ou a presença de filtros vazios).
+
+    :param query: O texto buscado, já normalizado.
+    :param filters: Os filtros da busca (ex.: tipo e limite).
+    :return: A chave do cache.
+    """
+    values = {name: value for name, value in (filters or {}).items() if value is not None}
+    return json.dumps([query, values], sort_keys=True, separators=(',', ':'), default=str)
+
+
+class SearchResultCache:
+    """
+    Cache LRU, com TTL, dos resultados da busca textual de estabelecimentos.
+
+    Cada entrada guarda só os IDs (e a relevância) dos estabelecimentos
+    encontrados; os registros são relidos a cada acerto, então nome, endereço
+    e notas estão sempre atualizados. Um índice reverso (estabelecimento ->
+    chaves) descarta as entradas que contêm um estabelecimento alterado.
+
+    Buscas em andamento durante uma invalidação não gravam o resultado (ver
+    `begin`), que pode ter sido lido antes da alteração. Logo após uma
+    invalidação, as buscas devem ir ao primário (ver `reads_from_primary`): uma
+    réplica atrasada ainda não teria a alteração, e o resultado ficaria em
+    cache por todo o TTL.
+
+    O cache e as invalidações valem só para o processo atual: uma alteração
+    feita por outro worker não descarta as entradas deste. Como os registros
+    são relidos (e os não aprovados, filtrados) a cada acerto, o que pode ficar
+    desatualizado é só a lista de resultados (ex.: um estabelecimento renomeado
+    ou recém-aprovado), e por no máximo `ttl_seconds`; por isso o TTL é curto.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 30.0,
+        primary_read_seconds: float = 0.0,
+    ):
+        """
+        :param max_entries: Número máximo de buscas mantidas em memória.
+        :param ttl_seconds: Tempo de vida de cada entrada.
+        :param primary_read_seconds: Por quanto tempo após uma invalidação as buscas vão ao primário.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.primary_read_seconds = primary_read_seconds
+        self._primary_until = 0.0
+        self._entries: OrderedDict[str, Tuple[float, CachedResults]] = OrderedDict()
+        self._keys_by_establishment: Dict[uuid.UUID, Set[str]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def get(self, key: str) -> Optional[CachedResults]:
+        """
+        Retorna os resultados em cache, se existirem e não tiverem expirado.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def begin(self) -> int:
+        """
+        Marca o início de uma busca no banco.
+
+        :return: A geração atual, a ser passada para `put`.
+        """
+        return self._generation
+
+    def reads_from_primary(self) -> bool:
+        """
+        Indica se as buscas devem ler do primário, por terem sido invalidadas há pouco.
+        """
+        return time.monotonic() < self._primary_until
+
+    def put(self, key: str, results: CachedResults, generation: int) -> bool:
+        """
+        Armazena os resultados de uma busca.
+
+        :param key: A chave da busca (`search_cache_key`).
+        :param results: Os pares (id, relevância), na ordem da busca.
+        :param generation: O valor de `begin` obtido antes da busca.
+        :return: False se houve invalidação durante a busca e o resultado foi descartado.
+        """
+        if generation != self._generation:
+            return False
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, results)
+        for establishment_id, _ in results:
+            self._keys_by_establishment.setdefault(establishment_id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+        return True
+
+    def invalidate(self, establishment_ids: Optional[Iterable[uuid.UUID]] = None) -> None:
+        """
+        Descarta as buscas que contêm algum dos estabelecimentos (ou todas, se None).
+
+        Use None quando um estabelecimento pode passar a aparecer em buscas que
+        ainda não o continham (ex.: aprovação ou mudança de nome).
+        """
+        self._generation += 1
+        self.invalidations += 1
+        self._primary_until = time.monotonic() + self.primary_read_seconds
+        if establishment_ids is None:
+            self._entries.clear()
+            self._keys_by_establishment.clear()
+            return
+        for establishment_id in establishment_ids:
+            for key in self._keys_by_establishment.pop(establishment_id, ()):
+                self._remove(key)
+
+    def record(self, hit: bool, seconds: float) -> None:
+        """
+        Contabiliza uma busca servida pelo cache (`hit`) ou pelo banco.
+
+        :param hit: True se os resultados vieram do cache.
+        :param seconds: O tempo gasto (releitura dos IDs ou busca completa).
+        """
+        if hit:
+            self.hits += 1
+            self.hit_seconds += seconds
+        else:
+            self.misses += 1
+            self.miss_seconds += seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna a taxa de acerto e a latência economizada.
+
+        A economia estimada é, por acerto, a diferença entre a latência média
+        de uma busca completa e a de uma releitura por IDs.
+        """
+        lookups = self.hits + self.misses
+        avg_hit_ms = self.hit_seconds / self.hits * 1000 if self.hits else 0.0
+        avg_miss_ms = self.miss_seconds / self.misses * 1000 if self.misses else 0.0
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'invalidations': self.invalidations,
+            'avg_hit_ms': avg_hit_ms,
+            'avg_miss_ms': avg_miss_ms,
+            'saved_ms': max(avg_miss_ms - avg_hit_ms, 0.0) * self.hits if self.misses else 0.0,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for establishment_id, _ in entry[1]:
+            keys = self._keys_by_establishment.get(establishment_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_establishment[establishment_id]
+
+
+# Cache compartilhado por todas as requisições deste processo (não entre processos)
+# Após uma invalidação, lê do primário pela mesma janela do read-your-writes
+search_result_cache = SearchResultCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+    primary_read_seconds=settings.READ_YOUR_WRITES_SECONDS,
+)
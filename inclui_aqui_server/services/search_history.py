@@ -0,0 +1,76 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.crud import search_history_crud
+from inclui_aqui_server.crud.search_history import add_months, month_start
+from inclui_aqui_server.db.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PartitionMaintenanceReport:
+    created: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    # Data a partir da qual as buscas são mantidas (None quando a retenção não foi aplicada)
+    retained_since: Optional[date] = None
+
+
+async def maintain_search_history_partitions(
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+    *,
+    today: Optional[date] = None,
+    premake_months: int = settings.SEARCH_HISTORY_PREMAKE_MONTHS,
+    retention_months: Optional[int] = settings.SEARCH_HISTORY_RETENTION_MONTHS,
+    dry_run: bool = False,
+) -> PartitionMaintenanceReport:
+    """
+    Cria as partições do mês atual e dos próximos meses e remove as expiradas.
+
+    São mantidos o mês atual e os `retention_months` meses completos anteriores;
+    partições mais antigas são removidas inteiras (DROP TABLE), sem DELETE.
+
+    :param session_factory: Fábrica das sessões do banco primário.
+    :param today: A data de referência; por padrão, a data atual.
+    :param premake_months: Meses futuros com partição já criada.
+    :param retention_months: Meses completos mantidos; None não remove nada.
+    :param dry_run: Se True, só informa o que seria feito (desfaz a transação).
+    :return: As partições criadas e removidas.
+    """
+    current_month = month_start(today or date.today())
+    report = PartitionMaintenanceReport()
+    async with session_factory() as db:
+        report.created = await search_history_crud.ensure_partitions(
+            db, first_month=current_month, months=premake_months + 1
+        )
+        if retention_months is not None:
+            report.retained_since = add_months(current_month, -retention_months)
+            report.dropped = await search_history_crud.drop_partitions_before(
+                db, report.retained_since
+            )
+        if dry_run:
+            await db.rollback()
+        else:
+            await db.commit()
+    return report
+
+
+async def ensure_search_history_partitions() -> None:
+    """
+    Garante, na inicialização da aplicação, as partições do mês atual e dos próximos.
+
+    Falhas (ex.: usuário sem permissão de DDL) são registradas no log sem impedir
+    a inicialização; nesse caso, o comando `maintain-search-history` deve ser agendado.
+    """
+    try:
+        report = await maintain_search_history_partitions(retention_months=None)
+    except Exception:
+        logger.exception('Could not ensure user_search_history partitions.')
+        return
+    if report.created:
+        logger.info('Created user_search_history partitions: %s', ', '.join(report.created))
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.sentiment import LexiconSentimentModel, SentimentModel
+from inclui_aqui_server.crud import review_crud
+from inclui_aqui_server.db.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class SentimentWorker:
+    """
+    Preenche `Review.sentiment_score` em segundo plano, fora do caminho de escrita.
+
+    Cada tarefa reserva um lote de avaliações sem nota (`FOR UPDATE SKIP LOCKED`),
+    pontua os comentários em uma thread, grava as notas com um único UPDATE e
+    faz commit. Várias tarefas (ou vários processos) podem rodar ao mesmo tempo
+    sem pontuar a mesma avaliação duas vezes.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        model: Optional[SentimentModel] = None,
+        batch_size: int = settings.SENTIMENT_BATCH_SIZE,
+        concurrency: int = settings.SENTIMENT_CONCURRENCY,
+        idle_seconds: float = settings.SENTIMENT_IDLE_SECONDS,
+        backlog_refresh_seconds: float = settings.SENTIMENT_BACKLOG_REFRESH_SECONDS,
+    ):
+        """
+        :param session_factory: Fábrica das sessões do banco primário.
+        :param model: O modelo de sentimento; por padrão, o `LexiconSentimentModel`.
+        :param batch_size: Quantidade de avaliações por lote.
+        :param concurrency: Quantidade de tarefas processando lotes em paralelo.
+        :param idle_seconds: Espera quando a fila está vazia (ou após um erro).
+        :param backlog_refresh_seconds: Intervalo mínimo entre contagens da fila.
+        """
+        self.session_factory = session_factory
+        self.model = model if model is not None else LexiconSentimentModel()
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.idle_seconds = idle_seconds
+        self.backlog_refresh_seconds = backlog_refresh_seconds
+        self._tasks: List[asyncio.Task] = []
+        self._backlog_checked_at = float('-inf')
+        self.backlog: Optional[int] = None
+        self.scored = 0
+        self.batches = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.last_batch_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """
+        Inicia as tarefas do worker no event loop atual (idempotente).
+        """
+        if self.running:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f'sentiment-worker-{index}')
+            for index in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Interrompe as tarefas; um lote em andamento é desfeito e volta para a fila.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self) -> int:
+        """
+        Processa um único lote.
+
+        :return: A quantidade de avaliações pontuadas (0 quando a fila está vazia).
+        """
+        started_at = time.perf_counter()
+        async with self.session_factory() as db:
+            rows = await review_crud.claim_unscored(db, limit=self.batch_size)
+            if not rows:
+                await db.rollback()
+                return 0
+            scores = await asyncio.to_thread(
+                self.model.score_batch, [row.comment for row in rows]
+            )
+            await review_crud.update_sentiment_scores(
+                db, [(row.id, score) for row, score in zip(rows, scores)]
+            )
+            await db.commit()
+
+        self.last_batch_seconds = time.perf_counter() - started_at
+        self.busy_seconds += self.last_batch_seconds
+        self.batches += 1
+        self.scored += len(rows)
+        return len(rows)
+
+    async def refresh_backlog(self, db: AsyncSession) -> None:
+        """
+        Atualiza a contagem de avaliações que aguardam nota.
+        """
+        self._backlog_checked_at = time.monotonic()
+        self.backlog = await review_crud.count_unscored(db)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o tamanho da fila e a vazão do worker.
+        """
+        return {
+            'running': self.running,
+            'model': self.model.version,
+            'backlog': self.backlog,
+            'scored': self.scored,
+            'batches': self.batches,
+            'errors': self.errors,
+            'rows_per_second': self.scored / self.busy_seconds if self.busy_seconds else 0.0,
+            'last_batch_ms': self.last_batch_seconds * 1000,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() - self._backlog_checked_at >= self.backlog_refresh_seconds:
+                    async with self.session_factory() as db:
+                        await self.refresh_backlog(db)
+                processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.errors += 1
+                logger.exception('Sentiment worker batch failed; retrying later.')
+                processed = 0
+            if processed < self.batch_size:
+                # Fila vazia (ou quase): aguarda novas avaliações
+                await asyncio.sleep(self.idle_seconds)
+
+
+# Cria uma instância única do worker, iniciada no ciclo de vida da aplicação.
+sentiment_worker = SentimentWorker()
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.suggestion import (
+    SuggestionInput,
+    SuggestionModel,
+    TemplateSuggestionModel,
+)
+from inclui_aqui_server.crud import review_crud, suggestion_crud
+from inclui_aqui_server.crud.review import criteria_scores
+from inclui_aqui_server.db.database import AsyncSessionLocal
+from inclui_aqui_server.db.schemas import SuggestionRunReport
+
+logger = logging.getLogger(__name__)
+
+# Estabelecimentos buscados por página na descoberta
+_DISCOVERY_PAGE_SIZE = 1000
+
+
+class SuggestionEngine:
+    """
+    Gera sugestões a partir das avaliações novas de cada estabelecimento.
+
+    Cada estabelecimento continua de onde parou: a avaliação mais recente entre
+    as fontes (`source_review_ids`) da sua última sugestão é a marca d'água, e
+    só as avaliações posteriores a ela são lidas. Os estabelecimentos são
+    processados por um número fixo de tarefas (`concurrency`), cada uma com a
+    sua sessão, alimentadas por uma fila limitada.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        model: Optional[SuggestionModel] = None,
+        concurrency: int = settings.SUGGESTION_CONCURRENCY,
+        batch_size: int = settings.SUGGESTION_BATCH_SIZE,
+        min_new_reviews: int = settings.SUGGESTION_MIN_NEW_REVIEWS,
+        settle_seconds: float = settings.SUGGESTION_SETTLE_SECONDS,
+    ):
+        """
+        :param session_factory: Fábrica das sessões do banco primário.
+        :param model: O modelo de sugestões; por padrão, o `TemplateSuggestionModel`.
+        :param concurrency: Quantidade de estabelecimentos processados em paralelo.
+        :param batch_size: Máximo de avaliações por sugestão.
+        :param min_new_reviews: Avaliações novas necessárias para gerar uma sugestão.
+        :param settle_seconds: Avaliações mais recentes que isso ficam para a próxima execução.
+        """
+        self.session_factory = session_factory
+        self.model = model if model is not None else TemplateSuggestionModel()
+        self.concurrency = max(concurrency, 1)
+        self.batch_size = batch_size
+        self.min_new_reviews = max(min_new_reviews, 1)
+        self.settle_seconds = settle_seconds
+
+    async def run(self) -> SuggestionRunReport:
+        """
+        Processa todos os estabelecimentos com avaliações novas.
+
+        Falhas em um estabelecimento são registradas no log e contadas no
+        relatório, sem interromper os demais.
+
+        :return: O relatório da execução, com a vazão em avaliações por segundo.
+        """
+        started_at = time.perf_counter()
+        report = SuggestionRunReport(ai_model_version=self.model.version)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        workers = [
+            asyncio.create_task(self._worker(queue, report))
+            for _ in range(self.concurrency)
+        ]
+        try:
+            await self._discover(queue, report)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        report.elapsed_seconds = time.perf_counter() - started_at
+        if report.elapsed_seconds > 0:
+            report.reviews_per_second = report.reviews / report.elapsed_seconds
+        return report
+
+    async def _discover(self, queue: asyncio.Queue, report: SuggestionRunReport) -> None:
+        after_id = None
+        while True:
+            async with self.session_factory() as db:
+                page = await suggestion_crud.get_pending_establishments(
+                    db,
+                    min_new_reviews=self.min_new_reviews,
+                    settle_seconds=self.settle_seconds,
+                    after_id=after_id,
+                    limit=_DISCOVERY_PAGE_SIZE,
+                )
+            for establishment_id in page:
+                report.establishments += 1
+                # Bloqueia quando a fila está cheia: a descoberta acompanha os workers
+                await queue.put(establishment_id)
+            if len(page) < _DISCOVERY_PAGE_SIZE:
+                return
+            after_id = page[-1]
+
+    async def _worker(self, queue: asyncio.Queue, report: SuggestionRunReport) -> None:
+        while (establishment_id := await queue.get()) is not None:
+            try:
+                await self.process_establishment(establishment_id, report)
+            except Exception:
+                report.failed += 1
+                logger.exception('Suggestion generation failed for establishment %s.', establishment_id)
+
+    async def process_establishment(
+        self, establishment_id: uuid.UUID, report: SuggestionRunReport
+    ) -> None:
+        """
+        Gera as sugestões pendentes de um estabelecimento, um lote por transação.
+
+        :param establishment_id: O UUID do estabelecimento.
+        :param report: O relatório atualizado com as contagens.
+        """
+        while True:
+            async with self.session_factory() as db:
+                if not await suggestion_crud.try_lock_establishment(db, establishment_id):
+                    report.skipped += 1
+                    return
+                # Relida sob o lock: outra execução pode ter avançado a marca
+                watermark = await suggestion_crud.get_watermark(db, establishment_id)
+                rows = await review_crud.get_after(
+                    db,
+                    establishment_id,
+                    after=watermark,
+                    settle_seconds=self.settle_seconds,
+                    limit=self.batch_size,
+                )
+                if len(rows) < self.min_new_reviews:
+                    await db.rollback()
+                    return
+
+                content = await self.model.generate(establishment_id, [
+                    SuggestionInput(
+                        review_id=row.id,
+                        rating=row.rating,
+                        comment=row.comment,
+                        criteria=criteria_scores(row.criteria_json),
+                        sentiment_score=(
+                            float(row.sentiment_score) if row.sentiment_score is not None else None
+                        ),
+                    )
+                    for row in rows
+                ])
+                await suggestion_crud.create(
+                    db,
+                    establishment_id=establishment_id,
+                    content=content,
+                    ai_model_version=self.model.version,
+                    source_review_ids=[row.id for row in rows],
+                )
+                await db.commit()
+
+            report.suggestions += 1
+            report.reviews += len(rows)
+            if len(rows) < self.batch_size:
+                return
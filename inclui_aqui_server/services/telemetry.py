@@ -0,0 +1,158 @@
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.write_behind import WriteBehindBuffer
+from inclui_aqui_server.db.database import AsyncSessionLocal
+from inclui_aqui_server.db.models import AIFeedbackLog, FeedbackType, UserSearchHistory
+
+# Buffers compartilhados por todo o processo; iniciados e esvaziados no ciclo de vida da aplicação.
+search_history_buffer = WriteBehindBuffer(
+    UserSearchHistory,
+    AsyncSessionLocal,
+    max_batch=settings.TELEMETRY_FLUSH_ROWS,
+    flush_interval=settings.TELEMETRY_FLUSH_SECONDS,
+    max_pending=settings.TELEMETRY_MAX_PENDING,
+)
+feedback_log_buffer = WriteBehindBuffer(
+    AIFeedbackLog,
+    AsyncSessionLocal,
+    max_batch=settings.TELEMETRY_FLUSH_ROWS,
+    flush_interval=settings.TELEMETRY_FLUSH_SECONDS,
+    max_pending=settings.TELEMETRY_MAX_PENDING,
+)
+
+TELEMETRY_BUFFERS = (search_history_buffer, feedback_log_buffer)
+
+
+def record_search(
+    user_id: uuid.UUID,
+    query: str,
+    search_filters: Optional[Dict[str, Any]] = None,
+    result_ids: Optional[Sequence[uuid.UUID]] = None,
+) -> bool:
+    """
+    Registra uma busca no histórico do usuário, sem esperar o banco.
+
+    :param user_id: O usuário que fez a busca.
+    :param query: O texto buscado.
+    :param search_filters: Os filtros aplicados.
+    :param result_ids: Os estabelecimentos retornados, na ordem exibida.
+    :return: False se o evento foi descartado (buffer cheio).
+    """
+    return search_history_buffer.submit({
+        'id': uuid.uuid4(),
+        'user_id': user_id,
+        'query': query[:255],
+        'search_filters': search_filters,
+        'search_results_ids': list(result_ids) if result_ids is not None else None,
+    })
+
+
+def record_feedback(
+    suggestion_id: uuid.UUID,
+    feedback_type: Union[FeedbackType, str],
+    feedback_comment: Optional[str] = None,
+) -> bool:
+    """
+    Registra o feedback sobre uma sugestão, sem esperar o banco.
+
+    Uma sugestão inexistente só é detectada na gravação: a linha é descartada
+    e contada em `rejected`, sem afetar as demais do lote.
+
+    :param suggestion_id: A sugestão avaliada.
+    :param feedback_type: O tipo do feedback (membro ou valor de `FeedbackType`).
+    :param feedback_comment: O comentário opcional.
+    :return: False se o evento foi descartado (buffer cheio).
+    """
+    return feedback_log_buffer.submit({
+        'id': uuid.uuid4(),
+        'suggestion_id': suggestion_id,
+        'feedback_type': FeedbackType(feedback_type),
+        'feedback_comment': feedback_comment,
+    })
+
+
+async def benchmark_search_history(
+    user_id: uuid.UUID,
+    events: int,
+    concurrency: int,
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compara a gravação do histórico de buscas com um INSERT + COMMIT por requisição
+    e com o `WriteBehindBuffer`, simulando `concurrency` requisições simultâneas.
+
+    As linhas criadas são removidas ao final.
+
+    :param user_id: Um usuário existente, dono das buscas simuladas.
+    :param events: Quantidade de buscas em cada modo.
+    :param concurrency: Quantidade de requisições simultâneas.
+    :param session_factory: Fábrica das sessões do banco primário.
+    :return: Por modo: eventos por segundo e latência (p50/p99, em ms) vista pela requisição.
+    """
+    marker = f'__benchmark__{uuid.uuid4().hex}'
+    per_worker = max(events // concurrency, 1)
+
+    async def per_request() -> List[float]:
+        latencies = []
+        for _ in range(per_worker):
+            started_at = time.perf_counter()
+            async with session_factory() as db:
+                db.add(UserSearchHistory(user_id=user_id, query=marker))
+                await db.commit()
+            latencies.append(time.perf_counter() - started_at)
+        return latencies
+
+    buffer = WriteBehindBuffer(
+        UserSearchHistory,
+        session_factory,
+        max_batch=settings.TELEMETRY_FLUSH_ROWS,
+        flush_interval=settings.TELEMETRY_FLUSH_SECONDS,
+        max_pending=settings.TELEMETRY_MAX_PENDING,
+        name='benchmark',
+    )
+
+    async def write_behind() -> List[float]:
+        latencies = []
+        for _ in range(per_worker):
+            started_at = time.perf_counter()
+            # `put` aguarda espaço: o benchmark mede a vazão sem descartar eventos
+            await buffer.put({'id': uuid.uuid4(), 'user_id': user_id, 'query': marker})
+            latencies.append(time.perf_counter() - started_at)
+            # Cede o loop, como faria uma requisição real entre um evento e outro
+            await asyncio.sleep(0)
+        return latencies
+
+    async def measure(worker, drain=None) -> Dict[str, float]:
+        started_at = time.perf_counter()
+        batches = await asyncio.gather(*(worker() for _ in range(concurrency)))
+        if drain is not None:
+            # O esvaziamento final entra na conta: a vazão é a de linhas gravadas
+            await drain()
+        elapsed = time.perf_counter() - started_at
+        latencies = sorted(latency for batch in batches for latency in batch)
+        return {
+            'events': len(latencies),
+            'seconds': elapsed,
+            'events_per_second': len(latencies) / elapsed,
+            'p50_ms': latencies[len(latencies) // 2] * 1000,
+            'p99_ms': latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] * 1000,
+        }
+
+    results = {}
+    try:
+        results['per_request'] = await measure(per_request)
+        buffer.start()
+        results['write_behind'] = await measure(write_behind, drain=buffer.stop)
+    finally:
+        await buffer.stop()
+        async with session_factory() as db:
+            await db.execute(delete(UserSearchHistory).where(UserSearchHistory.query == marker))
+            await db.commit()
+    return results
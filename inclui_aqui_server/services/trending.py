@@ -0,0 +1,298 @@
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.heavy_hitters import CountMinSketch, HeavyHitters
+from inclui_aqui_server.core.text import normalize_query
+from inclui_aqui_server.crud import search_history_crud
+from inclui_aqui_server.db.database import AsyncSessionLocal
+from inclui_aqui_server.db.schemas import TrendingSearch
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_VERSION = 1
+
+# Respostas guardadas entre duas leituras do histórico (limita a memória)
+_MAX_CACHED_RESULTS = 4096
+
+
+class TrendingSearches:
+    """
+    Buscas em alta e autocompletar de buscas, servidos da memória.
+
+    Uma tarefa em segundo plano lê as buscas novas do histórico (de todos os
+    usuários e processos) a partir de uma marca d'água (timestamp, id) e as
+    conta em um `HeavyHitters`. As consultas não acessam o banco: as respostas
+    são calculadas na memória e guardadas até a próxima leitura.
+
+    O estado (contagens e marca d'água) é gravado periodicamente em um snapshot
+    em disco e restaurado na inicialização, continuando de onde parou.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        capacity: int = settings.TRENDING_CAPACITY,
+        sketch_width: int = settings.TRENDING_SKETCH_WIDTH,
+        sketch_depth: int = settings.TRENDING_SKETCH_DEPTH,
+        half_life_seconds: float = settings.TRENDING_HALF_LIFE_SECONDS,
+        poll_seconds: float = settings.TRENDING_POLL_SECONDS,
+        batch_size: int = settings.TRENDING_POLL_BATCH_SIZE,
+        window_seconds: float = settings.TRENDING_WINDOW_SECONDS,
+        settle_seconds: float = settings.TRENDING_SETTLE_SECONDS,
+        snapshot_path: Optional[str] = settings.TRENDING_SNAPSHOT_PATH,
+        snapshot_seconds: float = settings.TRENDING_SNAPSHOT_SECONDS,
+    ):
+        """
+        :param session_factory: Fábrica das sessões do banco primário.
+        :param capacity: Buscas distintas mantidas por nome.
+        :param sketch_width: Contadores por linha do count-min sketch.
+        :param sketch_depth: Linhas do count-min sketch.
+        :param half_life_seconds: Tempo para o peso de uma busca cair à metade.
+        :param poll_seconds: Intervalo entre leituras do histórico.
+        :param batch_size: Buscas lidas por consulta ao banco.
+        :param window_seconds: Buscas mais antigas que isso não são lidas.
+        :param settle_seconds: Buscas mais recentes que isso ficam para a próxima leitura.
+        :param snapshot_path: Arquivo do snapshot; None desativa os snapshots.
+        :param snapshot_seconds: Intervalo entre snapshots.
+        """
+        self.session_factory = session_factory
+        self.capacity = capacity
+        self.sketch_width = sketch_width
+        self.sketch_depth = sketch_depth
+        self.half_life_seconds = half_life_seconds
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self.window_seconds = window_seconds
+        self.settle_seconds = settle_seconds
+        self.snapshot_path = snapshot_path
+        self.snapshot_seconds = snapshot_seconds
+        self.hitters = self._new_hitters()
+        self.watermark: Optional[Tuple[datetime, uuid.UUID]] = None
+        self._results: Dict[Tuple[str, int], List[TrendingSearch]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._snapshot_at = time.monotonic()
+        self.ingested = 0
+        self.skipped = 0
+        self.errors = 0
+        self.snapshots = 0
+        self.restored = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Inicia a tarefa de leitura no event loop atual (idempotente).
+        """
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name='trending-searches')
+
+    async def stop(self) -> None:
+        """
+        Interrompe a tarefa de leitura e grava um último snapshot.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        try:
+            await self.save_snapshot()
+        except Exception:
+            logger.exception('Failed to save the trending searches snapshot.')
+
+    def top(self, limit: int = 10) -> List[TrendingSearch]:
+        """
+        Retorna as buscas em alta.
+
+        :param limit: O número máximo de buscas.
+        :return: As buscas, da maior à menor pontuação.
+        """
+        return self._cached(('', limit), lambda: self.hitters.top(limit))
+
+    def complete(self, prefix: str, limit: int = 10) -> List[TrendingSearch]:
+        """
+        Retorna as buscas em alta que começam com o texto digitado.
+
+        :param prefix: O texto digitado até o momento (normalizado aqui).
+        :param limit: O número máximo de buscas.
+        :return: As buscas, da maior à menor pontuação.
+        """
+        normalized = normalize_query(prefix)
+        if not normalized:
+            return self.top(limit)
+        return self._cached(
+            (normalized, limit), lambda: self.hitters.complete(normalized, limit)
+        )
+
+    def ingest(self, rows: List[Any]) -> None:
+        """
+        Conta buscas lidas do histórico e avança a marca d'água.
+
+        :param rows: Linhas com timestamp, id e query, em ordem de (timestamp, id).
+        """
+        if not rows:
+            return
+        for row in rows:
+            query = normalize_query(row.query)
+            if len(query) < settings.SEARCH_MIN_QUERY_LENGTH:
+                self.skipped += 1
+                continue
+            self.hitters.add(query, row.timestamp.timestamp())
+            self.ingested += 1
+        self.watermark = (rows[-1].timestamp, rows[-1].id)
+        self._results.clear()
+
+    async def poll_once(self) -> int:
+        """
+        Lê e conta todas as buscas novas do histórico.
+
+        :return: A quantidade de buscas lidas.
+        """
+        total = 0
+        while True:
+            async with self.session_factory() as db:
+                rows = await search_history_crud.get_after(
+                    db,
+                    after=self.watermark,
+                    window_seconds=self.window_seconds,
+                    settle_seconds=self.settle_seconds,
+                    limit=self.batch_size,
+                )
+            self.ingest(rows)
+            total += len(rows)
+            if len(rows) < self.batch_size:
+                return total
+            # Cede o loop entre lotes grandes (ex.: a primeira leitura da janela)
+            await asyncio.sleep(0)
+
+    async def save_snapshot(self) -> bool:
+        """
+        Grava o estado no arquivo de snapshot (substituição atômica).
+
+        :return: False se os snapshots estão desativados.
+        """
+        if not self.snapshot_path:
+            return False
+        # Serializado de uma vez, sem ceder o loop: o estado é consistente com a marca d'água
+        payload = json.dumps({
+            'version': _SNAPSHOT_VERSION,
+            'watermark': (
+                [self.watermark[0].isoformat(), str(self.watermark[1])]
+                if self.watermark is not None else None
+            ),
+            'hitters': self.hitters.to_dict(),
+        })
+        await asyncio.to_thread(_write_atomically, self.snapshot_path, payload)
+        self._snapshot_at = time.monotonic()
+        self.snapshots += 1
+        return True
+
+    async def load_snapshot(self) -> bool:
+        """
+        Restaura o estado do arquivo de snapshot, se existir e for compatível
+        com a configuração atual.
+
+        :return: True se o estado foi restaurado.
+        """
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return False
+        data = json.loads(await asyncio.to_thread(_read_gzip, self.snapshot_path))
+        hitters = data['hitters']
+        if (
+            data.get('version') != _SNAPSHOT_VERSION
+            or hitters['capacity'] != self.capacity
+            or hitters['half_life_seconds'] != self.half_life_seconds
+            or hitters['sketch']['width'] != self.sketch_width
+            or hitters['sketch']['depth'] != self.sketch_depth
+        ):
+            logger.warning('Ignoring trending searches snapshot built with different settings.')
+            return False
+        self.hitters = HeavyHitters.from_dict(hitters)
+        watermark = data['watermark']
+        self.watermark = (
+            (datetime.fromisoformat(watermark[0]), uuid.UUID(watermark[1]))
+            if watermark is not None else None
+        )
+        self._results.clear()
+        self.restored = True
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o tamanho das estruturas e os contadores de leitura.
+        """
+        return {
+            'running': self.running,
+            'restored': self.restored,
+            'tracked_queries': len(self.hitters),
+            'events': self.hitters.events,
+            'ingested': self.ingested,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'snapshots': self.snapshots,
+            'watermark': self.watermark[0].isoformat() if self.watermark is not None else None,
+        }
+
+    def _new_hitters(self) -> HeavyHitters:
+        return HeavyHitters(
+            capacity=self.capacity,
+            half_life_seconds=self.half_life_seconds,
+            sketch=CountMinSketch(width=self.sketch_width, depth=self.sketch_depth),
+        )
+
+    def _cached(self, key: Tuple[str, int], compute) -> List[TrendingSearch]:
+        results = self._results.get(key)
+        if results is None:
+            if len(self._results) >= _MAX_CACHED_RESULTS:
+                self._results.clear()
+            results = [TrendingSearch(query=query, score=score) for query, score in compute()]
+            self._results[key] = results
+        return results
+
+    async def _run(self) -> None:
+        try:
+            await self.load_snapshot()
+        except Exception:
+            self.errors += 1
+            logger.exception('Failed to load the trending searches snapshot; starting empty.')
+        while True:
+            try:
+                await self.poll_once()
+                if time.monotonic() - self._snapshot_at >= self.snapshot_seconds:
+                    await self.save_snapshot()
+            except Exception:
+                self.errors += 1
+                logger.exception('Trending searches update failed; retrying later.')
+            await asyncio.sleep(self.poll_seconds)
+
+
+def _write_atomically(path: str, payload: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Nome temporário por processo: vários workers podem gravar o mesmo snapshot
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with gzip.open(temporary_path, 'wt', encoding='utf-8') as file:
+        file.write(payload)
+    os.replace(temporary_path, path)
+
+
+def _read_gzip(path: str) -> str:
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        return file.read()
+
+
+# Cria uma instância única do serviço, iniciada no ciclo de vida da aplicação.
+trending_searches = TrendingSearches()
@@ -1,51 +1,143 @@
+import asyncio
 import uuid
-from typing import List
+from datetime import datetime
+from typing import List, NoReturn, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Importa as camadas que o serviço irá orquestrar
-from inclui_aqui_server.crud import user as user_crud
+from inclui_aqui_server.crud import search_history_crud, user_crud
+from inclui_aqui_server.core.cache import LRUCache, ReadThroughCache
+from inclui_aqui_server.core.config import settings
 from inclui_aqui_server.core.security import password_handler
-from inclui_aqui_server.db.schemas import UserCreate, UserUpdate
+from inclui_aqui_server.db.schemas import (
+    UserBulkConflict,
+    UserBulkCreateResult,
+    UserCreate,
+    UserRead,
+    UserSearchRead,
+    UserUpdate,
+)
 from inclui_aqui_server.db.models import User
 from inclui_aqui_server.core.exception import NotFoundError, AlreadyExistsError
+from inclui_aqui_server.services.leaderboard import PointsLeaderboard, points_leaderboard
+
+# Cache compartilhado por todas as instâncias do serviço neste processo.
+# Armazena apenas a forma pública (UserRead), nunca o hashed_password.
+user_cache = ReadThroughCache(
+    LRUCache(max_size=settings.USER_CACHE_MAX_SIZE, ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
+)
+
+
+def _user_cache_key(user_id: uuid.UUID) -> str:
+    return f"user:{user_id}"
+
 
 class UserService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: ReadThroughCache = user_cache,
+        read_db: Optional[AsyncSession] = None,
+        leaderboard: PointsLeaderboard = points_leaderboard,
+    ):
         """
         O serviço é inicializado com uma sessão de banco de dados assíncrona.
 
-        :param db: A sessão do banco de dados a ser usada pelo serviço.
+        :param db: A sessão do banco de dados (primário) usada nas escritas.
         :type db: AsyncSession
+        :param cache: O cache de leitura dos perfis de usuário.
+        :type cache: ReadThroughCache
+        :param read_db: A sessão usada nas leituras (ex.: réplica); por padrão, a mesma de `db`.
+        :type read_db: Optional[AsyncSession]
+        :param leaderboard: O ranking de pontos em memória, atualizado a cada escrita.
+        :type leaderboard: PointsLeaderboard
         """
         self.db = db
+        self.cache = cache
+        self.read_db = read_db if read_db is not None else db
+        self.leaderboard = leaderboard
 
-    async def get_user(self, user_id: uuid.UUID) -> User:
+    async def get_user(self, user_id: uuid.UUID) -> UserRead:
         """
-        Busca um único usuário pelo seu ID de forma assíncrona.
+        Busca um único usuário pelo seu ID de forma assíncrona, passando pelo cache.
 
         :param user_id: O ID do usuário a ser buscado.
         :type user_id: uuid.UUID
         :raises NotFoundError: Se o usuário com o ID especificado não for encontrado.
-        :return: O objeto de modelo User correspondente.
-        :rtype: User
+        :return: Os dados públicos do usuário.
+        :rtype: UserRead
+        """
+        async def load_user():
+            db_user = await user_crud.get(self.read_db, user_id=user_id)
+            # Devolve a conexão ao pool assim que a leitura termina
+            await self.read_db.close()
+            if not db_user:
+                return None
+            return UserRead.model_validate(db_user).model_dump(mode="json")
+
+        cached_user = await self.cache.get_or_load(_user_cache_key(user_id), load_user)
+        if cached_user is None:
+            raise NotFoundError(resource="User")
+        return UserRead.model_validate(cached_user)
+
+    async def get_user_version(self, user_id: uuid.UUID) -> datetime:
+        """
+        Retorna a versão (`updated_at`) de um usuário, para validar GETs condicionais.
+
+        Usa o perfil em cache, se houver; senão, consulta apenas a coluna `updated_at`.
+
+        :param user_id: O ID do usuário.
+        :type user_id: uuid.UUID
+        :raises NotFoundError: Se o usuário com o ID especificado não for encontrado.
+        :return: A data da última alteração do usuário.
+        :rtype: datetime
         """
-        db_user = await user_crud.get(self.db, user_id=user_id)
-        if not db_user:
+        cached_user = await self.cache.peek(_user_cache_key(user_id))
+        if cached_user is not None:
+            return UserRead.model_validate(cached_user).updated_at
+
+        updated_at = await user_crud.get_updated_at(self.read_db, user_id=user_id)
+        await self.read_db.close()
+        if updated_at is None:
             raise NotFoundError(resource="User")
-        return db_user
+        return updated_at
 
-    async def get_users(self, skip: int, limit: int) -> List[User]:
+    async def get_users(self, limit: int, cursor: Optional[str] = None) -> Tuple[List[User], Optional[str]]:
         """
-        Busca uma lista de usuários com paginação de forma assíncrona.
+        Busca uma página de usuários usando paginação por cursor de forma assíncrona.
 
-        :param skip: O número de registros a pular.
-        :type skip: int
         :param limit: O número máximo de registros a retornar.
         :type limit: int
-        :return: Uma lista de objetos de modelo User.
-        :rtype: List[User]
+        :param cursor: O cursor retornado pela página anterior, ou None para a primeira página.
+        :type cursor: Optional[str]
+        :raises BadRequestError: Se o cursor for inválido.
+        :return: Uma tupla com a lista de objetos de modelo User e o cursor da próxima página.
+        :rtype: Tuple[List[User], Optional[str]]
+        """
+        page = await user_crud.get_page(self.read_db, limit=limit, cursor=cursor)
+        # Devolve a conexão ao pool assim que a leitura termina
+        await self.read_db.close()
+        return page
+
+    async def get_recent_searches(self, user_id: uuid.UUID, limit: int = 20) -> List[UserSearchRead]:
+        """
+        Busca as buscas mais recentes de um usuário.
+
+        As buscas são gravadas em lote, em segundo plano: as do último segundo
+        podem ainda não aparecer.
+
+        :param user_id: O ID do usuário.
+        :type user_id: uuid.UUID
+        :param limit: O número máximo de buscas a retornar.
+        :type limit: int
+        :return: As buscas, da mais recente à mais antiga.
+        :rtype: List[UserSearchRead]
         """
-        return await user_crud.get_multi(self.db, skip=skip, limit=limit)
+        searches = await search_history_crud.get_recent_by_user(self.read_db, user_id, limit=limit)
+        # Devolve a conexão ao pool assim que a leitura termina
+        await self.read_db.close()
+        return [UserSearchRead.model_validate(search) for search in searches]
 
     async def create_user(self, user_in: UserCreate) -> User:
         """
@@ -53,22 +145,105 @@ class UserService:
 
         :param user_in: Os dados do usuário a ser criado, validados pelo schema.
         :type user_in: CreateUserSchema
-        :raises AlreadyExistsError: Se um usuário com o mesmo e-mail já existir.
+        :raises AlreadyExistsError: Se um usuário com o mesmo e-mail ou nome de usuário já existir.
         :return: O objeto de modelo User recém-criado.
         :rtype: User
         """
-        existing_user = await user_crud.get_by_email(self.db, email=user_in.email)
-        if existing_user:
-            raise AlreadyExistsError(resource="User", field="email")
+        hashed_password = await password_handler.hash_async(user_in.password)
 
-        hashed_password = password_handler.get_password_hash(user_in.password)
+        # A unicidade de email e username é garantida pelas restrições UNIQUE do
+        # banco: sem consulta prévia e sem janela para cadastros concorrentes.
+        try:
+            created_user = await user_crud.create(
+                self.db,
+                user_in=user_in,
+                hashed_password=hashed_password
+            )
+        except IntegrityError as exc:
+            await self._raise_conflict(exc)
+        self.leaderboard.record(created_user.id, created_user.points)
+        return created_user
+
+    async def create_users(self, users_in: List[UserCreate]) -> UserBulkCreateResult:
+        """
+        Cria usuários em lote, reportando conflitos por linha sem abortar o lote.
 
-        created_user = await user_crud.create(
+        A verificação de duplicidade (email e username) é feita em uma única
+        consulta, os hashes das senhas são calculados em paralelo no pool de
+        hashing e a inserção usa um único INSERT multi-linha.
+
+        :param users_in: Os dados dos usuários a serem criados.
+        :type users_in: List[UserCreate]
+        :return: Os usuários criados e a lista de conflitos, indexados pela posição na entrada.
+        :rtype: UserBulkCreateResult
+        """
+        existing = await user_crud.get_existing_identifiers(
             self.db,
-            user_in=user_in,
-            hashed_password=hashed_password
+            emails=[user_in.email for user_in in users_in],
+            usernames=[user_in.username for user_in in users_in],
+        )
+        taken_emails = {email for email, _ in existing}
+        taken_usernames = {username for _, username in existing}
+
+        conflicts: List[UserBulkConflict] = []
+        accepted: List[tuple[int, UserCreate]] = []
+        for index, user_in in enumerate(users_in):
+            # Também detecta duplicidades dentro do próprio lote
+            if user_in.email in taken_emails:
+                conflicts.append(UserBulkConflict(index=index, field="email", value=user_in.email))
+                continue
+            if user_in.username in taken_usernames:
+                conflicts.append(
+                    UserBulkConflict(index=index, field="username", value=user_in.username)
+                )
+                continue
+            taken_emails.add(user_in.email)
+            taken_usernames.add(user_in.username)
+            accepted.append((index, user_in))
+
+        hashed_passwords = await asyncio.gather(
+            *(password_handler.hash_async(user_in.password) for _, user_in in accepted)
+        )
+
+        rows = []
+        for (_, user_in), hashed_password in zip(accepted, hashed_passwords):
+            user_data = user_in.model_dump()
+            user_data.pop("password", None)
+            rows.append({**user_data, "hashed_password": hashed_password})
+
+        created = await user_crud.create_many(self.db, rows=rows)
+        for user in created:
+            self.leaderboard.record(user.id, user.points)
+
+        # Linhas descartadas pelo ON CONFLICT foram inseridas por outra transação
+        # entre a verificação e o INSERT; uma nova consulta diz qual campo colidiu.
+        created_emails = {user.email for user in created}
+        dropped = [
+            (index, user_in) for index, user_in in accepted if user_in.email not in created_emails
+        ]
+        if dropped:
+            existing = await user_crud.get_existing_identifiers(
+                self.db,
+                emails=[user_in.email for _, user_in in dropped],
+                usernames=[user_in.username for _, user_in in dropped],
+            )
+            taken_emails = {email for email, _ in existing}
+            taken_usernames = {username for _, username in existing}
+            for index, user_in in dropped:
+                if user_in.email in taken_emails:
+                    field, value = "email", user_in.email
+                elif user_in.username in taken_usernames:
+                    field, value = "username", user_in.username
+                else:
+                    # O usuário que causou o conflito já foi removido
+                    field, value = "identifier", user_in.email
+                conflicts.append(UserBulkConflict(index=index, field=field, value=value))
+        conflicts.sort(key=lambda conflict: conflict.index)
+
+        return UserBulkCreateResult(
+            created=[UserRead.model_validate(user) for user in created],
+            conflicts=conflicts,
         )
-        return created_user
 
     async def update_user(self, user_id: uuid.UUID, user_in: UserUpdate) -> User:
         """
@@ -79,26 +254,28 @@ class UserService:
         :param user_in: Os dados a serem atualizados.
         :type user_in: UpdateUserSchema
         :raises NotFoundError: Se o usuário a ser atualizado não for encontrado.
-        :raises AlreadyExistsError: Se a atualização tentar usar um e-mail que já pertence a outro usuário.
+        :raises AlreadyExistsError: Se a atualização tentar usar um e-mail ou nome de usuário que já pertence a outro usuário.
         :return: O objeto de modelo User atualizado.
         :rtype: User
         """
-        db_user = await self.get_user(user_id) # Reutiliza o método da própria classe
         update_data = user_in.model_dump(exclude_unset=True)
-        
-        # Regra de negócio: se o e-mail estiver sendo atualizado, verificar duplicidade
-        if "email" in update_data and update_data["email"] != db_user.email:
-            existing_user = await user_crud.get_by_email(self.db, email=update_data["email"])
-            if existing_user:
-                raise AlreadyExistsError(resource="User", field="email")
-        
+
         # Regra de negócio: se a senha estiver sendo atualizada, gerar novo hash
-        if "password" in update_data and update_data["password"]:
-            hashed_password = password_handler.get_password_hash(update_data["password"])
-            update_data["hashed_password"] = hashed_password
-            del update_data["password"]
+        password = update_data.pop("password", None)
+        if password:
+            update_data["hashed_password"] = await password_handler.hash_async(password)
 
-        return await user_crud.update(self.db, db_obj=db_user, obj_in=update_data)
+        try:
+            updated_user = await user_crud.update(self.db, user_id=user_id, obj_in=update_data)
+        except IntegrityError as exc:
+            await self._raise_conflict(exc)
+        if not updated_user:
+            raise NotFoundError(resource="User")
+        self.leaderboard.record(user_id, updated_user.points)
+        await self.cache.refresh(
+            _user_cache_key(user_id), UserRead.model_validate(updated_user).model_dump(mode="json")
+        )
+        return updated_user
 
     async def delete_user(self, user_id: uuid.UUID) -> User:
         """
@@ -110,5 +287,23 @@ class UserService:
         :return: O objeto de modelo User que foi deletado.
         :rtype: User
         """
-        db_user = await self.get_user(user_id)
-        return await user_crud.remove(self.db, user_id=db_user.id)
\ No newline at end of file
+        deleted_user = await user_crud.remove(self.db, user_id=user_id)
+        if not deleted_user:
+            raise NotFoundError(resource="User")
+        await self.cache.invalidate(_user_cache_key(user_id))
+        self.leaderboard.forget(user_id)
+        return deleted_user
+
+    async def _raise_conflict(self, exc: IntegrityError) -> NoReturn:
+        """
+        Desfaz a transação e converte uma violação de unicidade em AlreadyExistsError.
+
+        :param exc: O IntegrityError levantado pela escrita.
+        :raises AlreadyExistsError: Se a violação for de email ou nome de usuário.
+        :raises IntegrityError: Para qualquer outra violação de integridade.
+        """
+        await self.db.rollback()
+        field = user_crud.get_conflicting_field(exc)
+        if field is None:
+            raise exc
+        raise AlreadyExistsError(resource="User", field=field) from exc
@@ -0,0 +1,93 @@
+"""
+Utilitários compartilhados pelos benchmarks (`pytest -m benchmark -s`).
+"""
+
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inclui_aqui_server.core.geo import encode_geohash
+from inclui_aqui_server.db.models import UserRole
+
+INSERT_BATCH_SIZE = 5000
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Retorna o percentil `fraction` (0 a 1) de uma lista de medições."""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def summary(label: str, seconds: List[float]) -> str:
+    """Formata p50 e p99 (em ms) de uma lista de medições."""
+    return (
+        f'{label}: {len(seconds)} runs, p50 {percentile(seconds, 0.5) * 1000:.2f} ms, '
+        f'p99 {percentile(seconds, 0.99) * 1000:.2f} ms'
+    )
+
+
+async def measure(operation: Callable[[], Awaitable[Any]], repeat: int) -> List[float]:
+    """Executa `operation` `repeat` vezes e retorna a duração de cada execução."""
+    durations = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await operation()
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+async def insert_rows(db: AsyncSession, model: Any, rows: List[Dict[str, Any]]) -> None:
+    """Insere linhas em lotes (INSERT com vários conjuntos de parâmetros) e faz commit."""
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        await db.execute(insert(model), rows[start:start + INSERT_BATCH_SIZE])
+    await db.commit()
+
+
+def user_rows(count: int, prefix: str = 'user') -> List[Dict[str, Any]]:
+    """Usuários sintéticos com `created_at` distintos e crescentes."""
+    started_at = datetime(2024, 1, 1)
+    return [
+        {
+            'id': uuid.uuid4(),
+            'username': f'{prefix}{index}',
+            'email': f'{prefix}{index}@example.com',
+            'hashed_password': 'not-a-real-hash',
+            'role': UserRole.client,
+            'created_at': started_at + timedelta(seconds=index),
+        }
+        for index in range(count)
+    ]
+
+
+# Região das coordenadas sintéticas: um quadrado de 1 grau em torno de São Paulo
+REGION_LAT = (-24.0, -23.0)
+REGION_LON = (-47.0, -46.0)
+
+
+def random_point(rng: random.Random) -> Tuple[float, float]:
+    """Um ponto aleatório dentro de `REGION_LAT` x `REGION_LON`."""
+    return rng.uniform(*REGION_LAT), rng.uniform(*REGION_LON)
+
+
+def establishment_rows(count: int, owner_id: uuid.UUID, seed: int = 0) -> List[Dict[str, Any]]:
+    """Estabelecimentos aprovados e espalhados pela região, com o geohash já calculado."""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        latitude, longitude = (round(value, 8) for value in random_point(rng))
+        rows.append({
+            'id': uuid.uuid4(),
+            'name': f'Lugar {index}',
+            'address': f'Rua {index % 5000}, {index}',
+            'latitude': latitude,
+            'longitude': longitude,
+            'geohash': encode_geohash(latitude, longitude),
+            'is_approved': True,
+            'owner_id': owner_id,
+        })
+    return rows
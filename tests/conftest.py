@@ -0,0 +1,145 @@
+import os
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+# As configurações obrigatórias precisam existir antes de importar a aplicação.
+# Os testes que dependem do PostgreSQL usam TEST_DATABASE_URL, um banco descartável
+# (as tabelas são recriadas a cada teste), e são ignorados quando ela não está definida.
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+if TEST_DATABASE_URL:
+    os.environ['DATABASE_URL'] = TEST_DATABASE_URL
+os.environ.setdefault('DATABASE_URL', 'postgresql+asyncpg://localhost/inclui_aqui_test')
+os.environ.setdefault('PROJECT_NAME', 'IncluiAqui')
+os.environ.setdefault('API_V1_STR', '/api/v1')
+
+from inclui_aqui_server.db.models import Establishment, User, UserRole  # noqa: E402 (registra as tabelas)
+from inclui_aqui_server.db.database import (  # noqa: E402
+    async_engine,
+    dispose_engines,
+    table_registry,
+)
+
+
+@compiles(ARRAY, 'sqlite')
+def _compile_array_for_sqlite(type_, compiler, **kw):
+    # Só a criação das tabelas: os testes em SQLite não gravam listas
+    return 'JSON'
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@contextmanager
+def count_statements(engine: AsyncEngine) -> Iterator[List[str]]:
+    """
+    Registra os comandos SQL enviados ao banco (uma ida ao banco por comando).
+    """
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
+async def _reset_postgres() -> AsyncEngine:
+    from inclui_aqui_server.services.search_history import ensure_search_history_partitions
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        await conn.run_sync(table_registry.metadata.drop_all)
+        await conn.run_sync(table_registry.metadata.create_all)
+    await ensure_search_history_partitions()
+    return async_engine
+
+
+@pytest.fixture
+async def postgres_engine():
+    """
+    O motor da aplicação, apontado para TEST_DATABASE_URL, com as tabelas recriadas.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip('Set TEST_DATABASE_URL to a disposable PostgreSQL database.')
+    try:
+        engine = await _reset_postgres()
+    except OSError as exc:
+        pytest.skip(f'PostgreSQL unavailable: {exc}')
+    yield engine
+    await dispose_engines()
+
+
+@pytest.fixture
+async def db_engine():
+    """
+    Um banco com todas as tabelas: o PostgreSQL de TEST_DATABASE_URL ou, sem ele, SQLite em memória.
+    """
+    if TEST_DATABASE_URL:
+        yield await _reset_postgres()
+        await dispose_engines()
+        return
+    pytest.importorskip('aiosqlite')
+    engine = create_async_engine('sqlite+aiosqlite://', poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(table_registry.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def seed_establishment(
+    db: AsyncSession, *, reviews: Sequence[int] = (), is_approved: bool = True
+) -> Establishment:
+    """
+    Cria um dono, um estabelecimento e as avaliações com as notas pedidas, cada uma
+    de um autor diferente (agregados incluídos).
+    """
+    from inclui_aqui_server.crud import review_crud
+    from inclui_aqui_server.db.schemas import ReviewCreate
+
+    owner, *authors = [_user('owner')] + [_user('author') for _ in reviews]
+    db.add_all([owner, *authors])
+    await db.flush()
+    establishment = Establishment(
+        name='Café Central',
+        address='Rua Augusta, 100',
+        latitude=-23.55,
+        longitude=-46.63,
+        is_approved=is_approved,
+        owner_id=owner.id,
+    )
+    db.add(establishment)
+    await db.commit()
+    for rating, author in zip(reviews, authors):
+        await review_crud.create(
+            db,
+            review_in=ReviewCreate(
+                establishment_id=establishment.id,
+                user_id=author.id,
+                rating=rating,
+                comment=f'Nota {rating}',
+            ),
+        )
+    return establishment
+
+
+def _user(prefix: str) -> User:
+    name = f'{prefix}-{uuid.uuid4().hex[:12]}'
+    return User(
+        username=name,
+        email=f'{name}@example.com',
+        hashed_password='not-a-real-hash',
+        role=UserRole.client,
+    )
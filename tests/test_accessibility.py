@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.accessibility import AccessibilityEncoder
+from inclui_aqui_server.core.exception import BadRequestError
+from inclui_aqui_server.crud import establishment_crud
+from inclui_aqui_server.db.schemas import EstablishmentRead
+from inclui_aqui_server.services.accessibility import RegionBitmap
+from tests.conftest import seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+RAMP, TOILET, TACTILE = 1 << 0, 1 << 1, 1 << 5
+
+
+@pytest.fixture
+def encoder():
+    return AccessibilityEncoder({'Rampa': 0, 'Banheiro adaptado': 1, 'Piso tátil': 5})
+
+
+def test_mask_for_sets_one_bit_per_criterion_ignoring_case(encoder):
+    assert encoder.mask_for([' rampa', 'PISO TÁTIL']) == RAMP | TACTILE
+    with pytest.raises(BadRequestError):
+        encoder.mask_for(['rampa', 'elevador'])
+
+
+def test_encode_reads_true_values_and_name_lists(encoder):
+    assert encoder.encode({'Rampa': True, 'Banheiro adaptado': False, 'Elevador': True}) == RAMP
+    assert encoder.encode(['piso tátil', 'banheiro adaptado']) == TOILET | TACTILE
+    assert encoder.encode(None) == 0
+    assert encoder.decode(RAMP | TOILET | TACTILE) == ['Rampa', 'Banheiro adaptado', 'Piso tátil']
+
+
+def test_ordinals_must_fit_in_the_bigint_mask():
+    with pytest.raises(ValueError):
+        AccessibilityEncoder({'Rampa': 63})
+
+
+@pytest.fixture
+async def region(db_engine):
+    """Quatro estabelecimentos aprovados na mesma região, com máscaras diferentes."""
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    masks = {}
+    async with session_factory() as db:
+        for mask in (RAMP | TOILET, RAMP, TOILET | TACTILE, 0):
+            establishment = await seed_establishment(db)
+            await establishment_crud.update_accessibility(
+                db, establishment_id=establishment.id, features={}, mask=mask
+            )
+            masks[establishment.id] = mask
+    return session_factory, establishment.geohash[:5], masks
+
+
+@pytest.mark.parametrize(
+    ('mask', 'match_all'),
+    [(RAMP | TOILET, True), (RAMP | TOILET, False), (TACTILE, True), (TACTILE | RAMP, True)],
+)
+async def test_sql_filter_and_region_bitmap_select_the_same_establishments(
+    region, mask, match_all
+):
+    session_factory, prefix, masks = region
+    expected = {
+        establishment_id
+        for establishment_id, stored in masks.items()
+        if (stored & mask == mask if match_all else stored & mask)
+    }
+
+    async with session_factory() as db:
+        rows, _ = await establishment_crud.get_by_accessibility(
+            db, mask=mask, match_all=match_all, region=prefix, limit=10
+        )
+        bitmap = RegionBitmap([
+            (EstablishmentRead.model_validate(item), item.accessibility_mask)
+            for item in await establishment_crud.get_region(db, region=prefix, limit=10)
+        ])
+    items, _ = bitmap.select(mask, match_all, limit=10)
+
+    assert [row.id for row in rows] == [item.id for item in items]
+    assert {item.id for item in items} == expected
+
+
+# Só no PostgreSQL: o SQLite grava created_at como texto e a comparação de tuplas do cursor difere
+async def test_region_bitmap_and_sql_cursors_are_interchangeable(postgres_engine, region):
+    session_factory, prefix, _ = region
+    async with session_factory() as db:
+        bitmap = RegionBitmap([
+            (EstablishmentRead.model_validate(item), item.accessibility_mask)
+            for item in await establishment_crud.get_region(db, region=prefix, limit=10)
+        ])
+        sql_pages = []
+        cursor = None
+        while True:
+            rows, cursor = await establishment_crud.get_by_accessibility(
+                db, mask=RAMP | TOILET, match_all=False, region=prefix, limit=1, cursor=cursor
+            )
+            sql_pages.append([row.id for row in rows])
+            if cursor is None:
+                break
+
+    # Alterna entre a consulta SQL e o bitmap, passando o cursor de um para o outro
+    first, cursor = bitmap.select(RAMP | TOILET, False, limit=1)
+    async with session_factory() as db:
+        second, cursor = await establishment_crud.get_by_accessibility(
+            db, mask=RAMP | TOILET, match_all=False, region=prefix, limit=1, cursor=cursor
+        )
+    third, cursor = bitmap.select(RAMP | TOILET, False, limit=1, cursor=cursor)
+
+    assert [[first[0].id], [second[0].id], [third[0].id]] == sql_pages
+    assert cursor is None
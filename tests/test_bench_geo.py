@@ -0,0 +1,82 @@
+"""
+Benchmark: busca por raio com o índice de geohash contra a varredura da tabela com distâncias em Python.
+"""
+
+import random
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.geo import haversine_m
+from inclui_aqui_server.crud import establishment_crud
+from inclui_aqui_server.db.models import Establishment, User
+from tests.benchmark import (
+    establishment_rows,
+    insert_rows,
+    measure,
+    percentile,
+    random_point,
+    summary,
+    user_rows,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+RADIUS_M = 1000.0
+LIMIT = 20
+INDEXED_REPEAT = 50
+SCAN_REPEAT = 5
+
+
+async def scan_within_radius(db, latitude: float, longitude: float):
+    """O caminho anterior: lê todas as coordenadas e calcula as distâncias em Python."""
+    result = await db.execute(
+        select(Establishment.id, Establishment.latitude, Establishment.longitude).filter(
+            Establishment.is_approved.is_(True)
+        )
+    )
+    distances = [
+        (haversine_m(latitude, longitude, float(row.latitude), float(row.longitude)), row.id)
+        for row in result
+    ]
+    return sorted(item for item in distances if item[0] <= RADIUS_M)[:LIMIT]
+
+
+@pytest.mark.parametrize('size', [10_000, 100_000, 1_000_000])
+async def test_radius_search_by_size(postgres_engine, size):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    owner = user_rows(1, prefix='owner')[0]
+    async with session_factory() as db:
+        await insert_rows(db, User, [owner])
+        await insert_rows(db, Establishment, establishment_rows(size, owner['id']))
+        await db.execute(text('ANALYZE establishments'))
+
+    rng = random.Random(size)
+    centers = iter([random_point(rng) for _ in range(INDEXED_REPEAT + SCAN_REPEAT)])
+
+    async def indexed():
+        latitude, longitude = next(centers)
+        return await establishment_crud.get_within_radius(
+            db, latitude=latitude, longitude=longitude, radius_m=RADIUS_M, limit=LIMIT
+        )
+
+    async def scan():
+        return await scan_within_radius(db, *next(centers))
+
+    async with session_factory() as db:
+        indexed_durations = await measure(indexed, INDEXED_REPEAT)
+        scan_durations = await measure(scan, SCAN_REPEAT)
+
+        latitude, longitude = random_point(rng)
+        rows, _ = await establishment_crud.get_within_radius(
+            db, latitude=latitude, longitude=longitude, radius_m=RADIUS_M, limit=LIMIT
+        )
+        scanned = await scan_within_radius(db, latitude, longitude)
+
+    print(
+        f'\n{size} establishments, radius {RADIUS_M:.0f} m, limit {LIMIT}'
+        f'\n{summary("geohash index", indexed_durations)}\n{summary("scan + Python", scan_durations)}'
+    )
+    assert [establishment.id for establishment, _ in rows] == [id_ for _, id_ in scanned]
+    assert percentile(indexed_durations, 0.5) < percentile(scan_durations, 0.5)
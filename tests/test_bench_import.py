@@ -0,0 +1,71 @@
+"""
+Benchmark: importação de 1M de linhas de CSV e reimportação do mesmo arquivo.
+"""
+
+import csv
+import random
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.db.models import Establishment
+from inclui_aqui_server.services.establishment_import import EstablishmentImporter
+from tests.benchmark import random_point
+from tests.conftest import seed_establishment
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+ROWS = 1_000_000
+FIELDS = ['google_place_id', 'name', 'address', 'latitude', 'longitude', 'type']
+
+
+def write_fixture(path) -> None:
+    """Grava o CSV linha a linha, sem manter o arquivo na memória."""
+    rng = random.Random(14)
+    with open(path, 'w', encoding='utf-8', newline='') as stream:
+        writer = csv.writer(stream)
+        writer.writerow(FIELDS)
+        for index in range(ROWS):
+            latitude, longitude = random_point(rng)
+            writer.writerow([
+                f'place-{index}',
+                f'Lugar {index}',
+                f'Rua {index % 5000}, {index}',
+                f'{latitude:.8f}',
+                f'{longitude:.8f}',
+                'restaurante',
+            ])
+
+
+async def test_import_one_million_rows(postgres_engine, tmp_path):
+    path = tmp_path / 'establishments.csv'
+    write_fixture(path)
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        owner_id = (await seed_establishment(db)).owner_id
+
+    reports = []
+    for _ in range(2):
+        async with session_factory() as db:
+            with open(path, encoding='utf-8', newline='') as stream:
+                importer = EstablishmentImporter(db, owner_id=owner_id)
+                reports.append(await importer.run(stream, 'csv'))
+    first, second = reports
+
+    async with session_factory() as db:
+        imported = await db.scalar(
+            select(func.count()).select_from(Establishment).filter(
+                Establishment.google_place_id.is_not(None)
+            )
+        )
+
+    for label, report in (('import', first), ('re-import', second)):
+        print(
+            f'\n{label}: {report.inserted} inserted, {report.updated} updated, '
+            f'{report.unchanged} unchanged, {report.rejected} rejected '
+            f'in {report.elapsed_seconds:.1f}s ({report.rows_per_second:.0f} rows/s)'
+        )
+    assert imported == ROWS
+    assert (first.inserted, first.rejected) == (ROWS, 0)
+    assert (second.inserted, second.updated, second.unchanged) == (0, 0, ROWS)
@@ -0,0 +1,44 @@
+"""
+Benchmark: página 1000 da listagem de usuários por OFFSET e por cursor (keyset).
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import user_crud
+from inclui_aqui_server.crud.pagination import encode_cursor
+from inclui_aqui_server.db.models import User
+from tests.benchmark import insert_rows, measure, percentile, summary, user_rows
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+PAGE_SIZE = 50
+PAGE = 1000
+REPEAT = 30
+
+
+async def test_page_1000_keyset_versus_offset(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await insert_rows(db, User, user_rows(PAGE_SIZE * PAGE))
+        await db.execute(text('ANALYZE users'))
+
+    skip = PAGE_SIZE * (PAGE - 1)
+    async with session_factory() as db:
+        # O cursor da página 1000 é o último item da página 999
+        previous = (await user_crud.get_multi(db, skip=skip - 1, limit=1))[0]
+        cursor = encode_cursor([previous.created_at, previous.id])
+
+        offset = await measure(
+            lambda: user_crud.get_multi(db, skip=skip, limit=PAGE_SIZE), REPEAT
+        )
+        keyset = await measure(
+            lambda: user_crud.get_page(db, limit=PAGE_SIZE, cursor=cursor), REPEAT
+        )
+        offset_page = await user_crud.get_multi(db, skip=skip, limit=PAGE_SIZE)
+        keyset_page, _ = await user_crud.get_page(db, limit=PAGE_SIZE, cursor=cursor)
+
+    print(f'\n{summary("offset", offset)}\n{summary("keyset", keyset)}')
+    assert [user.id for user in keyset_page] == [user.id for user in offset_page]
+    assert percentile(keyset, 0.5) < percentile(offset, 0.5)
@@ -0,0 +1,66 @@
+"""
+Benchmark: latência de uma rota sem relação com senhas (/metrics) enquanto o bcrypt roda.
+
+Compara o hashing no próprio event loop (como era antes de `hash_async`) com o
+pool de workers do `PasswordHandler`. Execute com `pytest -m benchmark -s`.
+"""
+
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+import pytest
+
+from inclui_aqui_server.app import app
+from inclui_aqui_server.core.security import PasswordHandler
+from tests.benchmark import percentile, summary
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+DURATION_SECONDS = 5.0
+HASHING_TASKS = min(os.cpu_count() or 1, 4)
+PASSWORD = 'correct horse battery staple'
+
+
+async def _metrics_latencies(hash_password: Callable[[str], Awaitable[str]]) -> List[float]:
+    stop = asyncio.Event()
+
+    async def hash_continuously():
+        while not stop.is_set():
+            await hash_password(PASSWORD)
+
+    hashers = [asyncio.create_task(hash_continuously()) for _ in range(HASHING_TASKS)]
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        deadline = time.perf_counter() + DURATION_SECONDS
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+            response = await client.get('/metrics')
+            latencies.append(time.perf_counter() - started_at)
+            assert response.status_code == 200
+            await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.gather(*hashers)
+    return latencies
+
+
+async def test_metrics_p99_while_hashing():
+    handler = PasswordHandler(max_workers=HASHING_TASKS)
+
+    async def hash_in_event_loop(password: str) -> str:
+        hashed = handler.get_password_hash(password)
+        # Cede o loop entre dois hashes, como faria uma requisição de cadastro
+        await asyncio.sleep(0)
+        return hashed
+
+    try:
+        inline = await _metrics_latencies(hash_in_event_loop)
+        pooled = await _metrics_latencies(handler.hash_async)
+    finally:
+        handler.shutdown()
+
+    print(f'\n{summary("event loop", inline)}\n{summary("worker pool", pooled)}')
+    assert percentile(pooled, 0.99) < percentile(inline, 0.99)
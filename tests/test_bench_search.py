@@ -0,0 +1,99 @@
+"""
+Benchmark: latência do autocomplete e da busca textual (índice de trigramas) sobre um corpus sintético.
+"""
+
+import random
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import establishment_crud
+from inclui_aqui_server.db.models import Establishment, User
+from inclui_aqui_server.services.establishment import EstablishmentService
+from tests.benchmark import (
+    establishment_rows,
+    insert_rows,
+    measure,
+    percentile,
+    summary,
+    user_rows,
+)
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+CORPUS_SIZE = 100_000
+VOCABULARY_SIZE = 5_000
+TYPES = ['restaurante', 'farmácia', 'mercado', 'hotel', 'museu', 'clínica', 'escola', 'parque']
+REPEAT = 200
+# Meta do autocomplete: responder em poucos milissegundos
+AUTOCOMPLETE_P50_MS = 10.0
+
+_SYLLABLES = [
+    consonant + vowel for consonant in 'bcdfglmnprstv' for vowel in 'aeiou'
+]
+
+
+def vocabulary(rng: random.Random) -> list[str]:
+    """Palavras sintéticas de 2 a 4 sílabas, sem repetição."""
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add(''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def queries(rng: random.Random, words: list[str]) -> list[str]:
+    """Prefixos de 3 a 6 letras, metade com uma letra trocada (erro de digitação)."""
+    result = []
+    for index in range(REPEAT):
+        word = rng.choice(words)
+        prefix = word[:rng.randint(3, 6)]
+        if index % 2:
+            position = rng.randrange(len(prefix))
+            prefix = prefix[:position] + rng.choice('aeiou') + prefix[position + 1:]
+        result.append(prefix)
+    return result
+
+
+async def test_autocomplete_and_search_latency(postgres_engine):
+    rng = random.Random(11)
+    words = vocabulary(rng)
+    owner = user_rows(1, prefix='owner')[0]
+    rows = establishment_rows(CORPUS_SIZE, owner['id'])
+    for index, row in enumerate(rows):
+        row['name'] = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 3))).title()
+        row['type'] = rng.choice(TYPES)
+        # 10% ainda não aprovados: nunca podem aparecer nos resultados
+        row['is_approved'] = index % 10 != 0
+    unapproved = {row['id'] for row in rows if not row['is_approved']}
+
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await insert_rows(db, User, [owner])
+        await insert_rows(db, Establishment, rows)
+        await db.execute(text('ANALYZE establishments'))
+
+    typed = iter(queries(rng, words))
+    searched = iter(queries(rng, words))
+    returned = set()
+
+    async def autocomplete():
+        suggestions = await EstablishmentService(db).autocomplete(next(typed), limit=10)
+        returned.update(suggestion.id for suggestion in suggestions)
+
+    async def search():
+        results = await establishment_crud.search(db, query=next(searched), limit=20)
+        returned.update(establishment.id for establishment, _ in results)
+
+    async with session_factory() as db:
+        autocomplete_durations = await measure(autocomplete, REPEAT)
+        search_durations = await measure(search, REPEAT)
+
+    print(
+        f'\n{CORPUS_SIZE} establishments, vocabulary {VOCABULARY_SIZE}'
+        f'\n{summary("autocomplete", autocomplete_durations)}'
+        f'\n{summary("search", search_durations)}'
+    )
+    assert returned
+    assert not returned & unapproved
+    assert percentile(autocomplete_durations, 0.5) * 1000 < AUTOCOMPLETE_P50_MS
@@ -0,0 +1,69 @@
+"""
+Benchmark: geração de sugestões a partir de 100 mil avaliações e a reexecução sem avaliações novas.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.db.models import Establishment, Review, Suggestion, User
+from inclui_aqui_server.services.suggestion import SuggestionEngine
+from tests.benchmark import establishment_rows, insert_rows, user_rows
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+ESTABLISHMENTS = 1000
+REVIEWS_PER_ESTABLISHMENT = 100
+CRITERIA = ['rampa', 'banheiro', 'sinalizacao', 'atendimento']
+
+
+def review_rows(establishments, authors, seed: int = 20):
+    """Uma avaliação de cada autor em cada estabelecimento, com `created_at` crescentes."""
+    rng = random.Random(seed)
+    started_at = datetime(2024, 1, 1)
+    rows = []
+    for establishment in establishments:
+        for index, author in enumerate(authors):
+            rows.append({
+                'establishment_id': establishment['id'],
+                'user_id': author['id'],
+                'rating': rng.randint(1, 5),
+                'comment': rng.choice(['Ótimo acesso', 'Sem rampa', 'Banheiro adaptado', None]),
+                'criteria_json': {criterion: rng.randint(1, 5) for criterion in CRITERIA},
+                'sentiment_score': round(rng.uniform(-1, 1), 2),
+                'created_at': started_at + timedelta(seconds=index),
+            })
+    return rows
+
+
+async def test_generate_from_100k_reviews(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    owner, *authors = user_rows(REVIEWS_PER_ESTABLISHMENT + 1)
+    establishments = establishment_rows(ESTABLISHMENTS, owner['id'])
+    async with session_factory() as db:
+        await insert_rows(db, User, [owner, *authors])
+        await insert_rows(db, Establishment, establishments)
+        await insert_rows(db, Review, review_rows(establishments, authors))
+        await db.execute(text('ANALYZE reviews'))
+
+    engine = SuggestionEngine(session_factory, settle_seconds=0)
+    first = await engine.run()
+    second = await engine.run()
+
+    async with session_factory() as db:
+        suggestions = await db.scalar(select(func.count()).select_from(Suggestion))
+
+    for label, report in (('generate', first), ('re-run', second)):
+        print(
+            f'\n{label}: {report.suggestions} suggestions from {report.reviews} reviews '
+            f'in {report.elapsed_seconds:.2f}s ({report.reviews_per_second:.0f} reviews/s)'
+        )
+    total = ESTABLISHMENTS * REVIEWS_PER_ESTABLISHMENT
+    assert (first.reviews, first.failed) == (total, 0)
+    assert suggestions == first.suggestions
+    # Sem avaliações novas, a reexecução não lê as avaliações já usadas
+    assert (second.establishments, second.suggestions) == (0, 0)
+    assert second.elapsed_seconds < first.elapsed_seconds
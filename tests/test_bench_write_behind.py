@@ -0,0 +1,33 @@
+"""
+Benchmark: histórico de buscas gravado com INSERT + COMMIT por requisição e com o buffer write-behind.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.services.telemetry import benchmark_search_history
+from tests.conftest import seed_establishment
+
+pytestmark = [pytest.mark.anyio, pytest.mark.benchmark]
+
+EVENTS = 10_000
+CONCURRENCY = 50
+
+
+async def test_write_behind_versus_per_request_commits(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        user_id = (await seed_establishment(db)).owner_id
+
+    results = await benchmark_search_history(user_id, EVENTS, CONCURRENCY, session_factory)
+
+    for mode, result in results.items():
+        print(
+            f'\n{mode}: {result["events"]} events in {result["seconds"]:.2f}s '
+            f'({result["events_per_second"]:.0f} events/s), '
+            f'request latency p50 {result["p50_ms"]:.3f} ms, p99 {result["p99_ms"]:.3f} ms'
+        )
+    per_request, write_behind = results['per_request'], results['write_behind']
+    assert per_request['events'] == write_behind['events'] == EVENTS
+    assert write_behind['events_per_second'] > per_request['events_per_second']
+    assert write_behind['p50_ms'] < per_request['p50_ms']
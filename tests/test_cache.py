@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from inclui_aqui_server.core.cache import LRUCache, ReadThroughCache
+
+pytestmark = pytest.mark.anyio
+
+
+class GatedLoader:
+    """Loader que só termina quando o teste libera `gate`; conta as cargas."""
+
+    def __init__(self, value):
+        self.value = value
+        self.gate = asyncio.Event()
+        self.started = asyncio.Event()
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await self.gate.wait()
+        return self.value
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = ReadThroughCache(LRUCache())
+    loader = GatedLoader({'id': 1})
+
+    gets = [asyncio.create_task(cache.get_or_load('user:1', loader)) for _ in range(10)]
+    await loader.started.wait()
+    await asyncio.sleep(0)
+    loader.gate.set()
+
+    assert await asyncio.gather(*gets) == [{'id': 1}] * 10
+    assert loader.calls == 1
+    assert cache.coalesced == 9
+    assert await cache.peek('user:1') == {'id': 1}
+
+
+async def test_invalidate_during_a_load_does_not_store_the_loaded_value():
+    cache = ReadThroughCache(LRUCache())
+    loader = GatedLoader({'id': 1, 'points': 0})
+
+    get = asyncio.create_task(cache.get_or_load('user:1', loader))
+    await loader.started.wait()
+    await cache.invalidate('user:1')
+    loader.gate.set()
+
+    # Quem já esperava recebe o valor lido, mas ele não fica no cache
+    assert await get == {'id': 1, 'points': 0}
+    assert await cache.peek('user:1') is None
+
+
+async def test_refresh_during_a_load_keeps_the_written_value():
+    cache = ReadThroughCache(LRUCache())
+    loader = GatedLoader({'id': 1, 'points': 0})
+
+    get = asyncio.create_task(cache.get_or_load('user:1', loader))
+    await loader.started.wait()
+    await cache.refresh('user:1', {'id': 1, 'points': 10})
+    loader.gate.set()
+    await get
+
+    assert await cache.peek('user:1') == {'id': 1, 'points': 10}
+
+
+async def test_failed_load_is_raised_to_every_waiter_and_not_cached():
+    cache = ReadThroughCache(LRUCache())
+    gate = asyncio.Event()
+
+    async def failing_loader():
+        await gate.wait()
+        raise RuntimeError('database unavailable')
+
+    gets = [asyncio.create_task(cache.get_or_load('user:1', failing_loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*gets, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await cache.peek('user:1') is None
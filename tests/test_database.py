@@ -0,0 +1,154 @@
+import time
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.cache import LRUCache, ReadThroughCache
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.db import database
+from inclui_aqui_server.db.database import (
+    PRIMARY_PIN_COOKIE,
+    AsyncSessionLocal,
+    LazySession,
+    create_engine_from_settings,
+    get_pool_stats,
+    get_write_session,
+    primary_pin_middleware,
+    table_registry,
+)
+from inclui_aqui_server.db.models import User, UserRole
+from inclui_aqui_server.services.user import UserService
+
+pytestmark = pytest.mark.anyio
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.middleware('http')(primary_pin_middleware)
+
+    @app.post('/write')
+    async def write(db=Depends(get_write_session)):
+        await db.commit()
+        # Resposta própria: a `Response` injetada pelo FastAPI seria descartada
+        return JSONResponse({'ok': True})
+
+    @app.get('/read')
+    async def read(db=Depends(get_write_session)):
+        return JSONResponse({'ok': True})
+
+    return app
+
+
+async def test_commit_pins_the_client_even_with_a_custom_response():
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        written = await client.post('/write')
+        read = await client.get('/read')
+
+    assert PRIMARY_PIN_COOKIE in written.cookies
+    assert 'set-cookie' not in read.headers
+
+
+def _request_with_pin(value: str) -> Request:
+    cookie = f'{PRIMARY_PIN_COOKIE}={value}'.encode()
+    return Request({'type': 'http', 'headers': [(b'cookie', cookie)]})
+
+
+@pytest.mark.parametrize(
+    ('value', 'pinned'),
+    [
+        (1.0, True),
+        (-1.0, False),
+        # Prazos que o servidor nunca emitiria: além da janela, infinitos ou inválidos
+        (3600.0, False),
+        ('inf', False),
+        ('nan', False),
+        ('soon', False),
+    ],
+)
+def test_pin_cookie_is_honoured_only_within_the_window(monkeypatch, value, pinned):
+    replica = object()
+    monkeypatch.setattr(settings, 'READ_YOUR_WRITES_SECONDS', 5.0)
+    monkeypatch.setattr(database.replica_router, 'pick', lambda: replica)
+    if isinstance(value, float):
+        value = str(time.time() + value)
+
+    chosen = database._read_sessionmaker(_request_with_pin(value))
+
+    assert chosen is (AsyncSessionLocal if pinned else replica)
+
+
+@pytest.fixture
+async def small_pool_engine(monkeypatch, tmp_path):
+    """Um motor com pool instrumentado de uma única conexão e timeout curto, com as tabelas."""
+    pytest.importorskip('aiosqlite')
+    monkeypatch.setattr(settings, 'DB_POOL_SIZE', 1)
+    monkeypatch.setattr(settings, 'DB_MAX_OVERFLOW', 0)
+    monkeypatch.setattr(settings, 'DB_POOL_TIMEOUT', 0.05)
+    engine = create_engine_from_settings(f'sqlite+aiosqlite:///{tmp_path / "pool.db"}', name='test')
+    async with engine.begin() as conn:
+        await conn.run_sync(table_registry.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def test_pool_stats_count_checkouts_waits_and_timeouts(small_pool_engine):
+    acquisitions = get_pool_stats(small_pool_engine)['acquisitions']
+    async with small_pool_engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+        busy = get_pool_stats(small_pool_engine)
+        with pytest.raises(exc.TimeoutError):
+            async with small_pool_engine.connect():
+                pass
+    idle = get_pool_stats(small_pool_engine)
+
+    assert (busy['checked_out'], busy['acquisitions'] - acquisitions, busy['timeouts']) == (1, 1, 0)
+    assert (idle['checked_out'], idle['checked_in']) == (0, 1)
+    assert (idle['acquisitions'] - acquisitions, idle['timeouts']) == (2, 1)
+    assert idle['max_wait_ms'] >= 50
+
+
+async def test_pool_metrics_survive_dispose(small_pool_engine):
+    acquisitions = get_pool_stats(small_pool_engine)['acquisitions']
+    async with small_pool_engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+
+    await small_pool_engine.dispose()
+    async with small_pool_engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+
+    assert get_pool_stats(small_pool_engine)['acquisitions'] - acquisitions == 2
+
+
+async def test_unused_lazy_session_never_checks_out_a_connection(small_pool_engine):
+    acquisitions = get_pool_stats(small_pool_engine)['acquisitions']
+    session = LazySession(async_sessionmaker(small_pool_engine))
+
+    await session.close()
+
+    assert not session.is_started
+    assert get_pool_stats(small_pool_engine)['acquisitions'] == acquisitions
+
+
+async def test_get_user_returns_the_read_connection_before_the_request_ends(small_pool_engine):
+    session_factory = async_sessionmaker(small_pool_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        user = User(username='ana', email='ana@example.com', hashed_password='x', role=UserRole.client)
+        db.add(user)
+        await db.commit()
+    acquisitions = get_pool_stats(small_pool_engine)['acquisitions']
+
+    write_db, read_db = LazySession(session_factory), LazySession(session_factory)
+    service = UserService(write_db, cache=ReadThroughCache(LRUCache()), read_db=read_db)
+    found = await service.get_user(user.id)
+    # As sessões ainda não foram fechadas pela dependência, mas a conexão já voltou ao pool
+    stats = get_pool_stats(small_pool_engine)
+
+    assert found.username == 'ana'
+    assert not write_db.is_started
+    assert (stats['checked_out'], stats['acquisitions'] - acquisitions) == (0, 1)
+    await read_db.close()
@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import establishment_crud
+from tests.conftest import seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_writes_return_the_rating_summary(db_engine):
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, reviews=[3, 5], is_approved=False)
+
+    async with session_factory() as db:
+        approved = await establishment_crud.set_approval(
+            db, establishment_id=establishment.id, is_approved=True
+        )
+    async with session_factory() as db:
+        moved, _ = await establishment_crud.update_location(
+            db, establishment_id=establishment.id, latitude=-23.56, longitude=-46.64
+        )
+    async with session_factory() as db:
+        described = await establishment_crud.update_accessibility(
+            db, establishment_id=establishment.id, features={'rampa': True}, mask=1
+        )
+
+    for written in (approved, moved, described):
+        assert (written.review_count, written.average_rating) == (2, 4.0)
+
+
+async def test_radius_search_crosses_the_antimeridian(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        east = await seed_establishment(db)
+        west = await seed_establishment(db)
+    for establishment, longitude in ((east, 179.999), (west, -179.999)):
+        async with session_factory() as db:
+            await establishment_crud.update_location(
+                db, establishment_id=establishment.id, latitude=-17.0, longitude=longitude
+            )
+
+    async with session_factory() as db:
+        rows, _ = await establishment_crud.get_within_radius(
+            db, latitude=-17.0, longitude=179.9995, radius_m=1000
+        )
+
+    assert {establishment.id for establishment, _ in rows} == {east.id, west.id}
+    assert all(distance < 200 for _, distance in rows)
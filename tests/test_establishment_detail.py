@@ -0,0 +1,81 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.api.dependencies import get_establishment_service
+from inclui_aqui_server.app import app
+from inclui_aqui_server.crud import review_crud
+from inclui_aqui_server.db.models import Comment
+from inclui_aqui_server.services.establishment import EstablishmentService
+from tests.conftest import count_statements, seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def client(db_engine):
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+
+    async def establishment_service():
+        async with session_factory() as db:
+            yield EstablishmentService(db)
+
+    app.dependency_overrides[get_establishment_service] = establishment_service
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        yield client
+    app.dependency_overrides.pop(get_establishment_service)
+
+
+async def test_current_etag_is_answered_by_the_version_probe(db_engine, client):
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, reviews=[4, 5])
+    url = f'/establishments/{establishment.id}'
+
+    first = await client.get(url)
+    etag = first.headers['etag']
+    with count_statements(db_engine) as statements:
+        cached = await client.get(url, headers={'If-None-Match': etag})
+
+    assert (first.status_code, cached.status_code) == (200, 304)
+    assert len(statements) == 1
+
+    # Um comentário muda o detalhe (comment_count) sem alterar o estabelecimento
+    async with session_factory() as db:
+        review = (await review_crud.get_recent_by_establishment(db, establishment.id, limit=1))[0]
+        db.add(Comment(review_id=review.id, user_id=review.user_id, content='Concordo'))
+        await db.commit()
+    changed = await client.get(url, headers={'If-None-Match': etag})
+
+    assert changed.status_code == 200
+    assert changed.headers['etag'] != etag
+    assert sum(item['comment_count'] for item in changed.json()['data']['reviews']) == 1
+
+
+# UPDATE ... FROM (VALUES ...) das notas só existe no Postgres
+async def test_scoring_a_review_changes_the_etag(postgres_engine, client):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, reviews=[4, 5])
+    url = f'/establishments/{establishment.id}'
+    etag = (await client.get(url)).headers['etag']
+
+    async with session_factory() as db:
+        claimed = await review_crud.claim_unscored(db, limit=1)
+        await review_crud.update_sentiment_scores(db, [(claimed[0].id, 0.0)])
+        await db.commit()
+    changed = await client.get(url, headers={'If-None-Match': etag})
+
+    assert changed.status_code == 200
+    assert changed.headers['etag'] != etag
+    scores = [review['sentiment_score'] for review in changed.json()['data']['reviews']]
+    assert sum(score is not None for score in scores) == 1
+
+
+async def test_unknown_establishment_is_not_found(client):
+    response = await client.get(
+        '/establishments/00000000-0000-0000-0000-000000000000', headers={'If-None-Match': '*'}
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,115 @@
+import asyncio
+import csv
+import io
+import json
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.accessibility import AccessibilityEncoder
+from inclui_aqui_server.db.schemas import EstablishmentImportReport
+from inclui_aqui_server.services.establishment_import import EstablishmentImporter, iter_records
+from tests.conftest import seed_establishment
+
+FIELDS = ['google_place_id', 'name', 'address', 'latitude', 'longitude']
+
+
+def _csv(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(FIELDS)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _row(place_id: str, name: str = 'Café Central'):
+    return [place_id, name, 'Rua Augusta, 100', '-23.55', '-46.63']
+
+
+def _read(stream, fmt='csv', chunk_size=100):
+    importer = EstablishmentImporter(None, owner_id=uuid.uuid4(), chunk_size=chunk_size)
+    report = EstablishmentImportReport()
+    chunk = importer._read_chunk(iter_records(stream, fmt), AccessibilityEncoder({}), report)
+    return chunk, report
+
+
+def test_malformed_csv_line_is_rejected_and_reading_continues():
+    huge = 'x' * (csv.field_size_limit() + 1)
+    chunk, report = _read(io.StringIO(_csv([_row('a'), _row('b', huge), _row('c')])))
+
+    assert [row['google_place_id'] for row in chunk] == ['a', 'c']
+    assert (report.total_rows, report.rejected, report.errors[0].line) == (3, 1, 3)
+    assert report.stopped_at_line is None
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'ndjson'])
+def test_undecodable_text_stops_with_a_partial_report(fmt):
+    if fmt == 'csv':
+        head = _csv([_row(f'p{index}') for index in range(2000)])
+    else:
+        head = ''.join(
+            json.dumps(dict(zip(FIELDS, _row(f'p{index}')))) + '\n' for index in range(2000)
+        )
+    # O TextIOWrapper decodifica em blocos: as linhas do bloco com o byte inválido também se perdem
+    stream = io.TextIOWrapper(io.BytesIO(head.encode() + b'\xff\n'), encoding='utf-8')
+    importer = EstablishmentImporter(None, owner_id=uuid.uuid4(), chunk_size=500)
+    report = EstablishmentImportReport()
+    records = iter_records(stream, fmt)
+    read = []
+    while (chunk := importer._read_chunk(records, AccessibilityEncoder({}), report)) is not None:
+        read.extend(chunk)
+
+    assert 0 < len(read) < 2000
+    assert report.rejected == 1
+    assert report.stopped_at_line == report.errors[0].line
+    assert report.stopped_at_line == len(read) + (2 if fmt == 'csv' else 1)
+
+
+def test_duplicates_in_a_chunk_are_merged():
+    chunk, report = _read(io.StringIO(_csv([
+        _row('a'), _row('a'), _row('b'), _row('b', 'Café Novo'),
+    ])))
+
+    assert [(row['google_place_id'], row['name']) for row in chunk] == [
+        ('a', 'Café Central'), ('b', 'Café Novo'),
+    ]
+    assert (report.unchanged, report.updated) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_import_reports_the_rows_before_unreadable_text(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        owner_id = (await seed_establishment(db)).owner_id
+    text = _csv([_row(f'p{index}') for index in range(2000)])
+    stream = io.TextIOWrapper(io.BytesIO(text.encode() + b'\xff\n'), encoding='utf-8')
+
+    async with session_factory() as db:
+        report = await EstablishmentImporter(db, owner_id=owner_id, chunk_size=500).run(
+            stream, 'csv'
+        )
+
+    assert 0 < report.inserted < 2000
+    assert report.stopped_at_line == report.inserted + 2
+
+
+@pytest.mark.anyio
+async def test_concurrent_imports_of_the_same_places_do_not_deadlock(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        owner_id = (await seed_establishment(db)).owner_id
+    rows = [_row(f'p{index:04}') for index in range(2000)]
+
+    async def run_import(ordered_rows):
+        async with session_factory() as db:
+            return await EstablishmentImporter(db, owner_id=owner_id, chunk_size=2000).run(
+                io.StringIO(_csv(ordered_rows)), 'csv'
+            )
+
+    # Os mesmos lugares em ordens opostas: sem uma ordem comum de bloqueio, as
+    # duas transações esperariam uma pela outra
+    reports = await asyncio.gather(run_import(rows), run_import(rows[::-1]))
+
+    assert sorted(report.inserted for report in reports) == [0, 2000]
+    assert all(report.rejected == 0 for report in reports)
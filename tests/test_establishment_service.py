@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.services.establishment import EstablishmentService
+from tests.conftest import count_statements, seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_detail_statement_count_does_not_grow_with_reviews(db_engine):
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        one = await seed_establishment(db, reviews=[5])
+        many = await seed_establishment(db, reviews=[1, 2, 3, 4, 5] * 4)
+
+    counts = {}
+    for establishment, expected_reviews in ((one, 1), (many, 20)):
+        async with session_factory() as db:
+            with count_statements(db_engine) as statements:
+                detail = await EstablishmentService(db).get_detail(establishment.id)
+        assert len(detail.reviews) == expected_reviews
+        assert len({review.user.id for review in detail.reviews}) == expected_reviews
+        counts[expected_reviews] = len(statements)
+
+    assert counts[1] == counts[20] == 5
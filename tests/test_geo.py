@@ -0,0 +1,29 @@
+import pytest
+
+from inclui_aqui_server.core.geo import bounding_box
+
+
+def test_bounding_box_inside_the_map_has_one_longitude_range():
+    lat_min, lat_max, lon_ranges = bounding_box(-23.55, -46.63, 1000)
+
+    assert lat_min < -23.55 < lat_max
+    assert len(lon_ranges) == 1
+    assert lon_ranges[0][0] < -46.63 < lon_ranges[0][1]
+
+
+@pytest.mark.parametrize('longitude', [179.999, -179.999])
+def test_bounding_box_is_split_at_the_antimeridian(longitude):
+    _, _, lon_ranges = bounding_box(-17.0, longitude, 1000)
+
+    assert len(lon_ranges) == 2
+    (west, east), (other_west, other_east) = sorted(lon_ranges, key=lambda r: r[0], reverse=True)
+    assert (east, other_west) == (180.0, -180.0)
+    assert 179.98 < west < 180.0
+    assert -180.0 < other_east < -179.98
+
+
+def test_bounding_box_around_a_pole_covers_every_longitude():
+    lat_min, lat_max, lon_ranges = bounding_box(89.99, 10.0, 5000)
+
+    assert lat_max == 90.0
+    assert lon_ranges == [(-180.0, 180.0)]
@@ -0,0 +1,103 @@
+import json
+import math
+import random
+from collections import Counter
+
+from inclui_aqui_server.core.heavy_hitters import CountMinSketch, HeavyHitters
+
+HOUR = 3600.0
+
+
+def test_count_min_estimates_stay_within_the_error_bound():
+    rng = random.Random(23)
+    sketch = CountMinSketch(width=512, depth=4)
+    keys = [f'busca {index}' for index in range(5000)]
+    stream = rng.choices(keys, weights=[1 / (rank + 1) for rank in range(len(keys))], k=50_000)
+    exact = Counter()
+    for key in stream:
+        sketch.add(key)
+        exact[key] += 1
+
+    errors = [sketch.estimate(key) - exact[key] for key in keys]
+    bound = math.e * len(stream) / sketch.width
+
+    # Nunca subestima; passa de e * N / width com probabilidade de no máximo e^-depth
+    assert min(errors) >= 0
+    assert sum(error > bound for error in errors) <= len(keys) * math.exp(-sketch.depth)
+
+
+def test_updated_terms_keep_one_heap_entry_and_the_minimum_is_evicted():
+    hitters = HeavyHitters(capacity=3, sketch=CountMinSketch(width=1024))
+    for key, count in (('rampa', 5), ('banheiro', 2), ('elevador', 3)):
+        for _ in range(count):
+            hitters.add(key, 0.0)
+    for _ in range(100):
+        hitters.add('banheiro', 0.0)
+
+    assert len(hitters._heap) == len(hitters) == 3
+
+    # 'banheiro' já foi o menor, mas a entrada antiga do heap não pode causar sua remoção
+    for _ in range(4):
+        hitters.add('piso tátil', 0.0)
+
+    assert [key for key, _ in hitters.top(3)] == ['banheiro', 'rampa', 'piso tátil']
+    assert len(hitters._heap) == 3
+
+
+def test_a_term_below_the_minimum_does_not_enter():
+    hitters = HeavyHitters(capacity=2, sketch=CountMinSketch(width=1024))
+    for key in ('rampa', 'rampa', 'banheiro', 'banheiro', 'elevador'):
+        hitters.add(key, 0.0)
+
+    assert sorted(key for key, _ in hitters.top(5)) == ['banheiro', 'rampa']
+
+
+def test_zero_capacity_tracks_nothing():
+    hitters = HeavyHitters(capacity=0, sketch=CountMinSketch(width=64))
+
+    hitters.add('rampa', 0.0)
+
+    assert (len(hitters), hitters.top(5), hitters.events) == (0, [], 1)
+
+
+def test_scores_decay_by_half_per_half_life_and_survive_a_rebase():
+    hitters = HeavyHitters(half_life_seconds=HOUR, sketch=CountMinSketch(width=1024))
+    hitters.add('rampa', 0.0)
+    hitters.add('banheiro', HOUR)
+
+    assert dict(hitters.top(2)) == {'banheiro': 1.0, 'rampa': 0.5}
+
+    # Bem depois do limite do expoente: os pesos são reescalonados
+    hitters.add('rampa', 100 * HOUR)
+    hitters.add('rampa', 100 * HOUR)
+
+    top = dict(hitters.top(2))
+    assert top['rampa'] == 2.0
+    assert top['banheiro'] < 1e-20
+
+
+def test_complete_filters_by_prefix_in_score_order():
+    hitters = HeavyHitters(sketch=CountMinSketch(width=1024))
+    for key, count in (('rampa', 3), ('rampa de acesso', 5), ('rota', 9), ('banheiro', 1)):
+        for _ in range(count):
+            hitters.add(key, 0.0)
+
+    assert [key for key, _ in hitters.complete('ram', 5)] == ['rampa de acesso', 'rampa']
+    assert hitters.complete('x', 5) == []
+
+
+def test_serialized_state_restores_the_same_rankings():
+    rng = random.Random(5)
+    hitters = HeavyHitters(capacity=50, half_life_seconds=HOUR, sketch=CountMinSketch(width=256))
+    for index in range(2000):
+        hitters.add(f'busca {rng.randint(0, 200)}', index * 5.0)
+
+    restored = HeavyHitters.from_dict(json.loads(json.dumps(hitters.to_dict())))
+
+    assert restored.top(10) == hitters.top(10)
+    assert restored.complete('busca 1', 10) == hitters.complete('busca 1', 10)
+    assert restored.sketch.estimate('busca 7') == hitters.sketch.estimate('busca 7')
+    # O estado restaurado continua recebendo eventos normalmente
+    for hitters_copy in (hitters, restored):
+        hitters_copy.add('nova busca', 2000 * 5.0, count=1000)
+    assert restored.top(3) == hitters.top(3)
@@ -0,0 +1,176 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.exception import (
+    BadRequestError,
+    PayloadTooLargeError,
+    UnsupportedMediaTypeError,
+)
+from inclui_aqui_server.core.storage import LocalObjectStore
+from inclui_aqui_server.services import image as image_module
+from inclui_aqui_server.services.image import (
+    ImageService,
+    ThumbnailPipeline,
+    sniff_image_type,
+)
+from tests.conftest import seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 24
+JPEG = b'\xff\xd8\xff\xe0' + b'\x00' * 24
+
+
+class RecordingPipeline(ThumbnailPipeline):
+    """Pipeline que só registra as imagens agendadas."""
+
+    def __init__(self):
+        super().__init__(sizes=[64])
+        self.submitted = []
+
+    def submit(self, key, content_hash):
+        self.submitted.append((key, content_hash))
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _files(root):
+    return sorted(
+        os.path.relpath(os.path.join(directory, name), root)
+        for directory, _, names in os.walk(root)
+        for name in names
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalObjectStore(str(tmp_path), '/media')
+
+
+@pytest.mark.parametrize(
+    ('head', 'content_type'),
+    [
+        (JPEG[:12], 'image/jpeg'),
+        (PNG[:12], 'image/png'),
+        (b'RIFF\x10\x00\x00\x00WEBP', 'image/webp'),
+        (b'GIF89a\x00\x00\x00\x00\x00\x00', None),
+        (b'RIFF\x10\x00\x00\x00WAVE', None),
+        (b'\xff\xd8', None),
+    ],
+)
+def test_sniff_image_type_reads_the_signature(head, content_type):
+    assert sniff_image_type(head) == content_type
+
+
+@pytest.mark.parametrize(
+    ('data', 'content_type', 'error'),
+    [
+        (PNG, 'image/gif', UnsupportedMediaTypeError),
+        # O Content-Type declarado precisa bater com o conteúdo
+        (PNG, 'image/jpeg', UnsupportedMediaTypeError),
+        (PNG[:5], 'image/png', UnsupportedMediaTypeError),
+        (b'', 'image/png', BadRequestError),
+    ],
+)
+async def test_invalid_uploads_are_rejected_without_leaving_files(
+    tmp_path, store, data, content_type, error
+):
+    pipeline = RecordingPipeline()
+    service = ImageService(db=None, store=store, pipeline=pipeline)
+
+    with pytest.raises(error):
+        await service._store(_chunks(data), content_type)
+
+    assert _files(tmp_path) == []
+    assert pipeline.submitted == []
+
+
+async def test_upload_stops_once_the_size_limit_is_exceeded(tmp_path, store, monkeypatch):
+    monkeypatch.setattr(settings, 'IMAGE_UPLOAD_MAX_BYTES', 20)
+    read = []
+
+    async def chunks():
+        for chunk in (PNG[:12], PNG[12:24], PNG[24:], b'\x00' * 1000):
+            read.append(chunk)
+            yield chunk
+
+    service = ImageService(db=None, store=store, pipeline=RecordingPipeline())
+    with pytest.raises(PayloadTooLargeError):
+        await service._store(chunks(), 'image/png')
+
+    # O corpo para de ser lido no bloco que passa do limite
+    assert len(read) == 2
+    assert _files(tmp_path) == []
+
+
+async def test_repeated_content_is_stored_once_and_scheduled_by_hash(
+    postgres_engine, tmp_path, store
+):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db)
+    pipeline = RecordingPipeline()
+
+    results = []
+    for chunk_size in (7, 1000):
+        async with session_factory() as db:
+            service = ImageService(db, store=store, pipeline=pipeline)
+            results.append(await service.upload_establishment_image(
+                establishment.id, _chunks(PNG, chunk_size), 'image/png; charset=binary'
+            ))
+
+    first, second = results
+    assert (first.deduplicated, second.deduplicated) == (False, True)
+    assert (second.id, second.url) == (first.id, first.url)
+    key = f'images/{first.content_hash[:2]}/{first.content_hash}.png'
+    assert _files(tmp_path) == [key]
+    assert pipeline.submitted == [(key, first.content_hash)] * 2
+
+
+async def test_existing_thumbnails_are_not_rendered_again(store, monkeypatch):
+    monkeypatch.setattr(image_module, 'PILLOW_AVAILABLE', True)
+    pipeline = ThumbnailPipeline(store_factory=lambda: store, sizes=[64, 128])
+    for size in pipeline.sizes:
+        await store.write(pipeline.thumbnail_key('ab' * 32, size), _chunks(JPEG))
+
+    pipeline.submit('images/ab/missing.png', 'ab' * 32)
+    while pipeline.get_stats()['pending']:
+        await asyncio.sleep(0)
+
+    assert (pipeline.completed, pipeline.skipped, pipeline.failed) == (0, 1, 0)
+
+
+async def test_without_pillow_thumbnails_are_skipped(store, monkeypatch):
+    monkeypatch.setattr(image_module, 'PILLOW_AVAILABLE', False)
+    pipeline = ThumbnailPipeline(store_factory=lambda: store, sizes=[64])
+
+    pipeline.submit('images/ab/image.png', 'ab' * 32)
+
+    assert pipeline.get_stats()['pending'] == 0
+    assert pipeline.skipped == 1
+    assert pipeline.thumbnail_urls(store, 'ab' * 32) == {}
+
+
+async def test_thumbnails_are_rendered_from_the_stored_image(tmp_path, store):
+    pil_image = pytest.importorskip('PIL.Image')
+    source = tmp_path / 'source.png'
+    pil_image.new('RGB', (400, 200), 'red').save(source)
+    await store.write('images/source.png', _chunks(source.read_bytes(), 4096))
+    pipeline = ThumbnailPipeline(store_factory=lambda: store, sizes=[64, 128], max_workers=1)
+
+    pipeline.submit('images/source.png', 'cd' * 32)
+    while pipeline.get_stats()['pending']:
+        await asyncio.sleep(0.01)
+    await pipeline.shutdown()
+
+    assert pipeline.completed == 1
+    for size in pipeline.sizes:
+        with pil_image.open(tmp_path / pipeline.thumbnail_key('cd' * 32, size)) as thumbnail:
+            assert max(thumbnail.size) == size
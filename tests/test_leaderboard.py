@@ -0,0 +1,141 @@
+import random
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.leaderboard import FenwickTree, Leaderboard
+from inclui_aqui_server.crud import user_crud
+from inclui_aqui_server.db.models import User
+from inclui_aqui_server.db.schemas import UserCreate, UserUpdate
+from inclui_aqui_server.services.leaderboard import LeaderboardService, PointsLeaderboard
+
+pytestmark = pytest.mark.anyio
+
+
+def ranking(points_by_user):
+    """O ranking esperado: mais pontos primeiro, empates por id, posição compartilhada."""
+    ordered = sorted(points_by_user.items(), key=lambda item: (-item[1], item[0]))
+    return [
+        (1 + sum(other > points for other in points_by_user.values()), user_id, points)
+        for user_id, points in ordered
+    ]
+
+
+def assert_matches(board, points_by_user):
+    expected = ranking(points_by_user)
+    assert board.top(len(expected) + 5) == expected
+    assert len(board) == len(expected)
+    for position, entry in enumerate(expected):
+        user_id = entry[1]
+        assert board.get(user_id) == entry
+        assert board.around(user_id, 2) == expected[max(position - 2, 0):position + 3]
+
+
+def test_fenwick_tree_prefix_sums_and_find():
+    counts = [3, 0, 2, 5, 0, 1]
+    tree = FenwickTree(counts)
+    tree.add(1, 4)
+    counts[1] += 4
+
+    assert [tree.prefix_sum(index) for index in range(len(counts))] == [
+        sum(counts[:index + 1]) for index in range(len(counts))
+    ]
+    # Menor índice cuja soma de prefixo alcança k
+    assert [tree.find(k) for k in (1, 3, 4, 7, 9, 10, 15)] == [0, 0, 1, 1, 2, 3, 5]
+
+
+@pytest.mark.parametrize('max_buckets', [1 << 16, 8])
+def test_random_updates_keep_ranks_in_sync(max_buckets):
+    rng = random.Random(max_buckets)
+    users = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(60)]
+    points_by_user = {user_id: rng.randint(-5, 40) for user_id in users[:40]}
+    board = Leaderboard(points_by_user, max_buckets=max_buckets)
+    assert_matches(board, points_by_user)
+
+    for _ in range(300):
+        user_id = rng.choice(users)
+        if rng.random() < 0.2:
+            board.remove(user_id)
+            points_by_user.pop(user_id, None)
+        else:
+            # Pontuações altas alargam os baldes quando `max_buckets` é pequeno
+            points = rng.choice([rng.randint(-5, 40), rng.randint(0, 5000)])
+            board.set(user_id, points)
+            points_by_user[user_id] = points
+
+    assert_matches(board, points_by_user)
+
+
+def test_ties_share_a_rank_and_are_ordered_by_id():
+    first, second, third = (uuid.UUID(int=value) for value in (1, 2, 3))
+    board = Leaderboard({third: 10, first: 10, second: 20})
+
+    assert board.top(3) == [(1, second, 20), (2, first, 10), (2, third, 10)]
+    assert board.top(2) == [(1, second, 20), (2, first, 10)]
+    assert board.around(third, 1) == [(2, first, 10), (2, third, 10)]
+
+
+def test_unknown_users_and_empty_boards():
+    board = Leaderboard()
+    unknown = uuid.uuid4()
+
+    assert (board.top(5), board.get(unknown), board.around(unknown, 3)) == ([], None, [])
+    board.remove(unknown)
+    assert len(board) == 0
+
+
+async def _create_user(db, points: int) -> User:
+    name = f'player-{uuid.uuid4().hex[:12]}'
+    user = await user_crud.create(
+        db,
+        user_in=UserCreate(username=name, email=f'{name}@example.com', password='password1', role='client'),
+        hashed_password='hash',
+    )
+    return await user_crud.update(db, user_id=user.id, obj_in=UserUpdate(points=points))
+
+
+async def _database_points(session_factory):
+    async with session_factory() as db:
+        rows = await db.execute(select(User.id, User.points).order_by(User.points.desc(), User.id))
+        return {row.id: row.points for row in rows}
+
+
+# O índice (updated_at, id) e o horário do banco usados na sincronização exigem o Postgres
+async def test_points_leaderboard_follows_writes_from_other_processes(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    rng = random.Random(25)
+    async with session_factory() as db:
+        users = [await _create_user(db, rng.randint(0, 50)) for _ in range(20)]
+    # Lotes pequenos: a carga e a leitura das alterações percorrem várias páginas
+    leaderboard = PointsLeaderboard(session_factory, settle_seconds=0, batch_size=7)
+
+    assert await leaderboard.load() == 20
+    assert leaderboard.board.top(100) == ranking(await _database_points(session_factory))
+
+    # Escritas de "outro processo": nada passa por record/forget
+    async with session_factory() as db:
+        for user in users[:10]:
+            await user_crud.update(db, user_id=user.id, obj_in=UserUpdate(points=rng.randint(0, 50)))
+        newcomer = await _create_user(db, 999)
+        await user_crud.remove(db, user_id=users[-1].id)
+
+    assert await leaderboard.poll_once() == 11
+    assert leaderboard.board.get(newcomer.id) == (1, newcomer.id, 999)
+    # A leitura das alterações não enxerga exclusões
+    assert users[-1].id in leaderboard.board
+    assert await leaderboard.poll_once() == 0
+
+    async with session_factory() as db:
+        entries = await LeaderboardService(db, leaderboard=leaderboard).get_top(100)
+    # O serviço descarta o usuário excluído ao montar a resposta
+    assert [(entry.rank, entry.user_id, entry.points) for entry in entries] == ranking(
+        await _database_points(session_factory)
+    )
+
+    leaderboard.board.set(users[-1].id, 10)
+    await leaderboard.load()
+    # A recarga completa também remove quem foi excluído em outro processo
+    assert users[-1].id not in leaderboard.board
+    assert leaderboard.board.top(100) == ranking(await _database_points(session_factory))
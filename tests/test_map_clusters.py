@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.core.config import settings
+from inclui_aqui_server.core.geo import mercator_cell
+from inclui_aqui_server.crud import establishment_crud, map_cell_crud
+from inclui_aqui_server.db.models import EstablishmentMapCell
+from inclui_aqui_server.services.establishment import EstablishmentService
+from tests.conftest import seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+
+async def _place(session_factory, latitude: float, longitude: float):
+    """Cria um estabelecimento na coordenada pedida e o aprova (o que o põe no mapa)."""
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, is_approved=False)
+    async with session_factory() as db:
+        await establishment_crud.update_location(
+            db, establishment_id=establishment.id, latitude=latitude, longitude=longitude
+        )
+    async with session_factory() as db:
+        await establishment_crud.set_approval(
+            db, establishment_id=establishment.id, is_approved=True
+        )
+    return establishment
+
+
+async def _cells(session_factory):
+    async with session_factory() as db:
+        cells = await db.scalars(select(EstablishmentMapCell).filter(EstablishmentMapCell.count > 0))
+        return {
+            (cell.zoom, cell.cell_x, cell.cell_y): (
+                cell.count, round(cell.latitude_sum, 6), round(cell.longitude_sum, 6)
+            )
+            for cell in cells
+        }
+
+
+def _expected_cells(latitude: float, longitude: float):
+    return {
+        (zoom, *mercator_cell(latitude, longitude, zoom + settings.MAP_CELL_BITS))
+        for zoom in range(settings.MAP_MAX_CLUSTER_ZOOM + 1)
+    }
+
+
+async def test_cells_follow_approval_and_moves_at_every_zoom(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    establishment = await _place(session_factory, -23.55, -46.63)
+    assert set(await _cells(session_factory)) == _expected_cells(-23.55, -46.63)
+
+    async with session_factory() as db:
+        await establishment_crud.update_location(
+            db, establishment_id=establishment.id, latitude=-22.9, longitude=-43.2
+        )
+    moved = await _cells(session_factory)
+    assert set(moved) == _expected_cells(-22.9, -43.2)
+    assert all(count == 1 for count, _, _ in moved.values())
+
+    # A reconstrução completa chega às mesmas células que as atualizações incrementais
+    async with session_factory() as db:
+        await map_cell_crud.rebuild(db)
+        await db.commit()
+    assert await _cells(session_factory) == moved
+
+    async with session_factory() as db:
+        await establishment_crud.set_approval(
+            db, establishment_id=establishment.id, is_approved=False
+        )
+    assert await _cells(session_factory) == {}
+
+
+async def test_map_box_across_the_antimeridian_reads_both_sides(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    await _place(session_factory, -17.0, 179.9)
+    await _place(session_factory, -17.0, -179.9)
+    await _place(session_factory, -17.0, 170.0)
+
+    async with session_factory() as db:
+        service = EstablishmentService(db)
+        clusters = await service.get_map_clusters(-17.5, 179.5, -16.5, -179.5, zoom=8)
+        points = await service.get_map_clusters(
+            -17.1, 179.8, -16.9, -179.8, zoom=settings.MAP_MAX_CLUSTER_ZOOM + 1
+        )
+
+    assert sum(cluster.count for cluster in clusters.clusters) == 2
+    assert sorted(point.longitude for point in points.points) == [-179.9, 179.9]
+
+
+async def test_map_points_stop_at_the_configured_maximum(postgres_engine, monkeypatch):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    for longitude in (179.91, 179.92, -179.91, -179.92):
+        await _place(session_factory, -17.0, longitude)
+    monkeypatch.setattr(settings, 'MAP_MAX_POINTS', 3)
+
+    async with session_factory() as db:
+        points = await EstablishmentService(db).get_map_clusters(
+            -17.1, 179.9, -16.9, -179.9, zoom=settings.MAP_MAX_CLUSTER_ZOOM + 1
+        )
+
+    # O limite vale para a soma das duas metades do retângulo
+    assert len(points.points) == 3
@@ -0,0 +1,44 @@
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from inclui_aqui_server.app import app
+from inclui_aqui_server.core.exception import BadRequestError
+from inclui_aqui_server.crud.pagination import decode_cursor, encode_cursor
+from inclui_aqui_server.db.models import User
+
+KEYS = (User.created_at, User.id)
+
+
+def test_decode_cursor_round_trips_the_key_values():
+    values = [datetime(2025, 1, 2, 3, 4, 5), uuid.uuid4()]
+
+    assert decode_cursor(encode_cursor(values), KEYS) == values
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        ['2025-01-02T03:04:05', str(uuid.uuid4())],
+        [datetime(2025, 1, 2), 'not-a-uuid'],
+        [datetime(2025, 1, 2), 42],
+        [datetime(2025, 1, 2, tzinfo=timezone.utc), uuid.uuid4()],
+        [datetime(2025, 1, 2)],
+    ],
+)
+def test_decode_cursor_rejects_values_that_do_not_match_the_keys(values):
+    with pytest.raises(BadRequestError):
+        decode_cursor(encode_cursor(values), KEYS)
+
+
+@pytest.mark.anyio
+async def test_tampered_cursor_is_a_bad_request():
+    # Base64 válido, mas com um texto no lugar do UUID: rejeitado antes de chegar ao banco
+    cursor = encode_cursor([datetime(2025, 1, 2), 'not-a-uuid'])
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+        response = await client.get('/', params={'cursor': cursor})
+
+    assert response.status_code == 400
@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import review_crud
+from inclui_aqui_server.db.schemas import ReviewUpdate
+from inclui_aqui_server.services.review import ReviewService
+from tests.conftest import seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize('review_in', [ReviewUpdate(), ReviewUpdate(rating=None)])
+async def test_empty_update_returns_the_unchanged_review(db_engine, review_in):
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, reviews=[4])
+        review = (await review_crud.get_recent_by_establishment(db, establishment.id, limit=1))[0]
+
+    async with session_factory() as db:
+        updated = await ReviewService(db).update_review(review.id, review_in)
+
+    assert (updated.id, updated.rating, updated.comment) == (review.id, 4, 'Nota 4')
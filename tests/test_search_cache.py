@@ -0,0 +1,45 @@
+import pytest
+
+from inclui_aqui_server.crud import establishment_crud
+from inclui_aqui_server.db.database import LazySession
+from inclui_aqui_server.services.establishment import EstablishmentService
+from inclui_aqui_server.services.search_cache import SearchResultCache
+
+
+def _unused_session() -> LazySession:
+    def factory():
+        raise AssertionError('the search itself is replaced in this test')
+    return LazySession(factory)
+
+
+def test_invalidation_opens_a_primary_read_window(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr('inclui_aqui_server.services.search_cache.time.monotonic', lambda: clock[0])
+    cache = SearchResultCache(primary_read_seconds=5.0)
+    assert not cache.reads_from_primary()
+
+    cache.invalidate()
+    clock[0] += 4.9
+    assert cache.reads_from_primary()
+    clock[0] += 0.2
+    assert not cache.reads_from_primary()
+
+
+@pytest.mark.anyio
+async def test_misses_after_invalidation_read_from_the_primary(monkeypatch):
+    primary, replica = _unused_session(), _unused_session()
+    sessions = []
+
+    async def search(db, **kwargs):
+        sessions.append(db)
+        return []
+
+    monkeypatch.setattr(establishment_crud, 'search', search)
+    cache = SearchResultCache(primary_read_seconds=60.0)
+    service = EstablishmentService(primary, read_db=replica, search_cache=cache)
+
+    await service.search('café central')
+    cache.invalidate()
+    await service.search('café paulista')
+
+    assert sessions == [replica, primary]
@@ -0,0 +1,69 @@
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.cli import build_parser
+from inclui_aqui_server.crud import search_history_crud
+from inclui_aqui_server.crud.search_history import month_start, partition_name
+from inclui_aqui_server.db.models import User, UserSearchHistory
+from inclui_aqui_server.services.search_history import maintain_search_history_partitions
+from tests.benchmark import insert_rows, user_rows
+
+pytestmark = pytest.mark.anyio
+
+
+async def _partition_names(session_factory):
+    async with session_factory() as db:
+        return {partition.name for partition in await search_history_crud.list_partitions(db)}
+
+
+async def test_retention_drops_whole_expired_partitions(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    report = await maintain_search_history_partitions(
+        session_factory, today=date(2025, 1, 15), premake_months=2, retention_months=None
+    )
+    assert report.created == ['user_search_history_p202501', 'user_search_history_p202502',
+                              'user_search_history_p202503']
+
+    user = user_rows(1)[0]
+    async with session_factory() as db:
+        await insert_rows(db, User, [user])
+        for month in (1, 2, 3):
+            await db.execute(insert(UserSearchHistory).values(
+                id=uuid.uuid4(), user_id=user['id'], query=f'busca {month}',
+                timestamp=datetime(2025, month, 10),
+            ))
+        await db.commit()
+
+    # Em abril, com um mês completo de retenção, janeiro e fevereiro expiraram
+    arguments = dict(today=date(2025, 4, 10), premake_months=0, retention_months=1)
+    planned = await maintain_search_history_partitions(session_factory, dry_run=True, **arguments)
+    assert planned.dropped == ['user_search_history_p202501', 'user_search_history_p202502']
+    assert 'user_search_history_p202501' in await _partition_names(session_factory)
+
+    applied = await maintain_search_history_partitions(session_factory, **arguments)
+    repeated = await maintain_search_history_partitions(session_factory, **arguments)
+
+    async with session_factory() as db:
+        queries = (await db.scalars(select(UserSearchHistory.query))).all()
+    names = await _partition_names(session_factory)
+    assert (applied.dropped, applied.created) == (planned.dropped, ['user_search_history_p202504'])
+    assert applied.retained_since == date(2025, 3, 1)
+    assert (repeated.created, repeated.dropped) == ([], [])
+    assert queries == ['busca 3']
+    assert not names & set(planned.dropped)
+    assert {'user_search_history_p202503', 'user_search_history_p202504'} <= names
+
+
+async def test_cli_command_creates_the_current_partitions(postgres_engine, capsys):
+    args = build_parser().parse_args(
+        ['maintain-search-history', '--premake-months', '1', '--retention-months', '600']
+    )
+    await args.handler(args)
+
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    assert partition_name(month_start(date.today())) in await _partition_names(session_factory)
+    assert 'Dropped partitions older than' in capsys.readouterr().out
@@ -0,0 +1,66 @@
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from inclui_aqui_server.core import security
+from inclui_aqui_server.core.security import PasswordHandler
+
+pytestmark = pytest.mark.anyio
+
+
+class BrokenPool(Executor):
+    """Simula um pool de processos cujos workers morrem com tarefas em andamento."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def break_pool(self):
+        for future in self.futures:
+            future.set_exception(BrokenProcessPool('A worker died.'))
+
+
+async def test_concurrent_broken_pool_falls_back_to_a_single_thread_pool(monkeypatch):
+    created = []
+
+    class RecordingThreadPool(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(security, 'ThreadPoolExecutor', RecordingThreadPool)
+    handler = PasswordHandler(max_workers=2, max_concurrency=4)
+    broken = BrokenPool()
+    handler._executor = broken
+
+    calls = [asyncio.create_task(handler.hash_async('secret')) for _ in range(4)]
+    while len(broken.futures) < 4:
+        await asyncio.sleep(0)
+    broken.break_pool()
+    hashes = await asyncio.gather(*calls)
+
+    assert all(handler.verify_password('secret', hashed) for hashed in hashes)
+    # As chamadas que encontram o mesmo pool quebrado não substituem o pool de threads
+    assert created == [handler._executor]
+    assert handler.get_stats()['executor'] == 'thread'
+    assert handler.get_stats()['completed'] == 4
+    handler.shutdown()
+
+
+async def test_failed_calls_are_counted_separately():
+    handler = PasswordHandler(executor_kind='thread', max_workers=1)
+
+    with pytest.raises(ValueError):
+        await handler.verify_async('secret', 'not-a-bcrypt-hash')
+    await handler.hash_async('secret')
+
+    stats = handler.get_stats()
+    assert stats['completed'] == 1
+    assert stats['failed'] == 1
+    handler.shutdown()
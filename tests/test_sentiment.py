@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import establishment_crud, review_crud
+from inclui_aqui_server.db.models import Review
+from inclui_aqui_server.services.sentiment import SentimentWorker
+from tests.conftest import seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+
+class FixedModel:
+    """Modelo que dá a mesma nota a qualquer comentário."""
+
+    version = 'fixed'
+
+    def __init__(self, score: float):
+        self.score = score
+
+    def score_batch(self, texts):
+        return [self.score for _ in texts]
+
+
+async def _reviews(session_factory):
+    async with session_factory() as db:
+        rows = await db.execute(select(Review.id, Review.sentiment_score, Review.updated_at))
+        return {row.id: (row.sentiment_score, row.updated_at) for row in rows}
+
+
+# FOR UPDATE SKIP LOCKED e UPDATE ... FROM (VALUES ...) só existem no Postgres
+async def test_concurrent_claimers_get_disjoint_batches(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await seed_establishment(db, reviews=[1, 2, 3, 4, 5, 5])
+    before = await _reviews(session_factory)
+
+    # O primeiro lote segue bloqueado enquanto o segundo worker reserva o seu
+    async with session_factory() as first, session_factory() as second:
+        first_batch = await review_crud.claim_unscored(first, limit=4)
+        second_batch = await review_crud.claim_unscored(second, limit=4)
+        await review_crud.update_sentiment_scores(first, [(row.id, 0.5) for row in first_batch])
+        await review_crud.update_sentiment_scores(second, [(row.id, -0.25) for row in second_batch])
+        await first.commit()
+        await second.commit()
+
+    first_ids = {row.id for row in first_batch}
+    second_ids = {row.id for row in second_batch}
+    assert (len(first_ids), len(second_ids)) == (4, 2)
+    assert first_ids | second_ids == set(before)
+
+    after = await _reviews(session_factory)
+    assert {review_id: float(score) for review_id, (score, _) in after.items()} == {
+        **{review_id: 0.5 for review_id in first_ids},
+        **{review_id: -0.25 for review_id in second_ids},
+    }
+    # A nota não conta como edição da avaliação
+    assert {review_id: updated_at for review_id, (_, updated_at) in after.items()} == {
+        review_id: updated_at for review_id, (_, updated_at) in before.items()
+    }
+
+
+async def test_workers_score_every_review_once_and_change_the_detail_version(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, reviews=[4, 5, 3])
+        version = await establishment_crud.get_detail_version(db, establishment.id)
+
+    workers = [
+        SentimentWorker(session_factory, model=FixedModel(0.75), batch_size=2) for _ in range(2)
+    ]
+    while sum([await worker.run_once() for worker in workers]):
+        pass
+
+    async with session_factory() as db:
+        assert await review_crud.count_unscored(db) == 0
+        assert await establishment_crud.get_detail_version(db, establishment.id) != version
+    assert sum(worker.scored for worker in workers) == 3
+    assert {float(score) for score, _ in (await _reviews(session_factory)).values()} == {0.75}
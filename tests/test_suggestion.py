@@ -0,0 +1,113 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import review_crud, user_crud
+from inclui_aqui_server.db.models import Review, Suggestion
+from inclui_aqui_server.db.schemas import ReviewCreate, UserCreate
+from inclui_aqui_server.services.suggestion import SuggestionEngine
+from tests.conftest import seed_establishment
+
+pytestmark = pytest.mark.anyio
+
+
+def _engine(session_factory, **kwargs) -> SuggestionEngine:
+    options = {'batch_size': 2, 'min_new_reviews': 2, 'settle_seconds': 0, 'concurrency': 2}
+    return SuggestionEngine(session_factory, **{**options, **kwargs})
+
+
+async def _add_reviews(session_factory, establishment_id: uuid.UUID, count: int) -> None:
+    async with session_factory() as db:
+        for _ in range(count):
+            name = f'late-{uuid.uuid4().hex[:12]}'
+            user = await user_crud.create(
+                db,
+                user_in=UserCreate(
+                    username=name, email=f'{name}@example.com', password='password1', role='client'
+                ),
+                hashed_password='hash',
+            )
+            await review_crud.create(
+                db,
+                review_in=ReviewCreate(
+                    establishment_id=establishment_id, user_id=user.id, rating=2, comment='Sem rampa'
+                ),
+            )
+
+
+async def _sources(session_factory, establishment_id: uuid.UUID):
+    async with session_factory() as db:
+        suggestions = await db.scalars(
+            select(Suggestion)
+            .filter(Suggestion.establishment_id == establishment_id)
+            .order_by(Suggestion.generated_at)
+        )
+        return [suggestion.source_review_ids for suggestion in suggestions]
+
+
+async def _review_ids(session_factory, establishment_id: uuid.UUID):
+    async with session_factory() as db:
+        return list(await db.scalars(
+            select(Review.id)
+            .filter(Review.establishment_id == establishment_id)
+            .order_by(Review.created_at, Review.id)
+        ))
+
+
+# O gerador usa LATERAL, ANY(array) e locks consultivos: os testes exigem o Postgres
+async def test_watermark_advances_batch_by_batch(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, reviews=[5, 4, 3, 2, 1])
+
+    report = await _engine(session_factory).run()
+
+    reviews = await _review_ids(session_factory, establishment.id)
+    # A quinta avaliação não basta para uma sugestão e fica para a próxima execução
+    assert (report.establishments, report.suggestions, report.reviews) == (1, 2, 4)
+    assert await _sources(session_factory, establishment.id) == [reviews[0:2], reviews[2:4]]
+
+    await _add_reviews(session_factory, establishment.id, 1)
+    report = await _engine(session_factory).run()
+
+    reviews = await _review_ids(session_factory, establishment.id)
+    assert (report.suggestions, report.reviews) == (1, 2)
+    assert (await _sources(session_factory, establishment.id))[-1] == reviews[4:6]
+
+
+async def test_rerun_without_new_reviews_creates_nothing(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        establishment = await seed_establishment(db, reviews=[5, 4, 3, 2])
+    await _engine(session_factory).run()
+    before = await _sources(session_factory, establishment.id)
+
+    report = await _engine(session_factory).run()
+
+    assert (report.establishments, report.suggestions, report.reviews, report.failed) == (0, 0, 0, 0)
+    assert await _sources(session_factory, establishment.id) == before
+
+
+async def test_concurrent_runs_use_each_review_once(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    establishments = []
+    for _ in range(4):
+        async with session_factory() as db:
+            establishments.append(await seed_establishment(db, reviews=[5, 4, 3, 2, 1, 1]))
+
+    reports = await asyncio.gather(*(_engine(session_factory).run() for _ in range(3)))
+
+    assert sum(report.failed for report in reports) == 0
+    for establishment in establishments:
+        sources = [
+            review_id
+            for source_review_ids in await _sources(session_factory, establishment.id)
+            for review_id in source_review_ids
+        ]
+        # O lock consultivo e a marca d'água relida impedem fontes repetidas
+        assert len(sources) == len(set(sources))
+        assert sorted(sources) == sorted(await _review_ids(session_factory, establishment.id))
+    assert sum(report.reviews for report in reports) == 4 * 6
@@ -0,0 +1,74 @@
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from inclui_aqui_server.services.trending import TrendingSearches
+
+pytestmark = pytest.mark.anyio
+
+STARTED_AT = datetime(2026, 1, 5, 12, 0)
+
+
+def _rows(*queries):
+    return [
+        SimpleNamespace(timestamp=STARTED_AT + timedelta(seconds=index), id=uuid.uuid4(), query=query)
+        for index, query in enumerate(queries)
+    ]
+
+
+def _trending(snapshot_path, **kwargs) -> TrendingSearches:
+    options = {'capacity': 100, 'sketch_width': 256, 'sketch_depth': 4, 'half_life_seconds': 3600}
+    return TrendingSearches(session_factory=None, snapshot_path=str(snapshot_path), **{**options, **kwargs})
+
+
+def test_ingest_normalizes_skips_short_queries_and_advances_the_watermark(tmp_path):
+    trending = _trending(tmp_path / 'snapshot.json.gz')
+    rows = _rows('Rampa  de acesso', 'rampa de acesso', 'ab', 'banheiro')
+
+    trending.ingest(rows)
+
+    assert [item.query for item in trending.top(5)] == ['rampa de acesso', 'banheiro']
+    assert [item.query for item in trending.complete(' RAM', 5)] == ['rampa de acesso']
+    assert (trending.ingested, trending.skipped) == (3, 1)
+    assert trending.watermark == (rows[-1].timestamp, rows[-1].id)
+
+
+async def test_snapshot_restores_counts_and_watermark(tmp_path):
+    path = tmp_path / 'snapshot.json.gz'
+    trending = _trending(path)
+    trending.ingest(_rows('rampa', 'rampa', 'banheiro', 'elevador', 'rampa'))
+    assert await trending.save_snapshot()
+
+    restored = _trending(path)
+    assert await restored.load_snapshot()
+
+    assert restored.restored
+    assert restored.watermark == trending.watermark
+    assert restored.top(3) == trending.top(3)
+    assert restored.get_stats()['events'] == trending.get_stats()['events']
+
+
+@pytest.mark.parametrize(
+    'changed',
+    [{'capacity': 50}, {'sketch_width': 512}, {'sketch_depth': 2}, {'half_life_seconds': 60}],
+)
+async def test_snapshot_built_with_other_settings_is_ignored(tmp_path, changed):
+    path = tmp_path / 'snapshot.json.gz'
+    trending = _trending(path)
+    trending.ingest(_rows('rampa', 'banheiro'))
+    await trending.save_snapshot()
+
+    restarted = _trending(path, **changed)
+
+    assert not await restarted.load_snapshot()
+    assert (restarted.restored, restarted.watermark, restarted.top(5)) == (False, None, [])
+
+
+async def test_missing_or_disabled_snapshot_starts_empty(tmp_path):
+    assert not await _trending(tmp_path / 'missing.json.gz').load_snapshot()
+
+    disabled = TrendingSearches(session_factory=None, snapshot_path=None)
+    assert not await disabled.save_snapshot()
+    assert not await disabled.load_snapshot()
@@ -0,0 +1,130 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import user_crud
+from inclui_aqui_server.db.models import User
+from inclui_aqui_server.db.schemas import UserCreate, UserUpdate
+from tests.conftest import count_statements
+
+pytestmark = pytest.mark.anyio
+
+
+class DriverError(Exception):
+    """Erro de driver com os atributos que o asyncpg expõe."""
+
+    def __init__(self, message, sqlstate, constraint_name=None):
+        super().__init__(message)
+        self.sqlstate = sqlstate
+        self.constraint_name = constraint_name
+
+
+# Caminho de escrita anterior ao RETURNING (UserService + UserCRUD), para comparação.
+# Os dois caminhos fazem um único COMMIT por operação; só os comandos SQL são contados.
+async def legacy_create(db, user_in: UserCreate, hashed_password: str) -> User:
+    user_data = user_in.model_dump()
+    user_data.pop('password', None)
+    db_obj = User(**user_data, hashed_password=hashed_password)
+    db.add(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
+    return db_obj
+
+
+async def legacy_update(db, user_id, user_in: UserUpdate) -> User:
+    db_obj = await user_crud.get(db, user_id=user_id)
+    for field, value in user_in.model_dump(exclude_unset=True).items():
+        setattr(db_obj, field, value)
+    db.add(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
+    return db_obj
+
+
+async def legacy_remove(db, user_id) -> User:
+    # UserService.delete_user buscava o usuário antes de chamar UserCRUD.remove, que buscava de novo
+    await user_crud.get(db, user_id=user_id)
+    db_obj = await user_crud.get(db, user_id=user_id)
+    await db.delete(db_obj)
+    await db.commit()
+    return db_obj
+
+
+def _user_in(username: str) -> UserCreate:
+    return UserCreate(
+        username=username, email=f'{username}@example.com', password='password1', role='client'
+    )
+
+
+async def test_returning_writes_take_one_statement_each(db_engine):
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    update_in = UserUpdate(points=10)
+
+    async with session_factory() as db:
+        with count_statements(db_engine) as legacy_create_statements:
+            legacy_user = await legacy_create(db, _user_in('legacy'), 'hash')
+    async with session_factory() as db:
+        with count_statements(db_engine) as legacy_update_statements:
+            await legacy_update(db, legacy_user.id, update_in)
+    async with session_factory() as db:
+        with count_statements(db_engine) as legacy_remove_statements:
+            await legacy_remove(db, legacy_user.id)
+
+    async with session_factory() as db:
+        with count_statements(db_engine) as create_statements:
+            user = await user_crud.create(db, user_in=_user_in('current'), hashed_password='hash')
+    async with session_factory() as db:
+        with count_statements(db_engine) as update_statements:
+            updated = await user_crud.update(db, user_id=user.id, obj_in=update_in)
+    async with session_factory() as db:
+        with count_statements(db_engine) as remove_statements:
+            removed = await user_crud.remove(db, user_id=user.id)
+
+    print(
+        f'\nstatements before/after: create {len(legacy_create_statements)}/{len(create_statements)}, '
+        f'update {len(legacy_update_statements)}/{len(update_statements)}, '
+        f'remove {len(legacy_remove_statements)}/{len(remove_statements)}'
+    )
+    assert (updated.points, removed.id) == (10, user.id)
+    assert len(create_statements) == 1
+    assert len(update_statements) == 1
+    # DELETE das avaliações do usuário (agregados) + DELETE do usuário
+    assert len(remove_statements) == 2
+    assert len(legacy_create_statements) > len(create_statements)
+    assert len(legacy_update_statements) > len(update_statements)
+    assert len(legacy_remove_statements) > len(remove_statements)
+
+
+@pytest.mark.parametrize(
+    ('error', 'field'),
+    [
+        (DriverError('duplicate key', '23505', 'users_email_key'), 'email'),
+        (DriverError('duplicate key', '23505', 'users_username_key'), 'username'),
+        # Sem o nome da restrição, o campo vem da mensagem do erro
+        (DriverError('Key (username)=(ana) already exists.', '23505'), 'username'),
+        (DriverError('duplicate key', '23505', 'users_other_key'), 'identifier'),
+        (DriverError('violates foreign key', '23503', 'users_badge_id_fkey'), None),
+    ],
+)
+def test_get_conflicting_field_maps_each_unique_constraint(error, field):
+    exc = IntegrityError('INSERT INTO users ...', {}, error)
+
+    assert user_crud.get_conflicting_field(exc) == field
+
+
+async def test_unique_violations_from_postgres_map_to_their_field(postgres_engine):
+    session_factory = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await user_crud.create(db, user_in=_user_in('ana'), hashed_password='hash')
+
+    fields = []
+    for user_in in (
+        UserCreate(username='bia', email='ana@example.com', password='password1', role='client'),
+        UserCreate(username='ana', email='bia@example.com', password='password1', role='client'),
+    ):
+        async with session_factory() as db:
+            with pytest.raises(IntegrityError) as exc_info:
+                await user_crud.create(db, user_in=user_in, hashed_password='hash')
+            fields.append(user_crud.get_conflicting_field(exc_info.value))
+
+    assert fields == ['email', 'username']
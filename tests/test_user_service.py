@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from inclui_aqui_server.crud import user_crud
+from inclui_aqui_server.db.models import User, UserRole
+from inclui_aqui_server.db.schemas import UserCreate
+from inclui_aqui_server.services import user as user_service_module
+from inclui_aqui_server.services.user import UserService
+
+pytestmark = pytest.mark.anyio
+
+
+async def _fast_hash(password: str) -> str:
+    return f'hashed:{password}'
+
+
+async def test_create_users_reports_the_field_that_lost_the_insert_race(db_engine, monkeypatch):
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as db:
+        for username, email in (('taken', 'first@example.com'), ('other', 'taken@example.com')):
+            db.add(User(username=username, email=email, hashed_password='x', role=UserRole.client))
+        await db.commit()
+
+    # Simula usuários criados por outra transação entre a verificação e o INSERT
+    real_lookup = user_crud.get_existing_identifiers
+    lookups = []
+
+    async def lookup_after_the_check(db, *, emails, usernames):
+        lookups.append(emails)
+        return [] if len(lookups) == 1 else await real_lookup(db, emails=emails, usernames=usernames)
+
+    monkeypatch.setattr(user_crud, 'get_existing_identifiers', lookup_after_the_check)
+    monkeypatch.setattr(user_service_module.password_handler, 'hash_async', _fast_hash)
+
+    async with session_factory() as db:
+        result = await UserService(db).create_users([
+            UserCreate(username=username, email=email, password='password1', role='client')
+            for username, email in (
+                ('taken', 'new@example.com'),
+                ('fresh', 'taken@example.com'),
+                ('created', 'created@example.com'),
+            )
+        ])
+
+    assert [user.username for user in result.created] == ['created']
+    assert [(c.index, c.field, c.value) for c in result.conflicts] == [
+        (0, 'username', 'taken'),
+        (1, 'email', 'taken@example.com'),
+    ]
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from inclui_aqui_server.core.write_behind import WriteBehindBuffer
+from inclui_aqui_server.db.models import AIFeedbackLog
+
+pytestmark = pytest.mark.anyio
+
+
+class SlowBuffer(WriteBehindBuffer):
+    """Buffer cuja gravação demora, sem banco: registra os lotes gravados."""
+
+    def __init__(self, **kwargs):
+        super().__init__(AIFeedbackLog, session_factory=None, **kwargs)
+        self.batches = []
+
+    async def _write(self, rows):
+        await asyncio.sleep(0.05)
+        self.batches.append(rows)
+        self.written += len(rows)
+
+
+async def test_stop_finishes_the_batch_being_written():
+    buffer = SlowBuffer(max_batch=10, flush_interval=60)
+    buffer.start()
+    for index in range(25):
+        buffer.submit({'index': index})
+    # Deixa a tarefa retirar o primeiro lote do buffer e começar a gravá-lo
+    await asyncio.sleep(0.01)
+
+    await buffer.stop()
+
+    assert buffer.written == 25
+    assert sorted(row['index'] for batch in buffer.batches for row in batch) == list(range(25))
+    assert not buffer.running
+
+
+async def test_put_on_a_full_buffer_writes_inline_when_not_running():
+    buffer = SlowBuffer(max_batch=10, max_pending=3)
+    for index in range(3):
+        buffer.submit({'index': index})
+
+    await asyncio.wait_for(buffer.put({'index': 3}), timeout=1)
+
+    assert (buffer.written, buffer.get_stats()['pending']) == (3, 1)